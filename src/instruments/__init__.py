@@ -1,46 +1,75 @@
 #!/usr/bin/env python
 """
 Defines globally-available subpackages and symbols for the instruments package.
+
+The vendor subpackages, such as `instruments.srs`, and `load_instruments` are
+only imported when they are first accessed, so that importing this package
+does not load every driver.
 """
 
 # IMPORTS ####################################################################
 
+import importlib
+
 __all__ = ["units"]
 
 
 from . import abstract_instruments
 from .abstract_instruments import Instrument
 
-from . import agilent
-from . import aimtti
-from . import comet
-from . import dressler
-from . import delta_elektronika
-from . import generic_scpi
-from . import fluke
-from . import gentec_eo
-from . import glassman
-from . import hcp
-from . import holzworth
-from . import hp
-from . import keithley
-from . import lakeshore
-from . import mettler_toledo
-from . import minghe
-from . import newport
-from . import oxford
-from . import phasematrix
-from . import pfeiffer
-from . import picowatt
-from . import qubitekk
-from . import rigol
-from . import srs
-from . import sunpower
-from . import tektronix
-from . import teledyne
-from . import thorlabs
-from . import toptica
-from . import yokogawa
-
-from .config import load_instruments
 from .units import ureg as units
+
+# CONSTANTS ##################################################################
+
+_SUBPACKAGES = frozenset(
+    (
+        "agilent",
+        "aimtti",
+        "comet",
+        "dressler",
+        "delta_elektronika",
+        "generic_scpi",
+        "fluke",
+        "gentec_eo",
+        "glassman",
+        "hcp",
+        "holzworth",
+        "hp",
+        "keithley",
+        "lakeshore",
+        "mettler_toledo",
+        "minghe",
+        "newport",
+        "oxford",
+        "phasematrix",
+        "pfeiffer",
+        "picowatt",
+        "qubitekk",
+        "rigol",
+        "srs",
+        "sunpower",
+        "tektronix",
+        "teledyne",
+        "thorlabs",
+        "toptica",
+        "yokogawa",
+    )
+)
+
+# FUNCTIONS ##################################################################
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        # Importing the subpackage also binds it as an attribute of this
+        # package, so that this is only called once per subpackage.
+        return importlib.import_module(f".{name}", __name__)
+    if name == "load_instruments":
+        from .config import load_instruments  # pylint: disable=import-outside-toplevel
+
+        return load_instruments
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBPACKAGES | {"load_instruments"})
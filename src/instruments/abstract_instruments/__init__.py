@@ -4,9 +4,11 @@ Module containing instrument abstract base classes and communication layers
 """
 
 from .instrument import Instrument
+from .instrument_executor import InstrumentExecutor
 from .electrometer import Electrometer
 from .function_generator import FunctionGenerator
 from .multimeter import Multimeter
 from .oscilloscope import Oscilloscope
 from .optical_spectrum_analyzer import OpticalSpectrumAnalyzer
 from .power_supply import PowerSupply
+from . import signal_generator
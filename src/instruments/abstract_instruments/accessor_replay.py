@@ -0,0 +1,472 @@
+#!/usr/bin/env python
+"""
+Provides the stand-ins used to run the synchronous property accessors of an
+instrument somewhere other than where its I/O is done, as by
+`~instruments.Instrument.aget`, `~instruments.Instrument.aset`,
+`~instruments.generic_scpi.SCPIInstrument.get_many` and
+`~instruments.abstract_instruments.InstrumentExecutor`.
+"""
+
+# IMPORTS #####################################################################
+
+
+import contextlib
+import functools
+import inspect
+import types
+
+from instruments.util_fns import _FactoryProperty
+
+# CONSTANTS ###################################################################
+
+#: Methods of `~instruments.Instrument` which communicate with the
+#: instrument. Those which a stand-in does not perform itself raise
+#: `UnsupportedIOError` rather than reaching the real communicator.
+_IO_METHODS = frozenset(
+    (
+        "sendcmd",
+        "query",
+        "read",
+        "read_raw",
+        "write",
+        "binblockread",
+        "binblockread_iter",
+    )
+)
+
+# CLASSES #####################################################################
+
+
+class PendingIO(BaseException):
+    """
+    Raised by `AccessorReplay` when a property accessor reaches an I/O
+    operation whose result is not yet known. This derives from
+    `BaseException` so that broad ``except Exception`` clauses in accessors
+    do not swallow it.
+    """
+
+    def __init__(self, op):
+        super().__init__(op)
+        self.op = op
+
+
+class UnsupportedIOError(NotImplementedError):
+    """
+    Raised when an accessor run against a stand-in uses I/O which the
+    stand-in cannot perform, such as the communicator of the instrument.
+    """
+
+
+class _CommunicatorGuard:
+    """
+    Stands in for the communicator of an instrument, so that accessors can
+    read its settings, such as ``_file.terminator``, but cannot communicate
+    with it behind the back of the stand-in.
+    """
+
+    def __init__(self, comm, user):
+        object.__setattr__(self, "_comm", comm)
+        object.__setattr__(self, "_user", user)
+
+    def __getattr__(self, name):
+        value = getattr(self._comm, name)
+        if callable(value):
+            raise UnsupportedIOError(
+                "Property accessors run by {} cannot use the communicator "
+                "directly, as with _file.{}().".format(self._user, name)
+            )
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self._comm, name, value)
+
+
+class _StandIn:
+    """
+    Base class of the stand-ins. Properties and methods of the instrument
+    are run against the stand-in, so that their I/O goes through it, while
+    other attributes are those of the instrument.
+    """
+
+    def __init__(self, instrument):
+        object.__setattr__(self, "_instrument", instrument)
+        # Property values are cached by the instrument, as if read directly.
+        object.__setattr__(self, "_cache_parent", instrument)
+
+    def __getattr__(self, name):
+        if name == "_file":
+            return _CommunicatorGuard(self._instrument._file, type(self).__name__)
+        if name in _IO_METHODS:
+            raise UnsupportedIOError(
+                "Property accessors run by {} cannot use {}.".format(
+                    type(self).__name__, name
+                )
+            )
+        attr = inspect.getattr_static(self._instrument, name)
+        if isinstance(attr, property):
+            return attr.fget(self)
+        if isinstance(attr, types.FunctionType):
+            return types.MethodType(attr, self)
+        return getattr(self._instrument, name)
+
+    def __setattr__(self, name, value):
+        attr = inspect.getattr_static(self._instrument, name, None)
+        if isinstance(attr, property):
+            attr.fset(self, value)
+        else:
+            setattr(self._instrument, name, value)
+
+
+class AccessorReplay(_StandIn):
+    """
+    Stands in for an instrument while running its property accessors.
+
+    Every ``sendcmd``, ``query`` and ``read`` made by the accessor is
+    recorded. When the accessor reaches an operation that has not been
+    performed yet, `PendingIO` is raised so that the caller can perform that
+    operation and run the accessor again, this time replaying the known
+    results. Accessors are thus run once for each of their operations, so
+    this is meant for accessors without side effects besides their I/O, such
+    as those of the properties made by the factories in
+    `instruments.util_fns`.
+
+    Once made live, the replay performs the operations which follow the
+    known results on the instrument itself, so that an accessor using I/O
+    which cannot be replayed can be completed without repeating what was
+    already performed.
+
+    :param instrument: The instrument to stand in for.
+    :param list results: Results of the I/O operations performed so far,
+        to which the caller appends.
+    """
+
+    def __init__(self, instrument, results):
+        super().__init__(instrument)
+        object.__setattr__(self, "_results", results)
+        object.__setattr__(self, "_pos", 0)
+        object.__setattr__(self, "_live", False)
+
+    def __getattr__(self, name):
+        if self._live and (name == "_file" or name in _IO_METHODS):
+            return getattr(self._instrument, name)
+        return super().__getattr__(name)
+
+    def _io(self, op):
+        pos = self._pos
+        if pos == len(self._results):
+            if not self._live:
+                raise PendingIO(op)
+            self._results.append(perform_io(self._instrument, op))
+        object.__setattr__(self, "_pos", pos + 1)
+        return self._results[pos]
+
+    def sendcmd(self, cmd):
+        """Records a command to be sent."""
+        self._io(("sendcmd", cmd))
+
+    def query(self, cmd, size=-1):
+        """Records a query, returning its response once known."""
+        return self._io(("query", cmd, size))
+
+    def read(self, size=-1, encoding="utf-8"):
+        """Records a read, returning its result once known."""
+        return self._io(("read", size, encoding))
+
+
+class _AwaitedCommunicator:
+    """
+    Stands in for the async communicator of an instrument on a worker
+    thread, awaiting each of its coroutines on the event loop. It is also
+    its own arbiter, whose transactions hold the communicator as its
+    ``transaction`` does, so that the ``sendcmd`` and ``query`` of a driver
+    are not interleaved with the I/O of other tasks.
+    """
+
+    def __init__(self, comm, loop):
+        object.__setattr__(self, "_comm", comm)
+        object.__setattr__(self, "_loop", loop)
+        object.__setattr__(self, "_depth", 0)
+
+    def __getattr__(self, name):
+        value = getattr(self._comm, name)
+        if inspect.iscoroutinefunction(value):
+            return lambda *args, **kwargs: self._await(value(*args, **kwargs))
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self._comm, name, value)
+
+    def _await(self, coro):
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    @property
+    def arbiter(self):
+        """
+        Gets this stand-in, which arbitrates the use of the communicator.
+        """
+        return self
+
+    @contextlib.contextmanager
+    def transaction(self, priority=0, timeout=None):  # pylint: disable=unused-argument
+        """
+        Holds exclusive use of the communicator for the duration of the
+        block. Nested transactions do not block.
+        """
+        depth = self._depth
+        if depth == 0:
+            held = self._comm.transaction()
+            self._await(held.__aenter__())
+        object.__setattr__(self, "_depth", depth + 1)
+        try:
+            yield self
+        finally:
+            object.__setattr__(self, "_depth", depth)
+            if depth == 0:
+                self._await(held.__aexit__(None, None, None))
+
+    def readinto(self, buffer):
+        """
+        Reads into ``buffer`` with the ``read_raw`` of the communicator.
+        """
+        view = memoryview(buffer).cast("B")
+        data = self._await(self._comm.read_raw(len(view)))
+        view[: len(data)] = data
+        return len(data)
+
+
+class AsyncBridge(_StandIn):
+    """
+    Stands in for an instrument with an async communicator while running a
+    property accessor once, on a worker thread. Each I/O operation is
+    awaited on the event loop of the instrument, blocking the worker
+    thread until it completes.
+
+    :param instrument: The instrument to stand in for.
+    :param loop: The event loop on which the I/O is awaited.
+    :type loop: `asyncio.AbstractEventLoop`
+    """
+
+    def __init__(self, instrument, loop):
+        super().__init__(instrument)
+        object.__setattr__(self, "_loop", loop)
+
+    def _await(self, coro):
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def sendcmd(self, cmd):
+        """Sends a command with `~instruments.Instrument.asendcmd`."""
+        self._await(self._instrument.asendcmd(cmd))
+
+    def query(self, cmd, size=-1):
+        """Sends a query with `~instruments.Instrument.aquery`."""
+        return self._await(self._instrument.aquery(cmd, size))
+
+    def read(self, size=-1, encoding="utf-8"):
+        """Reads with `~instruments.Instrument.aread`."""
+        return self._await(self._instrument.aread(size, encoding))
+
+    def read_raw(self, size=-1):
+        """Reads with `~instruments.Instrument.aread_raw`."""
+        return self._await(self._instrument.aread_raw(size))
+
+    def write(self, msg):
+        """Writes with `~instruments.Instrument.awrite`."""
+        self._await(self._instrument.awrite(msg))
+
+    def binblockread(self, data_width, fmt=None):
+        """Reads a binary block with `~instruments.Instrument.abinblockread`."""
+        return self._await(self._instrument.abinblockread(data_width, fmt))
+
+
+class ReplayedProperty:
+    """
+    A property resolved against an `AccessorReplay`, whose accessors are
+    run again as the results of their I/O become known. Use
+    `replay_property` to create one.
+    """
+
+    def __init__(self, descriptor, replay, results, target, attr):
+        self.descriptor = descriptor
+        self.results = results
+        self._replay = replay
+        self._target = target
+        self._attr = attr
+
+    @property
+    def factory(self):
+        """
+        Checks whether the property was made by one of the factories in
+        `instruments.util_fns`.
+
+        :type: `bool`
+        """
+        return isinstance(self.descriptor, _FactoryProperty)
+
+    @property
+    def on_instrument(self):
+        """
+        Checks whether the property belongs to the instrument itself, rather
+        than to a channel or other object whose I/O methods may add I/O of
+        their own.
+
+        :type: `bool`
+        """
+        return self._target is self._replay
+
+    @property
+    def cached(self):
+        """
+        Checks whether the property caches its values, in which case its
+        accessors store them in the cache of the instrument.
+
+        :type: `bool`
+        """
+        return not self.factory or self.descriptor.cached
+
+    def get(self, live=False):
+        """
+        Runs the getter, replaying the results known so far.
+
+        :param bool live: If `True`, the I/O which follows the known results
+            is performed on the instrument, as if the getter had been called
+            once on the instrument itself.
+        :raises PendingIO: If the getter reaches an I/O operation whose
+            result is not yet known, when not live.
+        """
+        object.__setattr__(self._replay, "_pos", 0)
+        object.__setattr__(self._replay, "_live", live)
+        return getattr(self._target, self._attr)
+
+    def set(self, value):
+        """
+        Runs the setter, replaying the results known so far.
+
+        :raises PendingIO: If the setter reaches an I/O operation whose
+            result is not yet known.
+        """
+        object.__setattr__(self._replay, "_pos", 0)
+        setattr(self._target, self._attr, value)
+
+    def run(self, accessor, perform):
+        """
+        Calls ``accessor``, which is `get` or `set`, until it completes,
+        performing each I/O operation it reaches with ``perform(op)``.
+        """
+        while True:
+            try:
+                return accessor()
+            except PendingIO as pending:
+                self.results.append(perform(pending.op))
+
+
+# FUNCTIONS ###################################################################
+
+
+def replay_property(instrument, name, factory_only=True):
+    """
+    Resolves the named property of ``instrument`` against an
+    `AccessorReplay`.
+
+    :param instrument: The instrument owning the property.
+    :type instrument: `~instruments.Instrument`
+    :param str name: Name of the property, optionally prefixed by attribute
+        and index accesses such as ``channel[0].``.
+    :param bool factory_only: If `True`, only properties made by the
+        factories in `instruments.util_fns` are resolved. The accessors of
+        other properties may have side effects, which would be repeated each
+        time they are replayed.
+    :return: The resolved property, or `None` if it is not a factory
+        property when ``factory_only`` is `True`, or if resolving its owner
+        needs I/O. The accessors of such properties should be run once, on
+        the real instrument.
+    :rtype: `ReplayedProperty` or `None`
+    """
+    results = []
+    replay = AccessorReplay(instrument, results)
+    try:
+        target, attr = instrument._resolve_expression(replay, name)
+    except (PendingIO, UnsupportedIOError):
+        return None
+    owner = type(instrument) if target is replay else type(target)
+    descriptor = inspect.getattr_static(owner, attr, None)
+    if factory_only and not isinstance(descriptor, _FactoryProperty):
+        return None
+    return ReplayedProperty(descriptor, replay, results, target, attr)
+
+
+def overrides_io(instrument):
+    """
+    Checks whether the driver class of ``instrument`` overrides the
+    ``sendcmd`` or ``query`` of `~instruments.Instrument` or
+    `~instruments.generic_scpi.SCPIInstrument`, as drivers checking for
+    errors after each command do. Running its accessors through
+    `~instruments.Instrument.asendcmd` and `~instruments.Instrument.aquery`
+    would skip these overrides.
+
+    :param instrument: The instrument to check.
+    :type instrument: `~instruments.Instrument`
+    :rtype: `bool`
+    """
+    # pylint: disable=import-outside-toplevel
+    from instruments.abstract_instruments.instrument import Instrument
+    from instruments.generic_scpi.scpi_instrument import SCPIInstrument
+
+    cls = type(instrument)
+    return any(
+        getattr(cls, name)
+        not in (getattr(Instrument, name), getattr(SCPIInstrument, name))
+        for name in ("sendcmd", "query")
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _driver_view_class(driver_cls):
+    # The slot takes precedence over the ``_file`` of the shared attributes.
+    return type(driver_cls.__name__, (driver_cls,), {"__slots__": ("_file",)})
+
+
+def driver_view(instrument, loop):
+    """
+    Returns a view of an instrument with an async communicator, for running
+    its property accessors once, on a worker thread, through the driver's
+    own I/O methods. The view is an instance of the driver class sharing the
+    attributes of the instrument, except for its communicator, which awaits
+    each operation on the event loop.
+
+    :param instrument: The instrument to view.
+    :param loop: The event loop on which the I/O is awaited.
+    :type loop: `asyncio.AbstractEventLoop`
+    """
+    # pylint: disable=protected-access,attribute-defined-outside-init
+    view = object.__new__(_driver_view_class(type(instrument)))
+    view.__dict__ = instrument.__dict__
+    view._file = _AwaitedCommunicator(instrument._file, loop)
+    return view
+
+
+def perform_io(instrument, op):
+    """
+    Performs an I/O operation recorded by an `AccessorReplay` on the
+    instrument, returning its result.
+    """
+    if op[0] == "sendcmd":
+        return instrument.sendcmd(op[1])
+    if op[0] == "query":
+        return instrument.query(op[1], op[2])
+    return instrument.read(op[1], op[2])
+
+
+async def aperform_io(instrument, op):
+    """
+    Awaitable counterpart of `perform_io`, for instruments with an async
+    communicator.
+    """
+    if op[0] == "sendcmd":
+        return await instrument.asendcmd(op[1])
+    if op[0] == "query":
+        return await instrument.aquery(op[1], op[2])
+    return await instrument.aread(op[1], op[2])
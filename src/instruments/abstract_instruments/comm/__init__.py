@@ -1,16 +1,56 @@
 #!/usr/bin/env python
 """
 Module containing communication layers
+
+The asyncio-based stream, serial and socket communicators are only imported
+when they are first accessed, so that importing this package does not load
+`asyncio`.
 """
 
+import importlib
+
 from .abstract_comm import AbstractCommunicator
+from .async_comm import AsyncAbstractCommunicator
+from .bus_arbiter import BusArbiter
+from .comm_metrics import (
+    CommunicatorMetrics,
+    KindTotals,
+    LatencyHistogram,
+    Transaction,
+)
 
 from .file_communicator import FileCommunicator
 from .gpib_communicator import GPIBCommunicator
+from .hislip_communicator import HiSLIPCommunicator
+from .instrument_server import InstrumentServer
 from .loopback_communicator import LoopbackCommunicator
+from .proxy_communicator import ProxyCommunicator
+from .recording_communicator import RecordingCommunicator
+from .replay_communicator import ReplayCommunicator
 from .serial_communicator import SerialCommunicator
 from .socket_communicator import SocketCommunicator
 from .usb_communicator import USBCommunicator
 from .usbtmc_communicator import USBTMCCommunicator
 from .visa_communicator import VisaCommunicator
 from .vxi11_communicator import VXI11Communicator
+
+from .async_loopback_communicator import AsyncLoopbackCommunicator
+
+_ASYNC_COMMUNICATORS = {
+    "AsyncStreamCommunicator": "async_stream_communicator",
+    "AsyncSerialCommunicator": "async_serial_communicator",
+    "AsyncSocketCommunicator": "async_socket_communicator",
+}
+
+
+def __getattr__(name):
+    if name in _ASYNC_COMMUNICATORS:
+        module = importlib.import_module(f".{_ASYNC_COMMUNICATORS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ASYNC_COMMUNICATORS))
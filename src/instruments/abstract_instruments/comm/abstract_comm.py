@@ -9,6 +9,10 @@ import abc
 import codecs
 import logging
 import struct
+import threading
+import time
+
+from instruments.abstract_instruments.comm.comm_metrics import CommunicatorMetrics
 
 # CLASSES ####################################################################
 
@@ -25,6 +29,11 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
 
     def __init__(self, *args, **kwargs):  # pylint: disable=unused-argument
         self._debug = False
+        self._arbiter = None
+        self._metrics = CommunicatorMetrics()
+        # Set while a thread is in `query`, so that the commands it sends
+        # are timed as part of the query rather than on their own.
+        self._querying = threading.local()
 
         # Create a new logger for the module containing the concrete
         # subclass that we're a part of.
@@ -66,6 +75,44 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
     def debug(self, newval):
         self._debug = bool(newval)
 
+    @property
+    def arbiter(self):
+        """
+        Gets/sets the `BusArbiter` used to serialize transactions from
+        instruments sharing this communicator, or `None` if the
+        communicator is not shared.
+
+        :type: `BusArbiter` or `None`
+        """
+        return self._arbiter
+
+    @arbiter.setter
+    def arbiter(self, newval):
+        self._arbiter = newval
+
+    @property
+    def metrics(self):
+        """
+        Gets the counters and latency histograms of the commands and queries
+        sent through this communicator. Unlike `debug`, these are always
+        kept, as they are cheap to update.
+
+        :type: `CommunicatorMetrics`
+        """
+        return self._metrics
+
+    @property
+    def marks_message_end(self):
+        """
+        Checks whether the transport marks the end of each message, as with
+        the END indicator of VISA, USBTMC, VXI-11 and HiSLIP, rather than
+        relying only on the terminator. Only then can `read_message` read a
+        message whose data may contain the terminator.
+
+        :type: `bool`
+        """
+        return False
+
     # ABSTRACT PROPERTIES #
 
     @property
@@ -180,6 +227,43 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
         """
         self.write_raw(msg.encode(encoding))
 
+    def readinto(self, buffer):
+        """
+        Read bytes from the connection directly into a preallocated, writable
+        buffer, such as a `bytearray`, `memoryview` or `numpy.ndarray`.
+
+        Like `read_raw` with a positive size, this may read fewer bytes than
+        requested. Communicators that can receive directly into the buffer
+        override this; the default implementation copies the result of
+        `read_raw`.
+
+        :param buffer: Buffer to fill, at most ``len(buffer)`` bytes are read.
+        :return: The number of bytes read
+        :rtype: `int`
+        """
+        view = memoryview(buffer).cast("B")
+        data = self.read_raw(len(view))
+        view[: len(data)] = data
+        return len(data)
+
+    def read_message(self):
+        """
+        Reads the rest of the current message, up to the end marked by the
+        transport rather than the first terminator, such as the data of an
+        indefinite-length binary block. The bytes are returned as sent,
+        including any terminator at the end of the message.
+
+        This is only supported by communicators whose `marks_message_end`
+        is `True`.
+
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} cannot find the end of a message other "
+            "than by its terminator."
+        )
+
     def read(self, size=-1, encoding="utf-8"):
         """
         Read bytes in from the connection, returning a decoded string
@@ -214,7 +298,17 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
         """
         if self.debug:
             self._logger.debug(" <- %s", repr(msg))
-        self._sendcmd(msg)
+        if getattr(self._querying, "active", False):
+            # Already being timed as part of the query.
+            self._sendcmd(msg)
+            return
+        start = time.perf_counter()
+        try:
+            self._sendcmd(msg)
+        except Exception:
+            self._metrics.record_error()
+            raise
+        self._metrics.record("sendcmd", msg, None, start, time.perf_counter() - start)
 
     def query(self, msg, size=-1):
         """
@@ -229,7 +323,16 @@ class AbstractCommunicator(metaclass=abc.ABCMeta):
         """
         if self.debug:
             self._logger.debug(" <- %s", repr(msg))
-        resp = self._query(msg, size)
+        start = time.perf_counter()
+        self._querying.active = True
+        try:
+            resp = self._query(msg, size)
+        except Exception:
+            self._metrics.record_error()
+            raise
+        finally:
+            self._querying.active = False
+        self._metrics.record("query", msg, resp, start, time.perf_counter() - start)
         if self.debug:
             self._logger.debug(" -> %s", repr(resp))
         return resp
@@ -0,0 +1,310 @@
+#!/usr/bin/env python
+"""
+Provides an abstract base class for asyncio-based communication layer classes
+"""
+
+# IMPORTS ####################################################################
+
+import abc
+import codecs
+import contextlib
+import logging
+import struct
+
+from instruments.units import ureg as u
+from instruments.util_fns import assume_units
+
+# CLASSES ####################################################################
+
+
+class AsyncAbstractCommunicator(metaclass=abc.ABCMeta):
+    """
+    Abstract base class for communicators whose I/O methods are coroutines,
+    for use with an `asyncio` event loop.
+
+    This mirrors `AbstractCommunicator`, except that `read_raw`, `write_raw`,
+    `read`, `write`, `sendcmd`, `query`, `flush_input` and `close` must be
+    awaited. An `~instruments.Instrument` wrapping an async communicator is
+    driven through its awaitable methods, such as
+    `~instruments.Instrument.aquery`.
+    """
+
+    # INITIALIZER #
+
+    def __init__(self, *args, **kwargs):  # pylint: disable=unused-argument
+        self._debug = False
+        self._terminator = "\n"
+        self._timeout = None
+        self._lock = None
+
+        # Create a new logger for the module containing the concrete
+        # subclass that we're a part of.
+        self._logger = logging.getLogger(type(self).__module__)
+
+        # Ensure that there's at least something setup to receive logs.
+        self._logger.addHandler(logging.NullHandler())
+
+    # FORMATTING METHODS #
+
+    def __repr__(self):
+        try:
+            addr = repr(self.address)
+        except:  # noqa: E722
+            addr = "unknown"
+        return f"<{type(self).__name__} object at 0x{id(self):X} connected to {addr}>"
+
+    # CONTEXT MANAGER METHODS #
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # CONCRETE PROPERTIES #
+
+    @property
+    def debug(self):
+        """
+        Enables or disables debug support. If active, all messages sent to
+        or received from this communicator are logged to the Python logging
+        service, with the logger name given by the module of the current
+        communicator.
+
+        :type: `bool`
+        """
+        return self._debug
+
+    @debug.setter
+    def debug(self, newval):
+        self._debug = bool(newval)
+
+    @property
+    def terminator(self):
+        """
+        Gets/sets the termination character appended to commands, and
+        used to detect the end of responses.
+
+        :type: `str`
+        """
+        return self._terminator
+
+    @terminator.setter
+    def terminator(self, newval):
+        if isinstance(newval, bytes):
+            newval = newval.decode("utf-8")
+        if not isinstance(newval, str):
+            raise TypeError(
+                "Terminator for async communicators must be "
+                "specified as a byte or unicode string."
+            )
+        self._terminator = newval
+
+    @property
+    def timeout(self):
+        """
+        Gets/sets the time to wait for each read to complete, or `None` to
+        wait indefinitely.
+
+        :type: `~pint.Quantity` or `None`
+        :units: As specified or assumed to be of units ``seconds``
+        """
+        if self._timeout is None:
+            return None
+        return self._timeout * u.second
+
+    @timeout.setter
+    def timeout(self, newval):
+        if newval is None:
+            self._timeout = None
+        else:
+            self._timeout = assume_units(newval, u.second).to(u.second).magnitude
+
+    @property
+    def marks_message_end(self):
+        """
+        Checks whether the transport marks the end of each message, rather
+        than relying only on the terminator. Only then can `read_message`
+        read a message whose data may contain the terminator.
+
+        :type: `bool`
+        """
+        return False
+
+    # ABSTRACT PROPERTIES #
+
+    @property
+    @abc.abstractmethod
+    def address(self):
+        """
+        Reads or changes the current address for this communicator.
+        """
+        raise NotImplementedError
+
+    @address.setter
+    @abc.abstractmethod
+    def address(self, newval):
+        raise NotImplementedError
+
+    # ABSTRACT METHODS #
+
+    @abc.abstractmethod
+    async def read_raw(self, size=-1):
+        """
+        Read bytes in from the connection.
+
+        :param int size: The number of bytes to read in from the
+            connection, or -1 to read until the terminator.
+
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+
+    @abc.abstractmethod
+    async def write_raw(self, msg):
+        """
+        Write bytes to the connection.
+
+        :param bytes msg: Bytes to be sent to the instrument over the
+            connection.
+        """
+
+    @abc.abstractmethod
+    async def flush_input(self):
+        """
+        Instruct the communicator to flush the input buffer, discarding the
+        entirety of its contents.
+        """
+
+    @abc.abstractmethod
+    async def close(self):
+        """
+        Close the connection.
+        """
+
+    # CONCRETE METHODS #
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        """
+        Async context manager holding exclusive use of this communicator, so
+        that a send-then-read exchange is not interleaved with those of other
+        tasks sharing the communicator.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            yield self
+
+    async def read_message(self):
+        """
+        Reads the rest of the current message, up to the end marked by the
+        transport rather than the first terminator. This is only supported
+        by communicators whose `marks_message_end` is `True`.
+
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} cannot find the end of a message other "
+            "than by its terminator."
+        )
+
+    async def _with_timeout(self, awaitable):
+        """
+        Awaits ``awaitable``, raising `TimeoutError` if it takes longer
+        than `timeout`.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        try:
+            return await asyncio.wait_for(awaitable, self._timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Timed out reading from {type(self).__name__}."
+            ) from None
+
+    async def write(self, msg, encoding="utf-8"):
+        """
+        Write a string to the connection. This string will be converted
+        to `bytes` using the provided encoding method.
+
+        :param str msg: String to be sent to the instrument over the
+            connection.
+        :param str encoding: Encoding to apply on msg to convert the message
+            into bytes
+        """
+        await self.write_raw(msg.encode(encoding))
+
+    async def read(self, size=-1, encoding="utf-8"):
+        """
+        Read bytes in from the connection, returning a decoded string
+        using the provided encoding method.
+
+        :param int size: The number of bytes to read in from the
+            connection.
+        :param str encoding: Encoding that will be applied to the read bytes
+
+        :return: The read string from the connection
+        :rtype: `str`
+        """
+        try:
+            codecs.lookup(encoding)
+            return (await self.read_raw(size)).decode(encoding)
+        except LookupError:
+            if encoding == "IEEE-754/64":
+                return struct.unpack(">d", await self.read_raw(size))[0]
+            else:
+                raise ValueError(f"Encoding {encoding} is not currently supported.")
+
+    async def _sendcmd(self, msg):
+        """
+        Sends a message with the termination character appended. Subclasses
+        needing secondary commands may override this.
+
+        :param str msg: The command message to send to the instrument
+        """
+        await self.write(msg + self._terminator)
+
+    async def _query(self, msg, size=-1):
+        """
+        Sends a message with `_sendcmd` and reads the response.
+
+        :param str msg: The query message to send to the instrument
+        :param int size: The number of bytes to read back from the instrument
+            response.
+        :return: The instrument response to the query
+        :rtype: `str`
+        """
+        await self._sendcmd(msg)
+        return await self.read(size)
+
+    async def sendcmd(self, msg):
+        """
+        Sends the incoming msg down to the connection, appending any
+        termination characters required by the communication.
+
+        :param str msg: The command message to send to the instrument
+        """
+        if self.debug:
+            self._logger.debug(" <- %s", repr(msg))
+        await self._sendcmd(msg)
+
+    async def query(self, msg, size=-1):
+        """
+        Send a string to the connected instrument and read the response.
+
+        :param str msg: The query message to send to the instrument
+        :param int size: The number of bytes to read back from the instrument
+            response.
+        :return: The instrument response to the query
+        :rtype: `str`
+        """
+        if self.debug:
+            self._logger.debug(" <- %s", repr(msg))
+        resp = await self._query(msg, size)
+        if self.debug:
+            self._logger.debug(" -> %s", repr(resp))
+        return resp
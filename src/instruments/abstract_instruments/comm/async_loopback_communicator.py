@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Provides an asyncio loopback communicator, used for creating unit tests of
+the awaitable instrument API.
+"""
+
+# IMPORTS #####################################################################
+
+
+from instruments.abstract_instruments.comm import AsyncAbstractCommunicator
+
+# CLASSES #####################################################################
+
+
+class AsyncLoopbackCommunicator(AsyncAbstractCommunicator):
+    """
+    Async counterpart to `LoopbackCommunicator`. Responses are played back
+    from the ``stdin`` file-like object, and everything written is stored in
+    ``stdout``.
+
+    :param stdin: The stream of data coming from the instrument
+    :type stdin: `io.BytesIO`
+    :param stdout: Stream that will hold data sent to the instrument
+    :type stdout: `io.BytesIO`
+    """
+
+    def __init__(self, stdin=None, stdout=None):
+        super().__init__()
+        self._stdin = stdin
+        self._stdout = stdout
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Gets the address of the loopback communicator, which is always
+        `None`.
+        """
+        return None
+
+    @address.setter
+    def address(self, newval):
+        raise NotImplementedError
+
+    # METHODS #
+
+    async def read_raw(self, size=-1):
+        """
+        Gets the next response from ``stdin``.
+
+        :param int size: Number of characters to read. Default value of -1
+            will read until termination character is found.
+        :rtype: `bytes`
+        """
+        if size == -1 or size is None:
+            if not self._terminator:
+                return self._stdin.read(-1)
+            term = self._terminator.encode("utf-8")
+            result = b""
+            while not result.endswith(term):
+                c = self._stdin.read(1)
+                if c == b"":
+                    break
+                result += c
+            return result[: -len(term)] if result.endswith(term) else result
+        elif size >= 0:
+            return bytes(self._stdin.read(size))
+        else:
+            raise ValueError("Must read a positive value of characters.")
+
+    async def write_raw(self, msg):
+        """
+        Write raw bytes to ``stdout``.
+
+        :param bytes msg: The bytes to be written
+        """
+        if self._stdout is not None:
+            self._stdout.write(msg)
+
+    async def flush_input(self):
+        """
+        For the loopback communicator, this does nothing.
+        """
+
+    async def close(self):
+        """
+        Close ``stdin``.
+        """
+        if self._stdin is not None:
+            self._stdin.close()
+
+    async def _sendcmd(self, msg):
+        """
+        Sends a message with the termination character appended. Empty
+        messages are not sent.
+
+        :param str msg: The command message to send to the instrument
+        """
+        if msg != "":
+            await self.write(f"{msg}{self._terminator}")
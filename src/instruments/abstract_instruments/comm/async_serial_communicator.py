@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Provides an asyncio serial communicator for connecting with instruments over
+serial ports and pseudo terminals.
+"""
+
+# IMPORTS #####################################################################
+
+
+import asyncio
+import os
+
+import serial
+
+from instruments.abstract_instruments.comm import AsyncStreamCommunicator
+
+# CLASSES #####################################################################
+
+
+class AsyncSerialCommunicator(AsyncStreamCommunicator):
+    """
+    Communicates with a serial port through the running `asyncio` event
+    loop. The port is opened and configured (baud rate, parity, ...) by a
+    `pyserial.Serial` object, and its file descriptor is then read and
+    written as non-blocking pipes. Use `AsyncSerialCommunicator.open` from
+    within a coroutine to connect.
+
+    .. note:: This requires a POSIX system, where serial ports and pseudo
+        terminals are character devices supported by the event loop.
+
+    :param conn: The open serial port.
+    :type conn: `pyserial.Serial`
+    """
+
+    def __init__(self, conn, reader, writer, read_transport=None):
+        super().__init__(reader, writer)
+        if not isinstance(conn, serial.Serial):
+            raise TypeError("AsyncSerialCommunicator must wrap a serial.Serial object.")
+        self._conn = conn
+        self._read_transport = read_transport
+
+    @classmethod
+    async def open(cls, conn):
+        """
+        Attaches the event loop to an open serial port.
+
+        :param conn: The open serial port.
+        :type conn: `pyserial.Serial`
+        :rtype: `AsyncSerialCommunicator`
+        """
+        if not isinstance(conn, serial.Serial):
+            raise TypeError("AsyncSerialCommunicator must wrap a serial.Serial object.")
+        loop = asyncio.get_running_loop()
+        fd = conn.fileno()
+
+        reader = asyncio.StreamReader(limit=cls.stream_limit)
+        read_transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader),
+            os.fdopen(os.dup(fd), "rb", buffering=0),
+        )
+        write_transport, write_protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin,
+            os.fdopen(os.dup(fd), "wb", buffering=0),
+        )
+        writer = asyncio.StreamWriter(write_transport, write_protocol, reader, loop)
+        return cls(conn, reader, writer, read_transport)
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Gets the name of the serial port.
+
+        :type: `str`
+        """
+        return self._conn.port
+
+    @address.setter
+    def address(self, newval):
+        raise NotImplementedError
+
+    # METHODS #
+
+    async def close(self):
+        """
+        Detach from the event loop and close the serial port.
+        """
+        if self._read_transport is not None:
+            self._read_transport.close()
+        self._writer.close()
+        self._conn.close()
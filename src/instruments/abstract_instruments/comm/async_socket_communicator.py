@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+Provides an asyncio tcpip socket communicator for connecting with instruments
+over raw ethernet connections.
+"""
+
+# IMPORTS #####################################################################
+
+
+import asyncio
+
+from instruments.abstract_instruments.comm import AsyncStreamCommunicator
+
+# CLASSES #####################################################################
+
+
+class AsyncSocketCommunicator(AsyncStreamCommunicator):
+    """
+    Communicates with an instrument over a TCP connection managed by the
+    running `asyncio` event loop. Use `AsyncSocketCommunicator.open` from
+    within a coroutine to connect.
+
+    Example usage:
+
+    >>> import asyncio
+    >>> import instruments as ik
+    >>> from instruments.abstract_instruments.comm import AsyncSocketCommunicator
+    >>> async def main():
+    ...     comm = await AsyncSocketCommunicator.open("192.168.0.10", 5025)
+    ...     inst = ik.Instrument(comm)
+    ...     return await inst.aquery("*IDN?")
+    >>> asyncio.run(main())  # doctest: +SKIP
+    """
+
+    @classmethod
+    async def open(cls, host, port):
+        """
+        Opens a TCP connection to the given host and port.
+
+        :param str host: Name or IP address of the instrument.
+        :param int port: TCP port on which the instrument is listening.
+        :rtype: `AsyncSocketCommunicator`
+        """
+        reader, writer = await asyncio.open_connection(
+            host, port, limit=cls.stream_limit
+        )
+        return cls(reader, writer)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""
+Provides a base class for asyncio communicators built on a
+`asyncio.StreamReader` and `asyncio.StreamWriter` pair.
+"""
+
+# IMPORTS #####################################################################
+
+
+import asyncio
+
+from instruments.abstract_instruments.comm import AsyncAbstractCommunicator
+
+# CLASSES #####################################################################
+
+
+class AsyncStreamCommunicator(AsyncAbstractCommunicator):
+    """
+    Communicates over a `asyncio.StreamReader` / `asyncio.StreamWriter`
+    pair, such as those returned by `asyncio.open_connection`.
+
+    :param reader: Stream from which instrument responses are read.
+    :type reader: `asyncio.StreamReader`
+    :param writer: Stream to which commands are written.
+    :type writer: `asyncio.StreamWriter`
+    """
+
+    #: Stream buffer limit used when this class opens streams itself.
+    stream_limit = 2**20
+
+    def __init__(self, reader, writer):
+        super().__init__()
+        if not isinstance(reader, asyncio.StreamReader):
+            raise TypeError(
+                f"{type(self).__name__} must wrap an asyncio.StreamReader, "
+                f"instead got {type(reader)}"
+            )
+        self._reader = reader
+        self._writer = writer
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Returns the peer address of the underlying transport, if known.
+        """
+        return self._writer.get_extra_info("peername")
+
+    @address.setter
+    def address(self, newval):
+        raise NotImplementedError("Unable to change address of streams.")
+
+    # METHODS #
+
+    async def read_raw(self, size=-1):
+        """
+        Read bytes in from the stream.
+
+        :param int size: The maximum number of bytes to read in from the
+            stream, or -1 to read until the termination character.
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        if size >= 0:
+            return await self._with_timeout(self._reader.read(size))
+        elif size == -1:
+            return await self._with_timeout(self._read_terminated())
+        else:
+            raise ValueError("Must read a positive value of characters.")
+
+    async def _read_terminated(self):
+        term = self._terminator.encode("utf-8")
+        if not term:
+            return await self._reader.read(self.stream_limit)
+        result = bytearray()
+        while True:
+            try:
+                chunk = await self._reader.readuntil(term)
+            except asyncio.LimitOverrunError as exc:
+                # Responses longer than the stream buffer limit are moved
+                # out of the stream buffer piecewise.
+                result += await self._reader.readexactly(exc.consumed)
+                continue
+            except asyncio.IncompleteReadError as exc:
+                raise OSError(
+                    "Connection closed before reading a termination character."
+                ) from exc
+            result += chunk[: -len(term)]
+            return bytes(result)
+
+    async def write_raw(self, msg):
+        """
+        Write bytes to the stream, waiting until it is safe to write more.
+
+        :param bytes msg: Bytes to be sent to the instrument.
+        """
+        self._writer.write(msg)
+        await self._writer.drain()
+
+    async def flush_input(self):
+        """
+        Instruct the communicator to flush the input buffer, discarding the
+        entirety of its contents.
+        """
+        _ = await self.read(-1)  # Read in everything in the buffer and trash it
+
+    async def close(self):
+        """
+        Close the underlying stream.
+        """
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (ConnectionError, BrokenPipeError):  # pragma: no cover
+            pass
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+"""
+Provides an arbiter used to serialize transactions from several instruments
+sharing a single physical communication channel.
+"""
+
+# IMPORTS #####################################################################
+
+
+import contextlib
+import heapq
+import itertools
+import threading
+import time
+
+from instruments.units import ureg as u
+
+# CLASSES #####################################################################
+
+
+class BusArbiter:
+    """
+    Grants exclusive access to a shared communication channel, such as a
+    serial port with several GPIB instruments behind one adapter, so that
+    each send-then-read transaction is atomic with respect to other threads.
+
+    Waiting transactions are granted the bus in order of priority, where
+    lower values are served first, and in arrival order for equal
+    priorities. The bus is handed directly to the next waiter on release, so
+    a thread that repeatedly polls cannot barge ahead of threads already
+    queued.
+
+    The arbiter is re-entrant: a thread that already holds the bus may open
+    nested transactions without blocking.
+
+    Example usage:
+
+    >>> from instruments.abstract_instruments.comm import BusArbiter
+    >>> arbiter = BusArbiter()
+    >>> with arbiter.transaction(priority=-1):
+    ...     pass  # exclusive access to the bus
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._owner = None
+        self._depth = 0
+        self._waiters = []
+        self._seq = itertools.count()
+
+        self._transactions = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._max_queue_depth = 0
+
+    # PROPERTIES #
+
+    @property
+    def queue_depth(self):
+        """
+        Gets the number of transactions currently waiting for the bus.
+
+        :type: `int`
+        """
+        return len(self._waiters)
+
+    @property
+    def stats(self):
+        """
+        Gets a snapshot of the arbiter statistics: the current and maximum
+        queue depth, the number of transactions granted, and the total,
+        mean and maximum time spent waiting for the bus.
+
+        :rtype: `dict`
+        """
+        with self._lock:
+            count = self._transactions
+            return {
+                "queue_depth": len(self._waiters),
+                "max_queue_depth": self._max_queue_depth,
+                "transactions": count,
+                "total_wait": u.Quantity(self._total_wait, u.second),
+                "mean_wait": u.Quantity(
+                    self._total_wait / count if count else 0.0, u.second
+                ),
+                "max_wait": u.Quantity(self._max_wait, u.second),
+            }
+
+    # METHODS #
+
+    def reset_stats(self):
+        """
+        Resets all accumulated statistics.
+        """
+        with self._lock:
+            self._transactions = 0
+            self._total_wait = 0.0
+            self._max_wait = 0.0
+            self._max_queue_depth = len(self._waiters)
+
+    def _record_wait(self, wait):
+        self._transactions += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+
+    def acquire(self, priority=0, timeout=None):
+        """
+        Blocks until the calling thread holds the bus.
+
+        :param int priority: Priority of this transaction. Lower values are
+            granted the bus first.
+        :param float timeout: Maximum number of seconds to wait, or `None`
+            to wait indefinitely.
+        :return: `True` if the bus was acquired, `False` on timeout.
+        :rtype: `bool`
+        """
+        me = threading.get_ident()
+        start = time.monotonic()
+        with self._lock:
+            if self._owner == me:
+                self._depth += 1
+                return True
+            if self._owner is None and not self._waiters:
+                self._owner = me
+                self._depth = 1
+                self._record_wait(0.0)
+                return True
+            event = threading.Event()
+            entry = (priority, next(self._seq), me, event)
+            heapq.heappush(self._waiters, entry)
+            self._max_queue_depth = max(self._max_queue_depth, len(self._waiters))
+
+        if not event.wait(timeout):
+            with self._lock:
+                # The bus may have been handed to us after the wait timed out.
+                if not event.is_set():
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    return False
+
+        with self._lock:
+            self._record_wait(time.monotonic() - start)
+        return True
+
+    def release(self):
+        """
+        Releases the bus held by the calling thread, handing it to the next
+        waiting transaction if there is one.
+        """
+        with self._lock:
+            if self._owner != threading.get_ident():
+                raise RuntimeError("Cannot release a bus that is not held.")
+            self._depth -= 1
+            if self._depth > 0:
+                return
+            if self._waiters:
+                _, _, owner, event = heapq.heappop(self._waiters)
+                self._owner = owner
+                self._depth = 1
+                event.set()
+            else:
+                self._owner = None
+
+    @contextlib.contextmanager
+    def transaction(self, priority=0, timeout=None):
+        """
+        Context manager holding the bus for the duration of the block.
+
+        :param int priority: Priority of this transaction. Lower values are
+            granted the bus first.
+        :param float timeout: Maximum number of seconds to wait, or `None`
+            to wait indefinitely.
+        :raises TimeoutError: If the bus could not be acquired in time.
+        """
+        if not self.acquire(priority, timeout):
+            raise TimeoutError("Timed out waiting for access to the shared bus.")
+        try:
+            yield self
+        finally:
+            self.release()
@@ -0,0 +1,400 @@
+#!/usr/bin/env python
+"""
+Provides lightweight counters, latency histograms and transaction hooks for
+communicators.
+"""
+
+# IMPORTS #####################################################################
+
+
+from collections import deque, namedtuple
+import threading
+
+from instruments.units import ureg as u
+
+# CONSTANTS ###################################################################
+
+#: Key under which commands are counted once `CommunicatorMetrics.max_prefixes`
+#: distinct prefixes have been seen.
+OTHER_PREFIX = "<other>"
+
+Transaction = namedtuple(
+    "Transaction", ["kind", "msg", "response", "start", "duration"]
+)
+Transaction.__doc__ = """
+A single command or query passed through a communicator.
+
+:param str kind: ``"sendcmd"`` or ``"query"``.
+:param str msg: The command or query sent.
+:param response: The response to a query, or `None` for commands.
+:param float start: Start time, from `time.perf_counter`, in seconds.
+:param float duration: Time taken, in seconds.
+"""
+
+KindTotals = namedtuple("KindTotals", ["count", "bytes_out", "bytes_in"])
+KindTotals.__doc__ = """
+Totals of the commands or queries passed through a communicator.
+
+:param int count: Number of transactions.
+:param int bytes_out: Encoded length of the messages sent, in bytes.
+:param int bytes_in: Encoded length of the responses read, in bytes.
+"""
+
+# FUNCTIONS ###################################################################
+
+
+def _encoded_len(data):
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    if isinstance(data, bytes):
+        return len(data)
+    return 0
+
+
+# CLASSES #####################################################################
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies with log-linear buckets, in the manner of an HDR
+    histogram. Each power of two of microseconds is split into 16 buckets,
+    so that recorded values are kept to within about 6% at any scale while
+    only occupied buckets use memory.
+    """
+
+    _SUB_BITS = 4
+    _SUB_COUNT = 1 << _SUB_BITS
+
+    def __init__(self):
+        self._counts = {}
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    @classmethod
+    def _index(cls, micros):
+        if micros < 2 * cls._SUB_COUNT:
+            return micros
+        shift = micros.bit_length() - cls._SUB_BITS - 1
+        return shift * cls._SUB_COUNT + (micros >> shift)
+
+    @classmethod
+    def _upper_bound(cls, idx):
+        if idx < 2 * cls._SUB_COUNT:
+            return idx + 1
+        shift = idx // cls._SUB_COUNT - 1
+        mantissa = idx % cls._SUB_COUNT + cls._SUB_COUNT
+        return (mantissa + 1) << shift
+
+    def record(self, seconds):
+        """
+        Adds a latency to the histogram.
+
+        :param float seconds: The latency, in seconds.
+        """
+        idx = self._index(int(seconds * 1e6))
+        self._counts[idx] = self._counts.get(idx, 0) + 1
+        self._count += 1
+        self._total += seconds
+        if seconds > self._max:
+            self._max = seconds
+
+    def _copy(self):
+        other = LatencyHistogram()
+        other._counts = dict(self._counts)
+        other._count = self._count
+        other._total = self._total
+        other._max = self._max
+        return other
+
+    @property
+    def count(self):
+        """
+        Gets the number of recorded latencies.
+
+        :type: `int`
+        """
+        return self._count
+
+    @property
+    def total(self):
+        """
+        Gets the sum of the recorded latencies.
+
+        :type: `~pint.Quantity`
+        :units: seconds
+        """
+        return self._total * u.second
+
+    @property
+    def mean(self):
+        """
+        Gets the mean of the recorded latencies.
+
+        :type: `~pint.Quantity`
+        :units: seconds
+        """
+        if self._count == 0:
+            return 0 * u.second
+        return self._total / self._count * u.second
+
+    @property
+    def max(self):
+        """
+        Gets the largest recorded latency.
+
+        :type: `~pint.Quantity`
+        :units: seconds
+        """
+        return self._max * u.second
+
+    def percentile(self, percent):
+        """
+        Gets an upper bound on the given percentile of the recorded
+        latencies, accurate to the bucket width.
+
+        :param float percent: Percentile to find, between 0 and 100.
+        :rtype: `~pint.Quantity`
+        :units: seconds
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Percentile must be between 0 and 100.")
+        if self._count == 0:
+            return 0 * u.second
+        target = max(1, percent / 100 * self._count)
+        seen = 0
+        for idx in sorted(self._counts):
+            seen += self._counts[idx]
+            if seen >= target:
+                break
+        return min(self._upper_bound(idx) / 1e6, self._max) * u.second
+
+
+class CommunicatorMetrics:
+    """
+    Always-on counters and per-command latency histograms for a
+    communicator, available as `AbstractCommunicator.metrics`.
+
+    Commands and queries are grouped by their prefix, which is the message up
+    to the first space, such as ``"VOLT"`` or ``"*IDN?"``. Byte counts are
+    the UTF-8 encoded lengths of the messages and responses, excluding
+    terminators and binary transfers read with
+    `~instruments.Instrument.binblockread`. Counts and byte totals are kept
+    separately for commands and queries, as given by `by_kind`.
+
+    For more detail, callbacks can be added with `add_hook`, and a ring
+    buffer of recent transactions can be kept by setting `history_size`.
+    Neither is active by default, so that the cost of each transaction is
+    only that of updating the counters.
+
+    The counters are updated under a lock, so that transactions made from
+    several threads through the same communicator are all counted. Hooks
+    are called outside of the lock, from the thread which made the
+    transaction.
+
+    Example usage:
+
+    >>> import instruments as ik
+    >>> inst = ik.Instrument.open_test()
+    >>> metrics = inst._file.metrics
+    >>> metrics.history_size = 100
+    >>> metrics.add_hook(print)  # doctest: +SKIP
+    >>> for prefix, hist in metrics.by_prefix().items():  # doctest: +SKIP
+    ...     print(prefix, hist.count, hist.percentile(99))
+    """
+
+    #: Maximum number of distinct command prefixes with their own histogram.
+    max_prefixes = 256
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hooks = []
+        self._history = None
+        self.reset()
+
+    # PROPERTIES #
+
+    @property
+    def history_size(self):
+        """
+        Gets/sets the number of recent transactions kept in `history`. Set
+        to 0 to stop keeping a history.
+
+        :type: `int`
+        """
+        return 0 if self._history is None else self._history.maxlen
+
+    @history_size.setter
+    def history_size(self, newval):
+        newval = int(newval)
+        if newval < 0:
+            raise ValueError("History size must be non-negative.")
+        with self._lock:
+            if newval == 0:
+                self._history = None
+            else:
+                self._history = deque(self._history or (), maxlen=newval)
+
+    @property
+    def history(self):
+        """
+        Gets the most recent transactions, oldest first.
+
+        :type: `list` of `Transaction`
+        """
+        with self._lock:
+            return [] if self._history is None else list(self._history)
+
+    @property
+    def commands(self):
+        """
+        Gets the number of commands sent.
+
+        :type: `int`
+        """
+        return self._totals("sendcmd").count
+
+    @property
+    def queries(self):
+        """
+        Gets the number of queries made.
+
+        :type: `int`
+        """
+        return self._totals("query").count
+
+    @property
+    def bytes_out(self):
+        """
+        Gets the number of bytes sent by commands and queries.
+
+        :type: `int`
+        """
+        return sum(totals.bytes_out for totals in self.by_kind().values())
+
+    @property
+    def bytes_in(self):
+        """
+        Gets the number of bytes read in response to queries.
+
+        :type: `int`
+        """
+        return sum(totals.bytes_in for totals in self.by_kind().values())
+
+    @property
+    def bus_time(self):
+        """
+        Gets the total time spent in commands and queries.
+
+        :type: `~pint.Quantity`
+        :units: seconds
+        """
+        with self._lock:
+            total = sum(hist._total for hist in self._prefixes.values())
+        return total * u.second
+
+    # METHODS #
+
+    def reset(self):
+        """
+        Resets all counters and histograms, and clears the history.
+        """
+        with self._lock:
+            self.errors = 0
+            self._kinds = {}
+            self._prefixes = {}
+            if self._history is not None:
+                self._history.clear()
+
+    def _totals(self, kind):
+        with self._lock:
+            return KindTotals(*self._kinds.get(kind, (0, 0, 0)))
+
+    def by_kind(self):
+        """
+        Gets a snapshot of the totals for each kind of transaction,
+        ``"sendcmd"`` and ``"query"``, which has been recorded.
+
+        :rtype: `dict` of `str` to `KindTotals`
+        """
+        with self._lock:
+            return {kind: KindTotals(*totals) for kind, totals in self._kinds.items()}
+
+    def by_prefix(self):
+        """
+        Gets a snapshot of the latency histogram for each command prefix.
+
+        :rtype: `dict` of `str` to `LatencyHistogram`
+        """
+        with self._lock:
+            return {prefix: hist._copy() for prefix, hist in self._prefixes.items()}
+
+    def add_hook(self, callback):
+        """
+        Adds a callback, called with a `Transaction` after each command or
+        query completes.
+
+        :param callable callback: Function taking a single `Transaction`.
+        """
+        with self._lock:
+            # The list is replaced rather than changed, so that transactions
+            # recorded meanwhile can call the hooks without holding the lock.
+            self._hooks = self._hooks + [callback]
+
+    def remove_hook(self, callback):
+        """
+        Removes a callback added with `add_hook`.
+
+        :param callable callback: The callback to remove.
+        """
+        with self._lock:
+            hooks = list(self._hooks)
+            hooks.remove(callback)
+            self._hooks = hooks
+
+    def record_error(self):
+        """
+        Counts a command or query which raised an exception. This is called
+        by `AbstractCommunicator.sendcmd` and `AbstractCommunicator.query`.
+        """
+        with self._lock:
+            self.errors += 1
+
+    def record(self, kind, msg, response, start, duration):
+        """
+        Records a completed command or query. This is called by
+        `AbstractCommunicator.sendcmd` and `AbstractCommunicator.query`.
+
+        :param str kind: ``"sendcmd"`` or ``"query"``, under which the
+            transaction is counted.
+        :param str msg: The command or query sent.
+        :param response: The response to a query, or `None` for commands.
+        :param float start: Start time, from `time.perf_counter`.
+        :param float duration: Time taken, in seconds.
+        """
+        bytes_out = _encoded_len(msg)
+        bytes_in = _encoded_len(response)
+        with self._lock:
+            totals = self._kinds.get(kind)
+            if totals is None:
+                totals = self._kinds[kind] = [0, 0, 0]
+            totals[0] += 1
+            totals[1] += bytes_out
+            totals[2] += bytes_in
+
+            prefix = msg.split(" ", 1)[0]
+            hist = self._prefixes.get(prefix)
+            if hist is None:
+                if len(self._prefixes) >= self.max_prefixes:
+                    prefix = OTHER_PREFIX
+                hist = self._prefixes.setdefault(prefix, LatencyHistogram())
+            hist.record(duration)
+
+            hooks = self._hooks
+            if self._history is None and not hooks:
+                return
+            transaction = Transaction(kind, msg, response, start, duration)
+            if self._history is not None:
+                self._history.append(transaction)
+        for hook in hooks:
+            hook(transaction)
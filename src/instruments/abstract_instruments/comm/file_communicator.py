@@ -8,10 +8,15 @@ Provides a communication layer for an instrument with a file on the filesystem
 
 import errno
 import io
+import os
+import select
 import time
 import logging
 
+from instruments.units import ureg as u
+
 from instruments.abstract_instruments.comm import AbstractCommunicator
+from instruments.util_fns import assume_units
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -30,9 +35,17 @@ class FileCommunicator(io.IOBase, AbstractCommunicator):
         ``rb+`` is recommended, and has been tested to work with character
         devices under Linux.
     :type filelike: `str` or `file`
+    :param bool poll: If `True`, responses are read by waiting for the
+        underlying file descriptor to become readable with ``poll``/``select``
+        and then reading everything available in large chunks, instead of
+        sleeping for a fixed delay and reading one byte at a time. This
+        requires a file-like object with a ``fileno`` on a POSIX system.
     """
 
-    def __init__(self, filelike):
+    #: Maximum number of bytes requested per ``os.readv`` in poll mode.
+    chunk_size = 65536
+
+    def __init__(self, filelike, poll=False):
         super().__init__(self)
         if isinstance(filelike, str):  # pragma: no cover
             filelike = open(filelike, "rb+")
@@ -41,6 +54,14 @@ class FileCommunicator(io.IOBase, AbstractCommunicator):
         self._terminator = "\n"
         self._testing = False
 
+        self._poll = False
+        self._poll_timeout = 3.0
+        self._poller = None
+        self._rx_buf = bytearray()
+        self._rx_chunk = None
+        if poll:
+            self.poll = True
+
     # PROPERTIES #
 
     @property
@@ -85,14 +106,60 @@ class FileCommunicator(io.IOBase, AbstractCommunicator):
     @property
     def timeout(self):
         """
+        Gets/sets the time to wait for the file to become readable when
+        `poll` is enabled.
+
         Getting and setting the timeout property for `FileCommunicator` is
-        not supported.
+        not supported when `poll` is disabled.
+
+        :type: `~pint.Quantity`
+        :units: As specified or assumed to be of units ``seconds``
         """
-        raise NotImplementedError
+        if not self._poll:
+            raise NotImplementedError
+        return self._poll_timeout * u.second
 
     @timeout.setter
     def timeout(self, newval):
-        raise NotImplementedError
+        if not self._poll:
+            raise NotImplementedError
+        self._poll_timeout = assume_units(newval, u.second).to(u.second).magnitude
+
+    @property
+    def poll(self):
+        """
+        Gets/sets whether responses are read by waiting for the file
+        descriptor to become readable, rather than by sleeping for a fixed
+        delay and reading one byte at a time.
+
+        :type: `bool`
+        """
+        return self._poll
+
+    @poll.setter
+    def poll(self, newval):
+        newval = bool(newval)
+        if newval == self._poll:
+            return
+        if newval:
+            try:
+                self._filelike.fileno()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                raise TypeError(
+                    "Poll mode requires a file-like object backed by a "
+                    "file descriptor."
+                )
+            if hasattr(select, "poll"):
+                self._poller = select.poll()
+                self._poller.register(self._filelike.fileno(), select.POLLIN)
+            else:  # pragma: no cover
+                self._poller = None
+            if self._rx_chunk is None:
+                self._rx_chunk = bytearray(self.chunk_size)
+        elif self._poller is not None:
+            self._poller.unregister(self._filelike.fileno())
+            self._poller = None
+        self._poll = newval
 
     # FILE-LIKE METHODS #
 
@@ -112,6 +179,8 @@ class FileCommunicator(io.IOBase, AbstractCommunicator):
         :param int size: The number of bytes to be read in from the file
         :rtype: `bytes`
         """
+        if self._poll:
+            return self._poll_read(size)
         if size >= 0:
             return self._filelike.read(size)
         elif size == -1:
@@ -127,6 +196,26 @@ class FileCommunicator(io.IOBase, AbstractCommunicator):
         else:
             raise ValueError("Must read a positive value of characters.")
 
+    def readinto(self, buffer):
+        """
+        Read bytes from the file directly into a writable buffer.
+
+        :param buffer: Buffer to fill, at most ``len(buffer)`` bytes are read.
+        :return: The number of bytes read
+        :rtype: `int`
+        """
+        view = memoryview(buffer).cast("B")
+        if self._poll:
+            nbytes = min(len(view), len(self._rx_buf))
+            view[:nbytes] = self._rx_buf[:nbytes]
+            del self._rx_buf[:nbytes]
+            if nbytes == 0 and len(view) > 0 and self._wait_readable():
+                nbytes = os.readv(self._filelike.fileno(), [view])
+            return nbytes
+        if hasattr(self._filelike, "readinto"):
+            return self._filelike.readinto(view) or 0
+        return super().readinto(view)
+
     def write_raw(self, msg):
         """
         Write bytes to the file.
@@ -157,10 +246,84 @@ class FileCommunicator(io.IOBase, AbstractCommunicator):
         """
         Flush the internal buffer to make sure everything has actually been
         written to the file. This can be equivalent to a no-op on some
-        filelike objects.
+        filelike objects. Any bytes read ahead in `poll` mode are discarded.
         """
+        self._rx_buf.clear()
         self._filelike.flush()
 
+    # POLL MODE #
+
+    def _wait_readable(self):
+        """
+        Blocks until the file descriptor is readable or the timeout expires.
+
+        :return: `True` if the file descriptor became readable.
+        :rtype: `bool`
+        """
+        if self._poller is not None:
+            return bool(self._poller.poll(self._poll_timeout * 1000))
+        readable, _, _ = select.select(  # pragma: no cover
+            [self._filelike], [], [], self._poll_timeout
+        )
+        return bool(readable)  # pragma: no cover
+
+    def _fill_buffer(self):
+        """
+        Waits for the file to become readable and appends everything that is
+        available, up to `chunk_size` bytes, to the read-ahead buffer.
+
+        :return: Number of bytes read, where 0 indicates end of file.
+        :rtype: `int`
+        """
+        if not self._wait_readable():
+            raise OSError(
+                errno.ETIMEDOUT,
+                f"Timed out waiting for a response from {self.address}.",
+            )
+        nbytes = os.readv(self._filelike.fileno(), [self._rx_chunk])
+        self._rx_buf += memoryview(self._rx_chunk)[:nbytes]
+        return nbytes
+
+    def _poll_read(self, size=-1):
+        """
+        Implementation of `read_raw` for `poll` mode.
+
+        :param int size: The number of bytes to be read in from the file, or
+            -1 to read until the termination character.
+        :rtype: `bytes`
+        """
+        if size == -1:
+            term = self._terminator.encode("utf-8")
+            start = 0
+            while True:
+                idx = self._rx_buf.find(term, start) if term else -1
+                if idx >= 0:
+                    result = bytes(self._rx_buf[:idx])
+                    del self._rx_buf[: idx + len(term)]
+                    return result
+                start = max(0, len(self._rx_buf) - len(term) + 1)
+                try:
+                    if self._fill_buffer() == 0:
+                        break
+                except OSError as ex:
+                    # As with the default mode, a timeout is not an error
+                    # if part of a response has already arrived.
+                    if ex.errno != errno.ETIMEDOUT or not self._rx_buf:
+                        raise
+                    break
+            result = bytes(self._rx_buf)
+            self._rx_buf.clear()
+            return result
+        elif size >= 0:
+            while len(self._rx_buf) < size:
+                if self._fill_buffer() == 0:
+                    break
+            result = bytes(self._rx_buf[:size])
+            del self._rx_buf[:size]
+            return result
+        else:
+            raise ValueError("Must read a positive value of characters.")
+
     # METHODS #
 
     def _sendcmd(self, msg):
@@ -193,6 +356,8 @@ class FileCommunicator(io.IOBase, AbstractCommunicator):
         :rtype: `str`
         """
         self.sendcmd(msg)
+        if self._poll:
+            return self.read(size)
         if not self._testing:
             time.sleep(0.02)  # Give the bus time to respond.
         resp = b""
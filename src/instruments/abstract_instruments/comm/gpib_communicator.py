@@ -7,18 +7,45 @@ Industries or Prologix GPIB adapter.
 # IMPORTS #####################################################################
 
 
+import contextlib
 from enum import Enum
 import io
 import time
+import weakref
 
 from instruments.units import ureg as u
 
 from instruments.abstract_instruments.comm import AbstractCommunicator
 from instruments.util_fns import assume_units
 
+# GLOBALS #####################################################################
+
+# Adapter state is keyed on the underlying communicator, so that every
+# GPIBCommunicator sharing one physical adapter (for example through
+# serial_manager) also shares its view of the adapter settings.
+_adapter_states = weakref.WeakKeyDictionary()
+
 # CLASSES #####################################################################
 
 
+class _AdapterState:
+    """
+    Tracks the settings last sent to a physical GPIB adapter, and the time of
+    the last I/O operation with it.
+    """
+
+    def __init__(self):
+        self.settings = {}
+        self.last_io = 0.0
+
+
+def _adapter_state(filelike):
+    try:
+        return _adapter_states.setdefault(filelike, _AdapterState())
+    except TypeError:  # Not weakly referenceable
+        return _AdapterState()
+
+
 class GPIBCommunicator(io.IOBase, AbstractCommunicator):
     """
     Communicates with a SocketCommunicator or SerialCommunicator object for
@@ -26,6 +53,10 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
 
     It essentially wraps those physical communication layers with the extra
     overhead required by the GPIB adapters.
+
+    The settings last sent to the adapter (address, EOI, EOS and timeout) are
+    tracked per physical adapter, and only the settings that differ from
+    those of the addressed instrument are re-sent before each command.
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -33,12 +64,18 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         super().__init__(self)
         self._model = self.Model(model)
         self._file = filelike
+        self._adapter = _adapter_state(filelike)
+        self._pacing = 0.01
         self._gpib_address = gpib_address
         self._file.terminator = "\r"
-        if self._model == GPIBCommunicator.Model.gi:
-            self._version = int(self._file.query("+ver"))
-        if self._model == GPIBCommunicator.Model.pl:
-            self._file.sendcmd("++auto 0")
+        # Other instruments behind the same adapter may be in the middle of
+        # a transaction.
+        arbiter = getattr(filelike, "arbiter", None)
+        with contextlib.nullcontext() if arbiter is None else arbiter.transaction():
+            if self._model == GPIBCommunicator.Model.gi:
+                self._version = int(self._file.query("+ver"))
+            if self._model == GPIBCommunicator.Model.pl:
+                self._file.sendcmd("++auto 0")
         self._terminator = None
         self.terminator = "\n"
         self._eoi = True
@@ -60,6 +97,9 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         #: Prologix, LLC
         pl = "pl"
 
+    # Prologix-style ``++eos`` codes for each supported EOS setting.
+    _EOS_CODES = {"\r\n": 0, "\r": 1, "\n": 2, None: 3}
+
     # PROPERTIES #
 
     @property
@@ -91,6 +131,20 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         else:
             raise TypeError("Not a valid input type for Instrument address.")
 
+    @property
+    def arbiter(self):
+        """
+        Gets/sets the `BusArbiter` of the underlying connection to the GPIB
+        adapter, which is shared by all instruments behind that adapter.
+
+        :type: `BusArbiter` or `None`
+        """
+        return getattr(self._file, "arbiter", None)
+
+    @arbiter.setter
+    def arbiter(self, newval):
+        self._file.arbiter = newval
+
     @property
     def timeout(self):
         """
@@ -105,14 +159,9 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
     @timeout.setter
     def timeout(self, newval):
         newval = assume_units(newval, u.second)
-        if self._model == GPIBCommunicator.Model.gi and self._version <= 4:
-            newval = newval.to(u.second)
-            self._file.sendcmd(f"+t:{int(newval.magnitude)}")
-        else:
-            newval = newval.to(u.millisecond)
-            self._file.sendcmd(f"++read_tmo_ms {int(newval.magnitude)}")
-        self._file.timeout = newval.to(u.second)
         self._timeout = newval.to(u.second)
+        self._send_setting("timeout", self._timeout_cmd())
+        self._file.timeout = self._timeout
 
     @property
     def terminator(self):
@@ -196,10 +245,7 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         if not isinstance(newval, bool):
             raise TypeError("EOI status must be specified as a boolean")
         self._eoi = newval
-        if self._model == GPIBCommunicator.Model.gi and self._version <= 4:
-            self._file.sendcmd("+eoi:{}".format("1" if newval else "0"))
-        else:
-            self._file.sendcmd("++eoi {}".format("1" if newval else "0"))
+        self._send_setting("eoi", self._eoi_cmd())
 
     @property
     def eos(self):
@@ -220,26 +266,33 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         if self._model == GPIBCommunicator.Model.gi and self._version <= 4:
             if isinstance(newval, (str, bytes)):
                 newval = ord(newval)
-            self._file.sendcmd(f"+eos:{newval}")
-            self._eos = newval
         else:
             if isinstance(newval, int):
                 newval = str(chr(newval))
-            if newval == "\r\n":
-                self._eos = newval
-                newval = 0
-            elif newval == "\r":
-                self._eos = newval
-                newval = 1
-            elif newval == "\n":
-                self._eos = newval
-                newval = 2
-            elif newval is None:
-                self._eos = newval
-                newval = 3
-            else:
+            if newval not in self._EOS_CODES:
                 raise ValueError("EOS must be CRLF, CR, LF, or None")
-            self._file.sendcmd(f"++eos {newval}")
+        self._eos = newval
+        self._send_setting("eos", self._eos_cmd())
+
+    @property
+    def pacing(self):
+        """
+        Gets/sets the minimum time between consecutive I/O operations with
+        the GPIB adapter. Rather than sleeping for a fixed time after every
+        operation, the communicator only waits for whatever remains of this
+        interval since the last read or write on the adapter.
+
+        :type: `~pint.Quantity`
+        :units: As specified, or assumed to be of units ``seconds``
+        """
+        return self._pacing * u.second
+
+    @pacing.setter
+    def pacing(self, newval):
+        newval = assume_units(newval, u.second).to(u.second).magnitude
+        if newval < 0:
+            raise ValueError("Pacing must be non-negative.")
+        self._pacing = newval
 
     # FILE-LIKE METHODS #
 
@@ -261,7 +314,24 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         :return: The read bytes from the connection
         :rtype: `bytes`
         """
-        return self._file.read_raw(size)
+        try:
+            return self._file.read_raw(size)
+        finally:
+            self._adapter.last_io = time.monotonic()
+
+    def readinto(self, buffer):
+        """
+        Read bytes from the gpibusb connection directly into a writable
+        buffer.
+
+        :param buffer: Buffer to fill, at most ``len(buffer)`` bytes are read.
+        :return: The number of bytes read
+        :rtype: `int`
+        """
+        try:
+            return self._file.readinto(buffer)
+        finally:
+            self._adapter.last_io = time.monotonic()
 
     def read(self, size=-1, encoding="utf-8"):
         """
@@ -280,7 +350,10 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         :return: Data read from the GPIB adapter
         :rtype: `str`
         """
-        return self._file.read(size, encoding)
+        try:
+            return self._file.read(size, encoding)
+        finally:
+            self._adapter.last_io = time.monotonic()
 
     def write_raw(self, msg):
         """
@@ -289,7 +362,9 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         :param bytes msg: Bytes to be sent to the instrument over the
             connection.
         """
+        self._wait_pacing()
         self._file.write_raw(msg)
+        self._adapter.last_io = time.monotonic()
 
     def write(self, msg, encoding="utf-8"):
         """
@@ -299,7 +374,9 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         :param str encoding: Encoding to apply on msg to convert the message
             into bytes
         """
+        self._wait_pacing()
         self._file.write(msg, encoding)
+        self._adapter.last_io = time.monotonic()
 
     def flush_input(self):
         """
@@ -310,6 +387,69 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
 
     # METHODS #
 
+    def _old_firmware(self):
+        return self._model == GPIBCommunicator.Model.gi and self._version <= 4
+
+    def _addr_cmd(self):
+        if self._model == GPIBCommunicator.Model.gi:
+            return f"+a:{str(self._gpib_address)}"
+        return f"++addr {str(self._gpib_address)}"
+
+    def _eoi_cmd(self):
+        if self._old_firmware():
+            return "+eoi:{}".format("1" if self._eoi else "0")
+        return "++eoi {}".format("1" if self._eoi else "0")
+
+    def _eos_cmd(self):
+        eos = self._eos
+        if self._old_firmware():
+            if isinstance(eos, (str, bytes)):
+                eos = ord(eos)
+            return f"+eos:{eos}"
+        if isinstance(eos, int):
+            eos = chr(eos)
+        return f"++eos {self._EOS_CODES[eos]}"
+
+    def _timeout_cmd(self):
+        if self._old_firmware():
+            return f"+t:{int(self._timeout.to(u.second).magnitude)}"
+        return f"++read_tmo_ms {int(self._timeout.to(u.millisecond).magnitude)}"
+
+    def _wait_pacing(self):
+        """
+        Sleeps for whatever remains of the pacing interval since the last
+        I/O operation with the adapter.
+        """
+        remaining = self._adapter.last_io + self._pacing - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _adapter_cmd(self, cmd):
+        """
+        Sends a command to the adapter itself, respecting the pacing interval.
+        """
+        self._wait_pacing()
+        self._file.sendcmd(cmd)
+        self._adapter.last_io = time.monotonic()
+
+    def _send_setting(self, name, cmd):
+        """
+        Sends an adapter setting command and records it as the adapter's
+        current state for that setting.
+        """
+        self._adapter_cmd(cmd)
+        self._adapter.settings[name] = cmd
+
+    def _sync_setting(self, name, cmd):
+        """
+        Sends an adapter setting command only if the adapter is not already
+        known to be in that state.
+        """
+        if self._adapter.settings.get(name) != cmd:
+            self._send_setting(name, cmd)
+            return True
+        return False
+
     def _sendcmd(self, msg):
         """
         This is the implementation of ``sendcmd`` for communicating with
@@ -317,25 +457,19 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         method `AbstractCommunicator.sendcmd` to provide consistent
         logging functionality across all communication layers.
 
+        Only the adapter settings that differ from those required by this
+        instrument are sent ahead of the command itself.
+
         :param str msg: The command message to send to the instrument
         """
-        sleep_time = 0.01
-
         if msg == "":
             return
-        if self._model == GPIBCommunicator.Model.gi:
-            self._file.sendcmd(f"+a:{str(self._gpib_address)}")
-        else:
-            self._file.sendcmd(f"++addr {str(self._gpib_address)}")
-        time.sleep(sleep_time)
-        self.eoi = self.eoi
-        time.sleep(sleep_time)
-        self.timeout = self.timeout
-        time.sleep(sleep_time)
-        self.eos = self.eos
-        time.sleep(sleep_time)
-        self._file.sendcmd(msg)
-        time.sleep(sleep_time)
+        self._sync_setting("addr", self._addr_cmd())
+        self._sync_setting("eoi", self._eoi_cmd())
+        if self._sync_setting("timeout", self._timeout_cmd()):
+            self._file.timeout = self._timeout
+        self._sync_setting("eos", self._eos_cmd())
+        self._adapter_cmd(msg)
 
     def _query(self, msg, size=-1):
         """
@@ -361,7 +495,11 @@ class GPIBCommunicator(io.IOBase, AbstractCommunicator):
         """
         self.sendcmd(msg)
         if self._model == GPIBCommunicator.Model.gi and "?" not in msg:
-            self._file.sendcmd("+read")
+            self._adapter_cmd("+read")
         if self._model == GPIBCommunicator.Model.pl:
-            self._file.sendcmd("++read")
-        return self._file.read(size).strip()
+            self._adapter_cmd("++read")
+        self._wait_pacing()
+        try:
+            return self._file.read(size).strip()
+        finally:
+            self._adapter.last_io = time.monotonic()
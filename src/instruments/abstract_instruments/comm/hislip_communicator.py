@@ -0,0 +1,485 @@
+#!/usr/bin/env python
+"""
+Provides a communicator for connecting with instruments using the HiSLIP
+(High-Speed LAN Instrument Protocol, IVI-6.1) protocol.
+"""
+
+# IMPORTS #####################################################################
+
+
+from enum import IntEnum
+import io
+import socket
+import struct
+
+from instruments.units import ureg as u
+
+from instruments.abstract_instruments.comm import AbstractCommunicator
+from instruments.util_fns import assume_units
+
+# CONSTANTS ###################################################################
+
+_HEADER = struct.Struct(">2sBBIQ")
+_PROLOGUE = b"HS"
+_SIZE = struct.Struct(">Q")
+
+#: Message ID of the first message after initialization or a device clear.
+_FIRST_MESSAGE_ID = 0xFFFFFF00
+
+# CLASSES #####################################################################
+
+
+class HiSLIPCommunicator(io.IOBase, AbstractCommunicator):
+    """
+    Communicates with an instrument using HiSLIP, a message-based protocol
+    over a pair of TCP connections which has much lower latency than VXI-11.
+    The synchronous channel carries commands and responses, and the
+    asynchronous channel carries out-of-band requests such as device clear.
+
+    Both synchronized mode and overlapped mode are supported. In
+    overlapped mode, several queries can be sent before their responses are
+    read, as done by `pipelined_query`. The mode requested with
+    ``overlapped`` is negotiated with the instrument when connecting, and
+    the mode in use is given by `overlapped`.
+
+    Messages longer than the largest message the instrument accepts, as
+    negotiated when connecting, are sent in several parts.
+
+    Use `~instruments.Instrument.open_hislip` to connect to an instrument.
+
+    :param sync_conn: Connection to the instrument for the synchronous
+        channel.
+    :type sync_conn: `socket.socket`
+    :param async_conn: Connection to the instrument for the asynchronous
+        channel.
+    :type async_conn: `socket.socket`
+    :param str sub_address: HiSLIP device sub-address, such as ``"hislip0"``.
+    :param bool overlapped: Request overlapped mode rather than synchronized
+        mode.
+    :param int max_message_size: Largest message, in bytes, which this
+        communicator accepts from the instrument.
+    """
+
+    class MessageType(IntEnum):
+        """
+        Enum containing HiSLIP message types
+        """
+
+        initialize = 0
+        initialize_response = 1
+        fatal_error = 2
+        error = 3
+        async_lock = 4
+        async_lock_response = 5
+        data = 6
+        data_end = 7
+        device_clear_complete = 8
+        device_clear_acknowledge = 9
+        async_remote_local_control = 10
+        async_remote_local_response = 11
+        trigger = 12
+        interrupted = 13
+        async_interrupted = 14
+        async_maximum_message_size = 15
+        async_maximum_message_size_response = 16
+        async_initialize = 17
+        async_initialize_response = 18
+        async_device_clear = 19
+        async_service_request = 20
+        async_status_query = 21
+        async_status_response = 22
+        async_device_clear_acknowledge = 23
+
+    #: Protocol version 1.0, as sent when connecting.
+    protocol_version = 0x0100
+
+    #: Two character vendor ID sent when connecting.
+    vendor_id = b"IK"
+
+    def __init__(
+        self,
+        sync_conn,
+        async_conn,
+        sub_address="hislip0",
+        overlapped=False,
+        max_message_size=2**20,
+    ):
+        super().__init__(self)
+        for conn in (sync_conn, async_conn):
+            if not isinstance(conn, socket.socket):
+                raise TypeError(
+                    "HiSLIPCommunicator must wrap "
+                    ":class:`socket.socket` objects, instead got "
+                    "{}".format(type(conn))
+                )
+        self._sync = sync_conn
+        self._async = async_conn
+        self._terminator = "\n"
+        self._rx_buf = bytearray()
+        self._rx_end = False
+        self._in_response = False
+        self._rmt_delivered = False
+        self._message_id = _FIRST_MESSAGE_ID
+        self._last_response_id = None
+        self._max_message_size = max_message_size
+
+        self._initialize(sub_address)
+        if overlapped != self._overlapped:
+            self.device_clear(overlapped=overlapped)
+
+    def _initialize(self, sub_address):
+        vendor = int.from_bytes(self.vendor_id, "big")
+        self._send(
+            self._sync,
+            self.MessageType.initialize,
+            param=(self.protocol_version << 16) | vendor,
+            payload=sub_address.encode("ascii"),
+        )
+        control, param, _ = self._expect(
+            self._sync, self.MessageType.initialize_response
+        )
+        self._overlapped = bool(control & 1)
+        self._session_id = param & 0xFFFF
+
+        self._send(
+            self._async, self.MessageType.async_initialize, param=self._session_id
+        )
+        self._expect(self._async, self.MessageType.async_initialize_response)
+
+        self._send(
+            self._async,
+            self.MessageType.async_maximum_message_size,
+            payload=_SIZE.pack(self._max_message_size),
+        )
+        _, _, payload = self._expect(
+            self._async, self.MessageType.async_maximum_message_size_response
+        )
+        self._server_max_message_size = _SIZE.unpack(payload)[0]
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Returns the peer address of the synchronous channel as a tuple.
+        """
+        return self._sync.getpeername()
+
+    @address.setter
+    def address(self, newval):
+        raise NotImplementedError("Unable to change address of sockets.")
+
+    @property
+    def terminator(self):
+        """
+        Gets/sets the termination character appended to commands and stripped
+        from responses. HiSLIP marks the end of each message itself, so this
+        may be set to an empty string.
+
+        :type: `str`
+        """
+        return self._terminator
+
+    @terminator.setter
+    def terminator(self, newval):
+        if isinstance(newval, bytes):
+            newval = newval.decode("utf-8")
+        if not isinstance(newval, str):
+            raise TypeError(
+                "Terminator for HiSLIP communicator must be "
+                "specified as a byte or unicode string."
+            )
+        self._terminator = newval
+
+    @property
+    def marks_message_end(self):
+        """
+        HiSLIP marks the end of each message, so this is always `True`.
+
+        :type: `bool`
+        """
+        return True
+
+    @property
+    def timeout(self):
+        """
+        Gets/sets the connection timeout of both HiSLIP channels.
+
+        :type: `~pint.Quantity`
+        :units: As specified or assumed to be of units ``seconds``
+        """
+        return self._sync.gettimeout() * u.second
+
+    @timeout.setter
+    def timeout(self, newval):
+        newval = assume_units(newval, u.second).to(u.second).magnitude
+        self._sync.settimeout(newval)
+        self._async.settimeout(newval)
+
+    @property
+    def overlapped(self):
+        """
+        Gets whether the connection is in overlapped mode, rather than
+        synchronized mode. Use `device_clear` to change mode.
+
+        :type: `bool`
+        """
+        return self._overlapped
+
+    @property
+    def session_id(self):
+        """
+        Gets the session ID assigned by the instrument.
+
+        :type: `int`
+        """
+        return self._session_id
+
+    @property
+    def max_message_size(self):
+        """
+        Gets the largest message, in bytes, accepted by the instrument.
+        Longer messages are sent in several parts.
+
+        :type: `int`
+        """
+        return self._server_max_message_size
+
+    # HISLIP MESSAGES #
+
+    @staticmethod
+    def _send(conn, msg_type, control=0, param=0, payload=b""):
+        header = _HEADER.pack(_PROLOGUE, msg_type, control, param, len(payload))
+        conn.sendall(header + payload)
+
+    @staticmethod
+    def _recv_exact(conn, size):
+        buf = bytearray(size)
+        view = memoryview(buf)
+        got = 0
+        while got < size:
+            nbytes = conn.recv_into(view[got:])
+            if nbytes == 0:
+                raise OSError("HiSLIP connection closed by the instrument.")
+            got += nbytes
+        return buf
+
+    def _recv(self, conn):
+        prologue, msg_type, control, param, length = _HEADER.unpack(
+            self._recv_exact(conn, _HEADER.size)
+        )
+        if prologue != _PROLOGUE:
+            raise OSError("Received a message that is not a HiSLIP message.")
+        payload = self._recv_exact(conn, length) if length else bytearray()
+        if msg_type in (self.MessageType.error, self.MessageType.fatal_error):
+            raise OSError(
+                "HiSLIP {} (code {}): {}".format(
+                    self.MessageType(msg_type).name.replace("_", " "),
+                    control,
+                    payload.decode("ascii", "replace"),
+                )
+            )
+        return msg_type, control, param, payload
+
+    def _expect(self, conn, msg_type):
+        got_type, control, param, payload = self._recv(conn)
+        if got_type != msg_type:
+            raise OSError(
+                "Expected HiSLIP message {}, got {}.".format(msg_type, got_type)
+            )
+        return control, param, payload
+
+    def _fetch(self):
+        """
+        Receives the next data message on the synchronous channel.
+        """
+        msg_type, _, param, payload = self._recv(self._sync)
+        if msg_type in (self.MessageType.data, self.MessageType.data_end):
+            self._rx_buf += payload
+            self._last_response_id = param
+            self._in_response = msg_type == self.MessageType.data
+            self._rx_end = not self._in_response
+        elif msg_type == self.MessageType.interrupted:
+            # The response being received was discarded by the instrument.
+            self._rx_buf.clear()
+            self._in_response = False
+        else:
+            raise OSError(f"Unexpected HiSLIP message {msg_type}.")
+
+    def _response_done(self):
+        self._rx_end = False
+        self._rmt_delivered = True
+
+    # FILE-LIKE METHODS #
+
+    def close(self):
+        """
+        Shutdown and close both HiSLIP connections.
+        """
+        for conn in (self._async, self._sync):
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            finally:
+                conn.close()
+
+    def read_raw(self, size=-1):
+        """
+        Read bytes of the response from the instrument.
+
+        :param int size: The number of bytes to read, or -1 to read the rest
+            of the current response.
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        if size == -1:
+            result = self.read_message()
+            term = self._terminator.encode("utf-8")
+            if term and result.endswith(term):
+                result = result[: -len(term)]
+            return result
+        elif size >= 0:
+            while len(self._rx_buf) < size and not self._rx_end:
+                self._fetch()
+            result = bytes(self._rx_buf[:size])
+            del self._rx_buf[:size]
+            if self._rx_end and not self._rx_buf:
+                self._response_done()
+            return result
+        else:
+            raise ValueError("Must read a positive value of characters.")
+
+    def read_message(self):
+        """
+        Read the rest of the current response from the instrument, without
+        stripping the terminator.
+
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        while not self._rx_end:
+            self._fetch()
+        result = bytes(self._rx_buf)
+        self._rx_buf.clear()
+        self._response_done()
+        return result
+
+    def write_raw(self, msg):
+        """
+        Send a complete message to the instrument, split into several parts if
+        it is longer than `max_message_size`.
+
+        :param bytes msg: Bytes to be sent to the instrument.
+        """
+        step = max(1, self._server_max_message_size)
+        view = memoryview(msg)
+        offsets = range(0, max(1, len(msg)), step)
+        for offset in offsets:
+            last = offset + step >= len(msg)
+            # In synchronized mode, tell the instrument whether the previous
+            # response has been read.
+            control = int(self._rmt_delivered and not self._overlapped)
+            self._rmt_delivered = False
+            self._send(
+                self._sync,
+                self.MessageType.data_end if last else self.MessageType.data,
+                control=control,
+                param=self._message_id,
+                payload=bytes(view[offset : offset + step]),
+            )
+        self._message_id = (self._message_id + 2) & 0xFFFFFFFF
+
+    def seek(self, offset):  # pylint: disable=unused-argument,no-self-use
+        raise NotImplementedError
+
+    def tell(self):  # pylint: disable=no-self-use
+        raise NotImplementedError
+
+    def flush_input(self):
+        """
+        Discard the response currently being received, if any.
+        """
+        while self._in_response:
+            self._fetch()
+        if self._rx_buf or self._rx_end:
+            self._rx_buf.clear()
+            self._response_done()
+
+    # METHODS #
+
+    def device_clear(self, overlapped=None):
+        """
+        Clears the instrument using the asynchronous channel, discarding any
+        pending commands and responses. This is also used to switch between
+        synchronized and overlapped mode.
+
+        :param bool overlapped: Mode to request, or `None` to keep the
+            current mode.
+        """
+        if overlapped is None:
+            overlapped = self._overlapped
+        self._send(self._async, self.MessageType.async_device_clear)
+        self._expect(self._async, self.MessageType.async_device_clear_acknowledge)
+        self._send(
+            self._sync,
+            self.MessageType.device_clear_complete,
+            control=int(bool(overlapped)),
+        )
+        while True:
+            msg_type, control, _, _ = self._recv(self._sync)
+            if msg_type == self.MessageType.device_clear_acknowledge:
+                break
+            # Anything else still in flight is discarded.
+        self._overlapped = bool(control & 1)
+        self._message_id = _FIRST_MESSAGE_ID
+        self._rx_buf.clear()
+        self._rx_end = False
+        self._in_response = False
+        self._rmt_delivered = False
+
+    def pipelined_query(self, msgs, size=-1):
+        """
+        Sends several queries and reads their responses. In overlapped mode,
+        all queries are sent before any response is read, so that the
+        instrument can work on them without waiting for a round trip per
+        query. In synchronized mode, the queries are made one at a time.
+
+        :param msgs: The query messages to send.
+        :type msgs: `list` of `str`
+        :param int size: The number of bytes to read back from each response.
+        :return: The responses, in the order of ``msgs``.
+        :rtype: `list` of `str`
+        """
+        if not self._overlapped:
+            return [self.query(msg, size) for msg in msgs]
+        for msg in msgs:
+            self._sendcmd(msg)
+        return [self.read(size) for _ in msgs]
+
+    def _sendcmd(self, msg):
+        """
+        This is the implementation of ``sendcmd`` for communicating with
+        HiSLIP connections. This function is in turn wrapped by the concrete
+        method `AbstractCommunicator.sendcmd` to provide consistent logging
+        functionality across all communication layers.
+
+        :param str msg: The command message to send to the instrument
+        """
+        self.write(msg + self._terminator)
+
+    def _query(self, msg, size=-1):
+        """
+        This is the implementation of ``query`` for communicating with
+        HiSLIP connections. This function is in turn wrapped by the concrete
+        method `AbstractCommunicator.query` to provide consistent logging
+        functionality across all communication layers.
+
+        :param str msg: The query message to send to the instrument
+        :param int size: The number of bytes to read back from the instrument
+            response.
+        :return: The instrument response to the query
+        :rtype: `str`
+        """
+        self.sendcmd(msg)
+        return self.read(size)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+"""
+Provides a server which owns the connection to an instrument and shares it
+with clients in other processes.
+"""
+
+# IMPORTS #####################################################################
+
+
+from concurrent import futures
+import math
+import socket
+import socketserver
+import threading
+import time
+
+from instruments.units import ureg as u
+
+from instruments.abstract_instruments.comm import AbstractCommunicator
+from instruments.abstract_instruments.comm.bus_arbiter import BusArbiter
+from instruments.abstract_instruments.comm.proxy_communicator import (
+    _HOLD,
+    _REPLY,
+    _REQUEST,
+    _Op,
+    _recv_exact,
+)
+from instruments.util_fns import assume_units
+
+# CLASSES #####################################################################
+
+
+class _ClientHandler(socketserver.BaseRequestHandler):
+    """
+    Serves the requests of one client, on a thread of its own.
+    """
+
+    def setup(self):
+        if self.request.family != getattr(socket, "AF_UNIX", None):
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.holding = False
+
+    def handle(self):
+        server = self.server.instrument_server
+        conn = self.request
+        try:
+            while True:
+                try:
+                    header = _recv_exact(conn, _REQUEST.size)
+                except OSError:
+                    return
+                op, flags, size, length = _REQUEST.unpack(header)
+                payload = bytes(_recv_exact(conn, length)) if length else b""
+                if op == _Op.release:
+                    self.release()
+                    continue
+                try:
+                    reply = server._perform(self, op, size, payload, flags & _HOLD)
+                    status = 0
+                except Exception as exc:  # pylint: disable=broad-except
+                    reply = f"{type(exc).__name__}: {exc}".encode("utf-8")
+                    status = 1
+                flags = _HOLD if self.holding else 0
+                conn.sendall(_REPLY.pack(status, flags, len(reply)) + reply)
+        finally:
+            self.release()
+
+    def release(self):
+        """
+        Releases the bus, if it is held for this client.
+        """
+        if self.holding:
+            self.holding = False
+            self.server.instrument_server.arbiter.release()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+else:  # pragma: no cover
+    _UnixServer = None
+
+
+class InstrumentServer:
+    """
+    Owns the connection to an instrument, such as a serial or GPIB
+    instrument which can only be opened by one process, and serves the
+    commands and queries of clients in other processes. Clients connect with
+    `~instruments.Instrument.open_proxy` or an ``ikproxy://`` URI, and use
+    the instrument as if they had opened it directly.
+
+    Each client is served on a thread of its own, and their transactions are
+    serialized by the `~instruments.abstract_instruments.comm.BusArbiter` of
+    the connection. A transaction of a client, such as a command followed by
+    reading its acknowledgement, is not interleaved with those of other
+    clients.
+
+    If ``cache_ttl`` and ``cacheable`` are given, replies to the queries
+    accepted by ``cacheable`` are kept for that long, so that several clients
+    polling the same value cost one transaction with the instrument. Clients
+    which ask for a value that is already being queried wait for that reply
+    rather than sending the query again. Any other command empties the
+    cache. Only queries without side effects should be cached, which rules
+    out queries such as ``*OPC?``, ``*ESR?``, ``SYST:ERR?``, ``READ?`` or
+    ``FETC?``, and only with instruments whose queries are not followed by
+    further reads, such as prompts.
+
+    Example usage, in the process owning the instrument:
+
+    >>> import instruments as ik
+    >>> from instruments.abstract_instruments.comm import InstrumentServer
+    >>> inst = ik.srs.SRS830.open_gpibusb("/dev/ttyUSB0", 1)  # doctest: +SKIP
+    >>> polled = {"TEMP?", "PRES?"}
+    >>> with InstrumentServer(
+    ...     inst, ("localhost", 5025), cache_ttl=0.005, cacheable=polled.__contains__
+    ... ) as server:  # doctest: +SKIP
+    ...     server.serve_forever()
+
+    and in each client process:
+
+    >>> inst = ik.srs.SRS830.open_from_uri("ikproxy://localhost:5025")  # doctest: +SKIP
+
+    :param instrument: The instrument or communicator whose connection is
+        to be served. It should not be used directly while being served.
+    :type instrument: `~instruments.Instrument` or
+        `~instruments.abstract_instruments.comm.AbstractCommunicator`
+    :param address: A ``(host, port)`` tuple to listen on TCP, or the path
+        of a Unix socket.
+    :param float cache_ttl: Number of seconds for which replies to cacheable
+        queries are reused, or `None` to always query the instrument.
+    :param callable cacheable: Given a query, returns whether its reply may
+        be reused. This must be given along with ``cache_ttl``.
+    """
+
+    def __init__(self, instrument, address, cache_ttl=None, cacheable=None):
+        if isinstance(instrument, AbstractCommunicator):
+            self._comm = instrument
+        else:
+            self._comm = instrument._file
+        if self._comm.arbiter is None:
+            self._comm.arbiter = BusArbiter()
+        if cache_ttl is not None and cacheable is None:
+            raise ValueError(
+                "Caching replies requires a cacheable predicate naming the "
+                "queries which are safe to cache."
+            )
+        self._cache_ttl = (
+            None
+            if cache_ttl is None
+            else assume_units(cache_ttl, u.second).to(u.second).magnitude
+        )
+        self._cacheable = cacheable
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+
+        if isinstance(address, str):
+            if _UnixServer is None:
+                raise NotImplementedError("Unix sockets are not supported here.")
+            self._server = _UnixServer(address, _ClientHandler)
+        else:
+            self._server = _TCPServer(address, _ClientHandler)
+        self._server.instrument_server = self
+        self._serving = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._serving:
+            self.shutdown()
+        self.close()
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Gets the address on which the server listens, which includes the
+        port picked by the system if it was given as 0.
+        """
+        return self._server.server_address
+
+    @property
+    def arbiter(self):
+        """
+        Gets the arbiter serializing the transactions of the clients.
+
+        :type: `~instruments.abstract_instruments.comm.BusArbiter`
+        """
+        return self._comm.arbiter
+
+    # METHODS #
+
+    def serve_forever(self, poll_interval=0.5):
+        """
+        Serves clients until `shutdown` is called.
+
+        :param float poll_interval: Number of seconds between checks for a
+            shutdown request.
+        """
+        self._serving = True
+        try:
+            self._server.serve_forever(poll_interval)
+        finally:
+            self._serving = False
+
+    def shutdown(self):
+        """
+        Stops `serve_forever`, from another thread. Clients which are
+        already connected are served until they disconnect.
+        """
+        self._server.shutdown()
+
+    def close(self):
+        """
+        Stops listening for clients.
+        """
+        self._server.server_close()
+
+    def invalidate_cache(self):
+        """
+        Discards all cached replies.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+
+    # PRIVATE METHODS #
+
+    def _on_bus(self, client, hold, fn, *args):
+        """
+        Calls ``fn`` holding the bus, and keeps holding it afterwards if the
+        request is part of a transaction of the client.
+        """
+        if client.holding:
+            return fn(*args)
+        if hold:
+            self.arbiter.acquire()
+            client.holding = True
+            return fn(*args)
+        with self.arbiter.transaction():
+            return fn(*args)
+
+    def _perform(self, client, op, size, payload, hold):
+        # pylint: disable=too-many-return-statements
+        comm = self._comm
+        if op == _Op.query:
+            cmd = payload.decode("utf-8")
+            if self._cache_ttl is not None and size == -1 and self._cacheable(cmd):
+                return self._cached_query(client, hold, cmd).encode("utf-8")
+            reply = self._on_bus(client, hold, comm.query, cmd, size)
+            self.invalidate_cache()
+            return reply.encode("utf-8")
+        if op == _Op.sendcmd:
+            self._on_bus(client, hold, comm.sendcmd, payload.decode("utf-8"))
+            self.invalidate_cache()
+            return b""
+        if op == _Op.read:
+            return self._on_bus(client, hold, comm.read_raw, size)
+        if op == _Op.write:
+            self._on_bus(client, hold, comm.write_raw, payload)
+            self.invalidate_cache()
+            return b""
+        if op == _Op.flush_input:
+            self._on_bus(client, hold, comm.flush_input)
+            return b""
+        if op == _Op.terminator:
+            if payload:
+                comm.terminator = payload.decode("utf-8")
+            return comm.terminator.encode("utf-8")
+        if op == _Op.timeout:
+            if payload:
+                comm.timeout = float(payload)
+            timeout = assume_units(comm.timeout, u.second).to(u.second).magnitude
+            return repr(float(timeout)).encode("ascii")
+        raise ValueError(f"Unknown request {op}.")
+
+    def _cached_query(self, client, hold, cmd):
+        """
+        Answers a read-only query from the cache, by waiting for the same
+        query from another client, or by querying the instrument.
+        """
+        with self._cache_lock:
+            entry = self._cache.get(cmd)
+            # Clients holding the bus cannot wait for a query which itself
+            # waits for the bus.
+            shared = (
+                entry is not None
+                and entry[0] > time.monotonic()
+                and (entry[1].done() or not client.holding)
+            )
+            if shared:
+                future = entry[1]
+            else:
+                future = futures.Future()
+                self._cache[cmd] = (math.inf, future)
+        if shared:
+            return future.result()
+        try:
+            reply = self._on_bus(client, hold, self._comm.query, cmd)
+        except BaseException as exc:
+            future.set_exception(exc)
+            with self._cache_lock:
+                if self._cache.get(cmd, (None, None))[1] is future:
+                    del self._cache[cmd]
+            raise
+        future.set_result(reply)
+        with self._cache_lock:
+            if self._cache.get(cmd, (None, None))[1] is future:
+                self._cache[cmd] = (time.monotonic() + self._cache_ttl, future)
+        return reply
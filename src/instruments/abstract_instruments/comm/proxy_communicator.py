@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+"""
+Provides a communicator for instruments whose connection is owned by an
+`~instruments.abstract_instruments.comm.InstrumentServer`, possibly in
+another process.
+"""
+
+# IMPORTS #####################################################################
+
+
+from enum import IntEnum
+import io
+import socket
+import struct
+import threading
+
+from instruments.units import ureg as u
+
+from instruments.abstract_instruments.comm import AbstractCommunicator
+from instruments.abstract_instruments.comm.bus_arbiter import BusArbiter
+from instruments.util_fns import assume_units
+
+# CONSTANTS ###################################################################
+
+#: Request header: operation, flags, read size and payload length.
+_REQUEST = struct.Struct(">BBiI")
+
+#: Reply header: status, flags and payload length.
+_REPLY = struct.Struct(">BBI")
+
+#: Flag of requests which are part of a transaction, asking the server to
+#: keep the bus until the end of the transaction, and of replies sent while
+#: the server holds the bus for the client.
+_HOLD = 1
+
+# FUNCTIONS ###################################################################
+
+
+def _recv_exact(conn, size):
+    """
+    Receives exactly ``size`` bytes from a socket.
+    """
+    buf = bytearray(size)
+    view = memoryview(buf)
+    got = 0
+    while got < size:
+        nbytes = conn.recv_into(view[got:])
+        if nbytes == 0:
+            raise OSError("Instrument server connection closed.")
+        got += nbytes
+    return buf
+
+
+# CLASSES #####################################################################
+
+
+class _Op(IntEnum):
+    """
+    Enum containing the operations which clients request from an
+    instrument server
+    """
+
+    sendcmd = 1
+    query = 2
+    read = 3
+    write = 4
+    flush_input = 5
+    release = 6
+    terminator = 7
+    timeout = 8
+
+
+class _ProxyArbiter(BusArbiter):
+    """
+    Arbiter of a `ProxyCommunicator`. Besides serializing the transactions
+    of threads in this process, it tells the server when a transaction
+    ends, so that the server can grant the bus to other clients.
+    """
+
+    def __init__(self, comm):
+        super().__init__()
+        self._comm = comm
+
+    def held(self):
+        """
+        Checks whether the calling thread holds the bus.
+        """
+        return self._owner == threading.get_ident()
+
+    def release(self):
+        if self.held() and self._depth == 1:
+            self._comm._end_transaction()
+        super().release()
+
+
+class ProxyCommunicator(io.IOBase, AbstractCommunicator):
+    """
+    Communicates with an instrument through an
+    `~instruments.abstract_instruments.comm.InstrumentServer`, which owns the
+    connection to the instrument and serves several clients, each of which
+    may be in a different process.
+
+    Each command, query or read is one round trip to the server. The
+    commands and reads of a transaction, such as a query followed by reading
+    its acknowledgement, are not interleaved with those of other clients.
+
+    Use `~instruments.Instrument.open_proxy` or an ``ikproxy://`` URI to
+    connect to a server.
+
+    :param conn: Connection to the instrument server.
+    :type conn: `socket.socket`
+    """
+
+    def __init__(self, conn):
+        super().__init__(self)
+        if not isinstance(conn, socket.socket):
+            raise TypeError(
+                "ProxyCommunicator must wrap a "
+                ":class:`socket.socket` object, instead got "
+                "{}".format(type(conn))
+            )
+        self._conn = conn
+        self._lock = threading.Lock()
+        self._holding = False
+        self._arbiter = _ProxyArbiter(self)
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Returns the address of the instrument server.
+        """
+        return self._conn.getpeername()
+
+    @address.setter
+    def address(self, newval):
+        raise NotImplementedError("Unable to change address of sockets.")
+
+    @property
+    def terminator(self):
+        """
+        Gets/sets the termination character of the connection owned by the
+        server. This is shared by all clients of the server.
+
+        :type: `str`
+        """
+        return self._request(_Op.terminator).decode("utf-8")
+
+    @terminator.setter
+    def terminator(self, newval):
+        if isinstance(newval, bytes):
+            newval = newval.decode("utf-8")
+        if not isinstance(newval, str):
+            raise TypeError(
+                "Terminator for ProxyCommunicator must be "
+                "specified as a byte or unicode string."
+            )
+        self._request(_Op.terminator, newval.encode("utf-8"))
+
+    @property
+    def timeout(self):
+        """
+        Gets/sets the timeout of the connection owned by the server. This is
+        shared by all clients of the server.
+
+        :type: `~pint.Quantity`
+        :units: As specified or assumed to be of units ``seconds``
+        """
+        return float(self._request(_Op.timeout)) * u.second
+
+    @timeout.setter
+    def timeout(self, newval):
+        newval = assume_units(newval, u.second).to(u.second).magnitude
+        self._request(_Op.timeout, repr(float(newval)).encode("ascii"))
+
+    # PROTOCOL #
+
+    def _request(self, op, payload=b"", size=0):
+        """
+        Sends a request to the server and returns the payload of its reply.
+        """
+        flags = _HOLD if self._arbiter.held() else 0
+        with self._lock:
+            self._conn.sendall(_REQUEST.pack(op, flags, size, len(payload)) + payload)
+            status, flags, length = _REPLY.unpack(_recv_exact(self._conn, _REPLY.size))
+            self._holding = bool(flags & _HOLD)
+            reply = bytes(_recv_exact(self._conn, length)) if length else b""
+        if status:
+            raise OSError(
+                "Instrument server error: {}".format(reply.decode("utf-8", "replace"))
+            )
+        return reply
+
+    def _end_transaction(self):
+        """
+        Lets the server grant the bus to other clients, if it is held for
+        this one. No reply is sent, so this does not cost a round trip.
+        """
+        with self._lock:
+            if self._holding:
+                self._conn.sendall(_REQUEST.pack(_Op.release, 0, 0, 0))
+                self._holding = False
+
+    # FILE-LIKE METHODS #
+
+    def close(self):
+        """
+        Shutdown and close the connection to the server.
+        """
+        try:
+            self._conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        finally:
+            self._conn.close()
+
+    def read_raw(self, size=-1):
+        """
+        Read bytes in from the instrument.
+
+        :param int size: The number of bytes to read, or -1 to read until
+            the termination character.
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        if size < -1:
+            raise ValueError("Must read a positive value of characters.")
+        return self._request(_Op.read, size=size)
+
+    def write_raw(self, msg):
+        """
+        Write bytes to the instrument.
+
+        :param bytes msg: Bytes to be sent to the instrument.
+        """
+        self._request(_Op.write, bytes(msg))
+
+    def seek(self, offset):  # pylint: disable=unused-argument,no-self-use
+        raise NotImplementedError
+
+    def tell(self):  # pylint: disable=no-self-use
+        raise NotImplementedError
+
+    def flush_input(self):
+        """
+        Instruct the server to discard any input waiting from the
+        instrument.
+        """
+        self._request(_Op.flush_input)
+
+    # METHODS #
+
+    def _sendcmd(self, msg):
+        """
+        This is the implementation of ``sendcmd`` for communicating through
+        an instrument server. This function is in turn wrapped by the
+        concrete method `AbstractCommunicator.sendcmd` to provide consistent
+        logging functionality across all communication layers.
+
+        :param str msg: The command message to send to the instrument
+        """
+        self._request(_Op.sendcmd, msg.encode("utf-8"))
+
+    def _query(self, msg, size=-1):
+        """
+        This is the implementation of ``query`` for communicating through an
+        instrument server. This function is in turn wrapped by the concrete
+        method `AbstractCommunicator.query` to provide consistent logging
+        functionality across all communication layers.
+
+        The command and its response are sent in one round trip.
+
+        :param str msg: The query message to send to the instrument
+        :param int size: The number of bytes to read back from the instrument
+            response.
+        :return: The instrument response to the query
+        :rtype: `str`
+        """
+        return self._request(_Op.query, msg.encode("utf-8"), size).decode("utf-8")
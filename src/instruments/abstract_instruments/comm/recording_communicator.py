@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+"""
+Provides a communicator that records a session with an instrument to a file,
+so that it can later be played back by `ReplayCommunicator`.
+"""
+
+# IMPORTS #####################################################################
+
+
+import struct
+import time
+
+from instruments.abstract_instruments.comm import AbstractCommunicator
+
+# CONSTANTS ###################################################################
+
+#: Identifies session recordings, followed by a format version byte.
+SESSION_MAGIC = b"IKSESS"
+SESSION_VERSION = 1
+
+#: Each record is a kind byte, the seconds elapsed since the previous record
+#: as a double, and the payload length, followed by the payload itself.
+RECORD_HEADER = struct.Struct("<cdI")
+
+KIND_WRITE = b"w"
+KIND_READ = b"r"
+KIND_SENDCMD = b"c"
+KIND_QUERY = b"q"
+KIND_FLUSH = b"f"
+
+# CLASSES #####################################################################
+
+
+class RecordingCommunicator(AbstractCommunicator):
+    """
+    Wraps another communicator, passing all traffic through to it while
+    logging every command, query, write and read, with the bytes exchanged
+    and the time between them, to a compact binary file. The recording can
+    be played back with `ReplayCommunicator` to exercise drivers and
+    parsing code against real traffic without the instrument.
+
+    Example usage:
+
+    >>> import instruments as ik
+    >>> from instruments.abstract_instruments.comm import RecordingCommunicator
+    >>> inst = ik.Instrument.open_tcpip("192.168.0.10", 5025)  # doctest: +SKIP
+    >>> inst._file = RecordingCommunicator(inst._file, "session.iks")  # doctest: +SKIP
+    >>> inst.query("*IDN?")  # doctest: +SKIP
+    >>> inst._file.close()  # doctest: +SKIP
+
+    :param comm: Communicator connected to the instrument.
+    :type comm: `AbstractCommunicator`
+    :param filename: Path of the recording to create, or a binary file-like
+        object to write it to.
+    :type filename: `str` or file-like
+    """
+
+    def __init__(self, comm, filename):
+        super().__init__(self)
+        if not isinstance(comm, AbstractCommunicator):
+            raise TypeError(
+                "RecordingCommunicator must wrap an AbstractCommunicator, "
+                f"instead got {type(comm)}"
+            )
+        self._comm = comm
+        if hasattr(filename, "write"):
+            self._record_file = filename
+        else:
+            self._record_file = open(filename, "wb")
+        self._record_file.write(SESSION_MAGIC + bytes([SESSION_VERSION]))
+        self._last_record = time.perf_counter()
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Gets/sets the address of the wrapped communicator.
+        """
+        return self._comm.address
+
+    @address.setter
+    def address(self, newval):
+        self._comm.address = newval
+
+    @property
+    def terminator(self):
+        """
+        Gets/sets the termination character of the wrapped communicator.
+
+        :type: `str`
+        """
+        return self._comm.terminator
+
+    @terminator.setter
+    def terminator(self, newval):
+        self._comm.terminator = newval
+
+    @property
+    def timeout(self):
+        """
+        Gets/sets the timeout of the wrapped communicator.
+        """
+        return self._comm.timeout
+
+    @timeout.setter
+    def timeout(self, newval):
+        self._comm.timeout = newval
+
+    @property
+    def arbiter(self):
+        """
+        Gets/sets the `BusArbiter` of the wrapped communicator.
+
+        :type: `BusArbiter` or `None`
+        """
+        return self._comm.arbiter
+
+    @arbiter.setter
+    def arbiter(self, newval):
+        self._comm.arbiter = newval
+
+    @property
+    def marks_message_end(self):
+        """
+        Checks whether the wrapped communicator marks the end of each
+        message.
+
+        :type: `bool`
+        """
+        return self._comm.marks_message_end
+
+    # METHODS #
+
+    def _record(self, kind, payload=b"", now=None):
+        """
+        Records an operation. Operations sending to the instrument are
+        timestamped before their I/O, with ``now``, and those reading from it
+        once their data has arrived.
+        """
+        if now is None:
+            now = time.perf_counter()
+        self._record_file.write(
+            RECORD_HEADER.pack(kind, now - self._last_record, len(payload))
+        )
+        self._record_file.write(payload)
+        self._last_record = now
+
+    def close(self):
+        """
+        Finish the recording and close the wrapped communicator.
+        """
+        self._record_file.close()
+        if hasattr(self._comm, "close"):
+            self._comm.close()
+
+    def read_raw(self, size=-1):
+        """
+        Read bytes in from the wrapped communicator, and record them.
+
+        :param int size: The number of bytes to read in from the
+            connection, or -1 to read until the terminator.
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        data = self._comm.read_raw(size)
+        self._record(KIND_READ, data)
+        return data
+
+    def read_message(self):
+        """
+        Read the rest of the current message from the wrapped communicator,
+        and record it.
+
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        data = self._comm.read_message()
+        self._record(KIND_READ, data)
+        return data
+
+    def readinto(self, buffer):
+        """
+        Read bytes from the wrapped communicator into a writable buffer, and
+        record them.
+
+        :param buffer: Buffer to fill, at most ``len(buffer)`` bytes are read.
+        :return: The number of bytes read
+        :rtype: `int`
+        """
+        view = memoryview(buffer).cast("B")
+        nbytes = self._comm.readinto(view)
+        self._record(KIND_READ, view[:nbytes])
+        return nbytes
+
+    def write_raw(self, msg):
+        """
+        Write bytes to the wrapped communicator, and record them.
+
+        :param bytes msg: Bytes to be sent to the instrument.
+        """
+        now = time.perf_counter()
+        self._comm.write_raw(msg)
+        self._record(KIND_WRITE, msg, now)
+
+    def flush_input(self):
+        """
+        Flush the input buffer of the wrapped communicator.
+        """
+        now = time.perf_counter()
+        self._comm.flush_input()
+        self._record(KIND_FLUSH, now=now)
+
+    def _sendcmd(self, msg):
+        """
+        Sends a command through the wrapped communicator, and records it.
+
+        :param str msg: The command message to send to the instrument
+        """
+        now = time.perf_counter()
+        self._comm._sendcmd(msg)  # pylint: disable=protected-access
+        self._record(KIND_SENDCMD, msg.encode("utf-8"), now)
+
+    def _query(self, msg, size=-1):
+        """
+        Sends a query through the wrapped communicator, and records both the
+        query and the response.
+
+        :param str msg: The query message to send to the instrument
+        :param int size: The number of bytes to read back from the instrument
+            response.
+        :return: The instrument response to the query
+        :rtype: `str`
+        """
+        now = time.perf_counter()
+        resp = self._comm._query(msg, size)  # pylint: disable=protected-access
+        self._record(KIND_QUERY, msg.encode("utf-8"), now)
+        self._record(KIND_READ, resp.encode("utf-8"))
+        return resp
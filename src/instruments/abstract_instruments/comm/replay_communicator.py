@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+"""
+Provides a communicator that plays back a session recorded by
+`RecordingCommunicator`.
+"""
+
+# IMPORTS #####################################################################
+
+
+import time
+
+from instruments.abstract_instruments.comm import AbstractCommunicator
+from instruments.abstract_instruments.comm.recording_communicator import (
+    KIND_FLUSH,
+    KIND_QUERY,
+    KIND_READ,
+    KIND_SENDCMD,
+    KIND_WRITE,
+    RECORD_HEADER,
+    SESSION_MAGIC,
+    SESSION_VERSION,
+)
+
+# CONSTANTS ###################################################################
+
+_KIND_NAMES = {
+    KIND_WRITE: "write",
+    KIND_READ: "read",
+    KIND_SENDCMD: "command",
+    KIND_QUERY: "query",
+    KIND_FLUSH: "input flush",
+}
+
+# CLASSES #####################################################################
+
+
+class ReplayCommunicator(AbstractCommunicator):
+    """
+    Plays back a session recorded by `RecordingCommunicator`, serving the
+    recorded responses to an instrument driver in place of the instrument.
+
+    The whole recording is loaded when the communicator is created, so that
+    replaying does no file I/O. By default responses are served as fast as
+    the driver asks for them, which isolates the overhead of the driver and
+    of parsing. With ``realtime=True``, each record is instead held back
+    until the time at which it occurred in the original session.
+
+    Example usage:
+
+    >>> import instruments as ik
+    >>> inst = ik.Instrument.open_replay("session.iks")  # doctest: +SKIP
+    >>> inst.query("*IDN?")  # doctest: +SKIP
+
+    :param filename: Path of the recording, or a binary file-like object to
+        read it from.
+    :type filename: `str` or file-like
+    :param bool realtime: Reproduce the timing of the original session.
+    :param bool verify: Check that commands, queries and writes sent by the
+        driver match those that were recorded, raising `ValueError` if not.
+    """
+
+    def __init__(self, filename, realtime=False, verify=True):
+        super().__init__(self)
+        self._terminator = "\n"
+        self._timeout = None
+        self.realtime = realtime
+        self.verify = verify
+
+        if hasattr(filename, "read"):
+            self._address = getattr(filename, "name", None)
+            data = filename.read()
+        else:
+            self._address = filename
+            with open(filename, "rb") as recording:
+                data = recording.read()
+        self._records = self._parse(data)
+        self._pos = 0
+        self._start = None
+
+    @staticmethod
+    def _parse(data):
+        header = SESSION_MAGIC + bytes([SESSION_VERSION])
+        if not data.startswith(header):
+            raise ValueError("Not a session recording of a supported version.")
+        records = []
+        offset = len(header)
+        elapsed = 0.0
+        while offset < len(data):
+            if offset + RECORD_HEADER.size > len(data):
+                raise ValueError("Session recording is truncated.")
+            kind, delta, length = RECORD_HEADER.unpack_from(data, offset)
+            offset += RECORD_HEADER.size
+            payload = data[offset : offset + length]
+            if len(payload) != length:
+                raise ValueError("Session recording is truncated.")
+            offset += length
+            elapsed += delta
+            records.append((kind, elapsed, payload))
+        return records
+
+    # PROPERTIES #
+
+    @property
+    def address(self):
+        """
+        Gets the name of the recording being played back.
+        """
+        return self._address
+
+    @address.setter
+    def address(self, newval):
+        raise NotImplementedError
+
+    @property
+    def terminator(self):
+        """
+        Gets/sets the termination character. This has no effect on the
+        replayed responses, which were recorded without terminators.
+
+        :type: `str`
+        """
+        return self._terminator
+
+    @terminator.setter
+    def terminator(self, newval):
+        if isinstance(newval, bytes):
+            newval = newval.decode("utf-8")
+        if not isinstance(newval, str):
+            raise TypeError(
+                "Terminator for replay communicator must be "
+                "specified as a byte or unicode string."
+            )
+        self._terminator = newval
+
+    @property
+    def timeout(self):
+        """
+        Gets/sets the timeout. This is stored, but has no effect on replay.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, newval):
+        self._timeout = newval
+
+    @property
+    def marks_message_end(self):
+        """
+        Recorded reads hold whole messages, so this is always `True`.
+
+        :type: `bool`
+        """
+        return True
+
+    @property
+    def remaining(self):
+        """
+        Gets the number of recorded records that have not been played back.
+
+        :type: `int`
+        """
+        return len(self._records) - self._pos
+
+    # METHODS #
+
+    def rewind(self):
+        """
+        Start playing the recording back from the beginning.
+        """
+        self._pos = 0
+        self._start = None
+
+    def _next(self, kind, payload=None):
+        """
+        Returns the payload of the next record, checking that it is of the
+        given kind and, when verifying, that it matches ``payload``.
+        """
+        if self._pos >= len(self._records):
+            raise OSError(
+                f"Session recording ended, but the driver attempted a "
+                f"{_KIND_NAMES[kind]}."
+            )
+        rec_kind, elapsed, rec_payload = self._records[self._pos]
+        if rec_kind != kind:
+            raise ValueError(
+                f"Expected a {_KIND_NAMES[kind]} at record {self._pos} of the "
+                f"session recording, but a {_KIND_NAMES.get(rec_kind, rec_kind)} was recorded."
+            )
+        if self.verify and payload is not None and payload != rec_payload:
+            raise ValueError(
+                f"{_KIND_NAMES[kind].capitalize()} {payload!r} does not match "
+                f"{rec_payload!r} at record {self._pos} of the session recording."
+            )
+        self._pos += 1
+
+        if self.realtime:
+            now = time.perf_counter()
+            if self._start is None:
+                self._start = now - elapsed
+            delay = self._start + elapsed - now
+            if delay > 0:
+                time.sleep(delay)
+        return rec_payload
+
+    def close(self):
+        """
+        Stops playback.
+        """
+        self._pos = len(self._records)
+
+    def read_raw(self, size=-1):
+        """
+        Plays back the next recorded read.
+
+        :param int size: Ignored, the recorded bytes are returned.
+        :rtype: `bytes`
+        """
+        return self._next(KIND_READ)
+
+    def read_message(self):
+        """
+        Plays back the next recorded read.
+
+        :rtype: `bytes`
+        """
+        return self._next(KIND_READ)
+
+    def write_raw(self, msg):
+        """
+        Plays back the next recorded write.
+
+        :param bytes msg: Bytes written by the driver.
+        """
+        self._next(KIND_WRITE, bytes(msg))
+
+    def flush_input(self):
+        """
+        Plays back the next recorded input flush.
+        """
+        self._next(KIND_FLUSH)
+
+    def _sendcmd(self, msg):
+        """
+        Plays back the next recorded command.
+
+        :param str msg: The command message sent by the driver.
+        """
+        self._next(KIND_SENDCMD, msg.encode("utf-8"))
+
+    def _query(self, msg, size=-1):
+        """
+        Plays back the next recorded query, returning the recorded response.
+
+        :param str msg: The query message sent by the driver.
+        :param int size: Ignored, the recorded response is returned.
+        :return: The recorded response to the query
+        :rtype: `str`
+        """
+        self._next(KIND_QUERY, msg.encode("utf-8"))
+        return self._next(KIND_READ).decode("utf-8")
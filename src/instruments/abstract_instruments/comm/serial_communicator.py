@@ -22,6 +22,10 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
     """
     Wraps a `pyserial.Serial` object to add a few properties as well as
     handling of termination characters.
+
+    Reads drain everything the port reports as waiting in a single call and
+    scan the accumulated bytes for the terminator. Bytes received past the
+    end of a terminated response are kept for the next read.
     """
 
     def __init__(self, conn):
@@ -31,6 +35,7 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
             self._conn = conn
             self._terminator = "\n"
             self._debug = False
+            self._rx_buf = bytearray()
         else:
             raise TypeError("SerialCommunicator must wrap a serial.Serial " "object.")
 
@@ -121,28 +126,76 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
         :rtype: `bytes`
         """
         if size >= 0:
-            resp = self._conn.read(size)
-            return resp
+            if not self._rx_buf:
+                return self._conn.read(size)
+            result = bytes(self._rx_buf[:size])
+            del self._rx_buf[:size]
+            if len(result) < size:
+                result += self._conn.read(size - len(result))
+            return result
         elif size == -1:
-            result = b""
-            # If the terminator is empty, we can't use endswith, but must
-            # read as many bytes as are available.
-            # On the other hand, if terminator is nonempty, we can check
-            # that the tail end of the buffer matches it.
-            c = None
-            term = self._terminator.encode("utf-8") if self._terminator else None
-            while not (result.endswith(term) if term is not None else c == b""):
-                c = self._conn.read(1)
-                if c == b"" and term is not None:
+            # If the terminator is empty, we can't search for it, but must
+            # read as many bytes as are available until the port times out.
+            if not self._terminator:
+                while True:
+                    chunk = self._read_chunk()
+                    if chunk == b"":
+                        break
+                    self._rx_buf += chunk
+                result = bytes(self._rx_buf)
+                self._rx_buf.clear()
+                return result
+
+            term = self._terminator.encode("utf-8")
+            start = 0
+            while True:
+                idx = self._rx_buf.find(term, start)
+                if idx >= 0:
+                    result = bytes(self._rx_buf[:idx])
+                    del self._rx_buf[: idx + len(term)]
+                    return result
+                # Multi-byte terminators may straddle two chunks, so only
+                # skip the part of the buffer that can't contain their start.
+                start = max(0, len(self._rx_buf) - len(term) + 1)
+                chunk = self._read_chunk()
+                if chunk == b"":
                     raise OSError(
                         "Serial connection timed out before reading "
                         "a termination character."
                     )
-                result += c
-            return result[: -len(term)] if term is not None else result
+                self._rx_buf += chunk
         else:
             raise ValueError("Must read a positive value of characters.")
 
+    def readinto(self, buffer):
+        """
+        Read bytes from the serial port directly into a writable buffer,
+        serving any bytes left over from a previous read first. Blocks until
+        the buffer is full or the port times out.
+
+        :param buffer: Buffer to fill, at most ``len(buffer)`` bytes are read.
+        :return: The number of bytes read
+        :rtype: `int`
+        """
+        view = memoryview(buffer).cast("B")
+        nbytes = min(len(view), len(self._rx_buf))
+        if nbytes:
+            view[:nbytes] = self._rx_buf[:nbytes]
+            del self._rx_buf[:nbytes]
+        if nbytes < len(view):
+            nbytes += self._conn.readinto(view[nbytes:])
+        return nbytes
+
+    def _read_chunk(self):
+        """
+        Reads everything currently waiting in the port's input buffer, or
+        blocks (up to the port timeout) for at least one byte if nothing is
+        waiting yet.
+
+        :rtype: `bytes`
+        """
+        return self._conn.read(max(1, self._conn.in_waiting))
+
     def write_raw(self, msg):
         """
         Write bytes to the `pyserial.Serial` object.
@@ -172,8 +225,10 @@ class SerialCommunicator(io.IOBase, AbstractCommunicator):
         Instruct the communicator to flush the input buffer, discarding the
         entirety of its contents.
 
-        Calls the pyserial flushInput() method.
+        Discards any bytes buffered by this communicator and calls the
+        pyserial flushInput() method.
         """
+        self._rx_buf.clear()
         self._conn.flushInput()
 
     # METHODS #
@@ -10,10 +10,11 @@ pyserial connections can be open at the same time to the same serial port.
 # IMPORTS #####################################################################
 
 
+import threading
 import weakref
 import serial
 
-from instruments.abstract_instruments.comm import SerialCommunicator
+from instruments.abstract_instruments.comm import BusArbiter, SerialCommunicator
 
 # GLOBALS #####################################################################
 
@@ -27,6 +28,10 @@ from instruments.abstract_instruments.comm import SerialCommunicator
 # for more details about what "great care" implies.
 serialObjDict = weakref.WeakValueDictionary()
 
+# Instruments may be opened from several threads, as by load_instruments, and
+# those sharing a port must get the same connection.
+_serial_lock = threading.Lock()
+
 # METHODS #####################################################################
 
 
@@ -40,6 +45,10 @@ def new_serial_connection(port, baud=460800, timeout=3, write_timeout=3, **kwarg
     such as the Galvant Industries GPIBUSB adapter can have multiple
     instruments on a single virtual serial port.
 
+    Each port is given a `BusArbiter`, through which `Instrument.sendcmd`
+    and `Instrument.query` make their transactions atomic when the
+    connection is shared between threads.
+
     :param str port: Port address for the serial port
     :param int baud: Baud rate for the serial port connection
     :param int timeout: Communication timeout for reading from the serial port
@@ -52,18 +61,21 @@ def new_serial_connection(port, baud=460800, timeout=3, write_timeout=3, **kwarg
     if not isinstance(port, str):
         raise TypeError("Serial port must be specified as a string.")
 
-    if port not in serialObjDict or serialObjDict[port] is None:
-        conn = SerialCommunicator(
-            serial.Serial(
-                port,
-                baudrate=baud,
-                timeout=timeout,
-                writeTimeout=write_timeout,
-                **kwargs
+    with _serial_lock:
+        conn = serialObjDict.get(port)
+        if conn is None:
+            conn = SerialCommunicator(
+                serial.Serial(
+                    port,
+                    baudrate=baud,
+                    timeout=timeout,
+                    writeTimeout=write_timeout,
+                    **kwargs
+                )
             )
-        )
-        serialObjDict[port] = conn
-    # pylint: disable=protected-access
-    if not serialObjDict[port]._conn.isOpen():
-        serialObjDict[port]._conn.open()
-    return serialObjDict[port]
+            conn.arbiter = BusArbiter()
+            serialObjDict[port] = conn
+        # pylint: disable=protected-access
+        if not conn._conn.isOpen():
+            conn._conn.open()
+    return conn
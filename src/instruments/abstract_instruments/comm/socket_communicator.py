@@ -24,14 +24,25 @@ class SocketCommunicator(io.IOBase, AbstractCommunicator):
     is used instead of `socket.makefile`, as that method does not support
     timeouts. We do not support all features of `file`-like objects here, but
     enough to make `~instrument.Instrument` happy.
+
+    Incoming data is received in large chunks into a preallocated buffer.
+    Any bytes received past the end of a terminated response are kept and
+    served to the next read, so a long reply only costs a handful of
+    ``recv`` calls instead of one per byte.
     """
 
+    #: Maximum number of bytes requested from the socket per ``recv_into``.
+    chunk_size = 65536
+
     def __init__(self, conn):
         super().__init__(self)
 
         if isinstance(conn, socket.socket):
             self._conn = conn
             self._terminator = "\n"
+            self._rx_buf = bytearray()
+            self._rx_chunk = bytearray(self.chunk_size)
+            self._rx_view = memoryview(self._rx_chunk)
         else:
             raise TypeError(
                 "SocketCommunicator must wrap a "
@@ -103,21 +114,50 @@ class SocketCommunicator(io.IOBase, AbstractCommunicator):
         :rtype: `bytes`
         """
         if size >= 0:
+            if self._rx_buf:
+                result = bytes(self._rx_buf[:size])
+                del self._rx_buf[:size]
+                return result
             return self._conn.recv(size)
         elif size == -1:
-            result = b""
-            while result.endswith(self._terminator.encode("utf-8")) is False:
-                c = self._conn.recv(1)
-                if c == b"":
+            term = self._terminator.encode("utf-8")
+            start = 0
+            while True:
+                idx = self._rx_buf.find(term, start)
+                if idx >= 0:
+                    result = bytes(self._rx_buf[:idx])
+                    del self._rx_buf[: idx + len(term)]
+                    return result
+                # The terminator may straddle two chunks, so only skip the
+                # part of the buffer that can no longer contain its start.
+                start = max(0, len(self._rx_buf) - len(term) + 1)
+                nbytes = self._conn.recv_into(self._rx_view)
+                if nbytes == 0:
                     raise OSError(
                         "Socket connection timed out before reading "
                         "a termination character."
                     )
-                result += c
-            return result[: -len(self._terminator)]
+                self._rx_buf += self._rx_view[:nbytes]
         else:
             raise ValueError("Must read a positive value of characters.")
 
+    def readinto(self, buffer):
+        """
+        Read bytes from the socket directly into a writable buffer, serving
+        any bytes left over from a previous read first.
+
+        :param buffer: Buffer to fill, at most ``len(buffer)`` bytes are read.
+        :return: The number of bytes read
+        :rtype: `int`
+        """
+        view = memoryview(buffer).cast("B")
+        if self._rx_buf:
+            nbytes = min(len(view), len(self._rx_buf))
+            view[:nbytes] = self._rx_buf[:nbytes]
+            del self._rx_buf[:nbytes]
+            return nbytes
+        return self._conn.recv_into(view)
+
     def write_raw(self, msg):
         """
         Write bytes to the `socket.socket` connection object.
@@ -149,6 +189,7 @@ class SocketCommunicator(io.IOBase, AbstractCommunicator):
         entirety of its contents.
         """
         _ = self.read(-1)  # Read in everything in the buffer and trash it
+        self._rx_buf.clear()
 
     # METHODS #
 
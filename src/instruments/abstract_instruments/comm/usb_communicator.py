@@ -9,9 +9,6 @@ connections.
 
 import io
 
-import usb.core
-import usb.util
-
 from instruments.abstract_instruments.comm import AbstractCommunicator
 from instruments.units import ureg as u
 from instruments.util_fns import assume_units
@@ -30,7 +27,15 @@ class USBCommunicator(io.IOBase, AbstractCommunicator):
     .. warning:: The operational status of this communicator is poorly tested.
     """
 
+    #: Largest single bulk read, in bytes, used to fetch sized responses such
+    #: as binary blocks. This is rounded to a whole number of packets.
+    chunk_size = 65536
+
     def __init__(self, dev):
+        # pylint: disable=import-outside-toplevel
+        import usb.core
+        import usb.util
+
         super().__init__(self)
         if not isinstance(dev, usb.core.Device):
             raise TypeError("USBCommunicator must wrap a usb.core.Device object.")
@@ -70,6 +75,7 @@ class USBCommunicator(io.IOBase, AbstractCommunicator):
         self._ep_in = ep_in
         self._ep_out = ep_out
         self._terminator = "\n"
+        self._rx_buf = bytearray()
 
     # PROPERTIES #
 
@@ -120,29 +126,70 @@ class USBCommunicator(io.IOBase, AbstractCommunicator):
         """
         Shutdown and close the USB connection
         """
+        import usb.util  # pylint: disable=import-outside-toplevel
+
         self._dev.reset()
         usb.util.dispose_resources(self._dev)
 
     def read_raw(self, size=-1):
         """Read raw string back from device and return.
 
-        String returned is most likely shorter than the size requested. Will
-        terminate by itself.
-        Read size of -1 will be transformed into 1000 bytes.
+        With a size of -1, packets are read until the terminator is found,
+        and the response up to the terminator is returned. Otherwise, up to
+        ``size`` bytes are read using bulk reads of up to `chunk_size` bytes,
+        stopping early if the device ends its transfer. Bytes received beyond
+        the requested response are kept for the next read.
 
         :param size: Size to read in bytes
         :type size: int
         """
         if size == -1:
-            size = self._max_packet_size
+            return self._read_terminated()
+        if size < 0:
+            raise ValueError("Must read a positive value of characters.")
+
+        packet = self._max_packet_size
+        while len(self._rx_buf) < size:
+            # Request whole packets, so that the device can't overflow
+            # the transfer.
+            request = min(self.chunk_size, size - len(self._rx_buf))
+            request = -(-request // packet) * packet
+            data = self._ep_in.read(request)
+            self._rx_buf += data
+            if len(data) < request:
+                # A short packet ends the transfer.
+                break
+        result = bytes(self._rx_buf[:size])
+        del self._rx_buf[:size]
+        return result
+
+    def _read_terminated(self):
         term = self._terminator.encode("utf-8")
-        read_val = bytes(self._ep_in.read(size))
-        if term not in read_val:
-            raise OSError(
-                f"Did not find the terminator in the returned string. "
-                f"Total size of {size} might not be enough."
-            )
-        return read_val.rstrip(term)
+        if not term:
+            # Without a terminator, return whatever the next transfer holds.
+            if not self._rx_buf:
+                self._rx_buf += self._ep_in.read(self._max_packet_size)
+            result = bytes(self._rx_buf)
+            self._rx_buf.clear()
+            return result
+        start = 0
+        while True:
+            idx = self._rx_buf.find(term, start)
+            if idx != -1:
+                result = bytes(self._rx_buf[:idx])
+                del self._rx_buf[: idx + len(term)]
+                return result
+            # The terminator may straddle two packets.
+            start = max(0, len(self._rx_buf) - len(term) + 1)
+            data = self._ep_in.read(self._max_packet_size)
+            self._rx_buf += data
+            if term not in self._rx_buf[start:] and len(data) < self._max_packet_size:
+                received = len(self._rx_buf)
+                self._rx_buf.clear()
+                raise OSError(
+                    f"Did not find the terminator in the returned string. "
+                    f"The transfer ended after {received} bytes."
+                )
 
     def write_raw(self, msg):
         """Write bytes to the raw usb connection object.
@@ -163,6 +210,7 @@ class USBCommunicator(io.IOBase, AbstractCommunicator):
         Instruct the communicator to flush the input buffer, discarding the
         entirety of its contents.
         """
+        self._rx_buf.clear()
         self._ep_in.read(self._max_packet_size)
 
     # METHODS #
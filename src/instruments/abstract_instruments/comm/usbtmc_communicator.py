@@ -9,8 +9,6 @@ instruments.
 
 import io
 
-import usbtmc
-
 from instruments.abstract_instruments.comm import AbstractCommunicator
 from instruments.util_fns import assume_units
 from instruments.units import ureg as u
@@ -24,8 +22,10 @@ class USBTMCCommunicator(io.IOBase, AbstractCommunicator):
     """
 
     def __init__(self, *args, **kwargs):
-        if usbtmc is None:
-            raise ImportError("usbtmc is required for TMC instruments.")
+        try:
+            import usbtmc  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise ImportError("usbtmc is required for TMC instruments.") from err
         super().__init__(self)
 
         self._filelike = usbtmc.Instrument(*args, **kwargs)
@@ -62,6 +62,15 @@ class USBTMCCommunicator(io.IOBase, AbstractCommunicator):
         self._terminator = newval
         self._filelike.term_char = ord(newval)
 
+    @property
+    def marks_message_end(self):
+        """
+        USBTMC marks the end of each message, so this is always `True`.
+
+        :type: `bool`
+        """
+        return True
+
     @property
     def timeout(self):
         """
@@ -114,6 +123,21 @@ class USBTMCCommunicator(io.IOBase, AbstractCommunicator):
         """
         return self._filelike.read_raw(num=size)
 
+    def read_message(self):
+        """
+        Read bytes in from the usbtmc connection up to the end of the
+        current message, ignoring the termination character.
+
+        :return: The read bytes
+        :rtype: `bytes`
+        """
+        term_char = self._filelike.term_char
+        self._filelike.term_char = None
+        try:
+            return self._filelike.read_raw()
+        finally:
+            self._filelike.term_char = term_char
+
     def write(self, msg, encoding="utf-8"):
         """
         Write a string to the usbtmc connection. This string will be converted
@@ -9,8 +9,6 @@ library.
 
 import io
 
-import pyvisa
-
 from instruments.abstract_instruments.comm import AbstractCommunicator
 from instruments.util_fns import assume_units
 from instruments.units import ureg as u
@@ -25,6 +23,8 @@ class VisaCommunicator(io.IOBase, AbstractCommunicator):
     """
 
     def __init__(self, conn):
+        import pyvisa  # pylint: disable=import-outside-toplevel
+
         super().__init__(self)
 
         self._terminator = None
@@ -92,6 +92,18 @@ class VisaCommunicator(io.IOBase, AbstractCommunicator):
         self.read_termination = newval
         self.write_termination = newval
 
+    @property
+    def marks_message_end(self):
+        """
+        Checks whether the VISA resource marks the end of each message,
+        which all but serial resources do.
+
+        :type: `bool`
+        """
+        import pyvisa  # pylint: disable=import-outside-toplevel
+
+        return self._conn.interface_type != pyvisa.constants.InterfaceType.asrl
+
     @property
     def timeout(self):
         return self._conn.timeout * u.second
@@ -152,6 +164,23 @@ class VisaCommunicator(io.IOBase, AbstractCommunicator):
             )
         return msg
 
+    def read_message(self):
+        """
+        Read bytes in from the VISA connection up to the end of the current
+        message, ignoring the read termination.
+
+        :return: The read bytes from the VISA connection
+        :rtype: `bytes`
+        """
+        read_termination = self._conn.read_termination
+        self._conn.read_termination = None
+        try:
+            msg = self._buf + self._conn.read_raw()
+        finally:
+            self._conn.read_termination = read_termination
+        self._buf = bytearray()
+        return bytes(msg)
+
     def write_raw(self, msg):
         """
         Write bytes to the VISA connection.
@@ -10,8 +10,6 @@ VXI11 devices.
 import io
 import logging
 
-import vxi11
-
 from instruments.abstract_instruments.comm import AbstractCommunicator
 
 logger = logging.getLogger(__name__)
@@ -39,10 +37,12 @@ class VXI11Communicator(io.IOBase, AbstractCommunicator):
 
     def __init__(self, *args, **kwargs):
         super().__init__(self)
-        if vxi11 is None:
+        try:
+            import vxi11  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
             raise ImportError(
                 "Package python-vxi11 is required for XVI11 " "connected instruments."
-            )
+            ) from err
         AbstractCommunicator.__init__(self)
 
         self._inst = vxi11.Instrument(*args, **kwargs)
@@ -87,6 +87,15 @@ class VXI11Communicator(io.IOBase, AbstractCommunicator):
             )
         self._inst.term_char = newval
 
+    @property
+    def marks_message_end(self):
+        """
+        VXI-11 marks the end of each message, so this is always `True`.
+
+        :type: `bool`
+        """
+        return True
+
     @property
     def timeout(self):
         """
@@ -122,6 +131,20 @@ class VXI11Communicator(io.IOBase, AbstractCommunicator):
         """
         return self._inst.read_raw(num=size)
 
+    def read_message(self):
+        """
+        Read bytes in from the vxi11 connection up to the end of the current
+        message, ignoring the termination character.
+
+        :rtype: `bytes`
+        """
+        term_char = self._inst.term_char
+        self._inst.term_char = None
+        try:
+            return self._inst.read_raw()
+        finally:
+            self._inst.term_char = term_char
+
     def write_raw(self, msg):
         """
         Write bytes to the vxi11 connection.
@@ -8,17 +8,18 @@ Provides the base Instrument class for all instruments.
 
 import os
 import collections
+import contextlib
 import socket
 import struct
 import typing_extensions
 import urllib.parse as parse
 
+import serial
 from serial import SerialException
-from serial.tools.list_ports import comports
-import pyvisa
-import usb.core
 
 from instruments.abstract_instruments.comm import (
+    AsyncAbstractCommunicator,
+    AsyncLoopbackCommunicator,
     SocketCommunicator,
     USBCommunicator,
     VisaCommunicator,
@@ -26,18 +27,47 @@ from instruments.abstract_instruments.comm import (
     LoopbackCommunicator,
     GPIBCommunicator,
     AbstractCommunicator,
+    HiSLIPCommunicator,
+    ProxyCommunicator,
+    ReplayCommunicator,
     USBTMCCommunicator,
     VXI11Communicator,
     serial_manager,
 )
+from instruments.abstract_instruments.accessor_replay import (
+    AsyncBridge,
+    PendingIO,
+    aperform_io,
+    driver_view,
+    overrides_io,
+    replay_property,
+)
 from instruments.optional_dep_finder import numpy
 from instruments.errors import AcknowledgementError, PromptError
+from instruments.util_fns import _IDX_REGEX
+
+# PyVISA, PyUSB and pyserial's port listing are imported by the functions
+# which use them, so that they are not loaded by ``import instruments``.
 
 # CONSTANTS ###################################################################
 
 _DEFAULT_FORMATS = collections.defaultdict(lambda: ">b")
 _DEFAULT_FORMATS.update({1: ">b", 2: ">h", 4: ">i"})
 
+# FUNCTIONS ###################################################################
+
+
+def comports():
+    """
+    Lists the serial ports of this computer, as `serial.tools.list_ports.comports`
+    does.
+    """
+    # pylint: disable=import-outside-toplevel
+    from serial.tools.list_ports import comports as _comports
+
+    return _comports()
+
+
 # CLASSES #####################################################################
 
 
@@ -51,7 +81,7 @@ class Instrument:
 
     def __init__(self, filelike, *args, **kwargs):
         # Check to make sure filelike is a subclass of AbstractCommunicator
-        if isinstance(filelike, AbstractCommunicator):
+        if isinstance(filelike, (AbstractCommunicator, AsyncAbstractCommunicator)):
             self._file = filelike
         else:
             raise TypeError(
@@ -61,10 +91,17 @@ class Instrument:
             )
         # Record if we're using the Loopback Communicator and put class in
         # testing mode so we can disable sleeps in class implementations
-        self._testing = isinstance(self._file, LoopbackCommunicator)
+        self._testing = isinstance(
+            self._file, (LoopbackCommunicator, AsyncLoopbackCommunicator)
+        )
 
         self._prompt = None
         self._terminator = "\n"
+        self._bus_priority = 0
+        self._property_cache = {}
+        self._cache_dependents = {}
+        self._cache_bypass = 0
+        self._magnitude_mode = 0
 
     # COMMAND-HANDLING METHODS #
 
@@ -87,28 +124,30 @@ class Instrument:
         :param str cmd: String containing the command to
             be sent.
         """
-        self._file.sendcmd(str(cmd))
-        ack_expected_list = self._ack_expected(
-            cmd
-        )  # pylint: disable=assignment-from-none
-        if not isinstance(ack_expected_list, (list, tuple)):
-            ack_expected_list = [ack_expected_list]
-        for ack_expected in ack_expected_list:
-            if ack_expected is None:
-                break
-            ack = self.read()
-            if ack != ack_expected:
-                raise AcknowledgementError(
-                    "Incorrect ACK message received: got {} "
-                    "expected {}".format(ack, ack_expected)
-                )
-        if self.prompt is not None:
-            prompt = self.read(len(self.prompt))
-            if prompt != self.prompt:
-                raise PromptError(
-                    "Incorrect prompt message received: got {} "
-                    "expected {}".format(prompt, self.prompt)
-                )
+        with self.transaction():
+            self._invalidate_cache_on(cmd)
+            self._file.sendcmd(str(cmd))
+            ack_expected_list = self._ack_expected(
+                cmd
+            )  # pylint: disable=assignment-from-none
+            if not isinstance(ack_expected_list, (list, tuple)):
+                ack_expected_list = [ack_expected_list]
+            for ack_expected in ack_expected_list:
+                if ack_expected is None:
+                    break
+                ack = self.read()
+                if ack != ack_expected:
+                    raise AcknowledgementError(
+                        "Incorrect ACK message received: got {} "
+                        "expected {}".format(ack, ack_expected)
+                    )
+            if self.prompt is not None:
+                prompt = self.read(len(self.prompt))
+                if prompt != self.prompt:
+                    raise PromptError(
+                        "Incorrect prompt message received: got {} "
+                        "expected {}".format(prompt, self.prompt)
+                    )
 
     def query(self, cmd, size=-1):
         """
@@ -122,30 +161,31 @@ class Instrument:
             connected instrument.
         :rtype: `str`
         """
-        ack_expected_list = self._ack_expected(
-            cmd
-        )  # pylint: disable=assignment-from-none
-        if not isinstance(ack_expected_list, (list, tuple)):
-            ack_expected_list = [ack_expected_list]
-
-        if ack_expected_list[0] is None:  # Case no ACK
-            value = self._file.query(cmd, size)
-        else:  # Case with ACKs
-            _ = self._file.query(cmd, size=0)  # Send the cmd, don't read
-            for ack_expected in ack_expected_list:  # Read and verify ACKs
-                ack = self.read()
-                if ack != ack_expected:
-                    raise AcknowledgementError(
-                        f"Incorrect ACK message received: got {ack} expected {ack_expected}"
+        with self.transaction():
+            ack_expected_list = self._ack_expected(
+                cmd
+            )  # pylint: disable=assignment-from-none
+            if not isinstance(ack_expected_list, (list, tuple)):
+                ack_expected_list = [ack_expected_list]
+
+            if ack_expected_list[0] is None:  # Case no ACK
+                value = self._file.query(cmd, size)
+            else:  # Case with ACKs
+                _ = self._file.query(cmd, size=0)  # Send the cmd, don't read
+                for ack_expected in ack_expected_list:  # Read and verify ACKs
+                    ack = self.read()
+                    if ack != ack_expected:
+                        raise AcknowledgementError(
+                            f"Incorrect ACK message received: got {ack} expected {ack_expected}"
+                        )
+                value = self.read(size)  # Now read in our return data
+            if self.prompt is not None:
+                prompt = self.read(len(self.prompt))
+                if prompt != self.prompt:
+                    raise PromptError(
+                        f"Incorrect prompt message received: got {prompt} expected {self.prompt}"
                     )
-            value = self.read(size)  # Now read in our return data
-        if self.prompt is not None:
-            prompt = self.read(len(self.prompt))
-            if prompt != self.prompt:
-                raise PromptError(
-                    f"Incorrect prompt message received: got {prompt} expected {self.prompt}"
-                )
-        return value
+            return value
 
     def read(self, size=-1, encoding="utf-8"):
         """
@@ -171,8 +211,111 @@ class Instrument:
         """
         return self._file.read_raw(size)
 
+    def transaction(self, timeout=None):
+        """
+        Returns a context manager that holds exclusive access to a shared
+        communication channel for the duration of the block, so that a group
+        of commands and reads is not interleaved with those of other threads
+        using the same channel. `sendcmd` and `query` already run inside
+        their own transaction; nested transactions do not block.
+
+        If the communicator is not shared, this does nothing.
+
+        :param float timeout: Maximum number of seconds to wait for the
+            channel, or `None` to wait indefinitely.
+        """
+        arbiter = self._file.arbiter
+        if arbiter is None:
+            return contextlib.nullcontext()
+        return arbiter.transaction(self.bus_priority, timeout)
+
+    # PROPERTY CACHE #
+
+    def invalidate_cache(self):
+        """
+        Discards all property values cached by properties created with a
+        ``cache_ttl``, such as ``unitful_property(..., cache_ttl=1)``, so
+        that they are next read from the instrument. This is done
+        automatically when ``*RST`` is sent.
+        """
+        self._property_cache.clear()
+
+    def _invalidate_cache_on(self, cmd):
+        """
+        Discards cached property values if ``cmd`` resets the instrument,
+        and values which depend on a setting changed by ``cmd``, as declared
+        by ``bounded_unitful_property(..., bounds_depend_on=...)``.
+        """
+        if not self._property_cache:
+            return
+        cmd = str(cmd).upper()
+        if "*RST" in cmd:
+            self._property_cache.clear()
+            return
+        for unit in cmd.split(";"):
+            # Commands sent by channels are prefixed, as in ``:CH1:FUNC``, so
+            # dependencies may match any component of the header.
+            header = ":" + unit.strip().lstrip(":").split(" ", 1)[0]
+            for dependency, keys in self._cache_dependents.items():
+                if ":" + dependency in header:
+                    for key in keys:
+                        self._property_cache.pop(key, None)
+
+    @contextlib.contextmanager
+    def no_cache(self):
+        """
+        Context manager inside which properties created with a ``cache_ttl``
+        are always read from the instrument. The values read still refresh
+        the cache.
+
+        >>> with inst.no_cache():  # doctest: +SKIP
+        ...     mode = inst.mode
+        """
+        self._cache_bypass += 1
+        try:
+            yield
+        finally:
+            self._cache_bypass -= 1
+
+    # UNIT HANDLING #
+
+    @contextlib.contextmanager
+    def magnitude_mode(self):
+        """
+        Context manager inside which properties created by
+        `~instruments.util_fns.unitful_property` return their values as
+        `~instruments.units.LazyQuantity` floats rather than as
+        `~pint.Quantity` objects. These carry their units, but avoid the cost
+        of creating a quantity, which adds up when polling many properties.
+        This also applies to the properties of the channels and other
+        objects owned by the instrument.
+
+        >>> with inst.magnitude_mode():  # doctest: +SKIP
+        ...     freqs = [inst.frequency for _ in range(1000)]
+        """
+        self._magnitude_mode += 1
+        try:
+            yield
+        finally:
+            self._magnitude_mode -= 1
+
     # PROPERTIES #
 
+    @property
+    def bus_priority(self):
+        """
+        Gets/sets the priority of this instrument's transactions when its
+        communication channel is shared with other instruments. Lower values
+        are granted the channel first.
+
+        :type: `int`
+        """
+        return self._bus_priority
+
+    @bus_priority.setter
+    def bus_priority(self, newval):
+        self._bus_priority = int(newval)
+
     @property
     def timeout(self):
         """
@@ -264,7 +407,7 @@ class Instrument:
         """
         self._file.write(msg)
 
-    def binblockread(self, data_width, fmt=None):
+    def binblockread(self, data_width, fmt=None, out=None):
         """ "
         Read a binary data block from attached instrument.
         This requires that the instrument respond in a particular manner
@@ -273,6 +416,17 @@ class Instrument:
         The format is as follows:
         #{number of following digits:1-F}{num of bytes to be read}{data bytes}
 
+        IEEE 488.2 indefinite-length blocks, of the form ``#0{data bytes}``
+        followed by a newline which ends the message, are also supported
+        when the communicator marks the end of each message, as do VISA,
+        USBTMC, VXI-11 and HiSLIP. Data bytes may equal the terminator, so
+        with communicators that rely on the terminator the rest of the
+        message is flushed and `OSError` is raised.
+
+        The data bytes of definite-length blocks are read directly into a
+        single buffer, and with numpy the returned array is a view onto that
+        buffer rather than a copy.
+
         :param int data_width: Specify the number of bytes wide each data
             point is. One of [1,2,4].
 
@@ -280,6 +434,94 @@ class Instrument:
             or `None` to choose a format automatically based on the data
             width. Typically you can just specify `data_width` and leave this
             default.
+
+        :param out: Optional preallocated buffer, such as a `bytearray` or a
+            `numpy.ndarray`, to read the data into. It must be at least as
+            large as the block. Reusing one buffer across reads avoids
+            allocating memory for every transfer; note that the returned
+            array then shares memory with ``out``.
+        """
+        # Make or use the required format string.
+        if fmt is None:
+            fmt = _DEFAULT_FORMATS[data_width]
+
+        num_of_bytes = self._read_binblock_header()
+        if num_of_bytes is None:
+            data = self._read_indefinite_block(data_width)
+            if out is None:
+                return self._binblock_decode(data, data_width, fmt)
+            buf = self._binblock_buffer(out, len(data))
+            buf[:] = data
+            return self._binblock_decode(buf, data_width, fmt)
+
+        # Read the data bytes straight into the buffer, and pass them to
+        # numpy using the specified data type (format).
+        buf = self._binblock_buffer(out, num_of_bytes)
+        self._binblock_fill(buf)
+        return self._binblock_decode(buf, data_width, fmt)
+
+    def binblockread_iter(self, data_width, fmt=None, chunk_size=2**20):
+        """
+        Read a binary data block from attached instrument, yielding the
+        data in chunks as they arrive rather than all at once.
+
+        This accepts the same blocks as `binblockread`, but only holds one
+        chunk of a definite-length block in memory at a time, so that
+        processing or saving the data can overlap with the transfer of very
+        long records.
+
+        The rest of the block must be read before the instrument is used
+        again. If the generator is closed early, the remaining data bytes are
+        read and discarded.
+
+        :param int data_width: Specify the number of bytes wide each data
+            point is. One of [1,2,4].
+
+        :param str fmt: Format string as specified by the :mod:`struct` module,
+            or `None` to choose a format automatically based on the data
+            width.
+
+        :param int chunk_size: Number of data points in each yielded chunk.
+            The last chunk may be shorter.
+
+        :return: Generator of `numpy.ndarray` if numpy is available, or of
+            `tuple` otherwise.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least one data point.")
+        if fmt is None:
+            fmt = _DEFAULT_FORMATS[data_width]
+
+        num_of_bytes = self._read_binblock_header()
+        chunk_bytes = chunk_size * data_width
+        if num_of_bytes is None:
+            data = self._read_indefinite_block(data_width)
+            for idx in range(0, len(data), chunk_bytes):
+                yield self._binblock_decode(
+                    data[idx : idx + chunk_bytes], data_width, fmt
+                )
+            return
+
+        remaining = num_of_bytes
+        try:
+            while remaining > 0:
+                buf = memoryview(bytearray(min(chunk_bytes, remaining)))
+                self._binblock_fill(buf)
+                remaining -= len(buf)
+                yield self._binblock_decode(buf, data_width, fmt)
+        except GeneratorExit:
+            # Keep the connection in sync with the instrument.
+            scratch = memoryview(bytearray(min(chunk_bytes, remaining)))
+            while remaining > 0:
+                buf = scratch[: min(len(scratch), remaining)]
+                self._binblock_fill(buf)
+                remaining -= len(buf)
+            raise
+
+    def _read_binblock_header(self):
+        """
+        Reads the header of a binary block, returning the number of data
+        bytes which follow, or `None` for an indefinite-length block.
         """
         # This needs to be a # symbol for valid binary block
         symbol = self._file.read_raw(1)
@@ -289,37 +531,330 @@ class Instrument:
                 "require the first character to be #, instead got "
                 "{}".format(symbol)
             )
-        else:
-            # Read in the num of digits for next part
-            digits = int(self._file.read_raw(1), 16)
-
-            # Read in the num of bytes to be read
-            num_of_bytes = int(self._file.read_raw(digits))
-
-            # Make or use the required format string.
-            if fmt is None:
-                fmt = _DEFAULT_FORMATS[data_width]
-
-            # Read in the data bytes, and pass them to numpy using the specified
-            # data type (format).
-            # This is looped in case a communication timeout occurs midway
-            # through transfer and multiple reads are required
-            tries = 3
-            data = self._file.read_raw(num_of_bytes)
-            while len(data) < num_of_bytes:
-                old_len = len(data)
-                data += self._file.read_raw(num_of_bytes - old_len)
-                if old_len == len(data):
-                    tries -= 1
-                if tries == 0:
-                    raise OSError(
-                        "Did not read in the required number of bytes "
-                        "during binblock read. Got {}, expected "
-                        "{}".format(len(data), num_of_bytes)
+        # Read in the num of digits for next part
+        digits = int(self._file.read_raw(1), 16)
+        if digits == 0:
+            return None
+        # Read in the num of bytes to be read
+        return int(self._file.read_raw(digits))
+
+    def _binblock_fill(self, buf):
+        """
+        Reads binary block data bytes until ``buf`` is full.
+        """
+        # This is looped in case a communication timeout occurs midway
+        # through transfer and multiple reads are required
+        tries = 3
+        got = 0
+        while got < len(buf):
+            nbytes = self._file.readinto(buf[got:])
+            got += nbytes
+            if nbytes == 0:
+                tries -= 1
+            if tries == 0:
+                raise OSError(
+                    "Did not read in the required number of bytes "
+                    "during binblock read. Got {}, expected "
+                    "{}".format(got, len(buf))
+                )
+
+    def _indefinite_block_error(self):
+        """
+        Returns the error raised for an indefinite-length (``#0``) binary
+        block if the communicator cannot find its end, or `None` if it can.
+        Data bytes may equal the terminator, so the block can only be read
+        up to the end of the message marked by the transport.
+        """
+        if self._file.marks_message_end:
+            return None
+        return OSError(
+            "Indefinite-length binary blocks can only be read from "
+            "communicators which mark the end of each message, such as "
+            "VISA, USBTMC, VXI-11 or HiSLIP, as their data may contain the "
+            "terminator. {} relies on the terminator.".format(type(self._file).__name__)
+        )
+
+    @staticmethod
+    def _strip_indefinite_block(data, data_width):
+        """
+        Returns the data of an indefinite-length binary block read up to the
+        end of the message, without the newline which follows it.
+        """
+        if data.endswith(b"\n"):
+            data = data[:-1]
+        if len(data) % data_width:
+            raise OSError(
+                "Indefinite-length binary block ended with a partial "
+                "data point of width {}.".format(data_width)
+            )
+        return data
+
+    def _read_indefinite_block(self, data_width):
+        """
+        Reads the data of an indefinite-length (``#0``) binary block, up to
+        the end of the message.
+        """
+        error = self._indefinite_block_error()
+        if error is not None:
+            self._file.flush_input()
+            raise error
+        return self._strip_indefinite_block(self._file.read_message(), data_width)
+
+    @staticmethod
+    def _binblock_buffer(out, num_of_bytes):
+        """
+        Returns a writable byte-wise `memoryview` of ``num_of_bytes`` bytes,
+        either onto ``out`` or onto a newly allocated `bytearray`.
+        """
+        if out is None:
+            return memoryview(bytearray(num_of_bytes))
+        buf = memoryview(out).cast("B")
+        if buf.readonly:
+            raise TypeError("Binary block output buffer must be writable.")
+        if len(buf) < num_of_bytes:
+            raise ValueError(
+                "Binary block output buffer is too small. Got {} bytes, "
+                "block has {} bytes.".format(len(buf), num_of_bytes)
+            )
+        return buf[:num_of_bytes]
+
+    @staticmethod
+    def _binblock_decode(data, data_width, fmt):
+        """
+        Converts the data bytes of a binary block into a `numpy.ndarray`
+        if numpy is available, or a `tuple` otherwise. With numpy, the array
+        is a view onto ``data`` rather than a copy.
+        """
+        if numpy:
+            return numpy.frombuffer(data, dtype=fmt)
+        return struct.unpack(f"{fmt[0]}{int(len(data)/data_width)}{fmt[-1]}", data)
+
+    # ASYNC METHODS #
+
+    async def asendcmd(self, cmd):
+        """
+        Awaitable counterpart of `sendcmd`, for instruments connected
+        through an async communicator such as `AsyncSocketCommunicator`.
+
+        :param str cmd: String containing the command to
+            be sent.
+        """
+        async with self._file.transaction():
+            await self._file.sendcmd(str(cmd))
+            ack_expected_list = self._ack_expected(
+                cmd
+            )  # pylint: disable=assignment-from-none
+            if not isinstance(ack_expected_list, (list, tuple)):
+                ack_expected_list = [ack_expected_list]
+            for ack_expected in ack_expected_list:
+                if ack_expected is None:
+                    break
+                ack = await self.aread()
+                if ack != ack_expected:
+                    raise AcknowledgementError(
+                        f"Incorrect ACK message received: got {ack} expected {ack_expected}"
                     )
-            if numpy:
-                return numpy.frombuffer(data, dtype=fmt)
-            return struct.unpack(f"{fmt[0]}{int(len(data)/data_width)}{fmt[-1]}", data)
+            await self._aread_prompt()
+
+    async def aquery(self, cmd, size=-1):
+        """
+        Awaitable counterpart of `query`, for instruments connected
+        through an async communicator such as `AsyncSocketCommunicator`.
+
+        :param str cmd: String containing the query to
+            execute.
+        :param int size: Number of bytes to be read. Default is read until
+            termination character is found.
+        :return: The result of the query as returned by the
+            connected instrument.
+        :rtype: `str`
+        """
+        async with self._file.transaction():
+            ack_expected_list = self._ack_expected(
+                cmd
+            )  # pylint: disable=assignment-from-none
+            if not isinstance(ack_expected_list, (list, tuple)):
+                ack_expected_list = [ack_expected_list]
+
+            if ack_expected_list[0] is None:  # Case no ACK
+                value = await self._file.query(cmd, size)
+            else:  # Case with ACKs
+                await self._file.sendcmd(cmd)
+                for ack_expected in ack_expected_list:  # Read and verify ACKs
+                    ack = await self.aread()
+                    if ack != ack_expected:
+                        raise AcknowledgementError(
+                            f"Incorrect ACK message received: got {ack} expected {ack_expected}"
+                        )
+                value = await self.aread(size)  # Now read in our return data
+            await self._aread_prompt()
+            return value
+
+    async def _aread_prompt(self):
+        if self.prompt is not None:
+            prompt = await self.aread(len(self.prompt))
+            if prompt != self.prompt:
+                raise PromptError(
+                    f"Incorrect prompt message received: got {prompt} expected {self.prompt}"
+                )
+
+    async def aread(self, size=-1, encoding="utf-8"):
+        """
+        Awaitable counterpart of `read`.
+
+        :param int size: Number of bytes to be read. Default is read until
+            termination character is found.
+        :rtype: `str`
+        """
+        return await self._file.read(size, encoding)
+
+    async def aread_raw(self, size=-1):
+        """
+        Awaitable counterpart of `read_raw`.
+
+        :param int size: Number of bytes to be read. Default is read until
+            termination character is found.
+        :rtype: `bytes`
+        """
+        return await self._file.read_raw(size)
+
+    async def awrite(self, msg):
+        """
+        Awaitable counterpart of `write`.
+
+        :param str msg: String that will be written to the communicator.
+        """
+        await self._file.write(msg)
+
+    async def abinblockread(self, data_width, fmt=None):
+        """
+        Awaitable counterpart of `binblockread`.
+
+        :param int data_width: Specify the number of bytes wide each data
+            point is. One of [1,2,4].
+        :param str fmt: Format string as specified by the :mod:`struct` module,
+            or `None` to choose a format automatically based on the data
+            width.
+        """
+        symbol = await self._file.read_raw(1)
+        if symbol != b"#":  # Check to make sure block is valid
+            raise OSError(
+                "Not a valid binary block start. Binary blocks "
+                "require the first character to be #, instead got "
+                "{}".format(symbol)
+            )
+        digits = int(await self._file.read_raw(1), 16)
+        if fmt is None:
+            fmt = _DEFAULT_FORMATS[data_width]
+        if digits == 0:
+            error = self._indefinite_block_error()
+            if error is not None:
+                await self._file.flush_input()
+                raise error
+            data = await self._file.read_message()
+            data = self._strip_indefinite_block(data, data_width)
+            return self._binblock_decode(data, data_width, fmt)
+        num_of_bytes = int(await self._file.read_raw(digits))
+
+        data = bytearray()
+        while len(data) < num_of_bytes:
+            chunk = await self._file.read_raw(num_of_bytes - len(data))
+            if not chunk:
+                raise OSError(
+                    "Did not read in the required number of bytes "
+                    "during binblock read. Got {}, expected "
+                    "{}".format(len(data), num_of_bytes)
+                )
+            data += chunk
+        return self._binblock_decode(bytes(data), data_width, fmt)
+
+    async def _arun_property(self, name, get, value=None):
+        """
+        Runs the getter, or the setter if ``get`` is `False`, of the named
+        property with its I/O awaited on the async communicator.
+
+        The accessors of properties made by the factories in
+        `instruments.util_fns` are replayed on the event loop, awaiting each
+        operation they reach. Other accessors, and all accessors of drivers
+        which override ``sendcmd`` or ``query``, are run once, on a worker
+        thread, with each of their operations awaited on the event loop.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        driver_io = overrides_io(self)
+        prop = None if driver_io else replay_property(self, name)
+        if prop is None:
+            loop = asyncio.get_running_loop()
+            if driver_io:
+                bridge = driver_view(self, loop)
+            else:
+                bridge = AsyncBridge(self, loop)
+
+            def _access():
+                target, attr = self._resolve_expression(bridge, name)
+                if get:
+                    return getattr(target, attr)
+                return setattr(target, attr, value)
+
+            return await loop.run_in_executor(None, _access)
+        while True:
+            try:
+                return prop.get() if get else prop.set(value)
+            except PendingIO as pending:
+                prop.results.append(await aperform_io(self, pending.op))
+
+    @staticmethod
+    def _resolve_expression(target, name_expr):
+        """
+        Resolves all but the last part of an attribute expression such as
+        ``channel[0].frequency``, returning the owning object and the final
+        attribute name.
+        """
+        *heads, name = name_expr.split(".")
+        for head in heads:
+            match = _IDX_REGEX.match(head)
+            if match:
+                head_name, head_idx = match.groups()
+                target = getattr(target, head_name)[int(head_idx)]
+            else:
+                target = getattr(target, head)
+        return target, name
+
+    async def aget(self, name):
+        """
+        Awaitable property read. This runs the getter of the named property,
+        including those created by the property factories in
+        `instruments.util_fns`, awaiting its I/O on the async communicator.
+
+        >>> freq = await inst.aget("frequency")  # doctest: +SKIP
+        >>> amp = await inst.aget("channel[1].amplitude")  # doctest: +SKIP
+
+        The accessors of properties made by the factories are replayed on
+        the event loop, with their I/O going through `aquery`, `asendcmd`
+        and `aread`. Other properties, and all properties of drivers which
+        override `query` or `sendcmd`, are run once on a worker thread of the
+        event loop, with each of their operations awaited on the loop and
+        those overrides applied. They may use `sendcmd`, `query`, `read`,
+        `read_raw`, `write` and `binblockread`, but only the accessors of
+        such drivers may use the communicator itself.
+
+        :param str name: Name of the property, optionally prefixed by
+            attribute and index accesses such as ``channel[0].``.
+        :return: The property value
+        """
+        return await self._arun_property(name, True)
+
+    async def aset(self, name, value):
+        """
+        Awaitable property write, the counterpart of `aget`.
+
+        >>> await inst.aset("frequency", 1 * u.kHz)  # doctest: +SKIP
+
+        :param str name: Name of the property, optionally prefixed by
+            attribute and index accesses such as ``channel[0].``.
+        :param value: The new value of the property
+        """
+        await self._arun_property(name, False, value)
 
     # CLASS METHODS #
 
@@ -332,6 +867,8 @@ class Instrument:
         "file",
         "usbtmc",
         "vxi11",
+        "hislip",
+        "ikproxy",
         "test",
     ]
 
@@ -348,11 +885,16 @@ class Instrument:
             serial://COM3
             serial:///dev/ttyACM0
             tcpip://192.168.0.10:4100
+            hislip://192.168.0.10
+            hislip://192.168.0.10:4880/hislip0
+            hislip://192.168.0.10?overlapped=1&timeout=5
             gpib+usb://COM3/15
             gpib+serial://COM3/15
             gpib+serial:///dev/ttyACM0/15 # Currently non-functional.
             visa://USB::0x0699::0x0401::C0000001::0::INSTR
             usbtmc://USB::0x0699::0x0401::C0000001::0::INSTR
+            ikproxy://localhost:5025
+            ikproxy:///tmp/instrument.sock
             test://
 
         For the ``serial`` URI scheme, baud rates may be explicitly specified
@@ -360,6 +902,10 @@ class Instrument:
         ``serial://COM9?baud=115200``. If not specified, the baud rate
         is assumed to be 115200.
 
+        For the ``hislip`` URI scheme, overlapped mode and the timeout may be
+        given as query parameters, as in
+        ``hislip://192.168.0.10?overlapped=1&timeout=5``.
+
         :param str uri: URI for the instrument to be loaded.
         :rtype: `Instrument`
 
@@ -432,6 +978,34 @@ class Instrument:
             #   vxi11://192.168.1.104
             #   vxi11://TCPIP::192.168.1.105::gpib,5::INSTR
             return cls.open_vxi11(parsed_uri.netloc, **kwargs)
+        elif parsed_uri.scheme == "hislip":
+            # Ex: hislip://192.168.0.10:4880/hislip0?overlapped=1&timeout=5
+            #     The port, sub-address and query string are optional.
+            if "overlapped" in kwargs:
+                kwargs["overlapped"] = kwargs["overlapped"][0].lower() in (
+                    "1",
+                    "true",
+                    "yes",
+                    "on",
+                )
+            if "timeout" in kwargs:
+                kwargs["timeout"] = float(kwargs["timeout"][0])
+            if parsed_uri.port is not None:
+                kwargs["port"] = parsed_uri.port
+            if parsed_uri.path.strip("/"):
+                kwargs["sub_address"] = parsed_uri.path.strip("/")
+            return cls.open_hislip(parsed_uri.hostname, **kwargs)
+        elif parsed_uri.scheme == "ikproxy":
+            # Ex: ikproxy://localhost:5025 connects over TCP, and
+            #     ikproxy:///tmp/instrument.sock over a Unix socket.
+            if parsed_uri.netloc:
+                if parsed_uri.port is None:
+                    raise ValueError(
+                        "ikproxy URIs must give the port of the instrument "
+                        "server, as in ikproxy://localhost:5025."
+                    )
+                return cls.open_proxy((parsed_uri.hostname, parsed_uri.port))
+            return cls.open_proxy(parsed_uri.path)
         elif parsed_uri.scheme == "test":
             return cls.open_test(**kwargs)
         else:
@@ -464,6 +1038,69 @@ class Instrument:
 
         return ret_cls
 
+    @classmethod
+    def open_hislip(
+        cls, host, port=4880, sub_address="hislip0", overlapped=False, timeout=10
+    ):
+        """
+        Opens an instrument, connecting via the HiSLIP protocol to a LAN
+        instrument.
+
+        :param str host: Name or IP address of the instrument.
+        :param int port: TCP port on which the instrument is listening for
+            HiSLIP connections.
+        :param str sub_address: HiSLIP device sub-address.
+        :param bool overlapped: Request overlapped mode, allowing several
+            queries to be outstanding at once, instead of synchronized mode.
+        :param float timeout: Number of seconds to wait when connecting and
+            reading before timing out.
+
+        :rtype: `Instrument`
+        :return: Object representing the connected instrument.
+
+        .. seealso::
+            `~instruments.abstract_instruments.comm.HiSLIPCommunicator`
+        """
+        conns = []
+        try:
+            for _ in range(2):
+                conn = socket.create_connection((host, port), timeout=timeout)
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                conns.append(conn)
+            comm = HiSLIPCommunicator(
+                conns[0], conns[1], sub_address=sub_address, overlapped=overlapped
+            )
+        except BaseException:
+            # Do not leak the channels opened before the failure.
+            for conn in conns:
+                conn.close()
+            raise
+        return cls(comm)
+
+    @classmethod
+    def open_proxy(cls, address):
+        """
+        Opens an instrument whose connection is owned by an
+        `~instruments.abstract_instruments.comm.InstrumentServer`, possibly in
+        another process.
+
+        :param address: The ``(host, port)`` tuple on which the server
+            listens, or the path of its Unix socket.
+
+        :rtype: `Instrument`
+        :return: Object representing the connected instrument.
+
+        .. seealso::
+            `~instruments.abstract_instruments.comm.ProxyCommunicator`
+        """
+        if isinstance(address, str):
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            conn.connect(address)
+        else:
+            conn = socket.create_connection(address)
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return cls(ProxyCommunicator(conn))
+
     # pylint: disable=too-many-arguments
     @classmethod
     def open_serial(
@@ -635,6 +1272,8 @@ class Instrument:
 
         .. _PyVISA: http://pyvisa.sourceforge.net/
         """
+        import pyvisa  # pylint: disable=import-outside-toplevel
+
         version = list(map(int, pyvisa.__version__.split(".")))
         while len(version) < 3:
             version += [0]
@@ -644,6 +1283,47 @@ class Instrument:
             ins = pyvisa.instrument(resource_name)  # pylint: disable=no-member
         return cls(VisaCommunicator(ins))
 
+    @classmethod
+    async def aopen_tcpip(cls, host, port):
+        """
+        Opens an instrument from within a coroutine, connecting via TCP/IP
+        through the running `asyncio` event loop. The returned instrument is
+        driven with its awaitable methods, such as `aquery`.
+
+        :param str host: Name or IP address of the instrument.
+        :param int port: TCP port on which the insturment is listening.
+
+        :rtype: `Instrument`
+        :return: Object representing the connected instrument.
+        """
+        # pylint: disable=import-outside-toplevel
+        from instruments.abstract_instruments.comm import AsyncSocketCommunicator
+
+        return cls(await AsyncSocketCommunicator.open(host, port))
+
+    @classmethod
+    async def aopen_serial(cls, port, baud=9600, **kwargs):
+        """
+        Opens an instrument from within a coroutine, connecting via a serial
+        port or pseudo terminal through the running `asyncio` event loop. The
+        returned instrument is driven with its awaitable methods, such as
+        `aquery`.
+
+        :param str port: Name of the the port or device file to open a
+            connection on, such as ``"/dev/ttyUSB0"``.
+        :param int baud: The baud rate at which instrument communicates.
+        :param kwargs: Additional keyword arguments that will be passed on to
+            serial, e.g., `parity`.
+
+        :rtype: `Instrument`
+        :return: Object representing the connected instrument.
+        """
+        # pylint: disable=import-outside-toplevel
+        from instruments.abstract_instruments.comm import AsyncSerialCommunicator
+
+        conn = serial.Serial(port, baudrate=baud, **kwargs)
+        return cls(await AsyncSerialCommunicator.open(conn))
+
     @classmethod
     def open_test(cls, stdin=None, stdout=None):
         """
@@ -663,6 +1343,25 @@ class Instrument:
         """
         return cls(LoopbackCommunicator(stdin, stdout))
 
+    @classmethod
+    def open_replay(cls, filename, realtime=False, verify=True):
+        """
+        Opens an instrument that plays back a session recorded with a
+        `~instruments.abstract_instruments.comm.RecordingCommunicator`,
+        instead of connecting to the physical instrument. This is useful
+        for profiling and benchmarking drivers against real traffic.
+
+        :param filename: Path of the recording, or a binary file-like object
+            to read it from.
+        :type filename: `str` or file-like
+        :param bool realtime: Reproduce the timing of the original session,
+            rather than responding as fast as possible.
+        :param bool verify: Check that the commands sent match those that
+            were recorded.
+        :return: Object representing the replayed instrument
+        """
+        return cls(ReplayCommunicator(filename, realtime=realtime, verify=verify))
+
     @classmethod
     def open_usbtmc(cls, *args, **kwargs):
         """
@@ -718,6 +1417,8 @@ class Instrument:
         :rtype: `Instrument`
         :return: Object representing the connected instrument.
         """
+        import usb.core  # pylint: disable=import-outside-toplevel
+
         dev = usb.core.find(idVendor=vid, idProduct=pid)
         if dev is None:
             raise OSError("No such device found.")
@@ -725,7 +1426,7 @@ class Instrument:
         return cls(USBCommunicator(dev))
 
     @classmethod
-    def open_file(cls, filename):
+    def open_file(cls, filename, poll=False):
         """
         Given a file, treats that file as a character device file that can
         be read from and written to in order to communicate with the
@@ -733,11 +1434,14 @@ class Instrument:
         is connected by the Linux ``usbtmc`` kernel driver.
 
         :param str filename: Name of the character device to open.
+        :param bool poll: If `True`, wait for responses by polling the file
+            descriptor instead of sleeping for a fixed delay. See
+            `~instruments.abstract_instruments.comm.FileCommunicator`.
 
         :rtype: `Instrument`
         :return: Object representing the connected instrument.
         """
-        return cls(FileCommunicator(filename))
+        return cls(FileCommunicator(filename, poll=poll))
 
     def __enter__(self) -> typing_extensions.Self:
         return self
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+"""
+Provides an executor which owns the communication with an instrument on a
+dedicated I/O thread, so that it can be shared by several threads.
+"""
+
+# IMPORTS #####################################################################
+
+
+from concurrent import futures
+import functools
+import queue
+import threading
+
+from instruments.abstract_instruments.accessor_replay import (
+    PendingIO,
+    perform_io,
+    replay_property,
+)
+
+# CLASSES #####################################################################
+
+
+class InstrumentExecutor:
+    """
+    Wraps an `~instruments.Instrument` so that it can be used from any
+    number of threads without external locks. All of the I/O with the
+    instrument is done by a single dedicated thread, in the order that
+    requests are submitted, and every request immediately returns a
+    `concurrent.futures.Future` for its result.
+
+    Requests are pipelined: replies to reads of properties made by the
+    factories in `instruments.util_fns` are parsed on a second thread, while
+    the I/O thread moves on to the next request. Other properties are read
+    and written once, on the I/O thread, with the instrument itself, as are
+    functions scheduled with `submit`. So are properties which cache their
+    values, so that the cache is updated in the order of the requests.
+
+    Example usage:
+
+    >>> import instruments as ik
+    >>> from instruments.abstract_instruments import InstrumentExecutor
+    >>> inst = ik.srs.SRS830.open_gpibusb("/dev/ttyUSB0", 1)  # doctest: +SKIP
+    >>> with InstrumentExecutor(inst) as executor:  # doctest: +SKIP
+    ...     executor.set("frequency", 1 * ik.units.kHz)
+    ...     freq = executor.get("frequency")
+    ...     print(freq.result())
+
+    :param instrument: The instrument whose communicator is to be owned
+        by the executor. It should not be used directly while the executor
+        is running.
+    :type instrument: `~instruments.Instrument`
+    """
+
+    _STOP = object()
+
+    def __init__(self, instrument):
+        self._instrument = instrument
+        self._requests = queue.SimpleQueue()
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._parser = futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="InstrumentExecutor-parse"
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="InstrumentExecutor-io", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    # PROPERTIES #
+
+    @property
+    def instrument(self):
+        """
+        Gets the instrument wrapped by this executor.
+
+        :type: `~instruments.Instrument`
+        """
+        return self._instrument
+
+    # METHODS #
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedules ``fn(*args, **kwargs)`` to be called on the I/O thread,
+        after all requests submitted before it. This can be used for methods
+        of the instrument which communicate with it, such as
+        ``executor.submit(inst.reset)``.
+
+        :param callable fn: The function to call.
+        :return: A future for the return value of ``fn``.
+        :rtype: `concurrent.futures.Future`
+        """
+        return self._put(fn, args, kwargs)
+
+    def sendcmd(self, cmd):
+        """
+        Schedules a command to be sent with `~instruments.Instrument.sendcmd`.
+
+        :param str cmd: The command to send.
+        :return: A future which completes once the command is sent.
+        :rtype: `concurrent.futures.Future`
+        """
+        return self._put(self._instrument.sendcmd, (cmd,), {})
+
+    def query(self, cmd, size=-1, parse=None):
+        """
+        Schedules a query with `~instruments.Instrument.query`.
+
+        If ``parse`` is given, the reply is passed to it on the parsing
+        thread, so that the next request can be sent in the meantime.
+
+        :param str cmd: The query to send.
+        :param int size: Number of bytes to read, or -1 to read until the
+            terminator.
+        :param callable parse: Converts the reply to the result of the
+            future.
+        :return: A future for the reply, or for its parsed value.
+        :rtype: `concurrent.futures.Future`
+        """
+        return self._put(self._instrument.query, (cmd, size), {}, parse)
+
+    def get(self, name):
+        """
+        Schedules a read of the named property, as with
+        `~instruments.Instrument.aget`.
+
+        >>> freq = executor.get("channel[0].frequency").result()  # doctest: +SKIP
+
+        :param str name: Name of the property, optionally prefixed by
+            attribute and index accesses such as ``channel[0].``.
+        :return: A future for the property value.
+        :rtype: `concurrent.futures.Future`
+        """
+        return self._put(self._access, (name, True), {})
+
+    def set(self, name, value):
+        """
+        Schedules a write of the named property, as with
+        `~instruments.Instrument.aset`.
+
+        :param str name: Name of the property, optionally prefixed by
+            attribute and index accesses such as ``channel[0].``.
+        :param value: The new value of the property.
+        :return: A future which completes once the value is written.
+        :rtype: `concurrent.futures.Future`
+        """
+        return self._put(self._access, (name, False, value), {})
+
+    def shutdown(self, wait=True):
+        """
+        Stops accepting requests. Requests which were already submitted are
+        still completed.
+
+        :param bool wait: If `True`, waits for the outstanding requests to
+            complete before returning.
+        """
+        with self._shutdown_lock:
+            if not self._shutdown:
+                self._shutdown = True
+                self._requests.put(self._STOP)
+        if wait:
+            self._thread.join()
+            self._parser.shutdown(wait=True)
+
+    # PRIVATE METHODS #
+
+    def _put(self, fn, args, kwargs, parse=None):
+        future = futures.Future()
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new requests after shutdown")
+            self._requests.put((future, fn, args, kwargs, parse))
+        return future
+
+    def _access(self, name, get, value=None):
+        """
+        Reads or writes the named property on the I/O thread.
+
+        The getters of factory properties of the instrument itself make a
+        single query. Those are replayed up to their query, and returned as
+        a `_Parse` so that the reply is parsed on the parsing thread.
+        """
+        inst = self._instrument
+        with inst.transaction():
+            prop = replay_property(inst, name)
+            if prop is None:
+                target, attr = inst._resolve_expression(inst, name)
+                if get:
+                    return getattr(target, attr)
+                return setattr(target, attr, value)
+            perform = functools.partial(perform_io, inst)
+            if not get:
+                return prop.run(functools.partial(prop.set, value), perform)
+            if prop.on_instrument and not prop.cached:
+                try:
+                    return prop.get()
+                except PendingIO as pending:
+                    op = pending.op
+                prop.results.append(perform(op))
+                if op[0] == "query":
+                    return _Parse(prop)
+            return prop.run(prop.get, perform)
+
+    def _run(self):
+        while True:
+            request = self._requests.get()
+            if request is self._STOP:
+                # Replies which are still being parsed are completed.
+                self._parser.shutdown(wait=False)
+                return
+            future, fn, args, kwargs, parse = request
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:  # pylint: disable=broad-except
+                future.set_exception(exc)
+                continue
+            if isinstance(result, _Parse):
+                parse = result.parse
+                result = None
+            if parse is None:
+                future.set_result(result)
+            else:
+                self._parser.submit(_set_parsed, future, parse, result)
+
+
+class _Parse:
+    """
+    Returned by `InstrumentExecutor._access` for property reads whose reply
+    is to be parsed on the parsing thread.
+    """
+
+    def __init__(self, prop):
+        self.prop = prop
+
+    def parse(self, _):
+        """
+        Runs the getter again, replaying the reply to its query.
+        """
+        return self.prop.get()
+
+
+# FUNCTIONS ###################################################################
+
+
+def _set_parsed(future, parse, result):
+    """
+    Completes ``future`` with ``parse(result)`` on the parsing thread.
+    """
+    try:
+        future.set_result(parse(result))
+    except BaseException as exc:  # pylint: disable=broad-except
+        future.set_exception(exc)
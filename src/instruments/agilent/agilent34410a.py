@@ -8,6 +8,7 @@ Provides support for the Agilent 34410a digital multimeter.
 from instruments.generic_scpi import SCPIMultimeter
 from instruments.optional_dep_finder import numpy
 from instruments.units import ureg as u
+from instruments.util_fns import parse_ascii_array
 
 # CLASSES #####################################################################
 
@@ -113,7 +114,7 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
             or if numpy is installed, `~pint.Quantity` with `numpy.array` data
         """
         units = UNITS[self.mode]
-        data = list(map(float, self.query("FETC?").split(",")))
+        data = parse_ascii_array(self.query("FETC?"))
         if numpy:
             return data * units
         return tuple(val * units for val in data)
@@ -139,8 +140,7 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
             sample_count = self.data_point_count
         units = UNITS[self.mode]
         self.sendcmd("FORM:DATA ASC")
-        data = self.query(f"DATA:REM? {sample_count}").split(",")
-        data = list(map(float, data))
+        data = parse_ascii_array(self.query(f"DATA:REM? {sample_count}"))
         if numpy:
             return data * units
         return tuple(val * units for val in data)
@@ -153,7 +153,7 @@ class Agilent34410a(SCPIMultimeter):  # pylint: disable=abstract-method
             or if numpy is installed, `~pint.Quantity` with `numpy.array` data
         """
         units = UNITS[self.mode]
-        data = list(map(float, self.query("DATA:DATA? NVMEM").split(",")))
+        data = parse_ascii_array(self.query("DATA:DATA? NVMEM"))
         if numpy:
             return data * units
         return tuple(val * units for val in data)
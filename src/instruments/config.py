@@ -6,12 +6,15 @@ Module containing support for loading instruments from configuration files.
 # IMPORTS #####################################################################
 
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import threading
+import time
 import warnings
 
 from ruamel.yaml import YAML
 
 from instruments.units import ureg as u
-from instruments.util_fns import setattr_expression, split_unit_str
+from instruments.util_fns import assume_units, setattr_expression, split_unit_str
 
 # FUNCTIONS ###################################################################
 
@@ -61,7 +64,9 @@ yaml = YAML(typ="unsafe")
 yaml.Constructor.add_constructor("!Q", quantity_constructor)
 
 
-def load_instruments(conf_file_name, conf_path="/"):
+def load_instruments(
+    conf_file_name, conf_path="/", max_workers=1, timeout=None, lazy=False, report=None
+):
     """
     Given the path to a YAML-formatted configuration file and a path within
     that file, loads the instruments described in that configuration file.
@@ -113,11 +118,42 @@ def load_instruments(conf_file_name, conf_path="/"):
     this function to load the instruments named in that block, and ignore
     all other keys in the YAML file.
 
+    Instruments are opened one after the other by default. As opening an
+    instrument mostly waits on its connection, a rack of instruments opens
+    much faster with ``max_workers`` greater than one, in which case up to
+    that many instruments are opened at once by a pool of threads. A
+    ``timeout`` gives up on instruments which take too long to open, such as
+    GPIB devices which are switched off; these are treated as instruments
+    which failed to open.
+
+    With ``lazy=True``, no instrument is opened by this function. Each one is
+    returned as an `InstrumentProxy`, which opens the instrument and sets its
+    attributes the first time one of its attributes is accessed.
+
     :param str conf_file_name: Name of the configuration file to load
         instruments from. Alternatively, a file-like object may be provided.
     :param str conf_path: ``"/"`` separated path to the section in the
         configuration file to load.
-
+    :param int max_workers: Largest number of instruments to open at once.
+    :param timeout: Time given to each instrument to open and set its
+        attributes, from when its opening starts, or `None` to wait as long
+        as needed. An instrument which is still opening when its time runs
+        out is closed once it has opened. Instruments waiting for a free
+        thread behind instruments which time out may time out before they
+        start opening, as a thread stuck opening an instrument stays busy
+        until its connection gives up.
+    :type timeout: `~pint.Quantity` or `float`, in seconds
+    :param bool lazy: If `True`, returns proxies that only open their
+        instrument when it is first used.
+    :param dict report: If given, this dictionary is filled with the time
+        taken to open each instrument, or to fail to, keyed by the name of
+        the instrument. In lazy mode, each time is added when the instrument
+        is opened.
+
+    :return: Dictionary from the names of the instruments to the instruments,
+        or `None` for those that failed to open. In lazy mode, the values are
+        `InstrumentProxy` objects, and failures are raised when an instrument
+        is first used.
     :rtype: `dict`
 
     .. warning::
@@ -138,24 +174,246 @@ def load_instruments(conf_file_name, conf_path="/"):
 
     conf_dict = walk_dict(conf_dict, conf_path)
 
-    inst_dict = {}
-    for name, value in conf_dict.items():
-        try:
-            inst_dict[name] = value["class"].open_from_uri(value["uri"])
-
-            if "attrs" in value:
-                # We have some attrs we can set on the newly created instrument.
-                for attr_name, attr_value in value["attrs"].items():
-                    setattr_expression(inst_dict[name], attr_name, attr_value)
-
-        except OSError as ex:
-            # FIXME: need to subclass Warning so that repeated warnings
-            #        aren't ignored.
-            warnings.warn(
-                "Exception occured loading device with URI "
-                "{}:\n\t{}.".format(value["uri"], ex),
-                RuntimeWarning,
+    if timeout is not None:
+        timeout = assume_units(timeout, u.second).to(u.second).magnitude
+    if report is None:
+        report = {}
+
+    if lazy:
+        return {
+            name: InstrumentProxy(
+                value, lambda latency, name=name: _report(report, name, latency)
             )
-            inst_dict[name] = None
+            for name, value in conf_dict.items()
+        }
+    if max_workers == 1 and timeout is None:
+        inst_dict = {}
+        try:
+            for name, value in conf_dict.items():
+                start = time.monotonic()
+                try:
+                    inst_dict[name] = _open_instrument(value)
+                except OSError as ex:
+                    _warn_open_failed(value, ex)
+                    inst_dict[name] = None
+                _report(report, name, time.monotonic() - start)
+        except BaseException:
+            _close_all(inst_dict)
+            raise
+        return inst_dict
+    return _open_concurrently(conf_dict, max_workers, timeout, report)
+
+
+def _open_instrument(value):
+    """
+    Opens the instrument described by the configuration node ``value``, and
+    sets its attributes.
+    """
+    instrument = value["class"].open_from_uri(value["uri"])
+    if "attrs" in value:
+        # We have some attrs we can set on the newly created instrument.
+        for attr_name, attr_value in value["attrs"].items():
+            setattr_expression(instrument, attr_name, attr_value)
+    return instrument
+
+
+def _warn_open_failed(value, ex):
+    # FIXME: need to subclass Warning so that repeated warnings
+    #        aren't ignored.
+    warnings.warn(
+        "Exception occured loading device with URI "
+        "{}:\n\t{}.".format(value["uri"], ex),
+        RuntimeWarning,
+    )
+
+
+def _report(report, name, latency):
+    report[name] = u.Quantity(latency, u.second)
+
+
+def _close_all(inst_dict):
+    """
+    Closes the instruments opened so far, when loading fails with an error
+    other than a connection error.
+    """
+    for inst in inst_dict.values():
+        if inst is not None:
+            inst.__exit__(None, None, None)
+
+
+def _close_late_instrument(future):
+    """
+    Closes an instrument which finished opening after its timeout.
+    """
+    if not future.cancelled() and future.exception() is None:
+        future.result().__exit__(None, None, None)
+
 
+def _open_concurrently(conf_dict, max_workers, timeout, report):
+    """
+    Opens the instruments of ``conf_dict`` with a pool of ``max_workers``
+    threads, giving up on those not open ``timeout`` seconds after their
+    opening started.
+
+    The deadline of an instrument which waits for a free thread is also
+    bounded by when its turn would come if each instrument ahead of it took
+    the whole ``timeout``, so that this returns within
+    ``timeout * ceil(len(conf_dict) / max_workers)`` seconds. Instruments
+    still waiting for a thread at their deadline are not opened.
+    """
+    started = {}
+    finished = {}
+
+    def open_instrument(name, value):
+        started[name] = time.monotonic()
+        try:
+            return _open_instrument(value)
+        finally:
+            finished[name] = time.monotonic()
+
+    inst_dict = dict.fromkeys(conf_dict)
+    executor = ThreadPoolExecutor(max_workers, thread_name_prefix="load_instruments")
+    submitted = time.monotonic()
+    futures = {
+        executor.submit(open_instrument, name, value): name
+        for name, value in conf_dict.items()
+    }
+    if timeout is not None:
+        latest = {
+            future: submitted + timeout * (idx // max_workers + 1)
+            for idx, future in enumerate(futures)
+        }
+    # Threads which are still opening instruments that timed out are not
+    # waited for, as their connections may take much longer to give up.
+    executor.shutdown(wait=False)
+
+    pending = set(futures)
+    # Futures whose instrument has been neither returned nor given up on.
+    unsettled = set(futures)
+    try:
+        while pending:
+            wait_time = None
+            if timeout is not None:
+                now = time.monotonic()
+                deadlines = {}
+                for future in pending:
+                    name = futures[future]
+                    deadlines[future] = latest[future]
+                    if name in started:
+                        deadlines[future] = min(
+                            deadlines[future], started[name] + timeout
+                        )
+                for future, deadline in deadlines.items():
+                    if deadline <= now and not future.done():
+                        name = futures[future]
+                        pending.discard(future)
+                        unsettled.discard(future)
+                        if not future.cancel():
+                            future.add_done_callback(_close_late_instrument)
+                        _warn_open_failed(
+                            conf_dict[name],
+                            TimeoutError(f"Not opened within {timeout} seconds"),
+                        )
+                        # The time given, from when the instrument could
+                        # have started opening at the latest.
+                        _report(report, name, now - deadline + timeout)
+                wait_time = max(
+                    0, min((d - now for d in deadlines.values() if d > now), default=0)
+                )
+            done, pending = wait(
+                pending, timeout=wait_time, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                unsettled.discard(future)
+                name = futures[future]
+                _report(report, name, finished[name] - started[name])
+                try:
+                    inst_dict[name] = future.result()
+                except OSError as ex:
+                    _warn_open_failed(conf_dict[name], ex)
+    except BaseException:
+        # Instruments which open later would otherwise be left open without
+        # anything referring to them.
+        for future in unsettled:
+            if not future.cancel():
+                future.add_done_callback(_close_late_instrument)
+        _close_all(inst_dict)
+        raise
     return inst_dict
+
+
+# CLASSES #####################################################################
+
+
+class InstrumentProxy:
+    """
+    Stands in for an instrument loaded by `load_instruments` in lazy mode.
+    The instrument is opened, and its configured attributes are set, the
+    first time one of its attributes is accessed. From then on, attribute
+    accesses are passed on to the instrument.
+
+    >>> insts = ik.load_instruments("rack.yml", lazy=True)
+    >>> insts["ddg"].trigger_source  # Opens the DDG.
+
+    As the proxy is not itself an instance of the instrument class, use
+    `InstrumentProxy.instrument` where the instrument is needed as such.
+
+    :param value: Configuration node giving the class and URI of the
+        instrument, and optionally its ``attrs``.
+    :param callable on_open: If given, called with the time taken to open the
+        instrument, in seconds, once it has opened or failed to.
+    """
+
+    __slots__ = ("_conf", "_on_open", "_instrument", "_lock")
+
+    def __init__(self, value, on_open=None):
+        object.__setattr__(self, "_conf", value)
+        object.__setattr__(self, "_on_open", on_open)
+        object.__setattr__(self, "_instrument", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    @property
+    def instrument(self):
+        """
+        Gets the instrument, opening it if it has not been opened yet.
+
+        :type: `~instruments.Instrument`
+        """
+        instrument = self._instrument
+        if instrument is not None:
+            return instrument
+        with self._lock:
+            if self._instrument is None:
+                start = time.monotonic()
+                try:
+                    object.__setattr__(
+                        self, "_instrument", _open_instrument(self._conf)
+                    )
+                finally:
+                    if self._on_open is not None:
+                        self._on_open(time.monotonic() - start)
+            return self._instrument
+
+    def __getattr__(self, name):
+        return getattr(self.instrument, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.instrument, name, value)
+
+    def __dir__(self):
+        return sorted(set(dir(type(self))) | set(dir(self.instrument)))
+
+    def __enter__(self):
+        return self.instrument.__enter__()
+
+    def __exit__(self, *exc):
+        return self.instrument.__exit__(*exc)
+
+    def __repr__(self):
+        state = "open" if self._instrument is not None else "not opened"
+        return "<{} for {} at {} ({})>".format(
+            type(self).__name__,
+            self._conf["class"].__name__,
+            self._conf["uri"],
+            state,
+        )
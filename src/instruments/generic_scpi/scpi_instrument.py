@@ -5,12 +5,25 @@ Provides support for SCPI compliant instruments
 
 # IMPORTS #####################################################################
 
+import contextlib
 from enum import IntEnum
+import re
+import threading
 
 from instruments.abstract_instruments import Instrument
+from instruments.abstract_instruments.accessor_replay import (
+    PendingIO,
+    UnsupportedIOError,
+    replay_property,
+)
 from instruments.units import ureg as u
 from instruments.util_fns import assume_units
 
+# CONSTANTS ###################################################################
+
+# Matches the ``;`` separating responses, but not one inside a quoted string.
+_RESPONSE_SEP_REGEX = re.compile(r';(?=(?:[^"]*"[^"]*")*[^"]*$)')
+
 # CLASSES #####################################################################
 
 
@@ -30,6 +43,14 @@ class SCPIInstrument(Instrument):
     >>> print(inst.name)
     """
 
+    #: Maximum length, in characters, of the compound messages sent by
+    #: `query_many`, `get_many` and `deferred_writes`, or `None` for no
+    #: limit. Set this to suit the input buffer of the instrument.
+    max_message_length = 256
+
+    # Holds the commands queued by `deferred_writes`, for each thread.
+    _deferred = None
+
     # PROPERTIES #
 
     @property
@@ -111,8 +132,9 @@ class SCPIInstrument(Instrument):
     def clear(self):
         """
         Clear instrument. Consult manual for specifics related to that
-        instrument.
+        instrument. This also discards cached property values.
         """
+        self.invalidate_cache()
         self.sendcmd("*CLS")
 
     def trigger(self):
@@ -133,6 +155,284 @@ class SCPIInstrument(Instrument):
         """
         self.sendcmd("*WAI")
 
+    # COMMAND-HANDLING METHODS #
+
+    def sendcmd(self, cmd):
+        """
+        Sends a command without waiting for a response. Inside
+        `deferred_writes`, the command is queued instead.
+
+        :param str cmd: String containing the command to
+            be sent.
+        """
+        cmds = self._deferred_cmds()
+        if cmds is not None:
+            self._invalidate_cache_on(cmd)
+            cmds.append(str(cmd))
+        else:
+            super().sendcmd(cmd)
+
+    def query(self, cmd, size=-1):
+        """
+        Executes the given query, first sending any commands queued by
+        `deferred_writes` so that the response reflects them.
+
+        :param str cmd: String containing the query to
+            execute.
+        :param int size: Number of bytes to be read. Default is read until
+            termination character is found.
+        :return: The result of the query as returned by the
+            connected instrument.
+        :rtype: `str`
+        """
+        self._flush_before_read()
+        return super().query(cmd, size)
+
+    def read(self, size=-1, encoding="utf-8"):
+        """
+        Read the last line, first sending any commands queued by
+        `deferred_writes`.
+
+        :param int size: Number of bytes to be read. Default is read until
+            termination character is found.
+        :return: The result of the read as returned by the
+            connected instrument.
+        :rtype: `str`
+        """
+        self._flush_before_read()
+        return super().read(size, encoding)
+
+    def read_raw(self, size=-1):
+        """
+        Read the raw last line, first sending any commands queued by
+        `deferred_writes`.
+
+        :param int size: Number of bytes to be read. Default is read until
+            termination character is found.
+        :return: The result of the read as returned by the
+            connected instrument.
+        :rtype: `bytes`
+        """
+        self._flush_before_read()
+        return super().read_raw(size)
+
+    def binblockread(self, data_width, fmt=None, out=None):
+        """
+        Read a binary data block from attached instrument, first sending any
+        commands queued by `deferred_writes`. See
+        `~instruments.Instrument.binblockread`.
+        """
+        self._flush_before_read()
+        return super().binblockread(data_width, fmt, out)
+
+    def binblockread_iter(self, data_width, fmt=None, chunk_size=2**20):
+        """
+        Read a binary data block in chunks, first sending any commands
+        queued by `deferred_writes`. See
+        `~instruments.Instrument.binblockread_iter`.
+        """
+        self._flush_before_read()
+        return super().binblockread_iter(data_width, fmt, chunk_size)
+
+    # DEFERRED WRITES ##
+
+    @contextlib.contextmanager
+    def deferred_writes(self, verify_opc=False, check_errors=False):
+        """
+        Context manager which queues the commands sent inside it, including
+        those sent by property setters, and sends them on exit as compound
+        messages such as ``CMD1 1;:CMD2 2``, each no longer than
+        `max_message_length`.
+
+        >>> with inst.deferred_writes(verify_opc=True):  # doctest: +SKIP
+        ...     inst.frequency = 1 * u.kHz
+        ...     inst.amplitude = 2 * u.V
+
+        A query or read made inside the block first sends the queued
+        commands, so that it sees their effect. Reads made directly on the
+        communicator do not. If the block raises an exception, the queued
+        commands are discarded. Nested blocks join the outermost one.
+
+        Commands are queued for the thread which entered the block, so
+        commands sent by other threads meanwhile are sent right away.
+
+        :param bool verify_opc: If `True`, ``*OPC?`` is appended to the last
+            message, and the instrument must report that all operations are
+            complete.
+        :param bool check_errors: If `True`, the error queue is read once all
+            commands are sent, using `check_error_queue`, and `OSError` is
+            raised if it is not empty.
+        """
+        if self._deferred_cmds() is not None:
+            yield
+            return
+        local = self.__dict__.setdefault("_deferred", threading.local())
+        local.cmds = []
+        try:
+            yield
+            self._flush_deferred(verify_opc)
+        finally:
+            local.cmds = None
+        if check_errors:
+            errors = self.check_error_queue()
+            if errors:
+                raise OSError(f"Instrument reported errors: {errors}")
+
+    def _deferred_cmds(self):
+        """
+        Returns the commands queued by `deferred_writes` on the calling
+        thread, or `None` outside of it.
+        """
+        if self._deferred is None:
+            return None
+        return getattr(self._deferred, "cmds", None)
+
+    def _flush_before_read(self):
+        """
+        Sends the commands queued by `deferred_writes`, if any, before
+        reading from the instrument.
+        """
+        if self._deferred_cmds():
+            self._flush_deferred()
+
+    def _flush_deferred(self, verify_opc=False):
+        """
+        Sends the commands queued by `deferred_writes`.
+        """
+        cmds, self._deferred.cmds = self._deferred.cmds, []
+        if verify_opc:
+            cmds.append("*OPC?")
+        with self.transaction():
+            batches = list(self._batch_messages(cmds))
+            for batch in batches[:-1]:
+                super().sendcmd(";".join(batch))
+            if not batches:
+                return
+            if verify_opc:
+                if not int(super().query(";".join(batches[-1]))):
+                    raise OSError("Instrument did not complete deferred writes.")
+            else:
+                super().sendcmd(";".join(batches[-1]))
+
+    # BATCHED QUERIES ##
+
+    def query_many(self, cmds):
+        """
+        Executes several queries, combining them into as few compound
+        messages such as ``CMD1?;:CMD2?`` as `max_message_length` allows,
+        and splitting the ``;``-separated replies.
+
+        >>> volt, curr = inst.query_many(["VOLT?", "CURR?"])  # doctest: +SKIP
+
+        Queries after the first in a message are prefixed with ``:``, so that
+        each is interpreted from the root of the command tree, as when sent on
+        its own.
+
+        :param cmds: Queries to execute.
+        :type cmds: `list` of `str`
+        :return: The responses, in the order of ``cmds``.
+        :rtype: `list` of `str`
+        """
+        responses = []
+        with self.transaction():
+            for batch in self._batch_messages(cmds):
+                reply = _RESPONSE_SEP_REGEX.split(self.query(";".join(batch)))
+                if len(reply) != len(batch):
+                    raise OSError(
+                        "Expected {} responses to compound query, got "
+                        "{}.".format(len(batch), len(reply))
+                    )
+                responses += [response.strip() for response in reply]
+        return responses
+
+    def _batch_messages(self, cmds):
+        """
+        Groups commands or queries into lists whose joined length does not
+        exceed `max_message_length`. One which is too long on its own is sent
+        alone.
+        """
+        batch = []
+        length = 0
+        limit = self.max_message_length
+        for cmd in cmds:
+            if batch:
+                joined = cmd if cmd.startswith(("*", ":")) else ":" + cmd
+                if limit is None or length + 1 + len(joined) <= limit:
+                    batch.append(joined)
+                    length += 1 + len(joined)
+                    continue
+                yield batch
+            batch = [cmd]
+            length = len(cmd)
+        if batch:
+            yield batch
+
+    def get_many(self, *names):
+        """
+        Reads several properties, combining the queries of those made by the
+        factories in `instruments.util_fns`, such as `unitful_property`,
+        `enum_property` and `bool_property`, into compound messages with
+        `query_many`. Other properties are read once, on their own.
+
+        >>> freq, shape = inst.get_many("frequency", "function")  # doctest: +SKIP
+
+        Each factory getter is run against a stand-in which records its I/O.
+        The next query of every getter is sent in one batch, so reading any
+        number of single-query properties costs one transaction while the
+        messages fit in `max_message_length`. Other I/O, such as fixed-size
+        reads, is performed on its own. Getters are run again after each
+        batch, replaying the replies known so far, which is why hand-written
+        getters, whose side effects would be repeated, are not batched.
+
+        :param str names: Names of the properties, optionally prefixed by
+            attribute and index accesses such as ``channel[0].``.
+        :return: The property values, in the order of ``names``.
+        :rtype: `tuple`
+        """
+        values = [None] * len(names)
+        props = [replay_property(self, name) for name in names]
+        pending = []
+        with self.transaction():
+            for idx, prop in enumerate(props):
+                if prop is None:
+                    values[idx] = self._get_once(names[idx])
+                else:
+                    pending.append(idx)
+            while pending:
+                batch = []
+                waiting = []
+                for idx in pending:
+                    try:
+                        values[idx] = props[idx].get()
+                        continue
+                    except UnsupportedIOError:
+                        values[idx] = props[idx].get(live=True)
+                        continue
+                    except PendingIO as pending_io:
+                        op = pending_io.op
+                    waiting.append(idx)
+                    if op[0] == "query" and op[2] == -1:
+                        batch.append((idx, op[1]))
+                    elif op[0] == "query":
+                        props[idx].results.append(self.query(op[1], op[2]))
+                    elif op[0] == "sendcmd":
+                        self.sendcmd(op[1])
+                        props[idx].results.append(None)
+                    else:
+                        props[idx].results.append(self.read(op[1], op[2]))
+                responses = self.query_many([cmd for _, cmd in batch])
+                for (idx, _), response in zip(batch, responses):
+                    props[idx].results.append(response)
+                pending = waiting
+        return tuple(values)
+
+    def _get_once(self, name):
+        """
+        Reads the named property directly, for `get_many`.
+        """
+        target, attr = self._resolve_expression(self, name)
+        return getattr(target, attr)
+
     # SYSTEM COMMANDS ##
 
     @property
@@ -11,7 +11,7 @@ from instruments.abstract_instruments import Multimeter
 from instruments.generic_scpi import SCPIMultimeter
 from instruments.optional_dep_finder import numpy
 from instruments.units import ureg as u
-from instruments.util_fns import ProxyList
+from instruments.util_fns import ProxyList, parse_ascii_array
 
 # CLASSES #####################################################################
 
@@ -215,7 +215,7 @@ class Keithley2182(SCPIMultimeter):
         :rtype: `tuple`[`~pint.Quantity`, ...]
             or if numpy is installed, `~pint.Quantity` with `numpy.array` data
         """
-        data = list(map(float, self.query("FETC?").split(",")))
+        data = parse_ascii_array(self.query("FETC?"))
         unit = self.units
         if numpy:
             return data * unit
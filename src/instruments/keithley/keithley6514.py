@@ -10,7 +10,7 @@ from enum import Enum
 from instruments.abstract_instruments import Electrometer
 from instruments.generic_scpi import SCPIInstrument
 from instruments.units import ureg as u
-from instruments.util_fns import bool_property, enum_property
+from instruments.util_fns import bool_property, enum_property, parse_ascii_array
 
 # CLASSES #####################################################################
 
@@ -107,7 +107,7 @@ class Keithley6514(SCPIInstrument, Electrometer):
 
     def _parse_measurement(self, ascii):
         # TODO: don't assume ASCII data format # pylint: disable=fixme
-        vals = list(map(float, ascii.split(",")))
+        vals = parse_ascii_array(ascii).tolist()
         reading = vals[0] * self.unit
         timestamp = vals[1]
         status = vals[2]
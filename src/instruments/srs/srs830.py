@@ -23,6 +23,7 @@ from instruments.util_fns import (
     bool_property,
     bounded_unitful_property,
     enum_property,
+    parse_ascii_array,
     unitful_property,
 )
 
@@ -500,7 +501,7 @@ class SRS830(SCPIInstrument):
             raise ValueError("Both parameters for the data snapshot are the " "same.")
 
         result = self.query(f"SNAP? {mode1},{mode2}")
-        return list(map(float, result.split(",")))
+        return parse_ascii_array(result).tolist()
 
     _valid_read_data_buffer = {Mode.ch1: 1, Mode.ch2: 2}
 
@@ -532,10 +533,10 @@ class SRS830(SCPIInstrument):
         # Query device for entire buffer, returning in ASCII, then
         # converting to a list of floats before returning to the
         # calling method
-        data = self.query(f"TRCA?{channel},0,{N}").strip()
+        data = parse_ascii_array(self.query(f"TRCA?{channel},0,{N}"))
         if numpy:
-            return numpy.fromstring(data, sep=",")
-        return tuple(map(float, data.split(",")))
+            return data
+        return tuple(data)
 
     def clear_data_buffer(self):
         """
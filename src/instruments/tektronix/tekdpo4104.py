@@ -12,7 +12,7 @@ from enum import Enum
 from instruments.abstract_instruments import Oscilloscope
 from instruments.optional_dep_finder import numpy
 from instruments.generic_scpi import SCPIInstrument
-from instruments.util_fns import ProxyList
+from instruments.util_fns import ProxyList, parse_ascii_array
 
 # FUNCTIONS ###################################################################
 
@@ -117,12 +117,7 @@ class TekDPO4104(SCPIInstrument, Oscilloscope):
                     # Set data encoding format to ASCII
                     self._tek.sendcmd("DAT:ENC ASCI")
                     sleep(0.02)  # Work around issue with 2.48 firmware.
-                    raw = self._tek.query("CURVE?")
-                    raw = raw.split(",")  # Break up comma delimited string
-                    if numpy:
-                        raw = numpy.array(raw, dtype=float)  # Convert to numpy array
-                    else:
-                        raw = map(float, raw)
+                    raw = parse_ascii_array(self._tek.query("CURVE?"))
                 else:
                     # Set encoding to signed, big-endian
                     self._tek.sendcmd("DAT:ENC RIB")
@@ -184,7 +184,20 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
             """
 
         # pylint: disable=protected-access
-        def read_waveform(self, bin_format=True):
+        def read_waveform(self, bin_format=True, chunk_size=None):
+            """
+            Gets the waveform of this data source.
+
+            :param bool bin_format: Unused, the waveform is always transferred
+                in binary.
+            :param int chunk_size: If given, return a generator yielding the
+                scaled waveform in chunks of this many points as they arrive,
+                instead of reading the whole record at once. The generator
+                must be exhausted or closed before using the instrument again.
+            :return: The scaled waveform.
+            """
+            if chunk_size is not None:
+                return self._stream_waveform(chunk_size)
             # We want to get the data back in binary, as it's just too much
             # otherwise.
             with self:
@@ -202,6 +215,37 @@ class TekDPO70000(SCPIInstrument, Oscilloscope):
 
                 return self._scale_raw_data(raw)
 
+        def _stream_waveform(self, chunk_size):
+            with self:
+                self._parent.select_fastest_encoding()
+                n_bytes = self._parent.outgoing_n_bytes
+                dtype = self._parent._dtype(
+                    self._parent.outgoing_binary_format,
+                    self._parent.outgoing_byte_order,
+                    n_bytes=None,
+                )
+                # The scaling is affine, so evaluate it once at 0 and 1
+                # before the transfer instead of querying the scale settings
+                # for every chunk.
+                ends = self._scale_raw_data(numpy.array((0, 1)) if numpy else (0, 1))
+                zero, step = ends[0], ends[1] - ends[0]
+                self._parent.sendcmd("CURV?")
+                chunks = self._parent.binblockread_iter(
+                    n_bytes, fmt=dtype, chunk_size=chunk_size
+                )
+                try:
+                    for raw in chunks:
+                        if numpy:
+                            yield zero + step * raw.astype(float)
+                        else:
+                            yield tuple(zero + step * float(d) for d in raw)
+                except GeneratorExit:
+                    chunks.close()
+                    self._parent._file.read_raw(1)
+                    raise
+                # Clear the queue by reading the end of line character
+                self._parent._file.read_raw(1)
+
         def __enter__(self):
             self._old_dsrc = self._parent.data_source
             if self._old_dsrc != self:
@@ -12,7 +12,7 @@ from enum import Enum
 from instruments.abstract_instruments import Oscilloscope
 from instruments.generic_scpi import SCPIInstrument
 from instruments.optional_dep_finder import numpy
-from instruments.util_fns import ProxyList
+from instruments.util_fns import ProxyList, parse_ascii_array
 from instruments.units import ureg as u
 
 # CLASSES #####################################################################
@@ -81,12 +81,7 @@ class TekTDS224(SCPIInstrument, Oscilloscope):
                 if not bin_format:
                     self._tek.sendcmd("DAT:ENC ASCI")
                     # Set the data encoding format to ASCII
-                    raw = self._tek.query("CURVE?")
-                    raw = raw.split(",")  # Break up comma delimited string
-                    if numpy:
-                        raw = numpy.array(raw, dtype=float)  # Convert to ndarray
-                    else:
-                        raw = tuple(map(float, raw))
+                    raw = parse_ascii_array(self._tek.query("CURVE?"))
                 else:
                     self._tek.sendcmd("DAT:ENC RIB")
                     # Set encoding to signed, big-endian
@@ -43,7 +43,7 @@ import time
 from instruments.abstract_instruments import Oscilloscope
 from instruments.generic_scpi import SCPIInstrument
 from instruments.optional_dep_finder import numpy
-from instruments.util_fns import ProxyList
+from instruments.util_fns import ProxyList, parse_ascii_array
 
 # CLASSES #####################################################################
 
@@ -138,12 +138,7 @@ class TekTDS5xx(SCPIInstrument, Oscilloscope):
                 if not bin_format:
                     # Set the data encoding format to ASCII
                     self._parent.sendcmd("DAT:ENC ASCI")
-                    raw = self._parent.query("CURVE?")
-                    raw = raw.split(",")  # Break up comma delimited string
-                    if numpy:
-                        raw = numpy.array(raw, dtype=float)  # Convert to numpy array
-                    else:
-                        raw = map(float, raw)
+                    raw = parse_ascii_array(self._parent.query("CURVE?"))
                 else:
                     # Set encoding to signed, big-endian
                     self._parent.sendcmd("DAT:ENC RIB")
@@ -19,7 +19,13 @@ from enum import Enum
 from instruments.abstract_instruments import Oscilloscope
 from instruments.optional_dep_finder import numpy
 from instruments.units import ureg as u
-from instruments.util_fns import assume_units, enum_property, bool_property, ProxyList
+from instruments.util_fns import (
+    assume_units,
+    enum_property,
+    bool_property,
+    parse_ascii_array,
+    ProxyList,
+)
 
 # CLASSES #####################################################################
 
@@ -264,11 +270,9 @@ class MAUI(Oscilloscope):
                 self._parent.trigger_state = trig_state
 
             # format the string to appropriate data
-            retval = retval.replace('"', "").split()
-            if numpy:
-                dat_val = numpy.array(retval, dtype=float)  # Convert to ndarray
-            else:
-                dat_val = tuple(map(float, retval))
+            dat_val = parse_ascii_array(retval, sep=None)
+            if not numpy:
+                dat_val = tuple(dat_val)
 
             # format horizontal data into floats
             horiz_off = float(horiz_off.replace('"', "").split(":")[1])
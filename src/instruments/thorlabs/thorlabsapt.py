@@ -1299,7 +1299,7 @@ class APTMotorController(ThorLabsAPT):
             )
             # chan, pos
             _, pos = struct.unpack("<Hl", response.data)
-            return u.Quantity(pos, "counts") / self.scale_factors[0]
+            return u.Quantity(pos, u.counts) / self.scale_factors[0]
 
         @backlash_correction.setter
         def backlash_correction(self, pos):
@@ -1384,7 +1384,7 @@ class APTMotorController(ThorLabsAPT):
                 int(home_dir),
                 int(lim_sw),
                 u.Quantity(vel) / self.scale_factors[1],
-                u.Quantity(offset, "counts") / self.scale_factors[0],
+                u.Quantity(offset, u.counts) / self.scale_factors[0],
             )
 
         @home_parameters.setter
@@ -1503,7 +1503,7 @@ class APTMotorController(ThorLabsAPT):
             )
             # chan, pos
             _, pos = struct.unpack("<Hl", response.data)
-            return u.Quantity(pos, "counts") / self.scale_factors[0]
+            return u.Quantity(pos, u.counts) / self.scale_factors[0]
 
         @property
         def position_encoder(self):
@@ -1526,7 +1526,7 @@ class APTMotorController(ThorLabsAPT):
             )
             # chan, pos
             _, pos = struct.unpack("<Hl", response.data)
-            return u.Quantity(pos, "counts")
+            return u.Quantity(pos, u.counts)
 
         def go_home(self):
             """
@@ -1,13 +1,143 @@
 #!/usr/bin/env python
 """
 Module containing custom units used by various instruments.
+
+InstrumentKit uses pint's application registry, so that quantities
+interoperate with those of user code. Parsing pint's unit definitions takes
+most of the time needed to import InstrumentKit. To keep the parsed
+definitions in pint's on-disk cache, set up the application registry before
+importing InstrumentKit:
+
+>>> import pint
+>>> pint.set_application_registry(
+...     pint.UnitRegistry(cache_folder=":auto:")
+... )  # doctest: +SKIP
+>>> import instruments as ik  # doctest: +SKIP
 """
 
 # IMPORTS #####################################################################
 
+import functools
+
 import pint
 
+# FUNCTIONS ###################################################################
+
+
+def resolve_unit(name):
+    """
+    Returns the `~pint.Unit` with the given name or symbol. Unlike
+    ``ureg.Unit(name)``, which parses ``name`` every time, the result is
+    memoized for each registry set as pint's application registry, and the
+    units which drivers use most are looked up in a prebuilt table.
+
+    >>> resolve_unit("ms") is resolve_unit("ms")
+    True
+
+    :param str name: Name of the unit, such as ``"ms"`` or ``"volt"``.
+    :rtype: `~pint.Unit`
+    """
+    registry = ureg.get()
+    if registry is _prebound_registry:
+        unit = _prebound_units.get(name)
+        if unit is not None:
+            return unit
+    return _resolve_unit(registry, name)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_unit(registry, name):
+    return registry.Unit(name)
+
+
 # UNITS #######################################################################
 
 ureg = pint.get_application_registry()
 ureg.define("centibelmilliwatt = 1e-3 watt; logbase: 10; logfactor: 100 = cBm")
+
+# Units which drivers use on most readings and settings, resolved once for
+# the registry in use at import. These are kept here rather than bound to the
+# registry, which belongs to the application.
+_PREBOUND_UNITS = (
+    "A",
+    "amp",
+    "ampere",
+    "count",
+    "counts",
+    "dBm",
+    "degC",
+    "dimensionless",
+    "hertz",
+    "Hz",
+    "K",
+    "kelvin",
+    "mA",
+    "ms",
+    "mW",
+    "ns",
+    "ohm",
+    "percent",
+    "s",
+    "second",
+    "V",
+    "volt",
+    "W",
+    "watt",
+)
+_prebound_registry = ureg.get()
+_prebound_units = {name: _prebound_registry.Unit(name) for name in _PREBOUND_UNITS}
+
+# CLASSES #####################################################################
+
+
+class LazyQuantity(float):
+    """
+    A `float` magnitude which carries its units, as returned by unitful
+    properties in magnitude mode (see `~instruments.Instrument.magnitude_mode`).
+    It behaves as a plain `float` in arithmetic, and the `~pint.Quantity` it
+    stands for is only created when asked for.
+
+    >>> freq = LazyQuantity(1000.0, ureg.hertz)
+    >>> freq.to(ureg.kilohertz)
+    <Quantity(1.0, 'kilohertz')>
+    """
+
+    __slots__ = ("units",)
+
+    def __new__(cls, magnitude, units):
+        self = super().__new__(cls, magnitude)
+        self.units = units
+        return self
+
+    def __repr__(self):
+        return f"<LazyQuantity({float(self)}, '{self.units}')>"
+
+    def __str__(self):
+        return float.__repr__(self)
+
+    @property
+    def magnitude(self):
+        """
+        Gets the magnitude as a plain `float`.
+
+        :type: `float`
+        """
+        return float(self)
+
+    @property
+    def quantity(self):
+        """
+        Gets the quantity with the magnitude and units of this value.
+
+        :type: `~pint.Quantity`
+        """
+        return ureg.Quantity(float(self), self.units)
+
+    def to(self, units):
+        """
+        Converts to a quantity in the given units.
+
+        :param units: Units to convert to.
+        :rtype: `~pint.Quantity`
+        """
+        return self.quantity.to(units)
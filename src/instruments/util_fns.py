@@ -6,15 +6,37 @@ Module containing various utility functions
 # IMPORTS #####################################################################
 
 
+from array import array
+import functools
+import math
 import re
+import time
+import weakref
 
 from enum import Enum, IntEnum
-from instruments.units import ureg as u
+from instruments.optional_dep_finder import numpy
+from instruments.units import LazyQuantity, resolve_unit, ureg as u
 
 # CONSTANTS ###################################################################
 
 _IDX_REGEX = re.compile(r"([a-zA-Z_][a-zA-Z0-9_]*)\[(-?[0-9]*)\]")
 
+# Borrowed from:
+# http://stackoverflow.com/questions/430079/how-to-split-strings-into-text-and-number
+# Reg exp tweaked on May 30, 2015 by scasagrande to match on input with
+# scientific notation. General flow borrowed from:
+# http://www.regular-expressions.info/floatingpoint.html
+_UNIT_STR_REGEX = re.compile(
+    r"([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*([a-z]+)?", re.I
+)
+
+# Quote characters removed from ASCII array replies by `parse_ascii_array`.
+_QUOTES = b"\"'"
+
+# Factors converting magnitudes between pairs of units, as found by
+# `_conversion_factor`.
+_CONVERSION_FACTORS = {}
+
 # FUNCTIONS ###################################################################
 
 
@@ -35,7 +57,9 @@ def assume_units(value, units):
     """
     if isinstance(value, u.Quantity):
         return value
-    elif isinstance(value, str):
+    if isinstance(units, str):
+        units = resolve_unit(units)
+    if isinstance(value, str):
         value = u.Quantity(value)
         if value.dimensionless:
             return u.Quantity(value.magnitude, units)
@@ -43,6 +67,47 @@ def assume_units(value, units):
     return u.Quantity(value, units)
 
 
+def _conversion_factor(from_units, to_units):
+    """
+    Returns the factor which converts magnitudes in ``from_units`` to
+    ``to_units``, or `None` if the conversion is not a plain scaling, as
+    between temperature scales. Factors are cached, as converting with pint
+    is slow.
+
+    :param from_units: Units, or the name of units, to convert from.
+    :param to_units: Units to convert to.
+    :rtype: `float` or `None`
+    """
+    key = (from_units, to_units)
+    try:
+        return _CONVERSION_FACTORS[key]
+    except KeyError:
+        pass
+    zero, one, two = (
+        u.Quantity(value, from_units).to(to_units).magnitude
+        for value in (0.0, 1.0, 2.0)
+    )
+    factor = one if zero == 0 and math.isclose(two, 2 * one) else None
+    _CONVERSION_FACTORS[key] = factor
+    return factor
+
+
+def _magnitude_in(value, units):
+    """
+    Returns the magnitude of ``value``, a `~pint.Quantity` or
+    `~instruments.units.LazyQuantity`, in ``units``. Values already in
+    ``units`` are returned unchanged, and other conversions use a cached
+    factor where possible.
+    """
+    from_units = value.units
+    if from_units == units:
+        return value.magnitude
+    factor = _conversion_factor(from_units, units)
+    if factor is None:
+        return value.to(units).magnitude
+    return value.magnitude * factor
+
+
 def setattr_expression(target, name_expr, value):
     """
     Recursively calls getattr/setattr for attribute
@@ -111,35 +176,131 @@ def split_unit_str(s, default_units=u.dimensionless, lookup=None):
         Lookups are never performed on the default units.
     :rtype: `tuple` of a `float` and a `str` or `u.Quantity`
     """
+    val, units = _parse_unit_str(str(s).strip())
+    if units is None:
+        return val, default_units
     if lookup is None:
-        lookup = lambda x: x
-
-    # Borrowed from:
-    # http://stackoverflow.com/questions/430079/how-to-split-strings-into-text-and-number
-    # Reg exp tweaked on May 30, 2015 by scasagrande to match on input with
-    # scientific notation. General flow borrowed from:
-    # http://www.regular-expressions.info/floatingpoint.html
-    regex = r"([-+]?[0-9]*\.?[0-9]+)([eE][-+]?[0-9]+)?\s*([a-z]+)?"
-    match = re.match(regex, str(s).strip(), re.I)
-    if match:
-        if match.groups()[1] is None:
-            val, _, units = match.groups()
-        else:
-            val = float(match.groups()[0]) * 10 ** float(match.groups()[1][1:])
-            units = match.groups()[2]
+        return val, units
+    return val, lookup(units)
 
-        if units is None:
-            return float(val), default_units
 
-        return float(val), lookup(units)
+def split_unit_strs(values, default_units=u.dimensionless, lookup=None):
+    """
+    Splits each of several strings into its numeric part and its unit part,
+    as done by `split_unit_str`. This is meant for replies that report many
+    unit-suffixed values at once::
+
+        >>> split_unit_strs("1 V, 2.5 mV")
+        [(1.0, 'V'), (2.5, 'mV')]
+
+    :param values: Comma-separated string, or iterable of strings, to be
+        split up.
+    :param default_units: If no units are specified for a value, this
+        argument is given as its units.
+    :param callable lookup: If specified, this function is called on the
+        units part of each value. If `None`, no lookup is performed.
+        Lookups are never performed on the default units.
+    :rtype: `list` of `tuple` of a `float` and a `str` or `u.Quantity`
+    """
+    if isinstance(values, str):
+        values = values.split(",")
+    parsed = [_parse_unit_str(str(value).strip()) for value in values]
+    if lookup is None:
+        return [
+            (val, default_units if units is None else units) for val, units in parsed
+        ]
+    return [
+        (val, default_units if units is None else lookup(units))
+        for val, units in parsed
+    ]
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_unit_str(s):
+    """
+    Splits a stripped string into a `float` and its unit string, which is
+    `None` if the string has no units. Results are memoized, since
+    instruments tend to report the same few values over and over.
+    """
+    match = _UNIT_STR_REGEX.match(s)
+    if match:
+        return float(match.group(1)), match.group(2)
 
     try:
-        return float(s), default_units
+        return float(s), None
     except ValueError:
         raise ValueError(f"Could not split '{repr(s)}' into value and units.")
 
 
-def rproperty(fget=None, fset=None, doc=None, readonly=False, writeonly=False):
+def parse_ascii_array(data, sep=",", header=False):
+    """
+    Parses an ASCII reply holding an array of numbers, such as a waveform,
+    a data buffer or a list of readings.
+
+    With numpy, the values are parsed from the reply in a single pass into
+    a preallocated array, without making an intermediate string per value.
+    Surrounding whitespace and terminators, quote characters and a trailing
+    separator are ignored::
+
+        >>> parse_ascii_array('"1.5, 2, -3e-3,"')
+        array([ 1.5  ,  2.   , -0.003])
+
+    :param data: Reply to be parsed, as returned by `Instrument.query` or,
+        to skip decoding it, by `Instrument.read_raw`.
+    :type data: `str` or `bytes`
+    :param sep: Separator between values, or `None` to separate values by
+        any run of whitespace.
+    :type sep: `str` or `None`
+    :param bool header: If `True`, the reply starts with a header, such as
+        ``CURVE`` or ``:CURV``, which is separated from the values by
+        whitespace and is skipped.
+    :rtype: `numpy.ndarray` if numpy is installed, or `array.array` of type
+        ``"d"`` otherwise
+    :raises ValueError: If a value cannot be parsed.
+    """
+    if isinstance(data, str):
+        data = data.encode("ascii")
+    else:
+        data = bytes(data)
+    if b'"' in data or b"'" in data:
+        data = data.translate(None, _QUOTES)
+    if sep is not None:
+        sep = sep.encode("ascii")
+    if header:
+        parts = data.split(None, 1)
+        data = parts[1] if len(parts) > 1 else b""
+    if not numpy:
+        tokens = data.split(sep)
+        if tokens and not tokens[-1].strip():
+            tokens.pop()
+        return array("d", map(float, tokens))
+
+    # Older versions of numpy stop at the first value they cannot parse,
+    # with a warning rather than an error, so the number of values read is
+    # checked.
+    data = data.strip()
+    if sep is None:
+        values = numpy.fromstring(data, sep=" ")
+        expected = len(data.split())
+    else:
+        if data.endswith(sep):
+            data = data[: -len(sep)].rstrip()
+        values = numpy.fromstring(data, sep=sep.decode("ascii"))
+        expected = data.count(sep) + 1 if data else 0
+    if len(values) != expected:
+        raise ValueError(f"Could not parse {data!r} as an array of numbers.")
+    return values
+
+
+def rproperty(
+    fget=None,
+    fset=None,
+    doc=None,
+    readonly=False,
+    writeonly=False,
+    cache_ttl=None,
+    cache_key=None,
+):
     """
     Creates and returns a new property based on the input parameters.
 
@@ -150,9 +311,16 @@ def rproperty(fget=None, fset=None, doc=None, readonly=False, writeonly=False):
         setter.
     :param bool writeonly: If `True`, the returned property does not have a
         getter. Both readonly and writeonly cannot both be `True`.
+    :param float cache_ttl: If not `None`, values read by ``fget`` are cached
+        on each instance for this many seconds, under ``cache_key``. The value
+        returned by ``fset``, if any, is cached when the property is set.
+    :param cache_key: Key under which values are cached, typically the query
+        sent by ``fget``.
     """
     if readonly and writeonly:
         raise ValueError("Properties cannot be both read- and write-only.")
+    if cache_ttl is not None:
+        fget, fset = _cached_accessors(fget, fset, cache_ttl, cache_key)
     if readonly:
         return property(fget=fget, fset=None, doc=doc)
     elif writeonly:
@@ -161,6 +329,109 @@ def rproperty(fget=None, fset=None, doc=None, readonly=False, writeonly=False):
     return property(fget=fget, fset=fset, doc=doc)
 
 
+def _instrument_scope(obj):
+    """
+    Returns the instrument which owns ``obj``, such as a channel, and the
+    scope of ``obj`` within it, as a `tuple` which is empty for the
+    instrument itself.
+
+    Objects made by `ProxyList` are scoped by their class and index, so that
+    channels which are made anew on each access share their scope. Other
+    objects are found through their ``_parent`` attribute, and scoped by
+    identity. If no instrument is found, ``obj`` is its own owner.
+    """
+    chain = []
+    owner = obj
+    while "_property_cache" not in getattr(owner, "__dict__", {}):
+        attrs = getattr(owner, "__dict__", {})
+        if "_cache_parent" in attrs:
+            parent = attrs["_cache_parent"]
+        else:
+            parent = attrs.get("_parent")
+            if parent is None or parent is owner:
+                return obj, ()
+        chain.append(owner)
+        owner = parent
+    cache = owner.__dict__["_property_cache"]
+    links = (_cache_link(cache, child) for child in reversed(chain))
+    return owner, tuple(link for link in links if link is not None)
+
+
+def _cache_link(cache, obj):
+    """
+    Returns the part of the scope contributed by ``obj``, or `None` for
+    objects which stand in for their parent. Objects are identified by a
+    weak reference, so that the key of a collected object cannot match a
+    new one, and their cached values are dropped when they are collected.
+    """
+    attrs = obj.__dict__
+    if "_cache_link" in attrs:
+        return attrs["_cache_link"]
+    if "_cache_parent" in attrs:
+        return None
+    link = weakref.ref(obj, functools.partial(_drop_cache_link, cache))
+    attrs["_cache_link"] = link
+    return link
+
+
+def _drop_cache_link(cache, link):
+    for key in list(cache):
+        if link in key[0]:
+            cache.pop(key, None)
+
+
+def _cache_of(obj):
+    """
+    Returns the instrument holding the property cache used by ``obj``, and
+    the scope of ``obj`` in that cache.
+    """
+    owner, scope = _instrument_scope(obj)
+    if "_property_cache" not in owner.__dict__:
+        owner.__dict__["_property_cache"] = {}
+    return owner, scope
+
+
+def _cached_accessors(fget, fset, cache_ttl, cache_key):
+    """
+    Wraps a property getter and setter so that values are cached in the
+    ``_property_cache`` dictionary of the instrument owning the instance, as
+    used by `~instruments.Instrument.invalidate_cache` and
+    `~instruments.Instrument.no_cache`.
+    """
+
+    def _getter(self):
+        return _cached_value(self, cache_key, cache_ttl, fget)
+
+    def _setter(self, newval):
+        owner, scope = _cache_of(self)
+        cache = owner._property_cache
+        cache.pop((scope, cache_key), None)
+        value = fset(self, newval)
+        if value is not None:
+            cache[(scope, cache_key)] = (time.monotonic() + cache_ttl, value)
+
+    return None if fget is None else _getter, None if fset is None else _setter
+
+
+def _cached_value(obj, cache_key, cache_ttl, fetch):
+    """
+    Returns the value cached for ``obj`` under ``cache_key``, or calls
+    ``fetch(obj)`` and caches its result for ``cache_ttl`` seconds. Values
+    are kept by the instrument owning ``obj``, so that they are discarded
+    along with those of the instrument itself.
+    """
+    owner, scope = _cache_of(obj)
+    cache = owner._property_cache
+    key = (scope, cache_key)
+    if not owner.__dict__.get("_cache_bypass"):
+        entry = cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+    value = fetch(obj)
+    cache[key] = (time.monotonic() + cache_ttl, value)
+    return value
+
+
 def bool_property(
     command,
     set_cmd=None,
@@ -170,6 +441,7 @@ def bool_property(
     readonly=False,
     writeonly=False,
     set_fmt="{} {}",
+    cache_ttl=None,
 ):
     """
     Called inside of SCPI classes to instantiate boolean properties
@@ -205,23 +477,21 @@ def bool_property(
         non-query to the instrument. The default is "{} {}" which places a
         space between the SCPI command the associated parameter. By switching
         to "{}={}" an equals sign would instead be used as the separator.
+    :param float cache_ttl: If not `None`, the value read from the instrument
+        is cached on each instance for this many seconds, and updated when
+        the property is set. See `~instruments.Instrument.no_cache`.
     """
 
-    def _getter(self):
-        return self.query(command + "?").strip() == inst_true
-
-    def _setter(self, newval):
-        if not isinstance(newval, bool):
-            raise TypeError("Bool properties must be specified with a " "boolean value")
-        self.sendcmd(
-            set_fmt.format(
-                command if set_cmd is None else set_cmd,
-                inst_true if newval else inst_false,
-            )
-        )
-
-    return rproperty(
-        fget=_getter, fset=_setter, doc=doc, readonly=readonly, writeonly=writeonly
+    return _BoolProperty(
+        command,
+        set_cmd,
+        inst_true,
+        inst_false,
+        doc,
+        readonly,
+        writeonly,
+        set_fmt,
+        cache_ttl,
     )
 
 
@@ -235,6 +505,7 @@ def enum_property(
     readonly=False,
     writeonly=False,
     set_fmt="{} {}",
+    cache_ttl=None,
 ):
     """
     Called inside of SCPI classes to instantiate Enum properties
@@ -270,42 +541,22 @@ def enum_property(
         to be used when reading/querying from the instrument. If used, the name
         parameter is still used to set the command for pure-write commands to
         the instrument.
+    :param float cache_ttl: If not `None`, the value read from the instrument
+        is cached on each instance for this many seconds, and updated when
+        the property is set. See `~instruments.Instrument.no_cache`.
     """
 
-    def _in_decor_fcn(val):
-        if input_decoration is None:
-            return val
-        elif hasattr(input_decoration, "__get__"):
-            return input_decoration.__get__(None, object)(val)
-        return input_decoration(val)
-
-    def _out_decor_fcn(val):
-        if output_decoration is None:
-            return val
-        elif hasattr(output_decoration, "__get__"):
-            return output_decoration.__get__(None, object)(val)
-        return output_decoration(val)
-
-    def _getter(self):
-        return enum(_in_decor_fcn(self.query(f"{command}?").strip()))
-
-    def _setter(self, newval):
-        try:  # First assume newval is Enum.value
-            newval = enum[newval]
-        except KeyError:  # Check if newval is Enum.name instead
-            try:
-                newval = enum(newval)
-            except ValueError:
-                raise ValueError("Enum property new value not in enum.")
-        self.sendcmd(
-            set_fmt.format(
-                command if set_cmd is None else set_cmd,
-                _out_decor_fcn(enum(newval).value),
-            )
-        )
-
-    return rproperty(
-        fget=_getter, fset=_setter, doc=doc, readonly=readonly, writeonly=writeonly
+    return _EnumProperty(
+        command,
+        enum,
+        set_cmd,
+        doc,
+        input_decoration,
+        output_decoration,
+        readonly,
+        writeonly,
+        set_fmt,
+        cache_ttl,
     )
 
 
@@ -317,6 +568,7 @@ def unitless_property(
     readonly=False,
     writeonly=False,
     set_fmt="{} {}",
+    cache_ttl=None,
 ):
     """
     Called inside of SCPI classes to instantiate properties with unitless
@@ -340,23 +592,13 @@ def unitless_property(
         non-query to the instrument. The default is "{} {}" which places a
         space between the SCPI command the associated parameter. By switching
         to "{}={}" an equals sign would instead be used as the separator.
+    :param float cache_ttl: If not `None`, the value read from the instrument
+        is cached on each instance for this many seconds, and updated when
+        the property is set. See `~instruments.Instrument.no_cache`.
     """
 
-    def _getter(self):
-        raw = self.query(f"{command}?")
-        return float(raw)
-
-    def _setter(self, newval):
-        if isinstance(newval, u.Quantity):
-            if newval.units == u.dimensionless:
-                newval = float(newval.magnitude)
-            else:
-                raise ValueError
-        strval = format_code.format(newval)
-        self.sendcmd(set_fmt.format(command if set_cmd is None else set_cmd, strval))
-
-    return rproperty(
-        fget=_getter, fset=_setter, doc=doc, readonly=readonly, writeonly=writeonly
+    return _UnitlessProperty(
+        command, set_cmd, format_code, doc, readonly, writeonly, set_fmt, cache_ttl
     )
 
 
@@ -369,6 +611,7 @@ def int_property(
     writeonly=False,
     valid_set=None,
     set_fmt="{} {}",
+    cache_ttl=None,
 ):
     """
     Called inside of SCPI classes to instantiate properties with unitless
@@ -394,35 +637,21 @@ def int_property(
         non-query to the instrument. The default is "{} {}" which places a
         space between the SCPI command the associated parameter. By switching
         to "{}={}" an equals sign would instead be used as the separator.
+    :param float cache_ttl: If not `None`, the value read from the instrument
+        is cached on each instance for this many seconds, and updated when
+        the property is set. See `~instruments.Instrument.no_cache`.
     """
 
-    def _getter(self):
-        raw = self.query(f"{command}?")
-        return int(raw)
-
-    if valid_set is None:
-
-        def _setter(self, newval):
-            strval = format_code.format(newval)
-            self.sendcmd(
-                set_fmt.format(command if set_cmd is None else set_cmd, strval)
-            )
-
-    else:
-
-        def _setter(self, newval):
-            if newval not in valid_set:
-                raise ValueError(
-                    "{} is not an allowed value for this property; "
-                    "must be one of {}.".format(newval, valid_set)
-                )
-            strval = format_code.format(newval)
-            self.sendcmd(
-                set_fmt.format(command if set_cmd is None else set_cmd, strval)
-            )
-
-    return rproperty(
-        fget=_getter, fset=_setter, doc=doc, readonly=readonly, writeonly=writeonly
+    return _IntProperty(
+        command,
+        set_cmd,
+        format_code,
+        doc,
+        readonly,
+        writeonly,
+        valid_set,
+        set_fmt,
+        cache_ttl,
     )
 
 
@@ -438,6 +667,7 @@ def unitful_property(
     writeonly=False,
     set_fmt="{} {}",
     valid_range=(None, None),
+    cache_ttl=None,
 ):
     """
     Called inside of SCPI classes to instantiate properties with unitful numeric
@@ -477,60 +707,24 @@ def unitful_property(
         range. The default of `(None, None)` has no min or max constraints.
         The valid set is inclusive of the values provided.
     :type valid_range: `tuple` or `list` of `int` or `float`
+    :param float cache_ttl: If not `None`, the value read from the instrument
+        is cached on each instance for this many seconds, and updated when
+        the property is set. See `~instruments.Instrument.no_cache`.
     """
 
-    def _in_decor_fcn(val):
-        if input_decoration is None:
-            return val
-        elif hasattr(input_decoration, "__get__"):
-            return input_decoration.__get__(None, object)(val)
-        return input_decoration(val)
-
-    def _out_decor_fcn(val):
-        if output_decoration is None:
-            return val
-        elif hasattr(output_decoration, "__get__"):
-            return output_decoration.__get__(None, object)(val)
-        return output_decoration(val)
-
-    def _getter(self):
-        raw = _in_decor_fcn(self.query(f"{command}?"))
-        return u.Quantity(*split_unit_str(raw, units)).to(units)
-
-    def _setter(self, newval):
-        newval = assume_units(newval, units).to(units)
-        min_value, max_value = valid_range
-        if min_value is not None:
-            if callable(min_value):
-                min_value = min_value(self)  # pylint: disable=not-callable
-            else:
-                min_value = assume_units(min_value, units)
-            if newval < min_value:
-                raise ValueError(
-                    f"Unitful quantity is too low. Got {newval}, "
-                    f"minimum value is {min_value}"
-                )
-        if max_value is not None:
-            if callable(max_value):
-                max_value = max_value(self)  # pylint: disable=not-callable
-            else:
-                max_value = assume_units(max_value, units)
-            if newval > max_value:
-                raise ValueError(
-                    f"Unitful quantity is too high. Got {newval}, "
-                    f"maximum value is {max_value}"
-                )
-        # Rescale to the correct unit before printing. This will also
-        # catch bad units.
-        strval = format_code.format(newval.magnitude)
-        self.sendcmd(
-            set_fmt.format(
-                command if set_cmd is None else set_cmd, _out_decor_fcn(strval)
-            )
-        )
-
-    return rproperty(
-        fget=_getter, fset=_setter, doc=doc, readonly=readonly, writeonly=writeonly
+    return _UnitfulProperty(
+        command,
+        units,
+        set_cmd,
+        format_code,
+        doc,
+        input_decoration,
+        output_decoration,
+        readonly,
+        writeonly,
+        set_fmt,
+        valid_range,
+        cache_ttl,
     )
 
 
@@ -540,6 +734,8 @@ def bounded_unitful_property(
     min_fmt_str="{}:MIN?",
     max_fmt_str="{}:MAX?",
     valid_range=("query", "query"),
+    cache_bounds=False,
+    bounds_depend_on=(),
     **kwargs,
 ):
     """
@@ -576,6 +772,16 @@ def bounded_unitful_property(
         the values provided.
     :type valid_range: `list` or `tuple` of `int`, `float`, `None`, or the
         string ``"query"``.
+    :param bool cache_bounds: If `True`, the minimum and maximum values
+        queried from the instrument are cached on each instance when first
+        needed, rather than queried every time the property is set. They are
+        discarded by `~instruments.Instrument.invalidate_cache`, when
+        ``*RST`` is sent, and when a command in ``bounds_depend_on`` is sent.
+    :param bounds_depend_on: Commands, such as ``("FUNC", "OUTP:LOAD")``,
+        which change the bounds of this property. Sending a command whose
+        header contains one of these, such as ``:CH1:FUNC SQU`` sent by a
+        channel, discards the cached bounds.
+    :type bounds_depend_on: `tuple` of `str`
     :param kwargs: All other keyword arguments are passed onto
         `unitful_property`
     :return: Returns a `tuple` of 3 properties: first is as returned by
@@ -583,19 +789,29 @@ def bounded_unitful_property(
         value, and third is a property representing the maximum value
     """
 
+    def _query_bound(self, fmt_str):
+        query = fmt_str.format(command)
+
+        def _fetch(obj):
+            return u.Quantity(*split_unit_str(obj.query(query), units))
+
+        if not cache_bounds:
+            return _fetch(self)
+        owner, scope = _cache_of(self)
+        dependents = owner.__dict__.setdefault("_cache_dependents", {})
+        for dependency in bounds_depend_on:
+            dependents.setdefault(dependency.upper(), set()).add((scope, query))
+        return _cached_value(self, query, float("inf"), _fetch)
+
     def _min_getter(self):
         if valid_range[0] == "query":
-            return u.Quantity(
-                *split_unit_str(self.query(min_fmt_str.format(command)), units)
-            )
+            return _query_bound(self, min_fmt_str)
 
         return assume_units(valid_range[0], units).to(units)
 
     def _max_getter(self):
         if valid_range[1] == "query":
-            return u.Quantity(
-                *split_unit_str(self.query(max_fmt_str.format(command)), units)
-            )
+            return _query_bound(self, max_fmt_str)
 
         return assume_units(valid_range[1], units).to(units)
 
@@ -619,6 +835,7 @@ def string_property(
     readonly=False,
     writeonly=False,
     set_fmt="{} {}{}{}",
+    cache_ttl=None,
 ):
     """
     Called inside of SCPI classes to instantiate properties with a string value.
@@ -641,32 +858,472 @@ def string_property(
         the bookmark symbols on either side of the parameter.
     :param str bookmark_symbol: The symbol that will flank both sides of the
         parameter to be sent to the instrument. By default this is ``"``.
+    :param float cache_ttl: If not `None`, the value read from the instrument
+        is cached on each instance for this many seconds, and updated when
+        the property is set. See `~instruments.Instrument.no_cache`.
     """
-    bookmark_length = len(bookmark_symbol)
 
-    def _getter(self):
-        string = self.query(f"{command}?")
-        string = (
-            string[bookmark_length:-bookmark_length] if bookmark_length > 0 else string
+    return _StringProperty(
+        command,
+        set_cmd,
+        bookmark_symbol,
+        doc,
+        readonly,
+        writeonly,
+        set_fmt,
+        cache_ttl,
+    )
+
+
+# CLASSES #####################################################################
+
+
+def _resolve_decoration(decoration):
+    """
+    Returns the callable to apply for an input or output decoration, which
+    may be given as a function, a `staticmethod` or `None`.
+    """
+    if decoration is not None and hasattr(decoration, "__get__"):
+        return decoration.__get__(None, object)
+    return decoration
+
+
+def _escape_fmt(value):
+    """
+    Escapes braces so that ``value`` can be substituted into a format string
+    which is formatted again later.
+    """
+    return str(value).replace("{", "{{").replace("}", "}}")
+
+
+class _PropertyDoc:
+    """
+    The ``__doc__`` of the `_FactoryProperty` classes. A property subclass
+    with ``__slots__`` has no instance dictionary to hold the docstring of
+    each property, and a ``__doc__`` slot cannot be combined with a class
+    docstring. This gives the docstring of the class when looked up on the
+    class, and that of the property, held in its ``_doc`` slot, when looked
+    up on an instance.
+    """
+
+    def __init__(self, class_doc):
+        self._class_doc = class_doc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self._class_doc
+        return obj._doc  # pylint: disable=protected-access
+
+    def __set__(self, obj, value):
+        obj._doc = value  # pylint: disable=protected-access
+
+
+class _FactoryProperty(property):
+    """
+    Base class for the descriptors made by the property factories. These
+    work out their command strings, lookup tables and decorations once, when
+    the instrument class is created, rather than on every access. They
+    derive from `property` so that they are still seen as properties by
+    `~instruments.Instrument.aget` and by the documentation.
+
+    Subclasses implement ``_get(obj)`` and ``_set(obj, newval)``, where
+    ``_set`` returns the value to cache when caching is enabled.
+    """
+
+    __slots__ = ("cached", "_doc")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__doc__ = _PropertyDoc(cls.__dict__.get("__doc__"))
+
+    def __init__(self, doc, readonly, writeonly, cache_ttl, cache_key):
+        if readonly and writeonly:
+            raise ValueError("Properties cannot be both read- and write-only.")
+        self.cached = cache_ttl is not None
+        fget = None if writeonly else self._get
+        fset = None if readonly else self._set
+        if cache_ttl is not None:
+            fget, fset = _cached_accessors(fget, fset, cache_ttl, cache_key)
+        if fget is not None:
+            fget = self._wrap_getter(fget)
+        super().__init__(fget, fset)
+        self.__doc__ = doc
+
+    def _wrap_getter(self, fget):  # pylint: disable=no-self-use
+        """
+        Returns the getter of the property, given one which returns the
+        value as read or cached.
+        """
+        return fget
+
+    def _get(self, obj):
+        raise NotImplementedError
+
+    def _set(self, obj, newval):
+        raise NotImplementedError
+
+
+class _BoolProperty(_FactoryProperty):
+    """
+    Descriptor made by `bool_property`.
+    """
+
+    __slots__ = ("_query", "_inst_true", "_set_true", "_set_false")
+
+    def __init__(
+        self,
+        command,
+        set_cmd,
+        inst_true,
+        inst_false,
+        doc,
+        readonly,
+        writeonly,
+        set_fmt,
+        cache_ttl,
+    ):
+        set_cmd = command if set_cmd is None else set_cmd
+        self._query = command + "?"
+        self._inst_true = inst_true
+        self._set_true = set_fmt.format(set_cmd, inst_true)
+        self._set_false = set_fmt.format(set_cmd, inst_false)
+        super().__init__(doc, readonly, writeonly, cache_ttl, self._query)
+
+    def _get(self, obj):
+        return obj.query(self._query).strip() == self._inst_true
+
+    def _set(self, obj, newval):
+        if not isinstance(newval, bool):
+            raise TypeError("Bool properties must be specified with a " "boolean value")
+        obj.sendcmd(self._set_true if newval else self._set_false)
+        return newval
+
+
+class _EnumProperty(_FactoryProperty):
+    """
+    Descriptor made by `enum_property`. Members are looked up by name and
+    by value in dictionaries, falling back on calling the enum for values
+    it accepts through ``_missing_``. The command sent for each member is
+    formatted the first time that member is set.
+    """
+
+    __slots__ = (
+        "_query",
+        "_enum",
+        "_by_name",
+        "_by_value",
+        "_in_decor",
+        "_out_decor",
+        "_set_cmd",
+        "_set_fmt",
+        "_set_cmds",
+    )
+
+    def __init__(
+        self,
+        command,
+        enum,
+        set_cmd,
+        doc,
+        input_decoration,
+        output_decoration,
+        readonly,
+        writeonly,
+        set_fmt,
+        cache_ttl,
+    ):
+        self._query = f"{command}?"
+        self._enum = enum
+        self._by_name = dict(enum.__members__)
+        self._by_value = {}
+        for member in enum:
+            try:
+                self._by_value.setdefault(member.value, member)
+            except TypeError:  # Unhashable values are left to the enum.
+                pass
+        self._in_decor = _resolve_decoration(input_decoration)
+        self._out_decor = _resolve_decoration(output_decoration)
+        self._set_cmd = command if set_cmd is None else set_cmd
+        self._set_fmt = set_fmt
+        self._set_cmds = {}
+        super().__init__(doc, readonly, writeonly, cache_ttl, self._query)
+
+    def _get(self, obj):
+        value = obj.query(self._query).strip()
+        if self._in_decor is not None:
+            value = self._in_decor(value)
+        try:
+            return self._by_value[value]
+        except (KeyError, TypeError):
+            return self._enum(value)
+
+    def _set(self, obj, newval):
+        try:  # First assume newval is Enum.name
+            newval = self._by_name[newval]
+        except KeyError:  # Check if newval is Enum.value instead
+            try:
+                newval = self._by_value[newval]
+            except (KeyError, TypeError):
+                try:
+                    newval = self._enum(newval)
+                except ValueError:
+                    raise ValueError("Enum property new value not in enum.")
+        try:
+            cmd = self._set_cmds[newval]
+        except KeyError:
+            value = newval.value
+            if self._out_decor is not None:
+                value = self._out_decor(value)
+            cmd = self._set_cmds[newval] = self._set_fmt.format(self._set_cmd, value)
+        obj.sendcmd(cmd)
+        return newval
+
+
+class _UnitlessProperty(_FactoryProperty):
+    """
+    Descriptor made by `unitless_property`.
+    """
+
+    __slots__ = ("_query", "_set_template")
+
+    def __init__(
+        self,
+        command,
+        set_cmd,
+        format_code,
+        doc,
+        readonly,
+        writeonly,
+        set_fmt,
+        cache_ttl,
+    ):
+        self._query = f"{command}?"
+        self._set_template = set_fmt.format(
+            _escape_fmt(command if set_cmd is None else set_cmd), format_code
         )
-        return string
+        super().__init__(doc, readonly, writeonly, cache_ttl, self._query)
 
-    def _setter(self, newval):
-        self.sendcmd(
-            set_fmt.format(
-                command if set_cmd is None else set_cmd,
-                bookmark_symbol,
-                newval,
-                bookmark_symbol,
-            )
+    def _get(self, obj):
+        return float(obj.query(self._query))
+
+    def _set(self, obj, newval):
+        if isinstance(newval, u.Quantity):
+            if newval.units == u.dimensionless:
+                newval = float(newval.magnitude)
+            else:
+                raise ValueError
+        obj.sendcmd(self._set_template.format(newval))
+        return float(newval)
+
+
+class _IntProperty(_FactoryProperty):
+    """
+    Descriptor made by `int_property`.
+    """
+
+    __slots__ = ("_query", "_set_template", "_valid_set")
+
+    def __init__(
+        self,
+        command,
+        set_cmd,
+        format_code,
+        doc,
+        readonly,
+        writeonly,
+        valid_set,
+        set_fmt,
+        cache_ttl,
+    ):
+        self._query = f"{command}?"
+        self._set_template = set_fmt.format(
+            _escape_fmt(command if set_cmd is None else set_cmd), format_code
         )
+        self._valid_set = valid_set
+        super().__init__(doc, readonly, writeonly, cache_ttl, self._query)
 
-    return rproperty(
-        fget=_getter, fset=_setter, doc=doc, readonly=readonly, writeonly=writeonly
+    def _get(self, obj):
+        return int(obj.query(self._query))
+
+    def _set(self, obj, newval):
+        if self._valid_set is not None and newval not in self._valid_set:
+            raise ValueError(
+                "{} is not an allowed value for this property; "
+                "must be one of {}.".format(newval, self._valid_set)
+            )
+        obj.sendcmd(self._set_template.format(newval))
+        return newval
+
+
+class _UnitfulProperty(_FactoryProperty):
+    """
+    Descriptor made by `unitful_property`. Values are handled as magnitudes
+    in the units of the property, avoiding pint conversions when the units
+    already match and using cached factors otherwise. The getter returns a
+    quantity, or a `LazyQuantity` in magnitude mode. Bounds which are not
+    callables are converted once.
+    """
+
+    __slots__ = (
+        "_query",
+        "_units",
+        "_format_code",
+        "_in_decor",
+        "_out_decor",
+        "_set_cmd",
+        "_set_fmt",
+        "_min_value",
+        "_max_value",
+        "_min_magnitude",
+        "_max_magnitude",
     )
 
+    def __init__(
+        self,
+        command,
+        units,
+        set_cmd,
+        format_code,
+        doc,
+        input_decoration,
+        output_decoration,
+        readonly,
+        writeonly,
+        set_fmt,
+        valid_range,
+        cache_ttl,
+    ):
+        self._query = f"{command}?"
+        if isinstance(units, str):
+            units = resolve_unit(units)
+        elif not isinstance(units, u.Unit):
+            units = u.Unit(units)
+        self._units = units
+        self._format_code = format_code
+        self._in_decor = _resolve_decoration(input_decoration)
+        self._out_decor = _resolve_decoration(output_decoration)
+        self._set_cmd = command if set_cmd is None else set_cmd
+        self._set_fmt = set_fmt
+        self._min_value, self._max_value = (
+            bound if bound is None or callable(bound) else assume_units(bound, units)
+            for bound in valid_range
+        )
+        self._min_magnitude, self._max_magnitude = (
+            (
+                None
+                if bound is None or callable(bound)
+                else _magnitude_in(bound, self._units)
+            )
+            for bound in (self._min_value, self._max_value)
+        )
+        super().__init__(doc, readonly, writeonly, cache_ttl, self._query)
+
+    def _wrap_getter(self, fget):
+        units = self._units
+
+        def _getter(obj):
+            magnitude = fget(obj)
+            # Channels and other children follow the magnitude mode of the
+            # instrument which owns them.
+            owner, _ = _instrument_scope(obj)
+            if owner.__dict__.get("_magnitude_mode"):
+                return LazyQuantity(magnitude, units)
+            return u.Quantity(magnitude, units)
+
+        return _getter
+
+    def _get(self, obj):
+        raw = obj.query(self._query)
+        if self._in_decor is not None:
+            raw = self._in_decor(raw)
+        value, units = split_unit_str(raw, self._units)
+        if units is self._units:
+            return value
+        factor = _conversion_factor(units, self._units)
+        if factor is None:
+            return u.Quantity(value, units).to(self._units).magnitude
+        return value * factor
+
+    def _bound_magnitude(self, obj, bound):
+        """
+        Returns the magnitude in the units of the property of a callable
+        bound.
+        """
+        bound = bound(obj)
+        if isinstance(bound, (u.Quantity, LazyQuantity)):
+            return _magnitude_in(bound, self._units)
+        return bound
+
+    def _set(self, obj, newval):
+        if isinstance(newval, (u.Quantity, LazyQuantity)):
+            magnitude = _magnitude_in(newval, self._units)
+        elif isinstance(newval, str):
+            magnitude = assume_units(newval, self._units).to(self._units).magnitude
+        else:
+            magnitude = newval
+        min_magnitude = self._min_magnitude
+        if min_magnitude is None and self._min_value is not None:
+            min_magnitude = self._bound_magnitude(obj, self._min_value)
+        if min_magnitude is not None and magnitude < min_magnitude:
+            raise ValueError(
+                "Unitful quantity is too low. Got {}, minimum value is {}".format(
+                    u.Quantity(magnitude, self._units),
+                    u.Quantity(min_magnitude, self._units),
+                )
+            )
+        max_magnitude = self._max_magnitude
+        if max_magnitude is None and self._max_value is not None:
+            max_magnitude = self._bound_magnitude(obj, self._max_value)
+        if max_magnitude is not None and magnitude > max_magnitude:
+            raise ValueError(
+                "Unitful quantity is too high. Got {}, maximum value is {}".format(
+                    u.Quantity(magnitude, self._units),
+                    u.Quantity(max_magnitude, self._units),
+                )
+            )
+        strval = self._format_code.format(magnitude)
+        if self._out_decor is not None:
+            strval = self._out_decor(strval)
+        obj.sendcmd(self._set_fmt.format(self._set_cmd, strval))
+        return magnitude
 
-# CLASSES #####################################################################
+
+class _StringProperty(_FactoryProperty):
+    """
+    Descriptor made by `string_property`.
+    """
+
+    __slots__ = ("_query", "_bookmark_length", "_set_template")
+
+    def __init__(
+        self,
+        command,
+        set_cmd,
+        bookmark_symbol,
+        doc,
+        readonly,
+        writeonly,
+        set_fmt,
+        cache_ttl,
+    ):
+        self._query = f"{command}?"
+        self._bookmark_length = len(bookmark_symbol)
+        self._set_template = set_fmt.format(
+            _escape_fmt(command if set_cmd is None else set_cmd),
+            _escape_fmt(bookmark_symbol),
+            "{}",
+            _escape_fmt(bookmark_symbol),
+        )
+        super().__init__(doc, readonly, writeonly, cache_ttl, self._query)
+
+    def _get(self, obj):
+        string = obj.query(self._query)
+        length = self._bookmark_length
+        return string[length:-length] if length > 0 else string
+
+    def _set(self, obj, newval):
+        obj.sendcmd(self._set_template.format(newval))
+        return newval
 
 
 class ProxyList:
@@ -704,9 +1361,22 @@ class ProxyList:
         else:
             self._isenum = False
 
+    def _make(self, idx):
+        obj = self._proxy_cls(self._parent, idx)
+        attrs = getattr(obj, "__dict__", None)
+        if attrs is not None:
+            # Lets cached property values of the proxy be kept by the
+            # instrument, under a scope shared by every proxy for ``idx``.
+            attrs["_cache_parent"] = self._parent
+            attrs["_cache_link"] = (
+                self._proxy_cls,
+                idx.value if isinstance(idx, Enum) else idx,
+            )
+        return obj
+
     def __iter__(self):
         for idx in self._valid_set:
-            yield self._proxy_cls(self._parent, idx)
+            yield self._make(idx)
 
     def __getitem__(self, idx):
         # If we have an enum, try to normalize by using getitem. This will
@@ -729,7 +1399,7 @@ class ProxyList:
                 raise IndexError(
                     "Index out of range. Must be " "in {}.".format(self._valid_set)
                 )
-        return self._proxy_cls(self._parent, idx)
+        return self._make(idx)
 
     def __len__(self):
         return len(self._valid_set)
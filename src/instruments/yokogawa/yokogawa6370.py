@@ -17,6 +17,7 @@ from instruments.util_fns import (
     unitful_property,
     unitless_property,
     bounded_unitful_property,
+    parse_ascii_array,
     ProxyList,
     string_property,
 )
@@ -85,13 +86,18 @@ class Yokogawa6370(OpticalSpectrumAnalyzer):
 
         # METHODS #
 
-        def _data(self, axis, limits=None, bin_format=True):
+        def _data(self, axis, limits=None, bin_format=True, chunk_size=None):
             """Get data of `axis`.
 
             :param axis: Axis to get the data of, "X" or "Y"
             :param limits: Range of samples to transfer as a tuple of min and
                 max value, e.g. (5, 100) transfers data from the fifth to the
                 100th sample. The possible values are from 0 to 50000.
+            :param int chunk_size: If given, return a generator yielding the
+                data in chunks of this many samples as they arrive. The
+                trace is queried when the first chunk is requested, and the
+                generator must be exhausted or closed before using the
+                instrument again.
             """
             if limits is None:
                 cmd = f":TRAC:{axis}? {self._name}"
@@ -99,30 +105,55 @@ class Yokogawa6370(OpticalSpectrumAnalyzer):
                 cmd = f":TRAC:{axis}? {self._name},{limits[0]+1},{limits[1]+1}"
             else:
                 raise ValueError("limits has to be a list or tuple with two members")
+            if chunk_size is not None:
+                return self._stream_data(cmd, chunk_size)
             self._parent.sendcmd(cmd)
             data = self._parent.binblockread(data_width=8, fmt="<d")
             self._parent._file.read_raw(1)  # pylint: disable=protected-access
             return data
 
-        def data(self, limits=None, bin_format=True):
+        # pylint: disable=protected-access
+        def _stream_data(self, cmd, chunk_size):
+            # The query is only sent once the first chunk is asked for, so
+            # that a generator which is never iterated leaves no response
+            # behind.
+            self._parent.sendcmd(cmd)
+            try:
+                yield from self._parent.binblockread_iter(
+                    data_width=8, fmt="<d", chunk_size=chunk_size
+                )
+            except GeneratorExit:
+                self._parent._file.read_raw(1)
+                raise
+            self._parent._file.read_raw(1)
+
+        def data(self, limits=None, bin_format=True, chunk_size=None):
             """
             Return the trace's level data.
 
             :param limits: Range of samples to transfer as a tuple of min and
                 max value, e.g. (5, 100) transfers data from the fifth to the
                 100th sample. The possible values are from 0 to 50000.
+            :param int chunk_size: If given, return a generator yielding the
+                data in chunks of this many samples as they arrive.
             """
-            return self._data("Y", limits=limits, bin_format=bin_format)
+            return self._data(
+                "Y", limits=limits, bin_format=bin_format, chunk_size=chunk_size
+            )
 
-        def wavelength(self, limits=None, bin_format=True):
+        def wavelength(self, limits=None, bin_format=True, chunk_size=None):
             """
             Return the trace's wavelength data.
 
             :param limits: Range of samples to transfer as a tuple of min and
                 max value, e.g. (5, 100) transfers data from the fifth to the
                 100th sample. The possible values are from 0 to 50000.
+            :param int chunk_size: If given, return a generator yielding the
+                data in chunks of this many samples as they arrive.
             """
-            return self._data("X", limits=limits, bin_format=bin_format)
+            return self._data(
+                "X", limits=limits, bin_format=bin_format, chunk_size=chunk_size
+            )
 
     # ENUMS #
 
@@ -296,7 +327,7 @@ class Yokogawa6370(OpticalSpectrumAnalyzer):
 
     def analysis(self):
         """Get the analysis data."""
-        return [float(x) for x in self.query(":CALC:DATA?").split(",")]
+        return parse_ascii_array(self.query(":CALC:DATA?")).tolist()
 
     def start_sweep(self):
         """
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""
+Configuration of the test suite.
+
+The benchmarks in ``tests/test_benchmarks`` are marked with
+``pytest.mark.benchmark``. They are slower than the unit tests, so they are
+skipped unless pytest is run with ``--benchmarks``.
+"""
+
+# IMPORTS ####################################################################
+
+
+import pytest
+
+# HOOKS ######################################################################
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the benchmarks in tests/test_benchmarks.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: benchmark which only runs with --benchmarks"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="Benchmarks only run with --benchmarks.")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Module containing tests for the stand-ins which replay property accessors
+"""
+
+# IMPORTS ####################################################################
+
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.accessor_replay import (
+    PendingIO,
+    UnsupportedIOError,
+    perform_io,
+    replay_property,
+)
+from instruments.units import ureg as u
+from instruments.util_fns import ProxyList, unitful_property
+from tests import expected_protocol, unit_eq
+
+# TEST CLASSES ###############################################################
+
+# pylint: disable=protected-access
+
+
+class MockInstrument(ik.Instrument):
+    """
+    Instrument with factory-built and hand-written properties.
+    """
+
+    class Channel:
+        def __init__(self, parent, idx):
+            self._parent = parent
+            self._idx = idx
+
+        def query(self, cmd, size=-1):
+            return self._parent.query(f"CH{self._idx}:{cmd}", size)
+
+        offset = unitful_property("OFFS", u.volt)
+
+    frequency = unitful_property("FREQ", u.Hz)
+    level = unitful_property("LEV", u.volt, cache_ttl=10)
+
+    @property
+    def channel(self):
+        return ProxyList(self, MockInstrument.Channel, range(2))
+
+    @property
+    def period(self):
+        return (1 / self.frequency).to(u.s)
+
+    @property
+    def raw_status(self):
+        self.sendcmd("STAT:FORM RAW")
+        return self._file.read_raw(2)
+
+
+# TESTS ######################################################################
+
+
+def test_replay_property_factory_only():
+    inst = MockInstrument.open_test()
+    assert replay_property(inst, "period") is None
+    assert replay_property(inst, "period", factory_only=False).cached
+    prop = replay_property(inst, "frequency")
+    assert prop.factory
+    assert prop.on_instrument
+    assert not prop.cached
+    assert replay_property(inst, "level").cached
+    assert not replay_property(inst, "channel[1].offset").on_instrument
+
+
+def test_replayed_property_get_and_run():
+    with expected_protocol(MockInstrument, ["CH1:OFFS?"], ["0.5"]) as inst:
+        prop = replay_property(inst, "channel[1].offset")
+        with pytest.raises(PendingIO) as pending:
+            prop.get()
+        assert pending.value.op == ("query", "CH1:OFFS?", -1)
+        unit_eq(prop.run(prop.get, lambda op: perform_io(inst, op)), 0.5 * u.volt)
+
+
+def test_replayed_property_communicator_use():
+    with expected_protocol(MockInstrument, ["STAT:FORM RAW"], ["ab"]) as inst:
+        prop = replay_property(inst, "raw_status", factory_only=False)
+        with pytest.raises(PendingIO):
+            prop.get()
+        prop.results.append(perform_io(inst, ("sendcmd", "STAT:FORM RAW")))
+        with pytest.raises(UnsupportedIOError):
+            prop.get()
+        assert prop.get(live=True) == b"ab"
+
+
+def test_replay_reads_communicator_settings():
+    inst = MockInstrument.open_test()
+    prop = replay_property(inst, "period", factory_only=False)
+    assert prop._replay._file.terminator == "\n"
+    with pytest.raises(UnsupportedIOError):
+        prop._replay.read_raw(1)
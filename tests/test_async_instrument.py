@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+"""
+Module containing tests for the awaitable Instrument API
+"""
+
+# IMPORTS ####################################################################
+
+
+import asyncio
+from enum import Enum
+from io import BytesIO
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.accessor_replay import UnsupportedIOError
+from instruments.abstract_instruments.comm import AsyncLoopbackCommunicator
+from instruments.errors import AcknowledgementError, PromptError
+from instruments.optional_dep_finder import numpy
+from instruments.units import ureg as u
+from instruments.util_fns import (
+    ProxyList,
+    bool_property,
+    enum_property,
+    unitful_property,
+)
+from tests import iterable_eq, unit_eq
+
+# TEST CLASSES ###############################################################
+
+# pylint: disable=protected-access
+
+
+class MockInstrument(ik.Instrument):
+    """
+    Instrument with a few factory-built properties.
+    """
+
+    class Shape(Enum):
+        sine = "SIN"
+        square = "SQU"
+
+    class Channel:
+        def __init__(self, parent, idx):
+            self._parent = parent
+            self._idx = idx
+
+        @property
+        def amplitude(self):
+            return u.Quantity(float(self._parent.query(f"CH{self._idx}:AMPL?")), u.volt)
+
+        @amplitude.setter
+        def amplitude(self, newval):
+            self._parent.sendcmd(f"CH{self._idx}:AMPL {newval.magnitude}")
+
+    frequency = unitful_property("FREQ", u.Hz, valid_range=(0, 1000))
+    shape = enum_property("SHAP", Shape)
+    output = bool_property("OUTP")
+
+    @property
+    def channel(self):
+        return ProxyList(self, MockInstrument.Channel, range(2))
+
+    @property
+    def period(self):
+        return (1 / self.frequency).to(u.s)
+
+    traces_read = 0
+
+    @property
+    def trace(self):
+        self.traces_read += 1
+        self.sendcmd("TRAC:FORM ASC")
+        return self.query("TRAC?")
+
+    @property
+    def raw_status(self):
+        return self._file.read_raw(1)
+
+
+class ErrCheckInstrument(MockInstrument):
+    """
+    Instrument whose driver checks for errors after each command and query.
+    """
+
+    errors_checked = 0
+
+    def _errcheck(self):
+        self.errors_checked += 1
+        assert super().query("ERR?") == "0"
+
+    def sendcmd(self, cmd):
+        super().sendcmd(cmd)
+        self._errcheck()
+
+    def query(self, cmd, size=-1):
+        resp = super().query(cmd, size)
+        self._errcheck()
+        return resp
+
+
+def _open(ins_to_host):
+    stdout = BytesIO()
+    comm = AsyncLoopbackCommunicator(BytesIO(ins_to_host), stdout)
+    return MockInstrument(comm), stdout
+
+
+# TESTS ######################################################################
+
+
+def test_async_instrument_init():
+    inst, _ = _open(b"")
+    assert inst._testing is True
+
+
+def test_async_instrument_aquery_asendcmd():
+    async def main():
+        inst, stdout = _open(b"answer\n")
+        await inst.asendcmd("CMD")
+        assert await inst.aquery("QUERY?") == "answer"
+        assert stdout.getvalue() == b"CMD\nQUERY?\n"
+
+    asyncio.run(main())
+
+
+def test_async_instrument_ack_and_prompt():
+    async def main():
+        inst, _ = _open(b"CMD\n> QUERY?\ndata\n> ")
+        inst._ack_expected = lambda msg: msg
+        inst.prompt = "> "
+        await inst.asendcmd("CMD")
+        assert await inst.aquery("QUERY?") == "data"
+
+    asyncio.run(main())
+
+
+def test_async_instrument_bad_ack():
+    async def main():
+        inst, _ = _open(b"nope\n")
+        inst._ack_expected = lambda msg: msg
+        with pytest.raises(AcknowledgementError):
+            await inst.aquery("QUERY?")
+
+    asyncio.run(main())
+
+
+def test_async_instrument_bad_prompt():
+    async def main():
+        inst, _ = _open(b"<<")
+        inst.prompt = "> "
+        with pytest.raises(PromptError):
+            await inst.asendcmd("CMD")
+
+    asyncio.run(main())
+
+
+def test_async_instrument_aread_raw_awrite():
+    async def main():
+        inst, stdout = _open(b"raw\n")
+        await inst.awrite("abc")
+        assert await inst.aread_raw() == b"raw"
+        assert stdout.getvalue() == b"abc"
+
+    asyncio.run(main())
+
+
+def test_async_instrument_abinblockread():
+    async def main():
+        inst, _ = _open(b"#210" + bytes.fromhex("00000001000200030004"))
+        expected = (0, 1, 2, 3, 4)
+        if numpy:
+            expected = numpy.array(expected)
+        iterable_eq(await inst.abinblockread(2), expected)
+
+    asyncio.run(main())
+
+
+def test_async_instrument_abinblockread_short():
+    async def main():
+        inst, _ = _open(b"#210" + bytes.fromhex("0000"))
+        with pytest.raises(OSError):
+            await inst.abinblockread(2)
+
+        inst, _ = _open(b"$210")
+        with pytest.raises(OSError):
+            await inst.abinblockread(2)
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("data_width", (1, 2, 4))
+def test_async_instrument_abinblockread_indefinite_length(data_width):
+    # Async communicators rely on the terminator, which data bytes may equal.
+    async def main():
+        inst, _ = _open(b"#0" + bytes.fromhex("00010a0000030004") + b"\n")
+        with pytest.raises(OSError):
+            await inst.abinblockread(data_width)
+
+    asyncio.run(main())
+
+
+def test_async_instrument_aget_aset():
+    async def main():
+        inst, stdout = _open(b"+1.000000E+02\nSQU\n1\n")
+        unit_eq(await inst.aget("frequency"), 100 * u.Hz)
+        assert await inst.aget("shape") == MockInstrument.Shape.square
+        await inst.aset("frequency", 2 * u.Hz)
+        await inst.aset("output", True)
+        assert stdout.getvalue() == (b"FREQ?\nSHAP?\nFREQ 2.000000e+00\nOUTP ON\n")
+
+        with pytest.raises(ValueError):
+            await inst.aset("frequency", 2 * u.kHz)
+
+    asyncio.run(main())
+
+
+def test_async_instrument_aget_nested_property():
+    async def main():
+        inst, stdout = _open(b"4\n")
+        unit_eq(await inst.aget("period"), 0.25 * u.s)
+        assert stdout.getvalue() == b"FREQ?\n"
+
+    asyncio.run(main())
+
+
+def test_async_instrument_aget_aset_channel():
+    async def main():
+        inst, stdout = _open(b"1.5\n")
+        unit_eq(await inst.aget("channel[1].amplitude"), 1.5 * u.volt)
+        await inst.aset("channel[0].amplitude", 2 * u.volt)
+        assert stdout.getvalue() == b"CH1:AMPL?\nCH0:AMPL 2\n"
+
+    asyncio.run(main())
+
+
+def test_async_instrument_aget_hand_written_runs_once():
+    async def main():
+        inst, stdout = _open(b"1,2,3\n")
+        assert await inst.aget("trace") == "1,2,3"
+        assert inst.traces_read == 1
+        assert stdout.getvalue() == b"TRAC:FORM ASC\nTRAC?\n"
+
+    asyncio.run(main())
+
+
+def test_async_instrument_aget_communicator_use_raises():
+    async def main():
+        inst, _ = _open(b"1")
+        with pytest.raises(UnsupportedIOError):
+            await inst.aget("raw_status")
+
+    asyncio.run(main())
+
+
+def test_async_instrument_aget_aset_driver_overrides():
+    async def main():
+        comm = AsyncLoopbackCommunicator(BytesIO(b"+1.0E+02\n0\n0\n"), BytesIO())
+        inst = ErrCheckInstrument(comm)
+        unit_eq(await inst.aget("frequency"), 100 * u.Hz)
+        await inst.aset("output", True)
+        assert inst.errors_checked == 2
+        assert comm._stdout.getvalue() == b"FREQ?\nERR?\nOUTP ON\nERR?\n"
+
+    asyncio.run(main())
+
+
+def test_async_instrument_concurrent_queries_are_atomic():
+    async def main():
+        inst, stdout = _open(b"a\nb\n")
+        results = await asyncio.gather(inst.aquery("A?"), inst.aquery("B?"))
+        assert results == ["a", "b"]
+        assert stdout.getvalue() == b"A?\nB?\n"
+
+    asyncio.run(main())
+
+
+def test_async_instrument_aopen_tcpip():
+    async def handle(reader, writer):
+        await reader.readline()
+        writer.write(b"NAME\n")
+        await writer.drain()
+        writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            inst = await MockInstrument.aopen_tcpip("127.0.0.1", port)
+            assert await inst.aquery("*IDN?") == "NAME"
+            await inst._file.close()
+
+    asyncio.run(main())
@@ -7,7 +7,9 @@ Module containing tests for the base Instrument class
 
 
 import socket
+import sys
 import io
+import threading
 import serial
 import usb.core
 from serial.tools.list_ports_common import ListPortInfo
@@ -27,6 +29,7 @@ from instruments.abstract_instruments.comm import (
     LoopbackCommunicator,
     GPIBCommunicator,
     AbstractCommunicator,
+    BusArbiter,
     USBTMCCommunicator,
     VXI11Communicator,
     SerialCommunicator,
@@ -88,6 +91,155 @@ def test_instrument_binblockread_too_many_reads():
         _ = inst.binblockread(2)
 
 
+def _open_message_end(message, stdin=b""):
+    """
+    Opens a test instrument whose communicator marks the end of each
+    message, and whose next message is ``message``.
+    """
+    inst = ik.Instrument.open_test(stdin=io.BytesIO(b"#0" + stdin))
+    inst._file.read_message = mock.MagicMock(return_value=message)
+    return inst
+
+
+@mock.patch.object(LoopbackCommunicator, "marks_message_end", True)
+def test_instrument_binblockread_indefinite_length():
+    inst = _open_message_end(bytes.fromhex("00000001000200030004") + b"\n")
+    expected = (0, 1, 2, 3, 4)
+    if numpy:
+        expected = numpy.array(expected)
+    iterable_eq(inst.binblockread(2), expected)
+
+
+@mock.patch.object(LoopbackCommunicator, "marks_message_end", True)
+def test_instrument_binblockread_indefinite_length_embedded_terminator():
+    # 2560 is 0x0a00, whose first byte is the terminator.
+    data = bytes.fromhex("00010a0000030004")
+    inst = _open_message_end(data + b"\n", stdin=b"NEXT\n")
+    expected = (1, 2560, 3, 4)
+    if numpy:
+        expected = numpy.array(expected)
+    iterable_eq(inst.binblockread(2), expected)
+    assert inst.read() == "NEXT"
+
+
+@pytest.mark.parametrize("data_width", (1, 2, 4))
+def test_instrument_binblockread_indefinite_length_terminator(data_width):
+    # The end of the block cannot be told from data bytes equal to the
+    # terminator, which a sample of 2560 starts with.
+    inst = ik.Instrument.open_test(
+        stdin=io.BytesIO(b"#0" + bytes.fromhex("00010a0000030004") + b"\nNEXT\n")
+    )
+    inst._file.flush_input = mock.MagicMock()
+    with pytest.raises(OSError):
+        _ = inst.binblockread(data_width)
+    inst._file.flush_input.assert_called_once_with()
+
+
+@mock.patch.object(LoopbackCommunicator, "marks_message_end", True)
+def test_instrument_binblockread_indefinite_length_partial_point():
+    inst = _open_message_end(b"\x00\n")
+    with pytest.raises(OSError):
+        _ = inst.binblockread(4)
+
+
+def test_instrument_binblockread_out_buffer():
+    out = bytearray(16)
+    with expected_protocol(
+        ik.Instrument,
+        [],
+        [b"#210" + bytes.fromhex("00000001000200030004")],
+        sep="\n",
+    ) as inst:
+        actual_data = inst.binblockread(2, out=out)
+        expected = (0, 1, 2, 3, 4)
+        if numpy:
+            expected = numpy.array(expected)
+        iterable_eq(actual_data, expected)
+    assert out[:10] == bytes.fromhex("00000001000200030004")
+
+
+@pytest.mark.skipif(numpy is None, reason="Requires numpy")
+def test_instrument_binblockread_out_numpy_shares_memory():
+    out = numpy.zeros(5, dtype=">u2")
+    with expected_protocol(
+        ik.Instrument,
+        [],
+        [b"#210" + bytes.fromhex("00000001000200030004")],
+        sep="\n",
+    ) as inst:
+        actual_data = inst.binblockread(2, out=out)
+    iterable_eq(actual_data, numpy.array((0, 1, 2, 3, 4)))
+    assert numpy.shares_memory(actual_data, out)
+
+
+def test_instrument_binblockread_out_too_small():
+    inst = ik.Instrument.open_test()
+    inst._file.read_raw = mock.MagicMock(side_effect=[b"#", b"2", b"10"])
+    with pytest.raises(ValueError):
+        _ = inst.binblockread(2, out=bytearray(4))
+
+
+def test_instrument_binblockread_out_read_only():
+    inst = ik.Instrument.open_test()
+    inst._file.read_raw = mock.MagicMock(side_effect=[b"#", b"2", b"10"])
+    with pytest.raises(TypeError):
+        _ = inst.binblockread(2, out=bytes(10))
+
+
+def test_instrument_binblockread_iter():
+    with expected_protocol(
+        ik.Instrument,
+        [],
+        [b"#210" + bytes.fromhex("00000001000200030004") + b"\n" + b"ok"],
+        sep="\n",
+    ) as inst:
+        chunks = list(inst.binblockread_iter(2, chunk_size=2))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        iterable_eq(sum((tuple(chunk) for chunk in chunks), ()), (0, 1, 2, 3, 4))
+        assert inst.read() == ""
+        assert inst.read() == "ok"
+
+
+@mock.patch.object(LoopbackCommunicator, "marks_message_end", True)
+def test_instrument_binblockread_iter_indefinite_length():
+    inst = _open_message_end(bytes.fromhex("0001000a0003") + b"\n")
+    chunks = list(inst.binblockread_iter(2, chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    iterable_eq(sum((tuple(chunk) for chunk in chunks), ()), (1, 10, 3))
+
+
+def test_instrument_binblockread_iter_close_early():
+    with expected_protocol(
+        ik.Instrument,
+        [],
+        [b"#210" + bytes.fromhex("00000001000200030004"), b"ok"],
+        sep="\n",
+    ) as inst:
+        chunks = inst.binblockread_iter(2, chunk_size=1)
+        iterable_eq(tuple(next(chunks)), (0,))
+        chunks.close()
+        assert inst.read() == ""
+        assert inst.read() == "ok"
+
+
+def test_instrument_binblockread_iter_short():
+    inst = ik.Instrument.open_test()
+    data = bytes.fromhex("00000001000200030004")
+    inst._file.read_raw = mock.MagicMock(
+        side_effect=[b"#", b"2", b"10", data[:4], data[4:6], b"", b"", b""]
+    )
+    chunks = inst.binblockread_iter(2, chunk_size=2)
+    iterable_eq(tuple(next(chunks)), (0, 1))
+    with pytest.raises(OSError):
+        list(chunks)
+
+
+def test_instrument_binblockread_iter_bad_chunk_size():
+    inst = ik.Instrument.open_test()
+    with pytest.raises(ValueError):
+        next(inst.binblockread_iter(2, chunk_size=0))
+
+
 def test_instrument_binblockread_bad_block_start():
     with pytest.raises(IOError):
         inst = ik.Instrument.open_test()
@@ -342,8 +494,9 @@ def test_instrument_open_gpibethernet(mock_socket_manager, mock_gpib_comm):
 
 
 @mock.patch("instruments.abstract_instruments.instrument.VisaCommunicator")
-@mock.patch("instruments.abstract_instruments.instrument.pyvisa")
-def test_instrument_open_visa_new_version(mock_visa, mock_visa_comm):
+@mock.patch.dict("sys.modules", pyvisa=mock.MagicMock())
+def test_instrument_open_visa_new_version(mock_visa_comm):
+    mock_visa = sys.modules["pyvisa"]
     mock_visa_comm.return_value.__class__ = VisaCommunicator
     mock_visa.__version__ = "1.8"
     visa_open_resource = mock_visa.ResourceManager.return_value.open_resource
@@ -357,8 +510,9 @@ def test_instrument_open_visa_new_version(mock_visa, mock_visa_comm):
 
 
 @mock.patch("instruments.abstract_instruments.instrument.VisaCommunicator")
-@mock.patch("instruments.abstract_instruments.instrument.pyvisa")
-def test_instrument_open_visa_old_version(mock_visa, mock_visa_comm):
+@mock.patch.dict("sys.modules", pyvisa=mock.MagicMock())
+def test_instrument_open_visa_old_version(mock_visa_comm):
+    mock_visa = sys.modules["pyvisa"]
     mock_visa_comm.return_value.__class__ = VisaCommunicator
     mock_visa.__version__ = "1.5"
 
@@ -394,16 +548,16 @@ def test_instrument_open_vxi11(mock_vxi11_comm):
 
 
 @mock.patch("instruments.abstract_instruments.instrument.USBCommunicator")
-@mock.patch("instruments.abstract_instruments.instrument.usb")
-def test_instrument_open_usb(mock_usb, mock_usb_comm):
+@mock.patch("usb.core.find")
+def test_instrument_open_usb(mock_find, mock_usb_comm):
     """Open USB device."""
-    mock_usb.core.find.return_value.__class__ = usb.core.Device
+    mock_find.return_value.__class__ = usb.core.Device
     mock_usb_comm.return_value.__class__ = USBCommunicator
 
     # fake instrument
     vid = "0x1000"
     pid = "0x1000"
-    dev = mock_usb.core.find(idVendor=vid, idProduct=pid)
+    dev = mock_find(idVendor=vid, idProduct=pid)
 
     # call instrument
     inst = ik.Instrument.open_usb(vid, pid)
@@ -412,10 +566,10 @@ def test_instrument_open_usb(mock_usb, mock_usb_comm):
     mock_usb_comm.assert_called_with(dev)
 
 
-@mock.patch("instruments.abstract_instruments.instrument.usb")
-def test_instrument_open_usb_no_device(mock_usb):
+@mock.patch("usb.core.find")
+def test_instrument_open_usb_no_device(mock_find):
     """Open USB, no device found."""
-    mock_usb.core.find.return_value = None  # mock no instrument found
+    mock_find.return_value = None  # mock no instrument found
     with pytest.raises(IOError) as err:
         _ = ik.Instrument.open_usb(0x1000, 0x1000)
     err_msg = err.value.args[0]
@@ -441,7 +595,7 @@ def test_instrument_open_file(mock_file_comm):
 
     assert isinstance(inst._file, FileCommunicator) is True
 
-    mock_file_comm.assert_called_with("filename")
+    mock_file_comm.assert_called_with("filename", poll=False)
 
 
 # OPEN URI TESTS
@@ -803,6 +957,41 @@ def test_instrument_query():
     assert inst.read.call_count == 3
 
 
+def test_instrument_query_holds_bus():
+    arbiter = BusArbiter()
+    with expected_protocol(ik.Instrument, "FOO?\n", "bar\n") as inst:
+        inst._file.arbiter = arbiter
+        inst.bus_priority = -5
+
+        def _query(msg, size=-1):
+            assert arbiter._owner == threading.get_ident()
+            return "bar"
+
+        inst._file.query = _query
+        assert inst.query("FOO?") == "bar"
+        inst._file.write("FOO?\n")
+        assert arbiter.stats["transactions"] == 1
+        assert arbiter._owner is None
+
+
+def test_instrument_transaction():
+    with expected_protocol(ik.Instrument, ["A", "B"], []) as inst:
+        with inst.transaction():
+            inst.sendcmd("A")
+        inst._file.arbiter = BusArbiter()
+        with inst.transaction():
+            inst.sendcmd("B")
+            assert inst._file.arbiter._depth == 1
+        assert inst._file.arbiter.stats["transactions"] == 1
+
+
+def test_instrument_bus_priority():
+    inst = ik.Instrument.open_test()
+    assert inst.bus_priority == 0
+    inst.bus_priority = "3"
+    assert inst.bus_priority == 3
+
+
 def test_instrument_read():
     mock_filelike = mock.MagicMock()
     mock_filelike.__class__ = AbstractCommunicator
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+"""
+Benchmarks of InstrumentKit, which only run when pytest is given
+``--benchmarks``.
+
+This file hosts helpers which measure work without relying on the speed of
+the machine running the benchmarks.
+"""
+
+# IMPORTS ####################################################################
+
+
+import sys
+
+# FUNCTIONS ##################################################################
+
+
+def count_calls(fcn, *args):
+    """
+    Calls ``fcn(*args)``, returning its result and the number of Python and
+    builtin function calls made meanwhile.
+    """
+    calls = 0
+
+    def _profile(frame, event, arg):  # pylint: disable=unused-argument
+        nonlocal calls
+        if event in ("call", "c_call"):
+            calls += 1
+
+    sys.setprofile(_profile)
+    try:
+        result = fcn(*args)
+    finally:
+        sys.setprofile(None)
+    return result, calls
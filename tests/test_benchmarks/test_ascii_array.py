@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Benchmarks for parsing ASCII array replies, such as waveforms and reading
+buffers.
+"""
+
+# IMPORTS ####################################################################
+
+
+import tracemalloc
+
+import pytest
+
+from instruments.optional_dep_finder import numpy
+from instruments.units import ureg as u
+from instruments.util_fns import parse_ascii_array
+from tests import unit_eq
+
+pytestmark = pytest.mark.benchmark
+
+# FUNCTIONS ##################################################################
+
+# pylint: disable=missing-docstring
+
+N_POINTS = 10000
+
+REPLY = ",".join(f"{(idx % 200 - 100) * 1.25e-3:.6E}" for idx in range(N_POINTS))
+
+
+def _map_float_quantity(reply):
+    """
+    Reference implementation of the previous reading buffer parsing, as used
+    by ``Agilent34410a.fetch``.
+    """
+    return list(map(float, reply.split(","))) * u.volt
+
+
+def _numpy_array_split(reply):
+    """
+    Reference implementation of the previous waveform parsing, as used by
+    ``TekTDS5xx``.
+    """
+    return numpy.array(reply.split(","), dtype=float)
+
+
+def _peak_memory(parse):
+    """
+    Returns the result of parsing ``REPLY`` and the peak memory allocated
+    meanwhile.
+    """
+    tracemalloc.start()
+    try:
+        result = parse(REPLY)
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# BENCHMARKS #################################################################
+
+
+@pytest.mark.skipif(numpy is None, reason="Requires numpy")
+def test_bench_ascii_array_readings():
+    before, before_peak = _peak_memory(_map_float_quantity)
+    after, after_peak = _peak_memory(lambda reply: parse_ascii_array(reply) * u.volt)
+
+    unit_eq(after, before)
+    assert after_peak < before_peak / 2
+
+
+@pytest.mark.skipif(numpy is None, reason="Requires numpy")
+def test_bench_ascii_array_waveform():
+    # Parsing into a preallocated array takes about as long as splitting the
+    # reply, but does not hold a string per value.
+    before, before_peak = _peak_memory(_numpy_array_split)
+    after, after_peak = _peak_memory(parse_ascii_array)
+
+    assert (after == before).all()
+    assert after_peak < before_peak / 2
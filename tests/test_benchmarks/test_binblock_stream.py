@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Benchmarks for streaming binary block reads, comparing the peak memory of
+reading a long record at once with reading it in chunks.
+"""
+
+# IMPORTS ####################################################################
+
+
+from io import BytesIO
+import tracemalloc
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import LoopbackCommunicator
+
+pytestmark = pytest.mark.benchmark
+
+# FUNCTIONS ##################################################################
+
+N_POINTS = 2**20
+CHUNK_SIZE = 2**14
+
+
+def _open_record():
+    data = b"\x00\x01" * N_POINTS
+    header = f"#{len(str(len(data)))}{len(data)}".encode()
+    return ik.Instrument(LoopbackCommunicator(stdin=BytesIO(header + data)))
+
+
+def _peak_memory(read):
+    inst = _open_record()
+    tracemalloc.start()
+    try:
+        total = read(inst)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert total == N_POINTS
+    return peak
+
+
+# BENCHMARKS #################################################################
+
+
+def test_bench_binblock_stream_peak_memory():
+    before = _peak_memory(lambda inst: len(inst.binblockread(2)))
+    after = _peak_memory(
+        lambda inst: sum(
+            len(chunk) for chunk in inst.binblockread_iter(2, chunk_size=CHUNK_SIZE)
+        )
+    )
+
+    assert after < before / 4
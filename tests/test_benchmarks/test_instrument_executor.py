@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Benchmarks for reading an instrument through an InstrumentExecutor, checking
+that each reply is parsed while the next query is in progress.
+"""
+
+# IMPORTS ####################################################################
+
+
+import threading
+
+import pytest
+
+from instruments import Instrument
+from instruments.abstract_instruments import InstrumentExecutor
+from instruments.util_fns import parse_ascii_array
+
+pytestmark = pytest.mark.benchmark
+
+# FUNCTIONS ##################################################################
+
+# pylint: disable=missing-docstring
+
+REPLY = ",".join(f"{idx * 1.5e-3:.6e}" for idx in range(4000))
+
+
+class OverlapInstrument(Instrument):
+    """
+    Stands in for an instrument whose second query only completes once the
+    reply to the first one is being parsed.
+    """
+
+    def __init__(self, filelike):
+        super().__init__(filelike)
+        self.querying = threading.Event()
+        self.parsing = threading.Event()
+
+    def query(self, cmd, size=-1):
+        if cmd == "CURV2?":
+            self.querying.set()
+            assert self.parsing.wait(10)
+        return REPLY
+
+
+# BENCHMARKS #################################################################
+
+
+def test_bench_instrument_executor():
+    inst = OverlapInstrument.open_test()
+
+    def _parse_first(reply):
+        # Parsing on the I/O thread would wait for a query which cannot
+        # start until parsing is done.
+        overlapped = inst.querying.wait(10)
+        inst.parsing.set()
+        return overlapped, list(parse_ascii_array(reply))
+
+    with InstrumentExecutor(inst) as executor:
+        first = executor.query("CURV1?", parse=_parse_first)
+        second = executor.query("CURV2?", parse=parse_ascii_array)
+        overlapped, values = first.result()
+        assert overlapped
+        assert values == list(second.result())
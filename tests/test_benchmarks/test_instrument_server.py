@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+Benchmarks for several clients polling the same value from an instrument
+shared through an InstrumentServer, with and without the query cache.
+"""
+
+# IMPORTS ####################################################################
+
+
+from io import BytesIO
+import threading
+
+import pytest
+
+from instruments import Instrument
+from instruments.abstract_instruments.comm import (
+    InstrumentServer,
+    LoopbackCommunicator,
+)
+
+pytestmark = pytest.mark.benchmark
+
+# FUNCTIONS ##################################################################
+
+# pylint: disable=missing-docstring,protected-access
+
+N_CLIENTS = 4
+N_POLLS = 25
+
+
+def _instrument_queries(**kwargs):
+    """
+    Returns the number of queries which reached the instrument while each
+    client polled it.
+    """
+    stdout = BytesIO()
+    comm = LoopbackCommunicator(BytesIO(b"1\n" * N_CLIENTS * N_POLLS), stdout)
+    with InstrumentServer(comm, ("127.0.0.1", 0), **kwargs) as server:
+        thread = threading.Thread(target=server.serve_forever, args=(0.01,))
+        thread.start()
+        clients = [Instrument.open_proxy(server.address) for _ in range(N_CLIENTS)]
+        replies = []
+
+        def _poll(inst):
+            for _ in range(N_POLLS):
+                replies.append(inst.query("TEMP?"))
+
+        pollers = [threading.Thread(target=_poll, args=(c,)) for c in clients]
+        for poller in pollers:
+            poller.start()
+        for poller in pollers:
+            poller.join()
+        for client in clients:
+            client._file.close()
+    thread.join()
+    assert replies == ["1"] * N_CLIENTS * N_POLLS
+    return stdout.getvalue().count(b"TEMP?")
+
+
+# BENCHMARKS #################################################################
+
+
+def test_bench_instrument_server_cache():
+    assert _instrument_queries() == N_CLIENTS * N_POLLS
+    # With a time to live longer than the benchmark, every poll after the
+    # first is answered from the cache.
+    assert _instrument_queries(cache_ttl=60, cacheable={"TEMP?"}.__contains__) == 1
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Benchmarks for loading a rack of instruments from a configuration file, with
+instruments which are slow to open.
+"""
+
+# IMPORTS ####################################################################
+
+
+from io import StringIO
+import threading
+from unittest import mock
+
+import pytest
+
+from instruments import Instrument
+from instruments.config import load_instruments
+
+pytestmark = pytest.mark.benchmark
+
+# FUNCTIONS ##################################################################
+
+# pylint: disable=missing-docstring
+
+N_INSTRUMENTS = 8
+
+CONFIG = "".join(f"""
+inst{idx}:
+    class: !!python/name:instruments.Instrument
+    uri: test://
+""" for idx in range(N_INSTRUMENTS))
+
+
+class _SlowOpens:
+    """
+    Stands in for opening instruments over slow connections, recording how
+    many are being opened at once. When opened concurrently, each open waits
+    for all of them to be in progress.
+    """
+
+    def __init__(self, parties):
+        self.barrier = threading.Barrier(parties)
+        self.lock = threading.Lock()
+        self.opening = 0
+        self.overlap = 0
+
+    def __call__(self, uri):  # pylint: disable=unused-argument
+        with self.lock:
+            self.opening += 1
+            self.overlap = max(self.overlap, self.opening)
+        try:
+            self.barrier.wait(timeout=10)
+        finally:
+            with self.lock:
+                self.opening -= 1
+        return Instrument.open_test()
+
+
+def _load(opens, **kwargs):
+    with mock.patch.object(Instrument, "open_from_uri", side_effect=opens):
+        insts = load_instruments(StringIO(CONFIG), **kwargs)
+    assert len(insts) == N_INSTRUMENTS
+    return opens.overlap
+
+
+# BENCHMARKS #################################################################
+
+
+def test_bench_load_instruments():
+    assert _load(_SlowOpens(1)) == 1
+    assert _load(_SlowOpens(N_INSTRUMENTS), max_workers=N_INSTRUMENTS) == (
+        N_INSTRUMENTS
+    )
+    assert _load(_SlowOpens(1), lazy=True) == 0
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+Benchmarks for the property factories, measuring the overhead of each
+property access on a loopback communicator as the number of function calls
+it makes. Unitful properties are left out, as their overhead is dominated by
+unit handling.
+"""
+
+# IMPORTS ####################################################################
+
+
+from enum import Enum
+from io import BytesIO
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import LoopbackCommunicator
+from instruments.util_fns import bool_property, enum_property, int_property
+from tests.test_benchmarks import count_calls
+
+pytestmark = pytest.mark.benchmark
+
+# FUNCTIONS ##################################################################
+
+# pylint: disable=protected-access,missing-docstring
+
+
+class Shape(Enum):
+    sine = "SIN"
+    square = "SQU"
+    ramp = "RAMP"
+
+
+def _closure_bool_property(command, inst_true="ON", inst_false="OFF"):
+    """
+    Reference implementation of the previous closure-based `bool_property`.
+    """
+
+    def _getter(self):
+        return self.query(command + "?").strip() == inst_true
+
+    def _setter(self, newval):
+        if not isinstance(newval, bool):
+            raise TypeError("Bool properties must be specified with a " "boolean value")
+        self.sendcmd("{} {}".format(command, inst_true if newval else inst_false))
+
+    return property(_getter, _setter)
+
+
+def _closure_enum_property(command, enum, input_decoration=None):
+    """
+    Reference implementation of the previous closure-based `enum_property`.
+    """
+
+    def _in_decor_fcn(val):
+        if input_decoration is None:
+            return val
+        elif hasattr(input_decoration, "__get__"):
+            return input_decoration.__get__(None, object)(val)
+        return input_decoration(val)
+
+    def _getter(self):
+        return enum(_in_decor_fcn(self.query(f"{command}?").strip()))
+
+    def _setter(self, newval):
+        try:
+            newval = enum[newval]
+        except KeyError:
+            try:
+                newval = enum(newval)
+            except ValueError:
+                raise ValueError("Enum property new value not in enum.")
+        self.sendcmd("{} {}".format(command, enum(newval).value))
+
+    return property(_getter, _setter)
+
+
+def _closure_int_property(command):
+    """
+    Reference implementation of the previous closure-based `int_property`.
+    """
+
+    def _getter(self):
+        return int(self.query(f"{command}?"))
+
+    def _setter(self, newval):
+        self.sendcmd("{} {}".format(command, "{:d}".format(newval)))
+
+    return property(_getter, _setter)
+
+
+class ClosureInstrument(ik.Instrument):
+    output = _closure_bool_property("OUTP")
+    shape = _closure_enum_property("FUNC", Shape, input_decoration=str.upper)
+    count = _closure_int_property("COUN")
+
+
+class DescriptorInstrument(ik.Instrument):
+    output = bool_property("OUTP")
+    shape = enum_property("FUNC", Shape, input_decoration=str.upper)
+    count = int_property("COUN")
+
+
+def _calls(inst_cls, accesses):
+    """
+    Returns the number of function calls made by ``accesses(inst)`` on a
+    loopback instrument, and what it sent to the instrument.
+    """
+    inst = inst_cls(
+        LoopbackCommunicator(stdin=BytesIO(b"ON\nsqu\n5\n" * 2), stdout=BytesIO())
+    )
+    # The first accesses fill any lookup caches.
+    accesses(inst)
+    inst._file._stdout = BytesIO()
+    _, calls = count_calls(accesses, inst)
+    return calls, inst._file._stdout.getvalue()
+
+
+def _property_accesses(inst):
+    inst.output = True
+    inst.shape = "square"
+    inst.count = 5
+    _ = inst.output
+    _ = inst.shape
+    _ = inst.count
+
+
+def _raw_io(inst):
+    """
+    The communication done by `_property_accesses`, without the properties.
+    """
+    inst.sendcmd("OUTP ON")
+    inst.sendcmd("FUNC SQU")
+    inst.sendcmd("COUN 5")
+    inst.query("OUTP?")
+    inst.query("FUNC?")
+    inst.query("COUN?")
+
+
+# BENCHMARKS #################################################################
+
+
+def test_bench_property_access():
+    io_calls, io_sent = _calls(ik.Instrument, _raw_io)
+    closure_calls, closure_sent = _calls(ClosureInstrument, _property_accesses)
+    descriptor_calls, descriptor_sent = _calls(DescriptorInstrument, _property_accesses)
+
+    assert descriptor_sent == closure_sent == io_sent
+    assert io_calls < descriptor_calls < closure_calls
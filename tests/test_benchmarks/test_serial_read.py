@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Benchmarks for the buffered serial read engine, run against a pseudo
+terminal pair so that the real pyserial code path is exercised.
+"""
+
+# IMPORTS ####################################################################
+
+
+import os
+import sys
+import threading
+
+import pytest
+import serial
+
+from instruments.abstract_instruments.comm import SerialCommunicator
+
+pytestmark = pytest.mark.benchmark
+
+# FIXTURES ###################################################################
+
+# pylint: disable=redefined-outer-name,protected-access
+
+PAYLOAD = b"+1.234567E-03," * 4096 + b"+1.234567E-03\r\n"
+
+
+@pytest.fixture
+def pty_serial():
+    """
+    Yields a ``(master_fd, serial.Serial)`` pair connected through a pseudo
+    terminal.
+    """
+    if sys.platform.startswith("win"):
+        pytest.skip("Pseudo terminals are not available on Windows.")
+    master, slave = os.openpty()
+    conn = serial.Serial(os.ttyname(slave), baudrate=460800, timeout=1)
+    yield master, conn
+    conn.close()
+    os.close(slave)
+    os.close(master)
+
+
+def _feed(master, payload):
+    thread = threading.Thread(target=os.write, args=(master, payload), daemon=True)
+    thread.start()
+    return thread
+
+
+# BENCHMARKS #################################################################
+
+
+def test_bench_serial_read_raw_chunks(pty_serial, mocker):
+    master, conn = pty_serial
+    comm = SerialCommunicator(conn)
+    comm.terminator = "\r\n"
+    read = mocker.spy(conn, "read")
+
+    for _ in range(3):
+        feeder = _feed(master, PAYLOAD)
+        assert comm.read_raw() == PAYLOAD[:-2]
+        feeder.join()
+
+    # The previous loop read and checked one byte at a time. The reply is
+    # now read in chunks of whatever the port has received.
+    assert read.call_count < 3 * len(PAYLOAD) / 100
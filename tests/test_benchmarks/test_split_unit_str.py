@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Benchmarks for splitting unit-suffixed readings into magnitudes and units.
+"""
+
+# IMPORTS ####################################################################
+
+
+import re
+
+import pytest
+
+from instruments.util_fns import split_unit_str, split_unit_strs
+from tests.test_benchmarks import count_calls
+
+pytestmark = pytest.mark.benchmark
+
+# FUNCTIONS ##################################################################
+
+# pylint: disable=missing-docstring
+
+# A reply reporting the readings of several channels, as sent by a
+# temperature controller or a scanning multimeter.
+READINGS = [f"{20 + idx % 5 * 0.25:.2f} C" for idx in range(32)] + [
+    f"{idx % 3 + 1}.5E-3 V" for idx in range(32)
+]
+REPLY = ",".join(READINGS)
+
+
+def _regex_split_unit_str(s, default_units="dimensionless", lookup=None):
+    """
+    Reference implementation of the previous `split_unit_str`, which
+    compiled its pattern and scaled the mantissa on every call.
+    """
+    if lookup is None:
+        lookup = lambda x: x
+
+    regex = r"([-+]?[0-9]*\.?[0-9]+)([eE][-+]?[0-9]+)?\s*([a-z]+)?"
+    match = re.match(regex, str(s).strip(), re.I)
+    if match:
+        if match.groups()[1] is None:
+            val, _, units = match.groups()
+        else:
+            val = float(match.groups()[0]) * 10 ** float(match.groups()[1][1:])
+            units = match.groups()[2]
+
+        if units is None:
+            return float(val), default_units
+
+        return float(val), lookup(units)
+
+    try:
+        return float(s), default_units
+    except ValueError:
+        raise ValueError(f"Could not split '{repr(s)}' into value and units.")
+
+
+# BENCHMARKS #################################################################
+
+
+def test_bench_split_unit_str():
+    # The first calls fill the cache of compiled patterns.
+    split_unit_str(READINGS[0])
+    before, before_calls = count_calls(
+        lambda reply: [_regex_split_unit_str(value) for value in reply.split(",")],
+        REPLY,
+    )
+    single, single_calls = count_calls(
+        lambda reply: [split_unit_str(value) for value in reply.split(",")], REPLY
+    )
+    batch, batch_calls = count_calls(split_unit_strs, REPLY)
+
+    assert list(single) == list(batch) == before
+    assert batch_calls < single_calls < before_calls
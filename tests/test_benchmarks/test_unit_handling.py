@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Benchmarks for unit handling in unitful properties, on a loopback
+communicator.
+"""
+
+# IMPORTS ####################################################################
+
+
+from io import BytesIO
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import LoopbackCommunicator
+from instruments.units import ureg as u
+from instruments.util_fns import assume_units, split_unit_str, unitful_property
+from tests import unit_eq
+from tests.test_benchmarks import count_calls
+
+pytestmark = pytest.mark.benchmark
+
+# FUNCTIONS ##################################################################
+
+# pylint: disable=missing-docstring
+
+
+def _pint_unitful_property(command, units, valid_range=(None, None)):
+    """
+    Reference implementation of the previous `unitful_property`, which
+    converted every value with pint.
+    """
+
+    def _getter(self):
+        raw = self.query(f"{command}?")
+        return u.Quantity(*split_unit_str(raw, units)).to(units)
+
+    def _setter(self, newval):
+        newval = assume_units(newval, units).to(units)
+        min_value, max_value = valid_range
+        if min_value is not None:
+            min_value = assume_units(min_value, units)
+            if newval < min_value:
+                raise ValueError
+        if max_value is not None:
+            max_value = assume_units(max_value, units)
+            if newval > max_value:
+                raise ValueError
+        self.sendcmd("{} {}".format(command, "{:e}".format(newval.magnitude)))
+
+    return property(_getter, _setter)
+
+
+class PintInstrument(ik.Instrument):
+    frequency = _pint_unitful_property("FREQ", u.Hz, valid_range=(0, 1e6))
+    voltage = _pint_unitful_property("VOLT", u.V, valid_range=(0, 10))
+
+
+class FastPathInstrument(ik.Instrument):
+    frequency = unitful_property("FREQ", u.Hz, valid_range=(0, 1e6))
+    voltage = unitful_property("VOLT", u.V, valid_range=(0, 10))
+
+
+def _poll(inst):
+    return inst.frequency, inst.voltage
+
+
+def _poll_magnitudes(inst):
+    with inst.magnitude_mode():
+        return _poll(inst)
+
+
+def _set(inst):
+    inst.frequency = 1000
+    inst.voltage = 2.5
+
+
+def _calls(inst_cls, accesses):
+    """
+    Returns the result of ``accesses(inst)`` on a loopback instrument, the
+    number of function calls it made and what it sent to the instrument.
+    """
+    # The frequency is reported in other units than those of the property.
+    inst = inst_cls(
+        LoopbackCommunicator(stdin=BytesIO(b"1 kHz\n2.5\n" * 2), stdout=BytesIO())
+    )
+    # The first accesses fill the caches of the unit lookups.
+    accesses(inst)
+    inst._file._stdout = BytesIO()  # pylint: disable=protected-access
+    result, calls = count_calls(accesses, inst)
+    return result, calls, inst._file._stdout.getvalue()
+
+
+# BENCHMARKS #################################################################
+
+
+def test_bench_unit_handling_poll():
+    pint_values, pint_calls, _ = _calls(PintInstrument, _poll)
+    fast_values, fast_calls, _ = _calls(FastPathInstrument, _poll)
+    magnitudes, magnitude_calls, _ = _calls(FastPathInstrument, _poll_magnitudes)
+
+    for pint_value, fast_value, magnitude in zip(pint_values, fast_values, magnitudes):
+        unit_eq(fast_value, pint_value)
+        assert magnitude == pint_value.magnitude
+    assert magnitude_calls < fast_calls < pint_calls
+
+
+def test_bench_unit_handling_set():
+    _, pint_calls, pint_sent = _calls(PintInstrument, _set)
+    _, fast_calls, fast_sent = _calls(FastPathInstrument, _set)
+
+    assert fast_sent == pint_sent
+    assert fast_calls < pint_calls
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""
+Benchmarks for looking up units by name.
+"""
+
+# IMPORTS ####################################################################
+
+
+import pytest
+
+from instruments.units import ureg as u
+from instruments.util_fns import assume_units
+from tests import unit_eq
+from tests.test_benchmarks import count_calls
+
+pytestmark = pytest.mark.benchmark
+
+# FUNCTIONS ##################################################################
+
+# pylint: disable=missing-docstring
+
+
+def _lookups_before():
+    """
+    Reference implementation of the previous per-reading unit handling,
+    which parsed the unit names every time.
+    """
+    return u.Quantity(1.5, u.Unit("volt")), u.Quantity(2.5, "ms")
+
+
+def _lookups_after():
+    return u.Quantity(1.5, u.volt), assume_units(2.5, "ms")
+
+
+# BENCHMARKS #################################################################
+
+
+def test_bench_unit_lookups():
+    # The first lookups fill the cache of resolved units.
+    _lookups_after()
+    before, before_calls = count_calls(_lookups_before)
+    after, after_calls = count_calls(_lookups_after)
+
+    for before_value, after_value in zip(before, after):
+        unit_eq(after_value, before_value)
+    assert after_calls < before_calls
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+"""
+Unit tests for the asyncio communication layers
+"""
+
+# IMPORTS ####################################################################
+
+
+import asyncio
+from io import BytesIO
+import os
+import sys
+
+import pytest
+import serial
+
+from instruments.abstract_instruments.comm import (
+    AsyncLoopbackCommunicator,
+    AsyncSerialCommunicator,
+    AsyncSocketCommunicator,
+    AsyncStreamCommunicator,
+)
+from instruments.units import ureg as u
+from tests import unit_eq
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access
+
+
+async def _echo_server(replies, hold=False):
+    """
+    Starts a TCP server on localhost that answers each received line with
+    the next entry of ``replies``. If ``hold`` is `True`, the connection is
+    kept open until the client closes it.
+    """
+
+    async def handle(reader, writer):
+        for reply in replies:
+            await reader.readline()
+            writer.write(reply)
+            await writer.drain()
+        if hold:
+            await reader.read()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def test_async_loopback_query():
+    async def main():
+        stdout = BytesIO()
+        comm = AsyncLoopbackCommunicator(BytesIO(b"abc\ndef\r\n"), stdout)
+        assert await comm.query("mock") == "abc"
+        comm.terminator = "\r\n"
+        assert await comm.read_raw() == b"def"
+        await comm.sendcmd("")
+        assert stdout.getvalue() == b"mock\n"
+
+    asyncio.run(main())
+
+
+def test_async_loopback_read_raw_size():
+    async def main():
+        comm = AsyncLoopbackCommunicator(BytesIO(b"12345"), BytesIO())
+        assert await comm.read_raw(2) == b"12"
+        with pytest.raises(ValueError):
+            await comm.read_raw(-2)
+
+    asyncio.run(main())
+
+
+def test_async_comm_terminator_and_timeout():
+    comm = AsyncLoopbackCommunicator()
+    comm.terminator = b"\r"
+    assert comm.terminator == "\r"
+    with pytest.raises(TypeError):
+        comm.terminator = 10
+
+    assert comm.timeout is None
+    comm.timeout = 500 * u.millisecond
+    unit_eq(comm.timeout, 0.5 * u.second)
+    comm.timeout = None
+    assert comm.timeout is None
+
+
+def test_async_comm_ieee754_read():
+    async def main():
+        comm = AsyncLoopbackCommunicator(
+            BytesIO(bytes.fromhex("3ff0000000000000")), BytesIO()
+        )
+        assert await comm.read(8, encoding="IEEE-754/64") == 1.0
+        with pytest.raises(ValueError):
+            await comm.read(1, encoding="derp")
+
+    asyncio.run(main())
+
+
+def test_async_stream_init_wrong_type():
+    with pytest.raises(TypeError):
+        _ = AsyncStreamCommunicator("derp", None)
+
+
+def test_async_socket_query():
+    async def main():
+        server, port = await _echo_server([b"first\n", b"second\n"])
+        async with server:
+            comm = await AsyncSocketCommunicator.open("127.0.0.1", port)
+            assert comm.address[1] == port
+            assert await comm.query("A?") == "first"
+            assert await comm.query("B?") == "second"
+            await comm.close()
+
+    asyncio.run(main())
+
+
+def test_async_socket_long_response():
+    payload = b"1.0," * 100000
+
+    async def main():
+        server, port = await _echo_server([payload + b"\n"])
+        async with server:
+            comm = await AsyncSocketCommunicator.open("127.0.0.1", port)
+            comm._reader._limit = 1024
+            assert await comm.query("CURVE?") == payload.decode()
+            await comm.close()
+
+    asyncio.run(main())
+
+
+def test_async_socket_timeout():
+    async def main():
+        server, port = await _echo_server([], hold=True)
+        async with server:
+            comm = await AsyncSocketCommunicator.open("127.0.0.1", port)
+            comm.timeout = 0.01
+            with pytest.raises(TimeoutError):
+                await comm.read_raw()
+            await comm.close()
+
+    asyncio.run(main())
+
+
+def test_async_socket_closed_before_terminator():
+    async def main():
+        server, port = await _echo_server([b"abc"])
+        async with server:
+            comm = await AsyncSocketCommunicator.open("127.0.0.1", port)
+            with pytest.raises(OSError):
+                await comm.query("A?")
+            await comm.close()
+
+    asyncio.run(main())
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Pseudo terminals are not available."
+)
+def test_async_serial_query():
+    master, slave = os.openpty()
+
+    async def main():
+        conn = serial.Serial(os.ttyname(slave), baudrate=115200)
+        comm = await AsyncSerialCommunicator.open(conn)
+        assert comm.address == os.ttyname(slave)
+
+        await comm.sendcmd("*IDN?")
+        await asyncio.sleep(0.01)
+        assert os.read(master, 100) == b"*IDN?\n"
+        os.write(master, b"NAME\n")
+        assert await comm.read() == "NAME"
+        await comm.close()
+
+    asyncio.run(main())
+    os.close(slave)
+    os.close(master)
+
+
+def test_async_serial_wrong_type():
+    async def main():
+        with pytest.raises(TypeError):
+            await AsyncSerialCommunicator.open("derp")
+
+    asyncio.run(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""
+Unit tests for the shared-bus arbiter
+"""
+
+# IMPORTS ####################################################################
+
+
+import threading
+import time
+
+import pytest
+
+from instruments.abstract_instruments.comm import BusArbiter
+from instruments.units import ureg as u
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access
+
+
+def _wait_for_queue(arbiter, depth):
+    deadline = time.monotonic() + 5
+    while arbiter.queue_depth < depth:
+        assert time.monotonic() < deadline, "Waiters never queued."
+        time.sleep(0.001)
+
+
+def test_arbiter_transaction():
+    arbiter = BusArbiter()
+    with arbiter.transaction() as bus:
+        assert bus is arbiter
+        assert arbiter._owner == threading.get_ident()
+    assert arbiter._owner is None
+
+
+def test_arbiter_reentrant():
+    arbiter = BusArbiter()
+    with arbiter.transaction():
+        with arbiter.transaction():
+            assert arbiter._depth == 2
+        assert arbiter._owner == threading.get_ident()
+    assert arbiter._owner is None
+
+
+def test_arbiter_release_not_held():
+    arbiter = BusArbiter()
+    with pytest.raises(RuntimeError):
+        arbiter.release()
+
+
+def test_arbiter_timeout():
+    arbiter = BusArbiter()
+    arbiter.acquire()
+
+    def other():
+        with pytest.raises(TimeoutError):
+            with arbiter.transaction(timeout=0.01):
+                pass
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    thread.join()
+    assert arbiter.queue_depth == 0
+    arbiter.release()
+
+
+def test_arbiter_priority_order():
+    arbiter = BusArbiter()
+    order = []
+    arbiter.acquire()
+
+    def worker(name, priority):
+        with arbiter.transaction(priority):
+            order.append(name)
+
+    threads = []
+    for idx, (name, priority) in enumerate(
+        [("slow1", 10), ("slow2", 10), ("urgent", -1), ("normal", 0)]
+    ):
+        thread = threading.Thread(target=worker, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        _wait_for_queue(arbiter, idx + 1)
+
+    arbiter.release()
+    for thread in threads:
+        thread.join()
+    assert order == ["urgent", "normal", "slow1", "slow2"]
+
+
+def test_arbiter_serializes_transactions():
+    arbiter = BusArbiter()
+    active = []
+    overlaps = []
+
+    def worker():
+        for _ in range(50):
+            with arbiter.transaction():
+                active.append(1)
+                if len(active) > 1:
+                    overlaps.append(1)
+                active.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not overlaps
+    assert arbiter.stats["transactions"] == 200
+
+
+def test_arbiter_stats():
+    arbiter = BusArbiter()
+    arbiter.acquire()
+
+    def worker():
+        with arbiter.transaction():
+            pass
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    _wait_for_queue(arbiter, 1)
+    assert arbiter.stats["queue_depth"] == 1
+    time.sleep(0.01)
+    arbiter.release()
+    thread.join()
+
+    stats = arbiter.stats
+    assert stats["queue_depth"] == 0
+    assert stats["max_queue_depth"] == 1
+    assert stats["transactions"] == 2
+    assert stats["max_wait"] >= 0.01 * u.second
+    assert stats["mean_wait"] == stats["total_wait"] / 2
+
+    arbiter.reset_stats()
+    assert arbiter.stats["transactions"] == 0
+    assert arbiter.stats["max_wait"] == 0 * u.second
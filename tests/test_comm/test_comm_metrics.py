@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+"""
+Unit tests for the communicator metrics
+"""
+
+# IMPORTS ####################################################################
+
+from io import BytesIO
+import threading
+
+import pytest
+
+from instruments.abstract_instruments.comm import (
+    CommunicatorMetrics,
+    KindTotals,
+    LatencyHistogram,
+    LoopbackCommunicator,
+    Transaction,
+)
+from instruments.units import ureg as u
+from tests import unit_eq
+from .. import mock
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access
+
+
+def test_latency_histogram_empty():
+    hist = LatencyHistogram()
+    assert hist.count == 0
+    unit_eq(hist.mean, 0 * u.second)
+    unit_eq(hist.percentile(50), 0 * u.second)
+
+
+def test_latency_histogram_percentiles():
+    hist = LatencyHistogram()
+    for micros in range(1, 1001):
+        hist.record(micros * 1e-6)
+
+    assert hist.count == 1000
+    unit_eq(hist.max, 1e-3 * u.second)
+    assert hist.mean.to(u.s).magnitude == pytest.approx(500.5e-6)
+    assert hist.total.to(u.s).magnitude == pytest.approx(0.5005)
+    for percent in (1, 50, 90, 99):
+        value = hist.percentile(percent).to(u.s).magnitude
+        assert percent * 1e-5 <= value <= percent * 1e-5 * 1.07 + 1e-6
+    unit_eq(hist.percentile(100), 1e-3 * u.second)
+
+    with pytest.raises(ValueError):
+        hist.percentile(101)
+
+
+def test_latency_histogram_buckets_are_contiguous():
+    upper = 0
+    for micros in range(0, 5000):
+        idx = LatencyHistogram._index(micros)
+        assert micros < LatencyHistogram._upper_bound(idx)
+        assert LatencyHistogram._upper_bound(idx) >= upper
+        upper = LatencyHistogram._upper_bound(idx)
+
+
+def test_comm_metrics_counts_commands_and_queries():
+    comm = LoopbackCommunicator(stdin=BytesIO(b"1.0\n"), stdout=BytesIO())
+    comm.sendcmd("VOLT 1")
+    comm.sendcmd("VOLT 2")
+    assert comm.query("MEAS:VOLT?") == "1.0"
+
+    metrics = comm.metrics
+    assert metrics.commands == 2
+    assert metrics.queries == 1
+    assert metrics.bytes_out == len("VOLT 1VOLT 2MEAS:VOLT?")
+    assert metrics.bytes_in == 3
+    prefixes = metrics.by_prefix()
+    assert sorted(prefixes) == ["MEAS:VOLT?", "VOLT"]
+    assert prefixes["VOLT"].count == 2
+    assert metrics.bus_time.to(u.s).magnitude >= 0
+
+    metrics.reset()
+    assert metrics.commands == 0
+    assert metrics.by_prefix() == {}
+
+
+def test_comm_metrics_by_kind():
+    metrics = CommunicatorMetrics()
+    metrics.record("sendcmd", "VOLT 1", None, 0.0, 1e-3)
+    metrics.record("query", "MEAS:VOLT?", "1.0", 0.0, 1e-3)
+    metrics.record("query", "DATA?", None, 0.0, 1e-3)
+
+    assert metrics.by_kind() == {
+        "sendcmd": KindTotals(1, 6, 0),
+        "query": KindTotals(2, 15, 3),
+    }
+    assert metrics.commands == 1
+    assert metrics.queries == 2
+    assert metrics.bytes_out == 21
+    assert metrics.bytes_in == 3
+
+
+def test_comm_metrics_counts_encoded_bytes():
+    metrics = CommunicatorMetrics()
+    metrics.record("query", "UNIT \u00b5A", "\u00b5A", 0.0, 1e-3)
+    metrics.record("query", "DATA?", b"\x00\x01", 0.0, 1e-3)
+    assert metrics.bytes_out == len("UNIT \u00b5A".encode("utf-8")) + 5
+    assert metrics.bytes_in == 3 + 2
+
+
+def test_comm_metrics_errors():
+    comm = LoopbackCommunicator()
+    comm._sendcmd = mock.MagicMock(side_effect=OSError)
+    comm._query = mock.MagicMock(side_effect=OSError)
+
+    with pytest.raises(OSError):
+        comm.sendcmd("VOLT 1")
+    with pytest.raises(OSError):
+        comm.query("VOLT?")
+    assert comm.metrics.errors == 2
+    assert comm.metrics.commands == 0
+
+
+def test_comm_metrics_command_during_query_of_other_thread():
+    comm = LoopbackCommunicator(stdin=BytesIO(), stdout=BytesIO())
+    querying = threading.Event()
+    release = threading.Event()
+
+    def _query(msg, size=-1):  # pylint: disable=unused-argument
+        querying.set()
+        assert release.wait(10)
+        return "1.0"
+
+    comm._query = _query
+    thread = threading.Thread(target=comm.query, args=("MEAS:VOLT?",))
+    thread.start()
+    assert querying.wait(10)
+    comm.sendcmd("VOLT 1")
+    release.set()
+    thread.join()
+
+    assert comm.metrics.commands == 1
+    assert comm.metrics.queries == 1
+
+
+def test_comm_metrics_threads():
+    metrics = CommunicatorMetrics()
+    n_threads, n_records = 4, 2000
+
+    def _record():
+        for _ in range(n_records):
+            metrics.record("sendcmd", "VOLT 1", None, 0, 1e-6)
+
+    threads = [threading.Thread(target=_record) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics.commands == n_threads * n_records
+    assert metrics.by_prefix()["VOLT"].count == n_threads * n_records
+
+
+def test_comm_metrics_max_prefixes():
+    metrics = CommunicatorMetrics()
+    metrics.max_prefixes = 2
+    for idx in range(4):
+        metrics.record("sendcmd", f"CH{idx}:SCALE 1", None, 0.0, 1e-3)
+
+    assert sorted(metrics.by_prefix()) == ["<other>", "CH0:SCALE", "CH1:SCALE"]
+    assert metrics.by_prefix()["<other>"].count == 2
+
+
+def test_comm_metrics_history():
+    metrics = CommunicatorMetrics()
+    assert metrics.history_size == 0
+    metrics.record("sendcmd", "A", None, 0.0, 1e-3)
+    assert metrics.history == []
+
+    metrics.history_size = 2
+    for msg in "BCD":
+        metrics.record("query", msg, "1", 0.0, 1e-3)
+    assert metrics.history_size == 2
+    assert [transaction.msg for transaction in metrics.history] == ["C", "D"]
+    assert metrics.history[-1] == Transaction("query", "D", "1", 0.0, 1e-3)
+
+    metrics.reset()
+    assert metrics.history == []
+    metrics.history_size = 0
+    assert metrics.history == []
+    with pytest.raises(ValueError):
+        metrics.history_size = -1
+
+
+def test_comm_metrics_hooks():
+    comm = LoopbackCommunicator(stdin=BytesIO(b"1.0\n"), stdout=BytesIO())
+    hook = mock.MagicMock()
+    comm.metrics.add_hook(hook)
+
+    comm.query("MEAS:VOLT?")
+    transaction = hook.call_args[0][0]
+    assert transaction.kind == "query"
+    assert transaction.msg == "MEAS:VOLT?"
+    assert transaction.response == "1.0"
+    assert transaction.duration >= 0
+
+    comm.metrics.remove_hook(hook)
+    comm.sendcmd("VOLT 1")
+    assert hook.call_count == 1
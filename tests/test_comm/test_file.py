@@ -6,9 +6,15 @@ Unit tests for the file communication layer
 # IMPORTS ####################################################################
 
 
+import io
+import socket
+import threading
+
 import pytest
 
 from instruments.abstract_instruments.comm import FileCommunicator
+from instruments.units import ureg as u
+from tests import unit_eq
 from .. import mock
 
 # TEST CASES #################################################################
@@ -134,3 +140,122 @@ def test_filecomm_flush_input():
     comm = FileCommunicator(mock.MagicMock())
     comm.flush_input()
     comm._filelike.flush.assert_called_with()
+
+
+# POLL MODE TESTS ############################################################
+
+
+@pytest.fixture
+def socket_file():
+    """
+    Yields a ``(file, peer)`` pair, where ``file`` is a file-like object
+    backed by one end of a connected unix socket pair.
+    """
+    host, device = socket.socketpair()
+    filelike = host.makefile("rwb", buffering=0)
+    yield filelike, device
+    filelike.close()
+    host.close()
+    device.close()
+
+
+def test_filecomm_poll_requires_fileno():
+    mock_file = mock.MagicMock()
+    mock_file.fileno.side_effect = io.UnsupportedOperation
+    with pytest.raises(TypeError):
+        _ = FileCommunicator(mock_file, poll=True)
+
+
+def test_filecomm_poll_timeout(socket_file):
+    filelike, _ = socket_file
+    comm = FileCommunicator(filelike, poll=True)
+    assert comm.poll is True
+
+    unit_eq(comm.timeout, 3 * u.second)
+    comm.timeout = 250 * u.millisecond
+    unit_eq(comm.timeout, 0.25 * u.second)
+
+
+def test_filecomm_poll_toggle(socket_file):
+    filelike, device = socket_file
+    comm = FileCommunicator(filelike, poll=True)
+    poller = comm._poller
+    comm.poll = True
+    assert comm._poller is poller
+
+    comm.poll = False
+    assert comm.poll is False
+    assert comm._poller is None
+
+    comm.poll = True
+    device.sendall(b"abc\n")
+    assert comm.read_raw() == b"abc"
+
+
+def test_filecomm_poll_query(socket_file):
+    filelike, device = socket_file
+    comm = FileCommunicator(filelike, poll=True)
+    device.sendall(b"abc\ndef\n")
+
+    assert comm._query("mock") == "abc"
+    assert device.recv(100) == b"mock\n"
+    assert comm.read_raw() == b"def"
+
+
+def test_filecomm_poll_read_raw_size(socket_file):
+    filelike, device = socket_file
+    comm = FileCommunicator(filelike, poll=True)
+    device.sendall(b"#3")
+    device.sendall(b"12345")
+
+    assert comm.read_raw(2) == b"#3"
+    assert comm.read_raw(5) == b"12345"
+
+
+def test_filecomm_poll_readinto(socket_file):
+    filelike, device = socket_file
+    comm = FileCommunicator(filelike, poll=True)
+    device.sendall(b"abc\n#1")
+    buf = bytearray(4)
+
+    assert comm.read_raw() == b"abc"
+    assert comm.readinto(buf) == 2
+    assert buf[:2] == b"#1"
+
+    device.sendall(b"2345")
+    assert comm.readinto(buf) == 4
+    assert buf == b"2345"
+
+
+def test_filecomm_poll_read_raw_large(socket_file):
+    filelike, device = socket_file
+    comm = FileCommunicator(filelike, poll=True)
+    payload = b"1.0," * 40000
+    writer = threading.Thread(target=device.sendall, args=(payload + b"\n",))
+    writer.start()
+
+    assert comm.read_raw() == payload
+    writer.join()
+
+
+def test_filecomm_poll_read_raw_timeout(socket_file):
+    filelike, device = socket_file
+    comm = FileCommunicator(filelike, poll=True)
+    comm.timeout = 0.01
+
+    with pytest.raises(OSError):
+        _ = comm.read_raw()
+
+    # A partial response is returned if the device stops talking.
+    device.sendall(b"abc")
+    assert comm.read_raw() == b"abc"
+
+
+def test_filecomm_poll_flush_input(socket_file):
+    filelike, device = socket_file
+    comm = FileCommunicator(filelike, poll=True)
+    device.sendall(b"abc\ndef\n")
+
+    assert comm.read_raw() == b"abc"
+    comm.flush_input()
+    assert comm._rx_buf == b""
@@ -6,11 +6,17 @@ Unit tests for the GPIBUSB communication layer
 # IMPORTS ####################################################################
 
 
+import threading
+
 import pytest
 import serial
 from instruments.units import ureg as u
 
-from instruments.abstract_instruments.comm import GPIBCommunicator, SerialCommunicator
+from instruments.abstract_instruments.comm import (
+    BusArbiter,
+    GPIBCommunicator,
+    SerialCommunicator,
+)
 from tests import unit_eq
 from .. import mock
 
@@ -48,6 +54,22 @@ def test_gpibusbcomm_init_correct_values_old_firmware():
     assert comm._eos == 10
 
 
+def test_gpibusbcomm_init_holds_arbiter():
+    mock_gpib = mock.MagicMock()
+    mock_gpib.arbiter = BusArbiter()
+    owners = []
+
+    def _query(cmd):
+        owners.append(mock_gpib.arbiter._owner)
+        return "5"
+
+    mock_gpib.query.side_effect = _query
+    _ = GPIBCommunicator(mock_gpib, 1)
+
+    assert owners == [threading.get_ident()]
+    assert mock_gpib.arbiter._owner is None
+
+
 def test_gpibusbcomm_address():
     # Create our communicator
     comm = GPIBCommunicator(mock.MagicMock(), 1)
@@ -190,6 +212,15 @@ def test_gpibusbcomm_terminator():
     assert comm._eoi is True
 
 
+def test_gpibusbcomm_arbiter():
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    arbiter = BusArbiter()
+
+    comm.arbiter = arbiter
+    assert comm._file.arbiter is arbiter
+    assert comm.arbiter is arbiter
+
+
 def test_gpibusbcomm_timeout():
     comm = GPIBCommunicator(mock.MagicMock(), 1)
     comm._version = 5
@@ -217,6 +248,16 @@ def test_gpibusbcomm_read_raw():
     comm._file.read_raw.assert_called_with(3)
 
 
+def test_gpibusbcomm_readinto():
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    comm._version = 5
+    comm._file.readinto = mock.MagicMock(return_value=3)
+    buf = bytearray(3)
+
+    assert comm.readinto(buf) == 3
+    comm._file.readinto.assert_called_with(buf)
+
+
 def test_gpibusbcomm_write_raw():
     comm = GPIBCommunicator(mock.MagicMock(), 1)
     comm._version = 5
@@ -241,6 +282,102 @@ def test_gpibusbcomm_sendcmd():
     )
 
 
+def test_gpibusbcomm_sendcmd_only_sends_changed_settings():
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    comm._version = 5
+    comm.pacing = 0
+
+    comm._sendcmd("mock")
+    comm._file.sendcmd = mock.MagicMock()
+    comm._sendcmd("mock2")
+    comm._file.sendcmd.assert_called_once_with("mock2")
+
+    comm._file.sendcmd = mock.MagicMock()
+    comm._eoi = False
+    comm._sendcmd("mock3")
+    assert comm._file.sendcmd.call_args_list == [
+        mock.call("++eoi 0"),
+        mock.call("mock3"),
+    ]
+
+
+def test_gpibusbcomm_sendcmd_shared_adapter():
+    adapter = mock.MagicMock()
+    adapter.query.return_value = "5"
+    comm1 = GPIBCommunicator(adapter, 1)
+    comm2 = GPIBCommunicator(adapter, 2)
+    comm1.pacing = 0
+    comm2.pacing = 0
+    comm2.timeout = 1000 * u.millisecond
+
+    comm1._sendcmd("one")
+    comm2._sendcmd("two")
+    adapter.sendcmd = mock.MagicMock()
+    comm1._sendcmd("one")
+    comm1._sendcmd("one")
+    comm2._sendcmd("two")
+    assert adapter.sendcmd.call_args_list == [
+        mock.call("+a:1"),
+        mock.call("one"),
+        mock.call("one"),
+        mock.call("+a:2"),
+        mock.call("two"),
+    ]
+
+
+def test_gpibusbcomm_pacing():
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    comm._version = 5
+
+    unit_eq(comm.pacing, 0.01 * u.second)
+    comm.pacing = 5 * u.millisecond
+    unit_eq(comm.pacing, 0.005 * u.second)
+    comm.pacing = 0.02
+    unit_eq(comm.pacing, 0.02 * u.second)
+
+    with pytest.raises(ValueError):
+        comm.pacing = -1
+
+
+@mock.patch("instruments.abstract_instruments.comm.gpib_communicator.time")
+def test_gpibusbcomm_pacing_measured_from_last_io(mock_time):
+    mock_time.monotonic.return_value = 0.0
+    comm = GPIBCommunicator(mock.MagicMock(), 1)
+    comm._version = 5
+    comm.pacing = 10 * u.millisecond
+    comm._sendcmd("mock")
+
+    mock_time.sleep.reset_mock()
+    comm._adapter.last_io = 100.0
+    mock_time.monotonic.return_value = 100.004
+    comm._sendcmd("mock")
+    mock_time.sleep.assert_called_once_with(pytest.approx(0.006))
+
+    mock_time.sleep.reset_mock()
+    comm._adapter.last_io = 100.0
+    mock_time.monotonic.return_value = 100.5
+    comm._sendcmd("mock")
+    mock_time.sleep.assert_not_called()
+
+
+@mock.patch("instruments.abstract_instruments.comm.gpib_communicator.time")
+def test_gpibusbcomm_query_paces_read(mock_time):
+    mock_time.monotonic.return_value = 0.0
+    mock_file = mock.MagicMock()
+    comm = GPIBCommunicator(mock_file, 1)
+    comm._version = 5
+    comm.pacing = 10 * u.millisecond
+    comm._sendcmd("mock")
+
+    mock_time.sleep.reset_mock()
+    mock_time.sleep.side_effect = lambda _: mock_file.read.assert_not_called()
+    mock_file.read.return_value = "answer"
+    assert comm._query("mock?") == "answer"
+    # Paced once before the query is written, and once before the read.
+    assert mock_time.sleep.call_args_list == [mock.call(pytest.approx(0.01))] * 2
+    mock_file.read.assert_called_once_with(-1)
+
+
 def test_gpibusbcomm_sendcmd_empty_string():
     comm = GPIBCommunicator(mock.MagicMock(), 1)
     comm._version = 5
@@ -0,0 +1,348 @@
+#!/usr/bin/env python
+"""
+Unit tests for the HiSLIP communication layer, run against a stand-in HiSLIP
+server on the loopback interface.
+"""
+
+# IMPORTS ####################################################################
+
+import socket
+import struct
+import threading
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import HiSLIPCommunicator
+from instruments.units import ureg as u
+from tests import unit_eq
+from .. import mock
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access,redefined-outer-name
+
+MessageType = HiSLIPCommunicator.MessageType
+HEADER = struct.Struct(">2sBBIQ")
+
+
+class StandInServer:
+    """
+    Minimal HiSLIP server. Queries (messages ending in ``?``) are answered
+    from ``responses``, split into data messages of at most ``chunk`` bytes.
+    Every data message received is kept in ``received`` as a tuple of
+    ``(type, control, message_id, payload)``.
+    """
+
+    def __init__(self, responses, overlapped=False, max_message_size=1024, chunk=8):
+        self.responses = responses
+        self.overlapped = overlapped
+        self.max_message_size = max_message_size
+        self.chunk = chunk
+        self.received = []
+        self.client_max_message_size = None
+        self.sub_address = None
+        self.device_clears = 0
+        self._listener = socket.socket()
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen(2)
+        self.port = self._listener.getsockname()[1]
+        self._threads = []
+        self._conns = []
+        self._accept = threading.Thread(target=self._serve, daemon=True)
+        self._accept.start()
+
+    def close(self):
+        self._listener.close()
+        for conn in self._conns:
+            conn.close()
+
+    @staticmethod
+    def _recv_exact(conn, size):
+        data = b""
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                raise EOFError
+            data += chunk
+        return data
+
+    def _recv(self, conn):
+        _, msg_type, control, param, length = HEADER.unpack(
+            self._recv_exact(conn, HEADER.size)
+        )
+        return msg_type, control, param, self._recv_exact(conn, length)
+
+    @staticmethod
+    def _send(conn, msg_type, control=0, param=0, payload=b""):
+        conn.sendall(HEADER.pack(b"HS", msg_type, control, param, len(payload)))
+        conn.sendall(payload)
+
+    def _serve(self):
+        for _ in range(2):
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            self._conns.append(conn)
+            thread = threading.Thread(target=self._handle, args=(conn,), daemon=True)
+            thread.start()
+
+    def _handle(self, conn):
+        message = b""
+        try:
+            while True:
+                msg_type, control, param, payload = self._recv(conn)
+                if msg_type == MessageType.initialize:
+                    self.sub_address = payload.decode()
+                    self._send(
+                        conn,
+                        MessageType.initialize_response,
+                        control=int(self.overlapped),
+                        param=(0x0100 << 16) | 42,
+                    )
+                elif msg_type == MessageType.async_initialize:
+                    assert param == 42
+                    self._send(conn, MessageType.async_initialize_response)
+                elif msg_type == MessageType.async_maximum_message_size:
+                    self.client_max_message_size = struct.unpack(">Q", payload)[0]
+                    self._send(
+                        conn,
+                        MessageType.async_maximum_message_size_response,
+                        payload=struct.pack(">Q", self.max_message_size),
+                    )
+                elif msg_type == MessageType.async_device_clear:
+                    self.device_clears += 1
+                    self._send(conn, MessageType.async_device_clear_acknowledge)
+                elif msg_type == MessageType.device_clear_complete:
+                    self.overlapped = bool(control & 1)
+                    self._send(
+                        conn,
+                        MessageType.device_clear_acknowledge,
+                        control=int(self.overlapped),
+                    )
+                elif msg_type in (MessageType.data, MessageType.data_end):
+                    self.received.append((msg_type, control, param, payload))
+                    message += payload
+                    if msg_type == MessageType.data_end:
+                        self._respond(conn, message.strip(), param)
+                        message = b""
+        except (EOFError, OSError):
+            pass
+
+    def _respond(self, conn, message, message_id):
+        if message == b"ERR?":
+            self._send(conn, MessageType.error, control=3, payload=b"Bad query")
+            return
+        if not message.endswith(b"?"):
+            return
+        response = self.responses[message.decode()] + b"\n"
+        parts = [
+            response[idx : idx + self.chunk]
+            for idx in range(0, len(response), self.chunk)
+        ]
+        for part in parts[:-1]:
+            self._send(conn, MessageType.data, param=message_id, payload=part)
+        self._send(conn, MessageType.data_end, param=message_id, payload=parts[-1])
+
+
+@pytest.fixture
+def server():
+    server = StandInServer(
+        {
+            "*IDN?": b"ACME,Stand-in HiSLIP server,1234,1.0",
+            "VOLT?": b"+1.000E+00",
+            "CURV?": b"#210" + bytes(range(10)),
+            "WAVE?": b"#0" + bytes.fromhex("00010a0000030004"),
+            "LONG?": b"x" * 5000,
+        }
+    )
+    yield server
+    server.close()
+
+
+def _connect(server, **kwargs):
+    sync_conn = socket.create_connection(("127.0.0.1", server.port), timeout=5)
+    async_conn = socket.create_connection(("127.0.0.1", server.port), timeout=5)
+    return HiSLIPCommunicator(sync_conn, async_conn, **kwargs)
+
+
+def test_hislipcomm_init(server):
+    comm = _connect(server, sub_address="hislip3", max_message_size=4096)
+
+    assert server.sub_address == "hislip3"
+    assert server.client_max_message_size == 4096
+    assert comm.session_id == 42
+    assert comm.max_message_size == 1024
+    assert comm.overlapped is False
+    assert comm.address == ("127.0.0.1", server.port)
+    comm.close()
+
+
+def test_hislipcomm_init_wrong_type():
+    with pytest.raises(TypeError):
+        _ = HiSLIPCommunicator(mock.MagicMock(), socket.socket())
+
+
+def test_hislipcomm_query(server):
+    comm = _connect(server)
+
+    assert comm.query("*IDN?") == "ACME,Stand-in HiSLIP server,1234,1.0"
+    assert comm.query("LONG?") == "x" * 5000
+    comm.sendcmd("VOLT 1")
+    assert comm.query("VOLT?") == "+1.000E+00"
+
+    ids = [message_id for _, _, message_id, _ in server.received]
+    assert ids == [0xFFFFFF00, 0xFFFFFF02, 0xFFFFFF04, 0xFFFFFF06]
+    # The RMT-delivered flag is set on the first message after each
+    # response has been read.
+    rmt = [control for _, control, _, _ in server.received]
+    assert rmt == [0, 1, 1, 0]
+    comm.close()
+
+
+def test_hislipcomm_large_message_split(server):
+    server.max_message_size = 16
+    comm = _connect(server)
+
+    comm.sendcmd("DATA " + "1," * 20)
+    assert comm.query("VOLT?") == "+1.000E+00"
+
+    parts = server.received[:-1]
+    assert [msg_type for msg_type, _, _, _ in parts] == [MessageType.data] * 2 + [
+        MessageType.data_end
+    ]
+    assert {message_id for _, _, message_id, _ in parts} == {0xFFFFFF00}
+    assert b"".join(payload for _, _, _, payload in parts) == (
+        b"DATA " + b"1," * 20 + b"\n"
+    )
+    comm.close()
+
+
+def test_hislipcomm_binblockread(server):
+    comm = _connect(server)
+    inst = ik.Instrument(comm)
+
+    inst.sendcmd("CURV?")
+    data = inst.binblockread(1, fmt=">B")
+    assert tuple(data) == tuple(range(10))
+    assert comm.read_raw(1) == b"\n"
+    assert inst.query("VOLT?") == "+1.000E+00"
+    comm.close()
+
+
+def test_hislipcomm_binblockread_indefinite_length(server):
+    comm = _connect(server)
+    inst = ik.Instrument(comm)
+
+    # 2560 is 0x0a00, whose first byte is the terminator.
+    inst.sendcmd("WAVE?")
+    assert tuple(inst.binblockread(2, fmt=">h")) == (1, 2560, 3, 4)
+    assert inst.query("VOLT?") == "+1.000E+00"
+    comm.close()
+
+
+def test_hislipcomm_error(server):
+    comm = _connect(server)
+    with pytest.raises(OSError) as err:
+        comm.query("ERR?")
+    assert "Bad query" in str(err.value)
+    comm.close()
+
+
+def test_hislipcomm_overlapped(server):
+    comm = _connect(server, overlapped=True)
+
+    assert comm.overlapped is True
+    assert server.overlapped is True
+    assert server.device_clears == 1
+    assert comm.pipelined_query(["*IDN?", "VOLT?", "LONG?"]) == [
+        "ACME,Stand-in HiSLIP server,1234,1.0",
+        "+1.000E+00",
+        "x" * 5000,
+    ]
+    # No response was read before all queries were sent.
+    assert [control for _, control, _, _ in server.received] == [0, 0, 0]
+    comm.close()
+
+
+def test_hislipcomm_pipelined_query_synchronized(server):
+    comm = _connect(server)
+    assert comm.pipelined_query(["VOLT?", "*IDN?"]) == [
+        "+1.000E+00",
+        "ACME,Stand-in HiSLIP server,1234,1.0",
+    ]
+    comm.close()
+
+
+def test_hislipcomm_device_clear(server):
+    comm = _connect(server)
+    comm.sendcmd("VOLT?")
+    comm.device_clear()
+
+    assert server.device_clears == 1
+    assert comm.overlapped is False
+    assert comm._message_id == 0xFFFFFF00
+    assert comm.query("VOLT?") == "+1.000E+00"
+
+    comm.device_clear(overlapped=True)
+    assert comm.overlapped is True
+    comm.close()
+
+
+def test_hislipcomm_flush_input(server):
+    comm = _connect(server)
+    comm.sendcmd("LONG?")
+    assert comm.read_raw(4) == b"xxxx"
+    comm.flush_input()
+    assert comm.query("VOLT?") == "+1.000E+00"
+    comm.close()
+
+
+def test_hislipcomm_terminator_and_timeout(server):
+    comm = _connect(server)
+
+    comm.terminator = b"\r\n"
+    assert comm.terminator == "\r\n"
+    with pytest.raises(TypeError):
+        comm.terminator = 42
+
+    comm.timeout = 1500 * u.millisecond
+    unit_eq(comm.timeout, 1.5 * u.second)
+    assert comm._async.gettimeout() == 1.5
+
+    with pytest.raises(NotImplementedError):
+        comm.address = ("localhost", 1)
+    with pytest.raises(ValueError):
+        comm.read_raw(-2)
+    comm.close()
+
+
+def test_instrument_open_hislip(server):
+    inst = ik.Instrument.open_hislip("127.0.0.1", server.port, sub_address="inst0")
+
+    assert isinstance(inst._file, HiSLIPCommunicator)
+    assert server.sub_address == "inst0"
+    assert inst.query("*IDN?") == "ACME,Stand-in HiSLIP server,1234,1.0"
+    inst._file.close()
+
+
+@mock.patch("instruments.abstract_instruments.instrument.Instrument.open_hislip")
+def test_instrument_open_from_uri_hislip(mock_open):
+    ik.Instrument.open_from_uri("hislip://192.168.0.10")
+    mock_open.assert_called_with("192.168.0.10")
+
+    ik.Instrument.open_from_uri("hislip://192.168.0.10:4881/hislip2")
+    mock_open.assert_called_with("192.168.0.10", port=4881, sub_address="hislip2")
+
+    ik.Instrument.open_from_uri("hislip://192.168.0.10?overlapped=true&timeout=2.5")
+    mock_open.assert_called_with("192.168.0.10", overlapped=True, timeout=2.5)
+
+
+@mock.patch("instruments.abstract_instruments.instrument.socket.create_connection")
+def test_instrument_open_hislip_closes_on_failure(mock_connect):
+    sync_conn = mock.MagicMock()
+    mock_connect.side_effect = [sync_conn, ConnectionRefusedError()]
+    with pytest.raises(ConnectionRefusedError):
+        ik.Instrument.open_hislip("192.168.0.10")
+    sync_conn.close.assert_called_once_with()
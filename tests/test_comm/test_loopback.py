@@ -86,6 +86,17 @@ def test_loopbackcomm_read_raw():
     mock_stdin.read.assert_called_with(10)
 
 
+def test_loopbackcomm_readinto():
+    mock_stdin = mock.MagicMock()
+    mock_stdin.read.return_value = b"abc"
+    comm = LoopbackCommunicator(stdin=mock_stdin)
+    buf = bytearray(5)
+
+    assert comm.readinto(buf) == 3
+    assert buf == b"abc\x00\x00"
+    mock_stdin.read.assert_called_with(5)
+
+
 def test_loopbackcomm_read_raw_2char_terminator():
     mock_stdin = mock.MagicMock()
     mock_stdin.read.side_effect = [b"a", b"b", b"c", b"\r", b"\n"]
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+"""
+Unit tests for the instrument server and the proxy communication layer used
+by its clients.
+"""
+
+# IMPORTS ####################################################################
+
+from io import BytesIO
+import socket
+import threading
+import time
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import (
+    InstrumentServer,
+    LoopbackCommunicator,
+    ProxyCommunicator,
+)
+from instruments.units import ureg as u
+from tests import unit_eq
+from .. import mock
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access,redefined-outer-name
+
+
+def _serve(ins_to_host, address=("127.0.0.1", 0), **kwargs):
+    stdout = BytesIO()
+    comm = LoopbackCommunicator(BytesIO(ins_to_host), stdout)
+    server = InstrumentServer(comm, address, **kwargs)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,))
+    thread.daemon = True
+    thread.start()
+    return server, stdout
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def _start(ins_to_host, **kwargs):
+        server, stdout = _serve(ins_to_host, **kwargs)
+        servers.append(server)
+        return server, stdout
+
+    yield _start
+    for server in servers:
+        server.shutdown()
+        server.close()
+
+
+def _uri(server):
+    host, port = server.address
+    return f"ikproxy://{host}:{port}"
+
+
+def test_proxycomm_init_wrong_type():
+    with pytest.raises(TypeError):
+        ProxyCommunicator(BytesIO())
+
+
+def test_proxy_sendcmd_query_read(serve):
+    server, stdout = serve(b"ACME\nabcdef")
+    inst = ik.Instrument.open_from_uri(_uri(server))
+    assert isinstance(inst._file, ProxyCommunicator)
+    assert inst._file.address == server.address
+    inst.sendcmd("*RST")
+    assert inst.query("*IDN?") == "ACME"
+    assert inst.read(3) == "abc"
+    assert inst.read_raw(3) == b"def"
+    inst._file.write_raw(b"raw")
+    inst._file.flush_input()
+    inst._file.close()
+    assert stdout.getvalue() == b"*RST\n*IDN?\nraw"
+
+
+def test_proxy_unix_socket(serve, tmp_path):
+    path = str(tmp_path / "instrument.sock")
+    _, stdout = serve(b"1\n", address=path)
+    inst = ik.Instrument.open_from_uri(f"ikproxy://{path}")
+    assert inst.query("VAL?") == "1"
+    assert stdout.getvalue() == b"VAL?\n"
+
+
+def test_proxy_terminator_and_timeout(serve):
+    server, _ = serve(b"")
+    comm = ik.Instrument.open_proxy(server.address)._file
+    assert comm.terminator == "\n"
+    comm.terminator = b"\r"
+    assert comm.terminator == "\r"
+    assert server._comm.terminator == "\r"
+    with pytest.raises(TypeError):
+        comm.terminator = 1
+    comm.timeout = 2 * u.s
+    unit_eq(comm.timeout, 0 * u.s)
+
+
+def test_proxy_server_errors(serve):
+    server, _ = serve(b"")
+    inst = ik.Instrument.open_proxy(server.address)
+    with mock.patch.object(
+        LoopbackCommunicator, "_sendcmd", side_effect=ValueError("boom")
+    ):
+        with pytest.raises(OSError, match="ValueError: boom"):
+            inst.sendcmd("A")
+    with pytest.raises(ValueError):
+        inst.read_raw(-2)
+
+
+def test_proxy_transactions_are_not_interleaved(serve):
+    server, stdout = serve(b"")
+    first = ik.Instrument.open_proxy(server.address)
+    second = ik.Instrument.open_proxy(server.address)
+    with first.transaction():
+        first.sendcmd("A")
+        other = threading.Thread(target=second.sendcmd, args=("X",))
+        other.start()
+        time.sleep(0.1)
+        first.sendcmd("B")
+    other.join()
+    assert stdout.getvalue() == b"A\nB\nX\n"
+    assert server.arbiter.stats["queue_depth"] == 0
+
+
+def test_proxy_disconnect_releases_bus(serve):
+    server, stdout = serve(b"")
+    first = ik.Instrument.open_proxy(server.address)
+    second = ik.Instrument.open_proxy(server.address)
+    first.transaction().__enter__()
+    first.sendcmd("A")
+    first._file._conn.shutdown(socket.SHUT_RDWR)
+    second.sendcmd("B")
+    assert stdout.getvalue() == b"A\nB\n"
+
+
+def test_proxy_query_cache(serve):
+    server, stdout = serve(
+        b"1\n2\n30\n0\n", cache_ttl=10, cacheable={"VAL?"}.__contains__
+    )
+    first = ik.Instrument.open_proxy(server.address)
+    second = ik.Instrument.open_proxy(server.address)
+    assert first.query("VAL?") == "1"
+    assert second.query("VAL?") == "1"
+    second.sendcmd("SET")
+    assert first.query("VAL?") == "2"
+    assert first.query("VAL?", size=1) == "3"
+    # Queries which are not declared cacheable always reach the instrument.
+    assert first.query("SYST:ERR?") == "0"
+    assert second.query("SYST:ERR?") == "0"
+    assert stdout.getvalue() == b"VAL?\nSET\nVAL?\nVAL?\nSYST:ERR?\nSYST:ERR?\n"
+
+
+def test_proxy_query_cache_needs_predicate():
+    comm = LoopbackCommunicator(BytesIO(), BytesIO())
+    with pytest.raises(ValueError):
+        InstrumentServer(comm, ("127.0.0.1", 0), cache_ttl=10)
+
+
+def test_proxy_uri_without_port():
+    with pytest.raises(ValueError, match="port"):
+        ik.Instrument.open_from_uri("ikproxy://localhost")
+
+
+def test_proxy_query_cache_expires(serve):
+    server, stdout = serve(b"1\n2\n", cache_ttl=0.01 * u.s, cacheable=lambda _: True)
+    inst = ik.Instrument.open_proxy(server.address)
+    assert inst.query("VAL") == "1"
+    time.sleep(0.02)
+    assert inst.query("VAL") == "2"
+    assert stdout.getvalue() == b"VAL\nVAL\n"
+
+
+def test_proxy_concurrent_queries_are_coalesced(serve):
+    server, stdout = serve(b"1\n", cache_ttl=10, cacheable={"VAL?"}.__contains__)
+    started = threading.Event()
+    proceed = threading.Event()
+    query = LoopbackCommunicator._query
+
+    def _slow_query(self, msg, size=-1):
+        started.set()
+        proceed.wait(5)
+        return query(self, msg, size)
+
+    clients = [ik.Instrument.open_proxy(server.address) for _ in range(3)]
+    replies = []
+    with mock.patch.object(LoopbackCommunicator, "_query", _slow_query):
+        threads = [
+            threading.Thread(target=lambda c=c: replies.append(c.query("VAL?")))
+            for c in clients
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)
+        proceed.set()
+        for thread in threads:
+            thread.join()
+    assert replies == ["1"] * 3
+    assert stdout.getvalue() == b"VAL?\n"
+
+
+def test_server_context_manager():
+    comm = LoopbackCommunicator(BytesIO(), BytesIO())
+    with InstrumentServer(comm, ("127.0.0.1", 0)) as server:
+        assert server.arbiter is comm.arbiter
+    inst = ik.Instrument.open_test()
+    with InstrumentServer(inst, ("127.0.0.1", 0)) as server:
+        assert server._comm is inst._file
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+"""
+Unit tests for the session recording and replay communicators
+"""
+
+# IMPORTS ####################################################################
+
+from io import BytesIO
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments.comm import (
+    LoopbackCommunicator,
+    RecordingCommunicator,
+    ReplayCommunicator,
+)
+from instruments.abstract_instruments.comm.recording_communicator import (
+    KIND_QUERY,
+    KIND_READ,
+    KIND_SENDCMD,
+)
+from .. import mock
+
+# TEST CASES #################################################################
+
+# pylint: disable=protected-access
+
+
+def _record_session(stdin):
+    """
+    Records a session with a loopback communicator, returning the recording
+    and the data written to the loopback.
+    """
+    recording = BytesIO()
+    stdout = BytesIO()
+    comm = RecordingCommunicator(
+        LoopbackCommunicator(stdin=BytesIO(stdin), stdout=stdout), recording
+    )
+    recording.close = mock.MagicMock()  # keep the contents readable
+    inst = ik.Instrument(comm)
+    assert inst.query("*IDN?") == "ACME,1234"
+    inst.sendcmd("VOLT 1")
+    inst.write("raw")
+    assert inst.binblockread(2) == pytest.approx((1, 2))
+    inst._file.flush_input()
+    comm.close()
+    return recording.getvalue(), stdout.getvalue()
+
+
+def test_recordingcomm_passes_through():
+    _, stdout = _record_session(b"ACME,1234\n#14\x00\x01\x00\x02")
+    assert stdout == b"*IDN?\nVOLT 1\nraw"
+
+
+def test_recordingcomm_init_wrong_type():
+    with pytest.raises(TypeError):
+        _ = RecordingCommunicator(BytesIO(), BytesIO())
+
+
+def test_recordingcomm_delegates_properties():
+    loopback = LoopbackCommunicator()
+    comm = RecordingCommunicator(loopback, BytesIO())
+
+    comm.terminator = "\r"
+    assert loopback.terminator == "\r"
+    assert comm.terminator == "\r"
+    assert comm.timeout == loopback.timeout
+    comm.timeout = 1
+    assert comm.address == loopback.address
+    with pytest.raises(NotImplementedError):
+        comm.address = "abc"
+    comm.arbiter = ik.abstract_instruments.comm.BusArbiter()
+    assert loopback.arbiter is comm.arbiter
+
+
+def test_recordingcomm_open_path(tmp_path):
+    path = tmp_path / "session.iks"
+    comm = RecordingCommunicator(LoopbackCommunicator(stdin=BytesIO(b"1\n")), path)
+    assert comm.query("A?") == "1"
+    comm.close()
+
+    replay = ReplayCommunicator(str(path))
+    assert replay.address == str(path)
+    assert replay.query("A?") == "1"
+    assert replay.remaining == 0
+
+
+def test_replaycomm_plays_back_session():
+    recording, _ = _record_session(b"ACME,1234\n#14\x00\x01\x00\x02")
+    inst = ik.Instrument.open_replay(BytesIO(recording))
+
+    assert inst.query("*IDN?") == "ACME,1234"
+    inst.sendcmd("VOLT 1")
+    inst.write("raw")
+    assert inst.binblockread(2) == pytest.approx((1, 2))
+    inst._file.flush_input()
+    assert inst._file.remaining == 0
+
+    with pytest.raises(OSError):
+        inst.query("*IDN?")
+
+    inst._file.rewind()
+    assert inst.query("*IDN?") == "ACME,1234"
+
+
+def test_replaycomm_verify_mismatch():
+    recording, _ = _record_session(b"ACME,1234\n#14\x00\x01\x00\x02")
+    comm = ReplayCommunicator(BytesIO(recording))
+    with pytest.raises(ValueError):
+        comm.query("*RST?")
+
+    comm = ReplayCommunicator(BytesIO(recording), verify=False)
+    assert comm.query("*RST?") == "ACME,1234"
+
+
+def test_replaycomm_kind_mismatch():
+    recording, _ = _record_session(b"ACME,1234\n#14\x00\x01\x00\x02")
+    comm = ReplayCommunicator(BytesIO(recording))
+    with pytest.raises(ValueError):
+        comm.sendcmd("*IDN?")
+
+
+def test_replaycomm_bad_recording():
+    with pytest.raises(ValueError):
+        _ = ReplayCommunicator(BytesIO(b"not a recording"))
+
+    recording, _ = _record_session(b"ACME,1234\n#14\x00\x01\x00\x02")
+    with pytest.raises(ValueError):
+        _ = ReplayCommunicator(BytesIO(recording[:-1]))
+    with pytest.raises(ValueError):
+        _ = ReplayCommunicator(BytesIO(recording[:10]))
+
+
+@mock.patch("instruments.abstract_instruments.comm.replay_communicator.time")
+def test_replaycomm_realtime(mock_time):
+    recording = BytesIO()
+    with mock.patch(
+        "instruments.abstract_instruments.comm.recording_communicator.time"
+    ) as mock_rec_time:
+        mock_rec_time.perf_counter.side_effect = [0.0, 1.0, 1.5]
+        comm = RecordingCommunicator(
+            LoopbackCommunicator(stdin=BytesIO(b"1\n")), recording
+        )
+        assert comm.query("A?") == "1"
+
+    mock_time.perf_counter.side_effect = [10.0, 10.2]
+    comm = ReplayCommunicator(BytesIO(recording.getvalue()), realtime=True)
+    assert comm.query("A?") == "1"
+    mock_time.sleep.assert_called_once_with(pytest.approx(0.3))
+
+
+def test_recordingcomm_timestamps_before_io():
+    clock = [0.0]
+
+    def _slow_io(*args):  # pylint: disable=unused-argument
+        clock[0] += 1.0
+        return "1"
+
+    inner = LoopbackCommunicator(stdin=BytesIO())
+    inner._sendcmd = inner._query = _slow_io
+    recording = BytesIO()
+    with mock.patch(
+        "instruments.abstract_instruments.comm.recording_communicator.time"
+    ) as mock_rec_time:
+        mock_rec_time.perf_counter.side_effect = lambda: clock[0]
+        comm = RecordingCommunicator(inner, recording)
+        comm.sendcmd("A")
+        comm.query("B?")
+
+    records = ReplayCommunicator._parse(recording.getvalue())
+    assert [(kind, elapsed) for kind, elapsed, _ in records] == [
+        (KIND_SENDCMD, 0.0),
+        (KIND_QUERY, 1.0),
+        (KIND_READ, 2.0),
+    ]
+
+
+@mock.patch.object(LoopbackCommunicator, "marks_message_end", True)
+def test_replaycomm_read_message():
+    inner = LoopbackCommunicator(stdin=BytesIO())
+    inner.read_message = mock.MagicMock(return_value=b"\x0a\x00\n")
+    recording = BytesIO()
+    comm = RecordingCommunicator(inner, recording)
+    assert comm.marks_message_end is True
+    assert comm.read_message() == b"\x0a\x00\n"
+
+    comm = ReplayCommunicator(BytesIO(recording.getvalue()))
+    assert comm.marks_message_end is True
+    assert comm.read_message() == b"\x0a\x00\n"
+
+
+def test_replaycomm_properties():
+    recording, _ = _record_session(b"ACME,1234\n#14\x00\x01\x00\x02")
+    comm = ReplayCommunicator(BytesIO(recording))
+
+    comm.terminator = b"\r"
+    assert comm.terminator == "\r"
+    with pytest.raises(TypeError):
+        comm.terminator = 42
+    comm.timeout = 1
+    assert comm.timeout == 1
+    with pytest.raises(NotImplementedError):
+        comm.address = "abc"
+
+    comm.close()
+    assert comm.remaining == 0
@@ -6,11 +6,20 @@ Unit tests for the serial communication layer
 # IMPORTS ####################################################################
 
 
+import os
+import sys
+import threading
+import time
+
 import pytest
 import serial
 from instruments.units import ureg as u
 
-from instruments.abstract_instruments.comm import SerialCommunicator
+from instruments.abstract_instruments.comm import (
+    BusArbiter,
+    SerialCommunicator,
+    serial_manager,
+)
 from tests import unit_eq
 from .. import mock
 
@@ -95,6 +104,7 @@ def test_serialcomm_close():
 def test_serialcomm_read_raw():
     comm = SerialCommunicator(serial.Serial())
     comm._conn = mock.MagicMock()
+    comm._conn.in_waiting = 0
     comm._conn.read = mock.MagicMock(side_effect=[b"a", b"b", b"c", b"\n"])
 
     assert comm.read_raw() == b"abc"
@@ -109,6 +119,7 @@ def test_serialcomm_read_raw():
 def test_loopbackcomm_read_raw_2char_terminator():
     comm = SerialCommunicator(serial.Serial())
     comm._conn = mock.MagicMock()
+    comm._conn.in_waiting = 0
     comm._conn.read = mock.MagicMock(side_effect=[b"a", b"b", b"c", b"\r", b"\n"])
     comm._terminator = "\r\n"
 
@@ -121,11 +132,80 @@ def test_serialcomm_read_raw_timeout():
     with pytest.raises(IOError):
         comm = SerialCommunicator(serial.Serial())
         comm._conn = mock.MagicMock()
+        comm._conn.in_waiting = 0
         comm._conn.read = mock.MagicMock(side_effect=[b"a", b"b", b""])
 
         _ = comm.read_raw(-1)
 
 
+def test_serialcomm_read_raw_drains_in_waiting():
+    comm = SerialCommunicator(serial.Serial())
+    comm._conn = mock.MagicMock()
+    in_waiting = mock.PropertyMock(side_effect=[0, 6])
+    type(comm._conn).in_waiting = in_waiting
+    comm._conn.read = mock.MagicMock(side_effect=[b"a", b"bc\r\nde"])
+    comm._terminator = "\r\n"
+
+    assert comm.read_raw() == b"abc"
+    comm._conn.read.assert_has_calls([mock.call(1), mock.call(6)])
+    assert comm._rx_buf == b"de"
+
+
+def test_serialcomm_read_raw_terminator_split_across_chunks():
+    comm = SerialCommunicator(serial.Serial())
+    comm._conn = mock.MagicMock()
+    comm._conn.in_waiting = 4
+    comm._conn.read = mock.MagicMock(side_effect=[b"abc\r", b"\nxyz"])
+    comm._terminator = "\r\n"
+
+    assert comm.read_raw() == b"abc"
+    assert comm._conn.read.call_count == 2
+
+
+def test_serialcomm_read_raw_keeps_leftover_bytes():
+    comm = SerialCommunicator(serial.Serial())
+    comm._conn = mock.MagicMock()
+    comm._conn.in_waiting = 12
+    comm._conn.read = mock.MagicMock(side_effect=[b"abc\ndef\n#12", b"3"])
+
+    assert comm.read_raw() == b"abc"
+    assert comm.read_raw() == b"def"
+    assert comm.read_raw(1) == b"#"
+    assert comm.read_raw(3) == b"123"
+    comm._conn.read.assert_called_with(1)
+    assert comm._conn.read.call_count == 2
+
+
+def test_serialcomm_read_raw_empty_terminator():
+    comm = SerialCommunicator(serial.Serial())
+    comm._conn = mock.MagicMock()
+    comm._conn.in_waiting = 3
+    comm._conn.read = mock.MagicMock(side_effect=[b"abc", b"de", b""])
+    comm._terminator = ""
+
+    assert comm.read_raw() == b"abcde"
+    assert comm._rx_buf == b""
+
+
+def test_serialcomm_readinto():
+    comm = SerialCommunicator(serial.Serial())
+    comm._conn = mock.MagicMock()
+    comm._conn.in_waiting = 6
+    comm._conn.read = mock.MagicMock(return_value=b"abc\n#1")
+
+    def _readinto(view):
+        view[:3] = b"234"
+        return 3
+
+    comm._conn.readinto = mock.MagicMock(side_effect=_readinto)
+    buf = bytearray(5)
+
+    assert comm.read_raw() == b"abc"
+    assert comm.readinto(buf) == 5
+    assert buf == b"#1234"
+    assert comm._rx_buf == b""
+
+
 def test_serialcomm_write_raw():
     comm = SerialCommunicator(serial.Serial())
     comm._conn = mock.MagicMock()
@@ -171,6 +251,52 @@ def test_serialcomm_tell():
 def test_serialcomm_flush_input():
     comm = SerialCommunicator(serial.Serial())
     comm._conn = mock.MagicMock()
+    comm._rx_buf += b"stale"
     comm.flush_input()
 
     comm._conn.flushInput.assert_called_with()
+    assert comm._rx_buf == b""
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Pseudo terminals are not available."
+)
+def test_serial_manager_shares_arbiter():
+    master, slave = os.openpty()
+    port = os.ttyname(slave)
+    comm1 = serial_manager.new_serial_connection(port, timeout=1)
+    comm2 = serial_manager.new_serial_connection(port, timeout=1)
+
+    assert comm1 is comm2
+    assert isinstance(comm1.arbiter, BusArbiter)
+
+    comm1._conn.close()
+    os.close(slave)
+    os.close(master)
+
+
+@mock.patch.object(serial_manager, "serial")
+@mock.patch.object(serial_manager, "SerialCommunicator")
+def test_serial_manager_threads_share_connection(mock_comm, mock_serial):
+    def _open(conn):
+        # Widen the window between looking the port up and storing it.
+        time.sleep(0.05)
+        return mock.MagicMock()
+
+    mock_comm.side_effect = _open
+    conns = []
+    threads = [
+        threading.Thread(
+            target=lambda: conns.append(
+                serial_manager.new_serial_connection("/dev/shared")
+            )
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mock_comm.call_count == 1
+    assert all(conn is conns[0] for conn in conns)
@@ -90,36 +90,108 @@ def test_socketcomm_close():
     comm._conn.close.assert_called_with()
 
 
+def _recv_into_from(chunks):
+    """
+    Returns a side effect for ``socket.recv_into`` that serves the given
+    chunks one per call.
+    """
+    chunks = iter(chunks)
+
+    def _recv_into(buf):
+        chunk = next(chunks)
+        buf[: len(chunk)] = chunk
+        return len(chunk)
+
+    return _recv_into
+
+
 def test_socketcomm_read_raw():
     comm = SocketCommunicator(socket.socket())
     comm._conn = mock.MagicMock()
-    comm._conn.recv = mock.MagicMock(side_effect=[b"a", b"b", b"c", b"\n"])
+    comm._conn.recv_into = mock.MagicMock(side_effect=_recv_into_from([b"abc\n"]))
 
     assert comm.read_raw() == b"abc"
-    comm._conn.recv.assert_has_calls([mock.call(1)] * 4)
-    assert comm._conn.recv.call_count == 4
+    assert comm._conn.recv_into.call_count == 1
 
     comm._conn.recv = mock.MagicMock()
     comm.read_raw(10)
     comm._conn.recv.assert_called_with(10)
 
 
+def test_socketcomm_read_raw_split_chunks():
+    comm = SocketCommunicator(socket.socket())
+    comm._conn = mock.MagicMock()
+    comm._conn.recv_into = mock.MagicMock(
+        side_effect=_recv_into_from([b"a", b"bc", b"\n"])
+    )
+
+    assert comm.read_raw() == b"abc"
+    assert comm._conn.recv_into.call_count == 3
+
+
+def test_socketcomm_read_raw_keeps_leftover_bytes():
+    comm = SocketCommunicator(socket.socket())
+    comm._conn = mock.MagicMock()
+    comm._conn.recv_into = mock.MagicMock(
+        side_effect=_recv_into_from([b"abc\ndef\n#12", b"xyz"])
+    )
+    comm._conn.recv = mock.MagicMock(return_value=b"z")
+
+    assert comm.read_raw() == b"abc"
+    assert comm.read_raw() == b"def"
+    assert comm.read_raw(1) == b"#"
+    assert comm.read_raw(5) == b"12"
+    comm._conn.recv.assert_not_called()
+    assert comm._conn.recv_into.call_count == 1
+
+
 def test_loopbackcomm_read_raw_2char_terminator():
     comm = SocketCommunicator(socket.socket())
     comm._conn = mock.MagicMock()
-    comm._conn.recv = mock.MagicMock(side_effect=[b"a", b"b", b"c", b"\r", b"\n"])
+    comm._conn.recv_into = mock.MagicMock(
+        side_effect=_recv_into_from([b"abc\r", b"\n"])
+    )
     comm._terminator = "\r\n"
 
     assert comm.read_raw() == b"abc"
-    comm._conn.recv.assert_has_calls([mock.call(1)] * 5)
-    assert comm._conn.recv.call_count == 5
+    assert comm._conn.recv_into.call_count == 2
+
+
+def test_socketcomm_read_raw_socketpair():
+    host, device = socket.socketpair()
+    comm = SocketCommunicator(host)
+    payload = b"1.0," * 50000
+    device.sendall(payload + b"\n" + b"2.0\n")
+
+    assert comm.read_raw() == payload
+    assert comm.read() == "2.0"
+
+    comm.close()
+    device.close()
+
+
+def test_socketcomm_readinto():
+    comm = SocketCommunicator(socket.socket())
+    comm._conn = mock.MagicMock()
+    comm._conn.recv_into = mock.MagicMock(
+        side_effect=_recv_into_from([b"abc\n#1", b"2345"])
+    )
+    buf = bytearray(4)
+
+    assert comm.read_raw() == b"abc"
+    assert comm.readinto(buf) == 2
+    assert buf[:2] == b"#1"
+    assert comm.readinto(buf) == 4
+    assert buf == b"2345"
 
 
 def test_serialcomm_read_raw_timeout():
     with pytest.raises(IOError):
         comm = SocketCommunicator(socket.socket())
         comm._conn = mock.MagicMock()
-        comm._conn.recv = mock.MagicMock(side_effect=[b"a", b"b", b""])
+        comm._conn.recv_into = mock.MagicMock(
+            side_effect=_recv_into_from([b"a", b"b", b""])
+        )
 
         _ = comm.read_raw(-1)
 
@@ -170,6 +242,8 @@ def test_socketcomm_flush_input():
     comm = SocketCommunicator(socket.socket())
     comm._conn = mock.MagicMock()
     comm.read = mock.MagicMock()
+    comm._rx_buf += b"stale"
     comm.flush_input()
 
     comm.read.assert_called_with(-1)
+    assert comm._rx_buf == b""
@@ -20,7 +20,7 @@ from .. import mock
 
 # pylint: disable=protected-access,unused-argument, redefined-outer-name
 
-patch_util = "instruments.abstract_instruments.comm.usb_communicator.usb.util"
+patch_util = "usb.util"
 
 
 @pytest.fixture()
@@ -182,12 +182,69 @@ def test_read_raw_termination_char_not_found(inst):
         _ = inst.read_raw()
     err_msg = err.value.args[0]
     assert (
-        err_msg == f"Did not find the terminator in the returned "
-        f"string. Total size of {default_read_size} might "
-        f"not be enough."
+        err_msg == "Did not find the terminator in the returned "
+        "string. The transfer ended after 7 bytes."
     )
 
 
+def test_read_raw_multiple_packets(inst):
+    """Keep reading packets until the terminator is found."""
+    inst._max_packet_size = 4
+    inst._terminator = "\r\n"
+    inst._ep_in.read.side_effect = [b"abcd", b"efg\r", b"\nhi"]
+
+    assert inst.read_raw() == b"abcdefg"
+    assert inst._ep_in.read.call_count == 3
+    assert inst._rx_buf == b"hi"
+
+
+def test_read_raw_keeps_leftover_bytes(inst):
+    """Bytes after the terminator are returned by the next read."""
+    inst._max_packet_size = 64
+    inst._ep_in.read.return_value = b"abc\n#14"
+
+    assert inst.read_raw() == b"abc"
+    assert inst.read_raw(1) == b"#"
+    assert inst.read_raw(2) == b"14"
+    inst._ep_in.read.assert_called_once_with(64)
+
+
+def test_read_raw_empty_terminator(inst):
+    """Without a terminator, return the next transfer."""
+    inst._max_packet_size = 64
+    inst._terminator = ""
+    inst._ep_in.read.return_value = b"abc"
+
+    assert inst.read_raw() == b"abc"
+
+
+def test_read_raw_sized_bulk(inst):
+    """Sized reads use large bulk reads of whole packets."""
+    inst._max_packet_size = 512
+    inst.chunk_size = 2048
+    payload = bytes(range(256)) * 20
+    inst._ep_in.read.side_effect = [payload[:2048], payload[2048:4096], payload[4096:]]
+
+    assert inst.read_raw(5000) == payload[:5000]
+    requests = [call[0][0] for call in inst._ep_in.read.call_args_list]
+    assert requests == [2048, 2048, 1024]
+    assert inst._rx_buf == payload[5000:]
+
+
+def test_read_raw_sized_short_transfer(inst):
+    """A short packet ends a sized read early."""
+    inst._max_packet_size = 512
+    inst._ep_in.read.return_value = b"abc"
+
+    assert inst.read_raw(1000) == b"abc"
+    inst._ep_in.read.assert_called_once_with(1024)
+
+
+def test_read_raw_size_invalid(inst):
+    with pytest.raises(ValueError):
+        inst.read_raw(-2)
+
+
 def test_write_raw(inst):
     """Write a message to the instrument."""
     msg = b"message\n"
@@ -210,7 +267,9 @@ def test_tell(inst):
 def test_flush_input(inst):
     """Flush the input out by trying to read until no more available."""
     inst._ep_in.read.side_effect = [b"message\n", usb.core.USBTimeoutError]
+    inst._rx_buf += b"leftover"
     inst.flush_input()
+    assert inst._rx_buf == b""
     inst._ep_in.read.assert_called()
 
 
@@ -17,16 +17,16 @@ from .. import mock
 
 # pylint: disable=protected-access,unused-argument,no-member
 
-patch_path = "instruments.abstract_instruments.comm.usbtmc_communicator.usbtmc"
+patch_path = "usbtmc.Instrument"
 
 
 @mock.patch(patch_path)
 def test_usbtmccomm_init(mock_usbtmc):
     _ = USBTMCCommunicator("foobar", var1=123)
-    mock_usbtmc.Instrument.assert_called_with("foobar", var1=123)
+    mock_usbtmc.assert_called_with("foobar", var1=123)
 
 
-@mock.patch(patch_path, new=None)
+@mock.patch.dict("sys.modules", usbtmc=None)
 def test_usbtmccomm_init_missing_module():
     with pytest.raises(ImportError):
         _ = USBTMCCommunicator()
@@ -98,6 +98,24 @@ def test_usbtmccomm_read_raw(mock_usbtmc):
     comm._filelike.read_raw.assert_called_with(num=10)
 
 
+@mock.patch(patch_path)
+def test_usbtmccomm_read_message(mock_usbtmc):
+    comm = USBTMCCommunicator()
+    comm._filelike.term_char = 10
+    terms = []
+
+    def _read_raw():
+        terms.append(comm._filelike.term_char)
+        return b"\x00\x0a\n"
+
+    comm._filelike.read_raw = _read_raw
+
+    assert comm.marks_message_end is True
+    assert comm.read_message() == b"\x00\x0a\n"
+    assert terms == [None]
+    assert comm._filelike.term_char == 10
+
+
 @mock.patch(patch_path)
 def test_usbtmccomm_write_raw(mock_usbtmc):
     comm = USBTMCCommunicator()
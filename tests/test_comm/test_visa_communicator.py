@@ -112,6 +112,27 @@ def test_visacomm_read_raw(visa_inst, mocker):
     assert comm._buf == bytearray()
 
 
+def test_visacomm_read_message(visa_inst, mocker):
+    """Read up to the end of the message, ignoring the read termination."""
+    comm = VisaCommunicator(visa_inst)
+    terms = []
+
+    def _read_raw():
+        terms.append(visa_inst.read_termination)
+        return b"\x00\x0a\n"
+
+    mocker.patch.object(visa_inst, "read_raw", side_effect=_read_raw)
+    assert comm.read_message() == b"\x00\x0a\n"
+    assert terms == [None]
+    assert visa_inst.read_termination == "\n"
+
+
+def test_visacomm_marks_message_end(visa_inst):
+    """Serial resources do not mark the end of messages."""
+    comm = VisaCommunicator(visa_inst)
+    assert comm.marks_message_end is False
+
+
 def test_visacomm_read_raw_size(visa_inst, mocker):
     """Read raw data from instrument with size specification."""
     comm = VisaCommunicator(visa_inst)
@@ -15,16 +15,16 @@ from .. import mock
 
 # pylint: disable=protected-access,unused-argument,no-member
 
-import_base = "instruments.abstract_instruments.comm.vxi11_communicator.vxi11"
+import_base = "vxi11.Instrument"
 
 
 @mock.patch(import_base)
 def test_vxi11comm_init(mock_vxi11):
     _ = VXI11Communicator("host")
-    mock_vxi11.Instrument.assert_called_with("host")
+    mock_vxi11.assert_called_with("host")
 
 
-@mock.patch(import_base, new=None)
+@mock.patch.dict("sys.modules", vxi11=None)
 def test_vxi11comm_init_no_vxi11():
     with pytest.raises(ImportError):
         _ = VXI11Communicator("host")
@@ -105,6 +105,24 @@ def test_vxi11comm_read(mock_vxi11):
     comm._inst.read_raw.assert_called_with(num=10)
 
 
+@mock.patch(import_base)
+def test_vxi11comm_read_message(mock_vxi11):
+    comm = VXI11Communicator()
+    comm._inst.term_char = "\n"
+    terms = []
+
+    def _read_raw():
+        terms.append(comm._inst.term_char)
+        return b"\x00\x0a\n"
+
+    comm._inst.read_raw = _read_raw
+
+    assert comm.marks_message_end is True
+    assert comm.read_message() == b"\x00\x0a\n"
+    assert terms == [None]
+    assert comm._inst.term_char == "\n"
+
+
 @mock.patch(import_base)
 def test_vxi11comm_write(mock_vxi11):
     comm = VXI11Communicator()
@@ -7,6 +7,9 @@ Module containing tests for util_fns.py
 
 
 from io import StringIO
+import threading
+import time
+from unittest import mock
 
 import pytest
 
@@ -14,7 +17,7 @@ from instruments.units import ureg as u
 
 import instruments as ik
 from instruments import Instrument
-from instruments.config import load_instruments, yaml
+from instruments.config import InstrumentProxy, load_instruments, yaml
 
 # TEST CASES #################################################################
 
@@ -91,3 +94,153 @@ test:
 
     with pytest.warns(RuntimeWarning):
         _ = load_instruments(config_data)
+
+
+RACK_CONFIG = """
+fast:
+    class: !!python/name:instruments.Instrument
+    uri: test://
+    attrs:
+        foo: !Q 111 GHz
+slow:
+    class: !!python/name:instruments.Instrument
+    uri: test://slow
+other:
+    class: !!python/name:instruments.Instrument
+    uri: test://
+"""
+
+
+def test_load_instruments_concurrently():
+    report = {}
+    insts = load_instruments(StringIO(RACK_CONFIG), max_workers=3, report=report)
+    assert list(insts) == ["fast", "slow", "other"]
+    assert all(isinstance(inst, Instrument) for inst in insts.values())
+    assert insts["fast"].foo == u.Quantity(111, "GHz")
+    assert set(report) == {"fast", "slow", "other"}
+    assert all(latency.units == u.second for latency in report.values())
+
+
+def test_load_instruments_concurrently_oserror(mocker):
+    mocker.patch.object(Instrument, "open_from_uri", side_effect=OSError)
+
+    with pytest.warns(RuntimeWarning):
+        insts = load_instruments(StringIO(RACK_CONFIG), max_workers=2)
+    assert insts == {"fast": None, "slow": None, "other": None}
+
+
+def test_load_instruments_timeout(mocker):
+    release = threading.Event()
+    slow_inst = mock.MagicMock()
+    open_from_uri = Instrument.open_from_uri
+
+    def open_slowly(uri):
+        if uri == "test://slow":
+            release.wait(5)
+            return slow_inst
+        return open_from_uri(uri)
+
+    mocker.patch.object(Instrument, "open_from_uri", side_effect=open_slowly)
+
+    report = {}
+    with pytest.warns(RuntimeWarning, match="test://slow"):
+        insts = load_instruments(
+            StringIO(RACK_CONFIG), max_workers=3, timeout=0.05, report=report
+        )
+    assert insts["slow"] is None
+    assert isinstance(insts["fast"], Instrument)
+    assert isinstance(insts["other"], Instrument)
+    assert report["slow"] >= u.Quantity(0.05, u.second)
+
+    # The instrument is closed once it has opened.
+    release.set()
+    for _ in range(100):
+        if slow_inst.__exit__.called:
+            break
+        time.sleep(0.01)
+    slow_inst.__exit__.assert_called_once_with(None, None, None)
+
+
+def test_load_instruments_timeout_queued(mocker):
+    release = threading.Event()
+    open_from_uri = Instrument.open_from_uri
+
+    def open_slowly(uri):
+        if uri == "test://slow":
+            release.wait(5)
+        return open_from_uri(uri)
+
+    spy = mocker.patch.object(Instrument, "open_from_uri", side_effect=open_slowly)
+
+    # The instrument queued behind the slow one does not wait for the slow
+    # one to give up.
+    with pytest.warns(RuntimeWarning):
+        insts = load_instruments(StringIO(RACK_CONFIG), max_workers=1, timeout=0.05)
+    assert not release.is_set()
+    assert insts["slow"] is None
+    assert insts["other"] is None
+    release.set()
+    assert [call.args for call in spy.call_args_list] == [
+        ("test://",),
+        ("test://slow",),
+    ]
+
+
+def test_load_instruments_concurrently_error_closes(mocker):
+    config = RACK_CONFIG.replace("test://slow", "test://other") + (
+        "bad:\n    class: !!python/name:instruments.Instrument\n    uri: test://bad\n"
+    )
+    open_from_uri = Instrument.open_from_uri
+
+    def open_or_fail(uri):
+        if uri == "test://bad":
+            raise ValueError("bad configuration")
+        return open_from_uri(uri)
+
+    mocker.patch.object(Instrument, "open_from_uri", side_effect=open_or_fail)
+    exit_spy = mocker.spy(Instrument, "__exit__")
+
+    with pytest.raises(ValueError):
+        load_instruments(StringIO(config))
+    assert exit_spy.call_count == 3
+    with pytest.raises(ValueError):
+        load_instruments(StringIO(config), max_workers=1, timeout=10)
+    assert exit_spy.call_count == 6
+
+
+def test_load_instruments_lazy(mocker):
+    spy = mocker.spy(Instrument, "open_from_uri")
+    report = {}
+
+    insts = load_instruments(StringIO(RACK_CONFIG), lazy=True, report=report)
+    assert all(isinstance(inst, InstrumentProxy) for inst in insts.values())
+    assert "not opened" in repr(insts["fast"])
+    spy.assert_not_called()
+    assert not report
+
+    assert insts["fast"].foo == u.Quantity(111, "GHz")
+    spy.assert_called_once_with("test://")
+    assert isinstance(insts["fast"].instrument, Instrument)
+    assert "(open)" in repr(insts["fast"])
+    assert list(report) == ["fast"]
+
+    insts["fast"].bar = 42
+    assert insts["fast"].instrument.bar == 42
+    assert "bar" in dir(insts["fast"])
+    spy.assert_called_once_with("test://")
+
+
+def test_load_instruments_lazy_oserror(mocker):
+    mocker.patch.object(Instrument, "open_from_uri", side_effect=OSError)
+    report = {}
+
+    insts = load_instruments(StringIO(RACK_CONFIG), lazy=True, report=report)
+    with pytest.raises(OSError):
+        _ = insts["other"].name
+    assert list(report) == ["other"]
+
+
+def test_instrument_proxy_context_manager():
+    insts = load_instruments(StringIO(RACK_CONFIG), lazy=True)
+    with insts["other"] as inst:
+        assert inst is insts["other"].instrument
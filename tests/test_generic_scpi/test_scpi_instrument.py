@@ -5,12 +5,15 @@ Module containing tests for generic SCPI instruments
 
 # IMPORTS ####################################################################
 
+import threading
+
 from hypothesis import given, strategies as st
 import pytest
 
 from instruments.units import ureg as u
 
 import instruments as ik
+from instruments.util_fns import bool_property, unitful_property
 from tests import expected_protocol, make_name_test, unit_eq
 
 # TESTS ######################################################################
@@ -188,3 +191,182 @@ def test_scpi_instrument_display_contrast_invalid_value(val):
             inst.display_contrast = val
         err_msg = err_info.value.args[0]
         assert err_msg == "Display contrast must be a number between 0 " "and 1."
+
+
+def test_scpi_instrument_query_many():
+    """Join queries into one compound message and split the replies."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIInstrument,
+        ["*IDN?;:SYST:VERS?;:DISP:BRIG?"],
+        ['"Foo;Bar";1999.0; 0.5'],
+    ) as inst:
+        assert inst.query_many(["*IDN?", "SYST:VERS?", "DISP:BRIG?"]) == [
+            '"Foo;Bar"',
+            "1999.0",
+            "0.5",
+        ]
+
+
+def test_scpi_instrument_query_many_max_message_length():
+    """Split compound messages that would be longer than allowed."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIInstrument,
+        ["*IDN?;*OPC?", "SYST:VERS?", "DISP:BRIG?"],
+        ["Foo;1", "1999.0", "0.5"],
+    ) as inst:
+        inst.max_message_length = 11
+        assert inst.query_many(["*IDN?", "*OPC?", "SYST:VERS?", "DISP:BRIG?"]) == [
+            "Foo",
+            "1",
+            "1999.0",
+            "0.5",
+        ]
+
+
+def test_scpi_instrument_query_many_wrong_count():
+    """Raise OSError if the number of replies does not match."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIInstrument, ["*IDN?;*OPC?"], ["Foo"]
+    ) as inst:
+        with pytest.raises(OSError):
+            inst.query_many(["*IDN?", "*OPC?"])
+
+
+class _FactoryInstrument(ik.generic_scpi.SCPIInstrument):
+    frequency = unitful_property("FREQ", u.Hz)
+    output = bool_property("OUTP", inst_true="1", inst_false="0")
+
+
+def test_scpi_instrument_get_many():
+    """Read factory properties with one compound query, others on their own."""
+    with expected_protocol(
+        _FactoryInstrument,
+        ["SYST:LFR?", "FREQ?;:OUTP?"],
+        ["60", "1000;1"],
+    ) as inst:
+        assert inst.get_many("frequency", "line_frequency", "output") == (
+            1000 * u.Hz,
+            60 * u.Hz,
+            True,
+        )
+
+
+class _RawTraceInstrument(_FactoryInstrument):
+    @property
+    def raw_trace(self):
+        self.sendcmd("DATA:SOUR CH1")
+        return self._file.read_raw(4)
+
+
+def test_scpi_instrument_get_many_hand_written_getter():
+    """Hand-written getters are run once, so their I/O is not repeated."""
+    with expected_protocol(
+        _RawTraceInstrument, ["DATA:SOUR CH1", "FREQ?"], ["abcd60"]
+    ) as inst:
+        assert inst.get_many("raw_trace", "frequency") == (b"abcd", 60 * u.Hz)
+
+
+def test_scpi_instrument_deferred_writes():
+    """Queue setter commands and send them as one compound message."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIInstrument,
+        ["*PSC 1;:SYST:LFR 50;:DISP:BRIG 0.5"],
+        [],
+    ) as inst:
+        with inst.deferred_writes():
+            inst.power_on_status = True
+            inst.line_frequency = 50
+            inst.display_brightness = 0.5
+
+
+def test_scpi_instrument_deferred_writes_query_flushes():
+    """A query inside the block first sends the queued commands."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIInstrument,
+        ["*PSC 1", "*PSC?", "*CLS"],
+        ["1"],
+    ) as inst:
+        with inst.deferred_writes():
+            inst.power_on_status = True
+            assert inst.power_on_status
+            with inst.deferred_writes():
+                inst.clear()
+
+
+@pytest.mark.parametrize(
+    "read",
+    (
+        lambda inst: inst.read(),
+        lambda inst: inst.read_raw(),
+        lambda inst: inst.binblockread(1),
+        lambda inst: list(inst.binblockread_iter(1)),
+    ),
+)
+def test_scpi_instrument_deferred_writes_read_flushes(read):
+    """Reads inside the block first send the queued commands."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIInstrument, ["*CLS;:INIT", "*TRG"], ["#11a"]
+    ) as inst:
+        with inst.deferred_writes():
+            inst.clear()
+            inst.sendcmd("INIT")
+            read(inst)
+            inst.trigger()
+
+
+def test_scpi_instrument_deferred_writes_other_thread():
+    """Commands sent by other threads are not queued."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIInstrument, ["*TRG", "*CLS"], []
+    ) as inst:
+        with inst.deferred_writes():
+            inst.clear()
+            other = threading.Thread(target=inst.trigger)
+            other.start()
+            other.join()
+
+
+def test_scpi_instrument_deferred_writes_verify():
+    """Split long messages and check *OPC? and the error queue at the end."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIInstrument,
+        ["*RST;*CLS", "*TRG;*OPC?", "SYST:ERR:CODE:ALL?"],
+        ["1", "0"],
+    ) as inst:
+        inst.max_message_length = 10
+        with inst.deferred_writes(verify_opc=True, check_errors=True):
+            inst.reset()
+            inst.clear()
+            inst.trigger()
+
+
+def test_scpi_instrument_deferred_writes_errors():
+    """Raise OSError if the instrument reports errors."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIInstrument,
+        ["*RST", "SYST:ERR:CODE:ALL?"],
+        ["-100,-222"],
+    ) as inst:
+        with pytest.raises(OSError):
+            with inst.deferred_writes(check_errors=True):
+                inst.reset()
+
+
+def test_scpi_instrument_deferred_writes_opc_failed():
+    """Raise OSError if *OPC? does not report completion."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIInstrument, ["*RST;*OPC?"], ["0"]
+    ) as inst:
+        with pytest.raises(OSError):
+            with inst.deferred_writes(verify_opc=True):
+                inst.reset()
+
+
+def test_scpi_instrument_deferred_writes_discarded_on_error():
+    """Queued commands are not sent if the block raises."""
+    with expected_protocol(ik.generic_scpi.SCPIInstrument, ["*CLS"], []) as inst:
+        with pytest.raises(ValueError):
+            with inst.deferred_writes():
+                inst.reset()
+                inst.display_brightness = 2
+        inst.clear()
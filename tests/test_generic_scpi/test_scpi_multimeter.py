@@ -35,6 +35,25 @@ def test_scpi_multimeter_trigger_mode():
         dmm.trigger_mode = dmm.TriggerMode.external
 
 
+def test_scpi_multimeter_get_many():
+    """Property factory getters are batched, others are read on their own."""
+    with expected_protocol(
+        ik.generic_scpi.SCPIMultimeter,
+        ["CONF?", "CONF?;:TRIG:SOUR?;:TRIG:DEL?"],
+        [
+            "CURR:AC AUTO,+3.000000E-06",
+            "FRES +1.000000E+01,+3.000000E-06;BUS;+1.000000E-03",
+        ],
+    ) as dmm:
+        mode, trigger_mode, trigger_delay, input_range = dmm.get_many(
+            "mode", "trigger_mode", "trigger_delay", "input_range"
+        )
+        assert mode == dmm.Mode.fourpt_resistance
+        assert trigger_mode == dmm.TriggerMode.bus
+        unit_eq(trigger_delay, 1e-3 * u.second)
+        assert input_range == dmm.InputRange.automatic
+
+
 def test_scpi_multimeter_input_range():
     with expected_protocol(
         ik.generic_scpi.SCPIMultimeter,
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+"""
+Module containing tests for the InstrumentExecutor
+"""
+
+# IMPORTS ####################################################################
+
+
+from concurrent import futures
+from enum import Enum
+import threading
+
+import pytest
+
+import instruments as ik
+from instruments.abstract_instruments import InstrumentExecutor
+from instruments.units import ureg as u
+from instruments.util_fns import ProxyList, enum_property, unitful_property
+from tests import expected_protocol, unit_eq
+
+# TEST CLASSES ###############################################################
+
+# pylint: disable=protected-access
+
+
+class MockInstrument(ik.Instrument):
+    """
+    Instrument with factory-built and hand-written properties.
+    """
+
+    class Shape(Enum):
+        sine = "SIN"
+        square = "SQU"
+
+    class Channel:
+        def __init__(self, parent, idx):
+            self._parent = parent
+            self._idx = idx
+
+        def query(self, cmd, size=-1):
+            return self._parent.query(cmd, size)
+
+        offset = unitful_property("OFFS", u.volt)
+
+    class AckChannel:
+        def __init__(self, parent, idx):
+            self._parent = parent
+            self._idx = idx
+
+        def query(self, cmd, size=-1):
+            reply = self._parent.query(cmd, size)
+            if self._parent.read() != "OK":
+                raise OSError("Not acknowledged.")
+            return reply
+
+        offset = unitful_property("OFFS", u.volt)
+
+    frequency = unitful_property("FREQ", u.Hz, valid_range=(0, 1000))
+    shape = enum_property("SHAP", Shape)
+    limited = unitful_property(
+        "LIM", u.volt, valid_range=(lambda inst: inst.frequency.magnitude, None)
+    )
+    level = unitful_property("LEV", u.volt, cache_ttl=10)
+
+    @property
+    def channel(self):
+        return ProxyList(self, MockInstrument.Channel, range(2))
+
+    @property
+    def ack_channel(self):
+        return ProxyList(self, MockInstrument.AckChannel, range(2))
+
+    @property
+    def period(self):
+        return (1 / self.frequency).to(u.s)
+
+    traces_read = 0
+
+    @property
+    def trace(self):
+        self.traces_read += 1
+        self.sendcmd("TRAC:FORM ASC")
+        return self._file.read_raw(3)
+
+
+# TESTS ######################################################################
+
+
+def test_executor_sendcmd_and_query():
+    with expected_protocol(MockInstrument, ["*RST", "*IDN?"], ["ACME"]) as inst:
+        with InstrumentExecutor(inst) as executor:
+            assert executor.instrument is inst
+            assert executor.sendcmd("*RST").result() is None
+            assert executor.query("*IDN?").result() == "ACME"
+
+
+def test_executor_query_parse():
+    with expected_protocol(MockInstrument, ["A?", "B?"], ["1", "2"]) as inst:
+        with InstrumentExecutor(inst) as executor:
+            first = executor.query("A?", parse=int)
+            second = executor.query("B?", parse=float)
+            assert first.result() == 1
+            assert second.result() == 2.0
+
+
+def test_executor_get_set_factory_properties():
+    with expected_protocol(
+        MockInstrument,
+        ["FREQ 1.000000e+02", "FREQ?", "SHAP?", "OFFS?"],
+        ["100", "SQU", "0.5"],
+    ) as inst:
+        with InstrumentExecutor(inst) as executor:
+            assert executor.set("frequency", 100 * u.Hz).result() is None
+            freq = executor.get("frequency")
+            shape = executor.get("shape")
+            offset = executor.get("channel[1].offset")
+            unit_eq(freq.result(), 100 * u.Hz)
+            assert shape.result() is MockInstrument.Shape.square
+            unit_eq(offset.result(), 0.5 * u.volt)
+
+
+def test_executor_get_hand_written_property():
+    with expected_protocol(MockInstrument, ["FREQ?"], ["4"]) as inst:
+        with InstrumentExecutor(inst) as executor:
+            unit_eq(executor.get("period").result(), 0.25 * u.s)
+
+
+def test_executor_hand_written_property_runs_once():
+    with expected_protocol(MockInstrument, ["TRAC:FORM ASC"], ["1,2"]) as inst:
+        with InstrumentExecutor(inst) as executor:
+            assert executor.get("trace").result() == b"1,2"
+            assert inst.traces_read == 1
+
+
+def test_executor_cached_property_is_written_through():
+    with expected_protocol(
+        MockInstrument, ["LEV 2.000000e+00", "LEV 3.000000e+00"], []
+    ) as inst:
+        with InstrumentExecutor(inst) as executor:
+            executor.set("level", 2 * u.volt)
+            unit_eq(executor.get("level").result(), 2 * u.volt)
+            executor.set("level", 3 * u.volt)
+            unit_eq(executor.get("level").result(), 3 * u.volt)
+
+
+def test_executor_getter_with_io_after_query():
+    with expected_protocol(
+        MockInstrument, ["OFFS?", "FREQ?"], ["0.5", "OK", "100"]
+    ) as inst:
+        with InstrumentExecutor(inst) as executor:
+            offset = executor.get("ack_channel[0].offset")
+            freq = executor.get("frequency")
+            unit_eq(offset.result(), 0.5 * u.volt)
+            unit_eq(freq.result(), 100 * u.Hz)
+
+
+def test_executor_set_with_queried_bound():
+    with expected_protocol(
+        MockInstrument, ["FREQ?", "LIM 2.000000e+00"], ["1"]
+    ) as inst:
+        with InstrumentExecutor(inst) as executor:
+            executor.set("limited", 2 * u.volt).result()
+
+
+def test_executor_errors_are_set_on_futures():
+    with expected_protocol(MockInstrument, ["A?"], ["x"]) as inst:
+        with InstrumentExecutor(inst) as executor:
+            with pytest.raises(ValueError):
+                executor.set("frequency", 2000 * u.Hz).result()
+            with pytest.raises(AttributeError):
+                executor.get("nonexistent").result()
+            with pytest.raises(ValueError):
+                executor.query("A?", parse=float).result()
+
+
+def test_executor_submit_runs_on_io_thread():
+    with expected_protocol(MockInstrument, [], []) as inst:
+        with InstrumentExecutor(inst) as executor:
+            name = executor.submit(lambda: threading.current_thread().name)
+            assert name.result() == "InstrumentExecutor-io"
+            assert executor.submit(int, "10", base=2).result() == 2
+
+
+def test_executor_keeps_request_order_across_threads():
+    cmds = [f"CMD{idx}" for idx in range(20)]
+    with expected_protocol(MockInstrument, cmds, []) as inst:
+        with InstrumentExecutor(inst) as executor:
+            lock = threading.Lock()
+
+            def _send(cmd):
+                # Submission order is fixed by the lock, not by the I/O.
+                with lock:
+                    return executor.sendcmd(cmd)
+
+            with futures.ThreadPoolExecutor(max_workers=4) as pool:
+                sent = [pool.submit(_send, cmd).result() for cmd in cmds]
+            futures.wait(sent)
+
+
+def test_executor_shutdown():
+    with expected_protocol(MockInstrument, ["A"], []) as inst:
+        executor = InstrumentExecutor(inst)
+        future = executor.sendcmd("A")
+        executor.shutdown()
+        assert future.done()
+        executor.shutdown()
+        with pytest.raises(RuntimeError):
+            executor.sendcmd("B")
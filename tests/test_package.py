@@ -4,7 +4,40 @@ Module containing tests for the base instruments package
 
 # IMPORTS ####################################################################
 
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
 import instruments._version as ik_version_file
+from instruments.config import load_instruments
+
+# FUNCTIONS ##################################################################
+
+# pylint: disable=protected-access
+
+
+def _imported_modules(statement):
+    """
+    Runs ``statement`` in a fresh interpreter, and returns the names of the
+    modules it loaded.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(ik_version_file.__file__))]
+        + env.get("PYTHONPATH", "").split(os.pathsep)
+    )
+    stdout = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print(*sys.modules)"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(stdout.split())
+
 
 # TEST CASES #################################################################
 
@@ -12,3 +45,50 @@ import instruments._version as ik_version_file
 def test_package_has_version():
     assert hasattr(ik_version_file, "version")
     assert hasattr(ik_version_file, "version_tuple")
+
+
+def test_package_subpackages_are_lazy():
+    import instruments as ik
+
+    assert ik.srs is importlib.import_module("instruments.srs")
+    assert ik.load_instruments is load_instruments
+    assert "srs" in dir(ik)
+    assert "load_instruments" in dir(ik)
+
+
+def test_package_missing_attribute():
+    import instruments as ik
+
+    with pytest.raises(AttributeError):
+        _ = ik.not_a_vendor
+
+
+def test_package_import_defers_modules():
+    import instruments as ik
+
+    deferred = (
+        [f"instruments.{name}" for name in sorted(ik._SUBPACKAGES)]
+        + ["instruments.config", "ruamel.yaml"]
+        + ["pyvisa", "usb.core", "usbtmc", "vxi11", "serial.tools.list_ports"]
+        + ["asyncio"]
+        + [
+            "instruments.abstract_instruments.comm.async_stream_communicator",
+            "instruments.abstract_instruments.comm.async_serial_communicator",
+            "instruments.abstract_instruments.comm.async_socket_communicator",
+        ]
+    )
+    # Some versions of pint load asyncio themselves.
+    loaded = _imported_modules("import instruments") - _imported_modules("import pint")
+    assert not [name for name in deferred if name in loaded]
+
+
+def test_package_async_communicators_are_lazy():
+    from instruments.abstract_instruments import comm
+
+    module = importlib.import_module(
+        "instruments.abstract_instruments.comm.async_socket_communicator"
+    )
+    assert comm.AsyncSocketCommunicator is module.AsyncSocketCommunicator
+    assert "AsyncSerialCommunicator" in dir(comm)
+    with pytest.raises(AttributeError):
+        _ = comm.NotACommunicator
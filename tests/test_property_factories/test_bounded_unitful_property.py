@@ -9,9 +9,10 @@ Module containing tests for the bounded unitful property factories
 import pytest
 from instruments.units import ureg as u
 
-from instruments.util_fns import bounded_unitful_property
+import instruments as ik
+from instruments.util_fns import ProxyList, bounded_unitful_property
 from . import MockInstrument
-from .. import mock
+from .. import expected_protocol, mock
 
 # TEST CASES #################################################################
 
@@ -137,3 +138,97 @@ def test_bounded_unitful_property_returns_none():
 
     assert mock_inst.property_min is None
     assert mock_inst.property_max is None
+
+
+def test_bounded_unitful_property_cache_bounds():
+    class BoundedUnitfulMock(MockInstrument):
+        property, property_min, property_max = bounded_unitful_property(
+            "MOCK", units=u.hertz, cache_bounds=True
+        )
+
+    mock_inst = BoundedUnitfulMock({"MOCK:MIN?": "10", "MOCK:MAX?": "9999"})
+
+    mock_inst.property = 1000 * u.hertz
+    mock_inst.property = 2000 * u.hertz
+    assert mock_inst.property_max == 9999 * u.hertz
+    with pytest.raises(ValueError):
+        mock_inst.property = 1 * u.hertz
+    assert mock_inst.value == (
+        "MOCK:MIN?\nMOCK:MAX?\nMOCK 1.000000e+03\nMOCK 2.000000e+03\n"
+    )
+
+
+def test_bounded_unitful_property_bounds_depend_on():
+    class BoundedUnitfulInstrument(ik.Instrument):
+        frequency, frequency_min, frequency_max = bounded_unitful_property(
+            "FREQ", units=u.hertz, cache_bounds=True, bounds_depend_on=("FUNC",)
+        )
+
+    with expected_protocol(
+        BoundedUnitfulInstrument,
+        [
+            "FREQ:MIN?",
+            "FREQ:MAX?",
+            "FREQ 1.000000e+03",
+            "VOLT 1",
+            "FREQ 2.000000e+03",
+            ":FUNC:SHAP SQU",
+            "FREQ:MIN?",
+            "FREQ:MAX?",
+        ],
+        ["1", "1e6", "1", "1e3"],
+    ) as inst:
+        inst.frequency = 1 * u.kHz
+        inst.sendcmd("VOLT 1")
+        inst.frequency = 2 * u.kHz
+        inst.sendcmd(":FUNC:SHAP SQU")
+        with pytest.raises(ValueError):
+            inst.frequency = 2 * u.kHz
+
+
+class BoundedChannelInstrument(ik.Instrument):
+    class Channel:
+        def __init__(self, parent, idx):
+            self._parent = parent
+            self._idx = idx
+
+        def sendcmd(self, cmd):
+            self._parent.sendcmd(f":CH{self._idx}:{cmd}")
+
+        def query(self, cmd, size=-1):
+            return self._parent.query(f":CH{self._idx}:{cmd}", size)
+
+        frequency, frequency_min, frequency_max = bounded_unitful_property(
+            "FREQ", units=u.hertz, cache_bounds=True, bounds_depend_on=("FUNC",)
+        )
+
+    @property
+    def channel(self):
+        return ProxyList(self, self.Channel, range(2))
+
+
+def test_bounded_unitful_property_channel_bounds_invalidated():
+    with expected_protocol(
+        BoundedChannelInstrument,
+        [
+            ":CH0:FREQ:MIN?",
+            ":CH0:FREQ:MAX?",
+            ":CH0:FREQ 1.000000e+03",
+            ":CH0:FREQ 2.000000e+03",
+            ":CH0:FUNC SQU",
+            ":CH0:FREQ:MIN?",
+            ":CH0:FREQ:MAX?",
+            "*RST",
+            ":CH0:FREQ:MIN?",
+            ":CH0:FREQ:MAX?",
+            ":CH0:FREQ 1.000000e+03",
+        ],
+        ["1", "1e6", "1", "1e3", "1", "1e6"],
+    ) as inst:
+        inst.channel[0].frequency = 1 * u.kHz
+        inst.channel[0].frequency = 2 * u.kHz
+        inst.channel[0].sendcmd("FUNC SQU")
+        with pytest.raises(ValueError):
+            inst.channel[0].frequency = 2 * u.kHz
+        inst.sendcmd("*RST")
+        inst.channel[0].frequency = 1 * u.kHz
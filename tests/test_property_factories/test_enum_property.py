@@ -194,3 +194,24 @@ def test_enum_property_set_cmd():
     mock_inst.a = SillyEnum.a
 
     assert mock_inst.value == "MOCK:A?\nFOOBAR:A aa\n"
+
+
+def test_enum_property_missing():
+    class MissingEnum(Enum):
+        a = "aa"
+        b = "bb"
+
+        @classmethod
+        def _missing_(cls, value):
+            if isinstance(value, str):
+                return cls(value.lower())
+            return None
+
+    class EnumMock(MockInstrument):
+        a = enum_property("MOCK:A", MissingEnum)
+
+    mock_inst = EnumMock({"MOCK:A?": "AA"})
+
+    assert mock_inst.a == MissingEnum.a
+    mock_inst.a = "BB"
+    assert mock_inst.value == "MOCK:A?\nMOCK:A bb\n"
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+"""
+Module containing tests for caching of property factory values
+"""
+
+# IMPORTS ####################################################################
+
+
+from enum import Enum
+
+import pytest
+
+import instruments as ik
+from instruments.util_fns import (
+    ProxyList,
+    bool_property,
+    enum_property,
+    int_property,
+    string_property,
+    unitful_property,
+    unitless_property,
+)
+from instruments.units import ureg as u
+from tests import expected_protocol, mock
+from . import MockInstrument
+
+# TEST CASES #################################################################
+
+# pylint: disable=missing-docstring,no-self-use
+
+
+class SomeEnum(Enum):
+    one = "1"
+    two = "2"
+
+
+class CachedMock(MockInstrument):
+    bool_prop = bool_property("BOOL", cache_ttl=10)
+    enum_prop = enum_property("ENUM", SomeEnum, cache_ttl=10)
+    int_prop = int_property("INT", cache_ttl=10)
+    unitless_prop = unitless_property("UNITLESS", cache_ttl=10)
+    unitful_prop = unitful_property("UNITFUL", u.hertz, cache_ttl=10)
+    string_prop = string_property("STRING", cache_ttl=10)
+
+
+@pytest.mark.parametrize(
+    "name,cmd,response,value",
+    [
+        ("bool_prop", "BOOL", "ON", True),
+        ("enum_prop", "ENUM", "1", SomeEnum.one),
+        ("int_prop", "INT", "5", 5),
+        ("unitless_prop", "UNITLESS", "1.5", 1.5),
+        ("unitful_prop", "UNITFUL", "1000", 1000 * u.hertz),
+        ("string_prop", "STRING", '"foo"', "foo"),
+    ],
+)
+def test_property_cache_get(name, cmd, response, value):
+    mock_inst = CachedMock({f"{cmd}?": response})
+
+    assert getattr(mock_inst, name) == value
+    assert getattr(mock_inst, name) == value
+    assert mock_inst.value == f"{cmd}?\n"
+
+
+@pytest.mark.parametrize(
+    "name,newval,value",
+    [
+        ("bool_prop", False, False),
+        ("enum_prop", "two", SomeEnum.two),
+        ("int_prop", 7, 7),
+        ("unitless_prop", 2, 2.0),
+        ("unitful_prop", 1 * u.kilohertz, 1000 * u.hertz),
+        ("string_prop", "bar", "bar"),
+    ],
+)
+def test_property_cache_write_through(name, newval, value):
+    mock_inst = CachedMock()
+
+    setattr(mock_inst, name, newval)
+    assert getattr(mock_inst, name) == value
+    assert "?" not in mock_inst.value
+
+
+def test_property_cache_ttl_expired():
+    mock_inst = CachedMock({"INT?": "5"})
+
+    with mock.patch("instruments.util_fns.time.monotonic", return_value=0):
+        assert mock_inst.int_prop == 5
+    with mock.patch("instruments.util_fns.time.monotonic", return_value=9):
+        assert mock_inst.int_prop == 5
+    with mock.patch("instruments.util_fns.time.monotonic", return_value=10):
+        assert mock_inst.int_prop == 5
+    assert mock_inst.value == "INT?\nINT?\n"
+
+
+def test_property_cache_failed_set_invalidates():
+    mock_inst = CachedMock({"ENUM?": "1"})
+
+    assert mock_inst.enum_prop == SomeEnum.one
+    with pytest.raises(ValueError):
+        mock_inst.enum_prop = "three"
+    assert mock_inst.enum_prop == SomeEnum.one
+    assert mock_inst.value == "ENUM?\nENUM?\n"
+
+
+def test_property_cache_default_off():
+    class UncachedMock(MockInstrument):
+        int_prop = int_property("INT")
+
+    mock_inst = UncachedMock({"INT?": "5"})
+
+    assert mock_inst.int_prop == 5
+    assert mock_inst.int_prop == 5
+    assert mock_inst.value == "INT?\nINT?\n"
+
+
+class CachedSCPIInstrument(ik.generic_scpi.SCPIInstrument):
+    int_prop = int_property("INT", cache_ttl=10)
+
+
+def test_property_cache_no_cache():
+    with expected_protocol(CachedSCPIInstrument, ["INT?", "INT?"], ["5", "6"]) as inst:
+        assert inst.int_prop == 5
+        with inst.no_cache():
+            assert inst.int_prop == 6
+        assert inst.int_prop == 6
+
+
+def test_property_cache_invalidate_cache():
+    with expected_protocol(CachedSCPIInstrument, ["INT?", "INT?"], ["5", "6"]) as inst:
+        assert inst.int_prop == 5
+        inst.invalidate_cache()
+        assert inst.int_prop == 6
+
+
+def test_property_cache_reset_and_clear_invalidate():
+    with expected_protocol(
+        CachedSCPIInstrument,
+        ["INT?", "*RST", "INT?", "*CLS", "INT?", "INT 1;*RST", "INT?"],
+        ["5", "6", "7", "8"],
+    ) as inst:
+        assert inst.int_prop == 5
+        inst.reset()
+        assert inst.int_prop == 6
+        inst.clear()
+        assert inst.int_prop == 7
+        with inst.deferred_writes():
+            inst.int_prop = 1
+            inst.reset()
+            assert inst.int_prop == 8
+
+
+class CachedUnitfulInstrument(ik.Instrument):
+    frequency = unitful_property("FREQ", u.hertz, cache_ttl=10)
+
+
+def test_property_cache_magnitude_mode():
+    with expected_protocol(CachedUnitfulInstrument, ["FREQ?"], ["1000"]) as inst:
+        with inst.magnitude_mode():
+            assert inst.frequency.units == u.hertz
+        assert isinstance(inst.frequency, u.Quantity)
+        assert inst.frequency == 1000 * u.hertz
+
+
+class CachedChannelInstrument(ik.generic_scpi.SCPIInstrument):
+    class Channel:
+        def __init__(self, parent, idx):
+            self._parent = parent
+            self._idx = idx
+
+        def query(self, cmd, size=-1):
+            return self._parent.query(f"CH{self._idx}:{cmd}", size)
+
+        frequency = unitful_property("FREQ", u.hertz, cache_ttl=10)
+
+    def __init__(self, filelike):
+        super().__init__(filelike)
+        self.fixed_channel = self.Channel(self, 9)
+
+    @property
+    def channel(self):
+        return ProxyList(self, self.Channel, range(2))
+
+
+def test_property_cache_channel_reset():
+    with expected_protocol(
+        CachedChannelInstrument,
+        ["CH9:FREQ?", "*RST", "CH9:FREQ?"],
+        ["1", "2"],
+    ) as inst:
+        assert inst.fixed_channel.frequency == 1 * u.hertz
+        assert inst.fixed_channel.frequency == 1 * u.hertz
+        inst.reset()
+        assert inst.fixed_channel.frequency == 2 * u.hertz
+
+
+def test_property_cache_proxy_list_channels():
+    with expected_protocol(
+        CachedChannelInstrument,
+        ["CH0:FREQ?", "CH1:FREQ?", "CH0:FREQ?", "CH0:FREQ?", "CH1:FREQ?"],
+        ["1", "2", "3", "4", "5"],
+    ) as inst:
+        # Channels made anew on each access share their cached values.
+        assert inst.channel[0].frequency == 1 * u.hertz
+        assert inst.channel[1].frequency == 2 * u.hertz
+        assert inst.channel[0].frequency == 1 * u.hertz
+        with inst.no_cache():
+            assert inst.channel[0].frequency == 3 * u.hertz
+        inst.invalidate_cache()
+        assert [ch.frequency for ch in inst.channel] == [4 * u.hertz, 5 * u.hertz]
+
+
+def test_property_cache_collected_channel_is_dropped():
+    with expected_protocol(CachedChannelInstrument, ["CH5:FREQ?"], ["1"]) as inst:
+        channel = inst.Channel(inst, 5)
+        assert channel.frequency == 1 * u.hertz
+        assert len(inst._property_cache) == 1
+        del channel
+        assert not inst._property_cache
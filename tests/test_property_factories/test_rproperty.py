@@ -6,9 +6,20 @@ Module containing tests for the property factories
 # IMPORTS ####################################################################
 
 
+from enum import Enum
+
 import pytest
 
-from instruments.util_fns import rproperty
+from instruments.units import ureg as u
+from instruments.util_fns import (
+    bool_property,
+    enum_property,
+    int_property,
+    rproperty,
+    string_property,
+    unitful_property,
+    unitless_property,
+)
 from . import MockInstrument
 
 # TEST CASES #################################################################
@@ -102,3 +113,26 @@ def test_rproperty_writeonly_writing_passes():
 def test_rproperty_readonly_and_writeonly():
     with pytest.raises(ValueError):
         _ = rproperty(readonly=True, writeonly=True)
+
+
+@pytest.mark.parametrize(
+    "factory,args",
+    [
+        (bool_property, ("MOCK",)),
+        (enum_property, ("MOCK", Enum("MockEnum", "a b"))),
+        (int_property, ("MOCK",)),
+        (unitless_property, ("MOCK",)),
+        (unitful_property, ("MOCK", u.hertz)),
+        (string_property, ("MOCK",)),
+    ],
+)
+def test_property_factories_are_documented_properties(factory, args):
+    prop = factory(*args, doc="Mock docs")
+    assert isinstance(prop, property)
+    assert prop.__doc__ == "Mock docs"
+    assert factory.__name__ in type(prop).__doc__
+    assert not hasattr(prop, "__dict__")
+    assert factory(*args, readonly=True).fset is None
+    assert factory(*args, writeonly=True).fget is None
+    with pytest.raises(ValueError):
+        factory(*args, readonly=True, writeonly=True)
@@ -9,9 +9,11 @@ Module containing tests for the unitful property factories
 import pytest
 import pint
 
-from instruments.util_fns import unitful_property
-from instruments.units import ureg as u
+import instruments as ik
+from instruments.util_fns import ProxyList, unitful_property
+from instruments.units import LazyQuantity, ureg as u
 from . import MockInstrument
+from .. import expected_protocol
 
 # TEST CASES #################################################################
 
@@ -234,3 +236,95 @@ def test_unitful_property_name_read_not_none():
     mock_inst.a = 1000 * u.hertz
 
     assert mock_inst.value == f"MOCK?\nFOOBAR {1000:e}\n"
+
+
+def test_unitful_property_keeps_magnitude_type():
+    class UnitfulMock(MockInstrument):
+        unitful_property = unitful_property("MOCK", u.hertz, format_code="{}")
+
+    mock_inst = UnitfulMock()
+
+    mock_inst.unitful_property = 5 * u.hertz
+    mock_inst.unitful_property = 5
+    mock_inst.unitful_property = 5 * u.kilohertz
+    assert mock_inst.value == "MOCK 5\nMOCK 5\nMOCK 5000.0\n"
+
+
+def test_unitful_property_offset_units():
+    class UnitfulMock(MockInstrument):
+        unitful_property = unitful_property(
+            "MOCK", u.degC, format_code="{:.2f}", valid_range=(0, 100)
+        )
+
+    mock_inst = UnitfulMock({"MOCK?": "300 K"})
+
+    assert mock_inst.unitful_property.magnitude == pytest.approx(26.85)
+    mock_inst.unitful_property = u.Quantity(300, u.kelvin)
+    with pytest.raises(ValueError):
+        mock_inst.unitful_property = u.Quantity(200, u.kelvin)
+    assert mock_inst.value == "MOCK?\nMOCK 26.85\n"
+
+
+def test_unitful_property_string_units():
+    class UnitfulMock(MockInstrument):
+        unitful_property = unitful_property("MOCK", "kHz")
+
+    mock_inst = UnitfulMock({"MOCK?": "1000 Hz"})
+
+    assert mock_inst.unitful_property == 1 * u.kilohertz
+    mock_inst.unitful_property = "2 kHz"
+    assert mock_inst.value == f"MOCK?\nMOCK {2:e}\n"
+
+
+class UnitfulInstrument(ik.Instrument):
+    class Channel:
+        def __init__(self, parent, idx):
+            self._parent = parent
+            self._idx = idx
+
+        def query(self, cmd, size=-1):
+            return self._parent.query(f"CH{self._idx}:{cmd}", size)
+
+        offset = unitful_property("OFFS", u.volt)
+
+    frequency = unitful_property("FREQ", u.hertz, valid_range=(0, 1e6))
+
+    @property
+    def channel(self):
+        return ProxyList(self, UnitfulInstrument.Channel, range(2))
+
+
+def test_unitful_property_magnitude_mode():
+    with expected_protocol(
+        UnitfulInstrument, ["FREQ?", "FREQ?", f"FREQ {1000:e}"], ["1 kHz", "5"]
+    ) as inst:
+        with inst.magnitude_mode():
+            freq = inst.frequency
+        assert isinstance(freq, LazyQuantity)
+        assert freq == 1000.0
+        assert freq.units == u.hertz
+        assert freq.quantity == 1000 * u.hertz
+        assert freq.to(u.kilohertz) == 1 * u.kilohertz
+        assert repr(freq) == "<LazyQuantity(1000.0, 'hertz')>"
+        assert str(freq) == "1000.0"
+
+        freq = inst.frequency
+        assert not isinstance(freq, LazyQuantity)
+        assert freq == 5 * u.hertz
+
+        inst.frequency = LazyQuantity(1.0, u.kilohertz)
+
+
+def test_unitful_property_magnitude_mode_channel():
+    with expected_protocol(
+        UnitfulInstrument, ["CH1:OFFS?", "CH1:OFFS?"], ["0.5", "0.25"]
+    ) as inst:
+        with inst.magnitude_mode():
+            offset = inst.channel[1].offset
+        assert isinstance(offset, LazyQuantity)
+        assert offset == 0.5
+        assert offset.units == u.volt
+
+        offset = inst.channel[1].offset
+        assert not isinstance(offset, LazyQuantity)
+        assert offset == 0.25 * u.volt
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """
-Module containing tests for the util_fns.split_unit_str utility function
+Module containing tests for the util_fns.split_unit_str and
+util_fns.split_unit_strs utility functions
 """
 
 # IMPORTS ####################################################################
@@ -9,7 +10,7 @@ Module containing tests for the util_fns.split_unit_str utility function
 import pytest
 
 from instruments.units import ureg as u
-from instruments.util_fns import split_unit_str
+from instruments.util_fns import split_unit_str, split_unit_strs
 
 # TEST CASES #################################################################
 
@@ -140,3 +141,53 @@ def test_split_unit_str_only_units():
     """
     with pytest.raises(ValueError):
         _ = split_unit_str("foobars")
+
+
+def test_split_unit_str_lookup():
+    """
+    split_unit_str: Given a lookup function, I expect it to be called on the
+    units part of the string, but not on the default units.
+    """
+    mag, units = split_unit_str("42 foobars", lookup=str.upper)
+    assert mag == 42
+    assert units == "FOOBARS"
+    mag, units = split_unit_str("42", default_units="foobars", lookup=str.upper)
+    assert mag == 42
+    assert units == "foobars"
+
+
+def test_split_unit_str_repeated():
+    """
+    split_unit_str: Given the same string several times, I expect the same
+    result each time, whatever the default units.
+    """
+    assert split_unit_str("1.5 V") == split_unit_str("1.5 V") == (1.5, "V")
+    assert split_unit_str("1.5", default_units=u.volt) == (1.5, u.volt)
+    assert split_unit_str("1.5", default_units=u.amp) == (1.5, u.amp)
+
+
+def test_split_unit_strs_comma_separated():
+    """
+    split_unit_strs: Given a comma-separated string, I expect each value to
+    be split into its magnitude and units.
+    """
+    values = split_unit_strs("1 V, -2.5E-3 mV,7", default_units="foobars")
+    assert values == [(1, "V"), (-2.5e-3, "mV"), (7, "foobars")]
+
+
+def test_split_unit_strs_iterable():
+    """
+    split_unit_strs: Given an iterable of strings and a lookup function, I
+    expect each value to be split and its units looked up.
+    """
+    values = split_unit_strs([" 12 c", "14.7 ghz"], lookup=str.upper)
+    assert values == [(12, "C"), (14.7, "GHZ")]
+
+
+def test_split_unit_strs_bad_value():
+    """
+    split_unit_strs: Given a reply with a value that cannot be parsed, I
+    expect the function to raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        _ = split_unit_strs("1 V,,2 V")
@@ -220,6 +220,51 @@ def test_data_source_read_waveform_with_old_data_source():
         iterable_eq(actual_waveform, expected_waveform)
 
 
+def test_data_source_read_waveform_chunked():
+    """Stream a waveform in chunks, scaling each chunk as it arrives."""
+    binary_format = ik.tektronix.TekDPO70000.BinaryFormat.int
+    byte_order = ik.tektronix.TekDPO70000.ByteOrder.big_endian
+    dtype_set = ik.tektronix.TekDPO70000._dtype(binary_format, byte_order, n_bytes=None)
+    values = (-32768, -5, 0, 7, 32767)
+    values_packed = b"".join(struct.pack(dtype_set, value) for value in values)
+    scale, position, offset = 2.0, 0.5, 0.25
+    scaled_values = [
+        scale
+        * ((ik.tektronix.TekDPO70000.VERT_DIVS / 2) * float(v) / (2**15) - position)
+        + offset
+        for v in values
+    ]
+
+    with expected_protocol(
+        ik.tektronix.TekDPO70000,
+        [
+            "DAT:SOU?",
+            "DAT:ENC FAS",
+            "WFMO:BYT_N?",
+            "WFMO:BN_F?",
+            "WFMO:BYT_O?",
+            "CH1:SCALE?",  # scaling is read once, before the transfer
+            "CH1:POS?",
+            "CH1:OFFS?",
+            "CURV?",
+        ],
+        [
+            "CH1",
+            "4",
+            f"{binary_format.value}",
+            f"{byte_order.value}",
+            f"{scale}",
+            f"{position}",
+            f"{offset}",
+            b"#220" + values_packed,
+        ],
+    ) as inst:
+        chunks = list(inst.channel[0].read_waveform(chunk_size=2))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        actual = [v.to(u.V).magnitude for chunk in chunks for v in chunk]
+        assert actual == pytest.approx(scaled_values)
+
+
 # MATH #
 
 
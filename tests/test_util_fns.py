@@ -5,17 +5,20 @@ Module containing tests for util_fns.py
 
 # IMPORTS ####################################################################
 
+from array import array
 from enum import Enum
 
 import pint
 import pytest
 
-from instruments.units import ureg as u
+from instruments.optional_dep_finder import numpy
+from instruments.units import resolve_unit, ureg as u
 from instruments.util_fns import (
     assume_units,
     bool_property,
     enum_property,
     int_property,
+    parse_ascii_array,
     ProxyList,
     setattr_expression,
     string_property,
@@ -23,7 +26,7 @@ from instruments.util_fns import (
     unitless_property,
 )
 
-from tests import unit_eq
+from tests import iterable_eq, unit_eq
 
 # FIXTURES ###################################################################
 
@@ -201,6 +204,76 @@ def test_assume_units_correct(input, out):
     unit_eq(assume_units(input, "m"), out)
 
 
+def test_assume_units_unit_name():
+    unit_eq(assume_units(7.5, "ms"), u.Quantity(7.5, u.ms))
+    unit_eq(assume_units("7.5", "ms"), u.Quantity(7.5, u.ms))
+
+
+def test_resolve_unit():
+    assert resolve_unit("kHz") == u.kilohertz
+    assert resolve_unit("kHz") is resolve_unit("kHz")
+
+
+def test_resolve_unit_per_registry():
+    registry = u.get()
+    other = pint.UnitRegistry()
+    pint.set_application_registry(other)
+    try:
+        assert resolve_unit("kHz")._REGISTRY is other
+        assert resolve_unit("V")._REGISTRY is other
+    finally:
+        pint.set_application_registry(registry)
+    assert resolve_unit("kHz")._REGISTRY is registry
+
+
+def test_resolve_unit_invalid():
+    with pytest.raises(pint.errors.UndefinedUnitError):
+        _ = resolve_unit("foobars")
+
+
+@pytest.mark.parametrize("name", ("V", "volt", "Hz", "s", "K", "ohm", "W", "dBm"))
+def test_prebound_units(name):
+    assert resolve_unit(name) is resolve_unit(name)
+    assert resolve_unit(name) == u.Unit(name)
+    # The registry of the application is left untouched.
+    assert name not in vars(u.get())
+
+
+@pytest.mark.parametrize(
+    "data, kwargs",
+    (
+        ("1.5,2,-3e-3", {}),
+        (" 1.5 , 2 ,-3e-3,\r\n", {}),
+        (b"1.5,2,-3e-3\n", {}),
+        ('"  1.5   2.   -3e-3  "', {"sep": None}),
+        ("1.5;2;-3e-3", {"sep": ";"}),
+        (":CURV 1.5,2,-3e-3", {"header": True}),
+        (b"CURVE 1.5,2,-3e-3", {"header": True}),
+    ),
+)
+def test_parse_ascii_array(data, kwargs):
+    expected = numpy.array([1.5, 2, -3e-3]) if numpy else array("d", [1.5, 2, -3e-3])
+    iterable_eq(parse_ascii_array(data, **kwargs), expected)
+
+
+@pytest.mark.parametrize(
+    "data, kwargs", (("", {}), (" \r\n", {}), ("CURVE", {"header": True}))
+)
+def test_parse_ascii_array_empty(data, kwargs):
+    assert len(parse_ascii_array(data, **kwargs)) == 0
+
+
+def test_parse_ascii_array_without_numpy(mocker):
+    mocker.patch("instruments.util_fns.numpy", None)
+    assert parse_ascii_array("1,2.5") == array("d", [1, 2.5])
+
+
+@pytest.mark.parametrize("data", ("1,,2", "1,x", "1 x"))
+def test_parse_ascii_array_invalid(data):
+    with pytest.raises(ValueError):
+        _ = parse_ascii_array(data, sep=None if " " in data else ",")
+
+
 def test_setattr_expression_simple():
     class A:
         x = "x"
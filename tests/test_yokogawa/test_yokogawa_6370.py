@@ -255,6 +255,33 @@ def test_channel_wavelength(values, channel):
         iterable_eq(inst.channel[channel].wavelength((0, 500)), values)
 
 
+def test_channel_data_chunked():
+    values = (1.5, -2.0, 3.25, 4.0, 5.5)
+    values_packed = b"".join(struct.pack("<d", value) for value in values)
+    with expected_protocol(
+        ik.yokogawa.Yokogawa6370,
+        [
+            ":FORMat:DATA REAL,64",
+            ":TRAC:Y? TRA",
+            ":TRAC:X? TRA",
+            ":TRAC:ACTIVE?",
+        ],
+        [b"#240" + values_packed, b"#240" + values_packed, "TRA"],
+    ) as inst:
+        chunks = list(inst.channel["A"].data(chunk_size=2))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        iterable_eq(sum((tuple(chunk) for chunk in chunks), ()), values)
+
+        # Closing the stream early keeps the connection in sync.
+        chunks = inst.channel["A"].wavelength(chunk_size=2)
+        iterable_eq(tuple(next(chunks)), values[:2])
+        chunks.close()
+        assert inst.active_trace == inst.Traces.A
+
+        # Nothing is sent for a stream which is never iterated.
+        inst.channel["A"].data(chunk_size=2).close()
+
+
 @given(value=st.floats(min_value=600e-9, max_value=1700e-9))
 def test_start_wavelength(value):
     with expected_protocol(